@@ -5,11 +5,22 @@ This module defines all abstract base classes (interfaces) following SOLID princ
 All implementations must adhere to these interfaces for consistency and testability.
 """
 
+import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import OutOfBoundsError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+
+# Distance either side of a position sampled for finite-difference terrain normals
+NORMAL_SAMPLE_STEP = 1.0
 
 # ============================================================================
 # Data Classes
@@ -24,7 +35,7 @@ class Team(Enum):
     NEUTRAL = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Vector3:
     """3D position vector."""
 
@@ -33,7 +44,7 @@ class Vector3:
     z: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Rotation:
     """3D rotation (Euler angles in degrees)."""
 
@@ -42,7 +53,7 @@ class Rotation:
     roll: float  # Z-axis rotation
 
 
-@dataclass
+@dataclass(slots=True)
 class Transform:
     """Complete 3D transform (position + rotation)."""
 
@@ -56,7 +67,7 @@ class Transform:
             self.scale = Vector3(1.0, 1.0, 1.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class GameObject:
     """Represents a game object (vehicle, building, prop, etc.)."""
 
@@ -67,7 +78,7 @@ class GameObject:
     properties: dict[str, Any]  # Additional properties from source game
 
 
-@dataclass
+@dataclass(slots=True)
 class SpawnPoint:
     """Player spawn point."""
 
@@ -76,7 +87,7 @@ class SpawnPoint:
     team: Team
 
 
-@dataclass
+@dataclass(slots=True)
 class CapturePoint:
     """Conquest-style capture point."""
 
@@ -278,6 +289,162 @@ class ITerrainProvider(ABC):
             OutOfBoundsError: If position is outside terrain bounds
         """
 
+    def get_heights_at(
+        self, xs: "Sequence[float] | np.ndarray", zs: "Sequence[float] | np.ndarray"
+    ) -> "np.ndarray":
+        """Query terrain heights for many world positions in one call.
+
+        The default implementation loops over get_height_at; providers with
+        array-backed terrain override it with a vectorized version.
+
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates (same length as xs)
+
+        Returns:
+            Float64 array of heights, NaN where a position is outside terrain bounds
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        zs = np.asarray(zs, dtype=np.float64).ravel()
+        heights = np.full(xs.shape, np.nan)
+        for i, (x, z) in enumerate(zip(xs.tolist(), zs.tolist(), strict=True)):
+            try:
+                heights[i] = self.get_height_at(x, z)
+            except OutOfBoundsError:
+                continue
+        return heights
+
+    def get_height_range(
+        self, rect: tuple[float, float, float, float]
+    ) -> tuple[float, float, float]:
+        """Get the minimum, maximum and mean terrain height over a region.
+
+        The default implementation samples the rectangle's centre and four
+        corners; grid-backed providers override it with exact queries over
+        the interpolated surface inside the rectangle.
+
+        Args:
+            rect: World-space rectangle (min_x, max_x, min_z, max_z)
+
+        Returns:
+            Tuple of (min_height, max_height, mean_height)
+
+        Raises:
+            OutOfBoundsError: If the region does not overlap the terrain
+        """
+        import numpy as np
+
+        min_x, max_x, min_z, max_z = rect
+        center_x, center_z = (min_x + max_x) / 2, (min_z + max_z) / 2
+        heights = self.get_heights_at(
+            [center_x, min_x, max_x, max_x, min_x], [center_z, min_z, min_z, max_z, max_z]
+        )
+        heights = heights[~np.isnan(heights)]
+        if heights.size == 0:
+            raise OutOfBoundsError(
+                f"Region [{min_x:.1f}, {max_x:.1f}] x [{min_z:.1f}, {max_z:.1f}] "
+                "is outside terrain bounds"
+            )
+        return float(heights.min()), float(heights.max()), float(heights.mean())
+
+    def get_min_height_in_radius(self, x: float, z: float, radius: float) -> float:
+        """Get the lowest terrain height within a radius of a position.
+
+        Queries the square circumscribing the circle. The default region
+        query only samples the square's centre and corners, so the result is
+        an estimate unless has_region_grid() is True, in which case it never
+        lies above the true minimum inside the circle.
+
+        Args:
+            x: World X coordinate of the centre
+            z: World Z coordinate of the centre
+            radius: Search radius
+
+        Returns:
+            Minimum terrain height
+
+        Raises:
+            OutOfBoundsError: If the region does not overlap the terrain
+        """
+        return self.get_height_range((x - radius, x + radius, z - radius, z + radius))[0]
+
+    def has_region_grid(self) -> bool:
+        """Check if region queries are answered exactly from a height grid.
+
+        Grid-backed providers reduce every sample of the interpolated surface
+        inside the region, so callers can replace point samples over a
+        footprint with one region query.
+
+        Returns:
+            False for the default implementation, which samples points
+        """
+        return False
+
+    def get_normals_at(
+        self, xs: "Sequence[float] | np.ndarray", zs: "Sequence[float] | np.ndarray"
+    ) -> "np.ndarray":
+        """Get unit terrain surface normals for many world positions in one call.
+
+        The default implementation takes central differences of heights
+        NORMAL_SAMPLE_STEP either side of each position (one-sided at the
+        terrain edge); grid-backed providers override it with precomputed
+        gradients.
+
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates (same length as xs)
+
+        Returns:
+            Float64 (N, 3) array of (x, y, z) normals, NaN rows for positions
+            outside terrain bounds
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        zs = np.asarray(zs, dtype=np.float64).ravel()
+        step = NORMAL_SAMPLE_STEP
+        heights = self.get_heights_at(
+            np.concatenate([xs, xs - step, xs + step, xs, xs]),
+            np.concatenate([zs, zs, zs, zs - step, zs + step]),
+        ).reshape(5, -1)
+        center = heights[0]
+
+        def slope(low: "np.ndarray", high: "np.ndarray") -> "np.ndarray":
+            # Fall back to the centre sample where a neighbour is out of bounds
+            low_ok, high_ok = ~np.isnan(low), ~np.isnan(high)
+            rise = np.where(high_ok, high, center) - np.where(low_ok, low, center)
+            run = step * (low_ok.astype(np.float64) + high_ok)
+            gradient: np.ndarray = np.divide(rise, run, out=np.zeros_like(rise), where=run > 0)
+            return gradient
+
+        normals = np.stack(
+            [-slope(heights[1], heights[2]), np.ones_like(center), -slope(heights[3], heights[4])],
+            axis=1,
+        )
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+        normals[np.isnan(center)] = np.nan
+        return normals
+
+    def get_normal_at(self, x: float, z: float) -> Vector3:
+        """Get the unit terrain surface normal at world coordinates.
+
+        Args:
+            x: World X coordinate
+            z: World Z coordinate
+
+        Returns:
+            Surface normal pointing up (positive Y)
+
+        Raises:
+            OutOfBoundsError: If position is outside terrain bounds
+        """
+        normal = self.get_normals_at([x], [z])[0]
+        if math.isnan(normal[0]):  # NaN marks an out-of-bounds position
+            raise OutOfBoundsError(f"Position ({x:.1f}, {z:.1f}) is outside terrain bounds")
+        return Vector3(float(normal[0]), float(normal[1]), float(normal[2]))
+
     @abstractmethod
     def get_bounds(self) -> tuple[Vector3, Vector3]:
         """Get terrain bounds (min, max).
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Parallel parsing of many maps across worker processes.
+
+Map parsing is CPU-bound pure Python, so batches of maps are fanned out to
+a ProcessPoolExecutor. Each worker builds its engine once and keeps it (and
+its per-process caches) for every map it is given. Results come back in
+input order whatever order the workers finish in, so merged output is
+deterministic.
+
+Single Responsibility: Only handles distributing per-map work over processes.
+"""
+
+import contextlib
+import io
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..core.exceptions import BFPortalError
+from ..core.interfaces import IGameEngine, MapData
+
+# Engine of the current worker process, created by _init_worker
+_worker_engine: IGameEngine | None = None
+
+
+@dataclass
+class MapParseResult:
+    """Outcome of parsing one map in a batch.
+
+    Attributes:
+        map_path: Map directory that was parsed
+        map_data: Parsed map, or None if parsing failed
+        error: Error message if parsing failed
+        log: Progress output the engine printed while parsing this map
+    """
+
+    map_path: Path
+    map_data: MapData | None = None
+    error: str | None = None
+    log: str = ""
+
+
+def _worker_count(max_workers: int | None, jobs: int) -> int:
+    """Get the number of worker processes to use for a batch."""
+    return max(1, min(max_workers or os.cpu_count() or 1, jobs))
+
+
+def map_in_parallel(
+    func: Callable[[Path], Any], map_dirs: Iterable[Path], max_workers: int | None = None
+) -> list[Any]:
+    """Apply a per-map function to every map directory in worker processes.
+
+    Args:
+        func: Module-level (picklable) function taking a map directory; its
+            return value must be picklable
+        map_dirs: Map directories
+        max_workers: Worker processes (default: one per CPU); 1 runs in-process
+
+    Returns:
+        Results in the order of map_dirs
+    """
+    map_dirs = list(map_dirs)
+    workers = _worker_count(max_workers, len(map_dirs))
+    if workers == 1:
+        return [func(map_dir) for map_dir in map_dirs]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, map_dirs))
+
+
+def _init_worker(engine_factory: Callable[[], IGameEngine]) -> None:
+    """Create the engine a worker process reuses for all of its maps."""
+    global _worker_engine
+    _worker_engine = engine_factory()
+
+
+def _parse_with_engine(engine: IGameEngine, map_path: Path) -> MapParseResult:
+    """Parse one map, capturing its progress output and any parse failure."""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            map_data = engine.parse_map(map_path)
+        except (BFPortalError, OSError) as e:
+            return MapParseResult(map_path, error=str(e), log=log.getvalue())
+    return MapParseResult(map_path, map_data=map_data, log=log.getvalue())
+
+
+def _parse_in_worker(map_path: Path) -> MapParseResult:
+    """Parse one map with the worker's engine."""
+    assert _worker_engine is not None, "worker started without _init_worker"
+    return _parse_with_engine(_worker_engine, map_path)
+
+
+def parse_maps(
+    map_dirs: Iterable[Path],
+    engine_factory: Callable[[], IGameEngine],
+    max_workers: int | None = None,
+) -> list[MapParseResult]:
+    """Parse many maps in parallel.
+
+    A map that fails to parse is reported in its result instead of
+    aborting the batch.
+
+    Args:
+        map_dirs: Map directories (extracted RFAs)
+        engine_factory: Picklable callable creating the game engine, e.g. the
+            engine class itself (BF1942Engine)
+        max_workers: Worker processes (default: one per CPU); 1 runs in-process
+
+    Returns:
+        One result per map, in the order of map_dirs
+    """
+    map_dirs = list(map_dirs)
+    workers = _worker_count(max_workers, len(map_dirs))
+    if workers == 1:
+        engine = engine_factory()
+        return [_parse_with_engine(engine, map_dir) for map_dir in map_dirs]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(engine_factory,)
+    ) as pool:
+        return list(pool.map(_parse_in_worker, map_dirs))
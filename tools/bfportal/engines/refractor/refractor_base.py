@@ -6,6 +6,8 @@ shared functionality for all Refractor-based games while allowing subclasses
 to customize game-specific behavior.
 """
 
+import math
+import re
 from abc import abstractmethod
 from pathlib import Path
 
@@ -23,8 +25,63 @@ from ...core.interfaces import (
     Vector3,
 )
 from ...parsers.con_parser import ConFileSet, ConParser
+from ...parsers.map_files import MapFiles
+from ...parsers.spawner_template_index import SpawnerTemplateIndex, get_shared_index
 from ...parsers.spawner_template_parser import SpawnerTemplateParser
 
+# Spawn group number in spawn names (e.g. "spawn_3_1" -> 3); groups 1 and 2 are the HQs
+_SPAWN_GROUP = re.compile(r"_(\d+)_")
+
+# Neutral spawns without a usable group join the nearest capture point within this range
+NEUTRAL_SPAWN_MAX_CP_DISTANCE = 150.0
+
+
+class _CapturePointGrid:
+    """Uniform XZ grid over capture points for nearest-point lookups.
+
+    Cells are as wide as the search range, so the nearest capture point
+    within range is always in the query's cell or one of its 8 neighbours.
+    """
+
+    def __init__(self, capture_points: list[CapturePoint], max_distance: float):
+        """Build the grid.
+
+        Args:
+            capture_points: Capture points to index (by current position)
+            max_distance: Search range in meters
+        """
+        self.capture_points = capture_points
+        self.max_distance = max_distance
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        for i, cp in enumerate(capture_points):
+            position = cp.transform.position
+            self._cells.setdefault(self._cell(position.x, position.z), []).append(i)
+
+    def _cell(self, x: float, z: float) -> tuple[int, int]:
+        """Get the grid cell containing an XZ position."""
+        return math.floor(x / self.max_distance), math.floor(z / self.max_distance)
+
+    def nearest(self, position: Vector3) -> CapturePoint | None:
+        """Get the capture point closest to a position (ties go to the earliest).
+
+        Args:
+            position: Query position
+
+        Returns:
+            Nearest capture point within range, or None
+        """
+        cell_x, cell_z = self._cell(position.x, position.z)
+        # Only points strictly within range are accepted; equal distances keep the lower index
+        best_index, best_distance = -1, self.max_distance
+        for dx in (-1, 0, 1):
+            for dz in (-1, 0, 1):
+                for i in self._cells.get((cell_x + dx, cell_z + dz), ()):
+                    cp_position = self.capture_points[i].transform.position
+                    distance = math.hypot(cp_position.x - position.x, cp_position.z - position.z)
+                    if (distance, i) < (best_distance, best_index):
+                        best_index, best_distance = i, distance
+        return self.capture_points[best_index] if best_index != -1 else None
+
 
 class RefractorCoordinateSystem(ICoordinateSystem):
     """Coordinate system for Refractor Engine games.
@@ -103,12 +160,18 @@ class RefractorEngine(IGameEngine):
     - Game-specific features
     """
 
-    def __init__(self):
-        """Initialize RefractorEngine."""
+    def __init__(self, spawner_index: SpawnerTemplateIndex | None = None):
+        """Initialize RefractorEngine.
+
+        Args:
+            spawner_index: Parsed spawner template index (defaults to the
+                persisted index shared by all engines in the process)
+        """
         self.con_parser = ConParser()
         self.coordinate_system = RefractorCoordinateSystem()
         self.spawn_template_types: set[str] = set()  # Known SpawnPoint template types
         self.spawner_parser = SpawnerTemplateParser()  # Vehicle spawner template parser
+        self.spawner_index = spawner_index
 
     # ========================================================================
     # Abstract Methods (Subclasses MUST implement)
@@ -154,16 +217,20 @@ class RefractorEngine(IGameEngine):
         print(f"{'=' * 70}")
 
         # Step 1: Load all .con files
-        con_files = ConFileSet(map_path)
+        con_files = ConFileSet(map_path, game_mode=self.get_game_mode_default())
         print(f"📁 Found {len(con_files.con_files)} .con files")
 
         # Step 1.5: Load spawn templates (MUST be done before parsing spawns/objects)
         # This establishes single source of truth for what constitutes a spawn point
         self._load_spawn_templates(con_files)
 
+        # The first index() call above parsed (or loaded from cache) every file
+        cache_stats = con_files.cache_stats()
+        print(f"🗃️  Parse cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+
         # Step 1.6: Load vehicle spawner templates
         # This maps spawner names (lighttankspawner) to vehicle types (T34, PanzerIV)
-        self._load_vehicle_spawner_templates(map_path)
+        self._load_vehicle_spawner_templates(map_path, con_files.files)
 
         # Step 2: Parse spawn points
         team1_spawns = self._parse_spawns(con_files, Team.TEAM_1)
@@ -240,34 +307,32 @@ class RefractorEngine(IGameEngine):
             point identification. All spawn detection should reference
             self.spawn_template_types rather than using pattern matching.
         """
-        parsed_files = con_files.parse_all()
-
-        for _filename, parsed_data in parsed_files.items():
-            for obj in parsed_data["objects"]:
-                obj_type = obj.get("type", "").lower()
-
-                # If this is a template definition for SpawnPoint
-                if obj_type == "spawnpoint":
-                    # Store the template name (which becomes the instance type)
-                    template_name = obj.get("name", "").lower()
-                    if template_name:
-                        self.spawn_template_types.add(template_name)
+        # Template definitions for SpawnPoint
+        for obj in con_files.index().of_type("spawnpoint"):
+            # Store the template name (which becomes the instance type)
+            template_name = obj.get("name", "").lower()
+            if template_name:
+                self.spawn_template_types.add(template_name)
 
         # Log loaded templates for debugging
         if self.spawn_template_types:
             print(f"   📍 Loaded {len(self.spawn_template_types)} spawn templates")
 
-    def _load_vehicle_spawner_templates(self, map_path: Path) -> None:
+    def _load_vehicle_spawner_templates(
+        self, map_path: Path, files: MapFiles | None = None
+    ) -> None:
         """Load vehicle spawner templates (ObjectSpawnTemplates.con).
 
         Parses template files to map spawner names to vehicle types.
         This enables automatic vehicle type detection for VehicleSpawner nodes.
+        Files already in the spawner template index are not re-parsed.
 
         Single Responsibility: Only loads vehicle spawner type mappings.
         DRY Principle: Vehicle assignments defined once in template files.
 
         Args:
             map_path: Path to map directory
+            files: Files of the map directory, if already listed
 
         Note:
             Spawner templates define which vehicles spawn for each team:
@@ -275,7 +340,11 @@ class RefractorEngine(IGameEngine):
             - heavytankspawner: Team 1 = Tiger, Team 2 = T34
             This is the Single Source of Truth for vehicle→spawner mapping.
         """
-        self.spawner_parser.parse_directory(map_path)
+        # Start from an empty set so templates of a previously parsed map don't leak in
+        self.spawner_parser.templates.clear()
+        index = self.spawner_index or get_shared_index()
+        self.spawner_parser.parse_directory(map_path, index, files)
+        index.save()
 
         # Log loaded templates for debugging
         template_count = self.spawner_parser.get_template_count()
@@ -374,35 +443,32 @@ class RefractorEngine(IGameEngine):
         """
         spawns: list[SpawnPoint] = []
 
-        # Parse all .con files to find spawn points
-        parsed_files = con_files.parse_all()
-
-        for _filename, parsed_data in parsed_files.items():
-            for obj in parsed_data["objects"]:
-                obj_name = obj.get("name", "").lower()
-                obj_type = obj.get("type", "").lower()
+        # Search the objects of all .con files for spawn points
+        for obj in con_files.index().objects:
+            obj_name = obj.get("name", "").lower()
+            obj_type = obj.get("type", "").lower()
 
-                # Step 1: Check if this is a spawn point
-                if not self._is_spawn_point(obj_name, obj_type):
-                    continue
+            # Step 1: Check if this is a spawn point
+            if not self._is_spawn_point(obj_name, obj_type):
+                continue
 
-                # Step 2: Classify ownership
-                ownership = self._classify_spawn_ownership(obj_name)
+            # Step 2: Classify ownership
+            ownership = self._classify_spawn_ownership(obj_name)
 
-                # Step 3: Check if this spawn belongs to requested team
-                if not self._should_include_spawn_for_team(ownership, team):
-                    continue
+            # Step 3: Check if this spawn belongs to requested team
+            if not self._should_include_spawn_for_team(ownership, team):
+                continue
 
-                # Step 4: Extract transform and create spawn point
-                transform = self.con_parser.parse_transform(obj)
-                if transform:
-                    spawns.append(
-                        SpawnPoint(
-                            name=obj.get("name", f"Spawn_{team.value}_{len(spawns) + 1}"),
-                            transform=transform,
-                            team=team,
-                        )
+            # Step 4: Extract transform and create spawn point
+            transform = self.con_parser.parse_transform(obj)
+            if transform:
+                spawns.append(
+                    SpawnPoint(
+                        name=obj.get("name", f"Spawn_{team.value}_{len(spawns) + 1}"),
+                        transform=transform,
+                        team=team,
                     )
+                )
 
         # Warn if too few spawns
         if len(spawns) < 4:
@@ -453,105 +519,88 @@ class RefractorEngine(IGameEngine):
             List of CapturePoints with spawns
         """
         capture_points: list[CapturePoint] = []
-        parsed_files = con_files.parse_all()
+        index = con_files.index()
 
         # Step 1: Find all control points (instances from ControlPoints.con, not templates)
-        for _filename, parsed_data in parsed_files.items():
-            # Only process ControlPoints.con (instances), skip ControlPointTemplates.con
-            # ControlPoints.con contains Object.create with actual positions
-            # ControlPointTemplates.con contains ObjectTemplate.create at origin (0, 8.2, 0)
-            filename_lower = _filename.lower()
-            if filename_lower != "controlpoints.con":
+        # Only process ControlPoints.con (instances), skip ControlPointTemplates.con
+        # ControlPoints.con contains Object.create with actual positions
+        # ControlPointTemplates.con contains ObjectTemplate.create at origin (0, 8.2, 0)
+        for obj in index.in_file("ControlPoints.con"):
+            obj_name = obj.get("name", "").lower()
+
+            # Skip HQ bases - those are handled by _parse_hq()
+            if "base" in obj_name and (
+                "axis" in obj_name or "allies" in obj_name or "_1_" in obj_name or "_2_" in obj_name
+            ):
                 continue
 
-            for obj in parsed_data["objects"]:
-                obj_name = obj.get("name", "").lower()
-
-                # Skip HQ bases - those are handled by _parse_hq()
-                if "base" in obj_name and (
-                    "axis" in obj_name
-                    or "allies" in obj_name
-                    or "_1_" in obj_name
-                    or "_2_" in obj_name
-                ):
-                    continue
-
-                # This is a neutral/contestable capture point
-                transform = self.con_parser.parse_transform(obj)
-                if transform:
-                    # Default radius (can be overridden in subclasses)
-                    radius = float(obj.get("properties", {}).get("radius", 50.0))
-
-                    # Auto-generate label (A, B, C, etc.)
-                    label = chr(ord("A") + len(capture_points))
-
-                    cp = CapturePoint(
-                        name=obj.get("name", f"CP_{len(capture_points) + 1}"),
-                        transform=transform,
-                        radius=radius,
-                        control_area=[],  # TODO: Parse control area polygon
-                        label=label,
-                    )
-                    capture_points.append(cp)
-
-        # Step 2: Find neutral spawns and associate them with capture points
-        for _filename, parsed_data in parsed_files.items():
-            for obj in parsed_data["objects"]:
-                obj_name = obj.get("name", "").lower()
-                obj_type = obj.get("type", "").lower()
-
-                # Check if this is a spawn point
-                if not self._is_spawn_point(obj_name, obj_type):
-                    continue
-
-                # Check if it's a neutral spawn
-                ownership = self._classify_spawn_ownership(obj_name)
-                if ownership != "neutral":
-                    continue
-
-                # Extract spawn group number (e.g., _3_, _4_)
-                # This tells us which capture point it belongs to
-                import re
+            # This is a neutral/contestable capture point
+            transform = self.con_parser.parse_transform(obj)
+            if transform:
+                # Default radius (can be overridden in subclasses)
+                radius = float(obj.get("properties", {}).get("radius", 50.0))
+
+                # Auto-generate label (A, B, C, etc.)
+                label = chr(ord("A") + len(capture_points))
+
+                cp = CapturePoint(
+                    name=obj.get("name", f"CP_{len(capture_points) + 1}"),
+                    transform=transform,
+                    radius=radius,
+                    control_area=[],  # TODO: Parse control area polygon
+                    label=label,
+                )
+                capture_points.append(cp)
+
+        # Step 2: Find neutral spawns and associate them with capture points.
+        # The spawn group number names the capture point (groups 1 and 2 are
+        # the HQs, so group 3 is the first CP); spawns without a usable group
+        # are kept for the nearest-CP fallback in Step 4.
+        cp_by_group = {i + 3: cp for i, cp in enumerate(capture_points)}
+        spawns_by_cp: dict[int, list[SpawnPoint]] = {id(cp): [] for cp in capture_points}
+        unassigned: list[SpawnPoint] = []
+
+        for obj in index.objects:
+            obj_name = obj.get("name", "").lower()
+            obj_type = obj.get("type", "").lower()
+
+            # Check if this is a neutral spawn point
+            if not self._is_spawn_point(obj_name, obj_type):
+                continue
+            if self._classify_spawn_ownership(obj_name) != "neutral":
+                continue
 
-                match = re.search(r"_(\d+)_", obj_name)
-                if not match:
-                    continue
+            transform = self.con_parser.parse_transform(obj)
+            if not transform:
+                continue
 
-                group_num = int(match.group(1))
-                # Capture point index is group_num - 3 (since CP 1 and 2 are HQs)
-                cp_index = group_num - 3
+            match = _SPAWN_GROUP.search(obj_name)
+            group_num = int(match.group(1)) if match else None
+            # Create spawn point (belongs to both teams when captured)
+            spawn = SpawnPoint(
+                name=obj.get("name", f"NeutralSpawn_{group_num}"),
+                transform=transform,
+                team=Team.NEUTRAL,
+            )
 
-                if 0 <= cp_index < len(capture_points):
-                    transform = self.con_parser.parse_transform(obj)
-                    if transform:
-                        # Create spawn point (belongs to both teams when captured)
-                        spawn = SpawnPoint(
-                            name=obj.get("name", f"NeutralSpawn_{group_num}"),
-                            transform=transform,
-                            team=Team.NEUTRAL,
-                        )
-                        # Add to both team spawn lists for this capture point
-                        # __post_init__ ensures these are never None, but need explicit check for mypy
-                        cp_team1_spawns = capture_points[cp_index].team1_spawns
-                        cp_team2_spawns = capture_points[cp_index].team2_spawns
-                        if cp_team1_spawns is not None:
-                            cp_team1_spawns.append(spawn)
-                        if cp_team2_spawns is not None:
-                            cp_team2_spawns.append(spawn)
+            owner = cp_by_group.get(group_num) if group_num is not None else None
+            if owner is not None:
+                spawns_by_cp[id(owner)].append(spawn)
+            else:
+                unassigned.append(spawn)
 
         # Step 3: Calculate capture point positions from spawn centroids
         # The .con file positions are placeholders - real position is where spawns are
         for cp in capture_points:
-            # __post_init__ ensures these are never None, but need explicit check for mypy
-            team1_spawns = cp.team1_spawns if cp.team1_spawns is not None else []
-            team2_spawns = cp.team2_spawns if cp.team2_spawns is not None else []
-
-            if team1_spawns or team2_spawns:
-                all_spawns = team1_spawns + team2_spawns
-                total_x = sum(s.transform.position.x for s in all_spawns)
-                total_y = sum(s.transform.position.y for s in all_spawns)
-                total_z = sum(s.transform.position.z for s in all_spawns)
-                count = len(all_spawns)
+            spawns = spawns_by_cp[id(cp)]
+            if spawns:
+                total_x = total_y = total_z = 0.0
+                for spawn in spawns:
+                    position = spawn.transform.position
+                    total_x += position.x
+                    total_y += position.y
+                    total_z += position.z
+                count = len(spawns)
 
                 # Update CP transform to be at centroid of its spawns
                 cp.transform = Transform(
@@ -559,6 +608,23 @@ class RefractorEngine(IGameEngine):
                     rotation=cp.transform.rotation,  # Keep original rotation
                 )
 
+        # Step 4: Attach ungrouped neutral spawns to the nearest capture point in range
+        # (after the centroids, so they do not move the capture points)
+        if unassigned and capture_points:
+            grid = _CapturePointGrid(capture_points, NEUTRAL_SPAWN_MAX_CP_DISTANCE)
+            for spawn in unassigned:
+                nearest = grid.nearest(spawn.transform.position)
+                if nearest is not None:
+                    spawns_by_cp[id(nearest)].append(spawn)
+
+        # Add spawns to both team spawn lists of their capture point
+        for cp in capture_points:
+            # __post_init__ ensures these are never None, but need explicit check for mypy
+            if cp.team1_spawns is not None:
+                cp.team1_spawns.extend(spawns_by_cp[id(cp)])
+            if cp.team2_spawns is not None:
+                cp.team2_spawns.extend(spawns_by_cp[id(cp)])
+
         return capture_points
 
     def _parse_game_objects(self, con_files: ConFileSet) -> list[GameObject]:
@@ -571,93 +637,43 @@ class RefractorEngine(IGameEngine):
             List of GameObjects (includes vehicle spawners with vehicle type info)
         """
         game_objects = []
-        parsed_files = con_files.parse_all()
-
-        for _filename, parsed_data in parsed_files.items():
-            for obj in parsed_data["objects"]:
-                obj_name = obj.get("name", "").lower()
-                obj_type = obj.get("type", "").lower()
-
-                # Handle ObjectSpawners (vehicles and weapon emplacements) specially
-                # obj_type will be the spawner template name (e.g., "lighttankspawner")
-                # Check if this spawner template is known
-                spawner_template = self.spawner_parser.get_template(obj_type)
-                if spawner_template:
-                    # Categorize spawner types:
-                    # 1. Functional weapon emplacements (MG, TOW)
-                    # 2. Decorative static props (AA guns, artillery wrecks)
-                    # 3. Vehicle spawners (tanks, aircraft, APCs)
-
-                    functional_emplacements = {"machinegunspawner", "antitankgunspawner"}
-                    decorative_spawners = {"aagunspawner", "artilleryspawner"}
-
-                    # Functional weapon emplacements (will generate StationaryEmplacementSpawner nodes)
-                    if obj_type in functional_emplacements:
-                        transform = self.con_parser.parse_transform(obj)
-                        if transform:
-                            team = self.con_parser.parse_team(obj)
-                            properties = obj.get("properties", {}).copy()
-                            properties["spawner_type"] = "weapon_emplacement"
-                            properties["original_spawner"] = obj_type
-
-                            # Map weapon type for StationaryEmplacementGenerator
-                            if obj_type == "machinegunspawner":
-                                properties["weapon_type"] = "machinegun"
-                            elif obj_type == "antitankgunspawner":
-                                properties["weapon_type"] = "tow_launcher"
-
-                            game_objects.append(
-                                GameObject(
-                                    name=obj["name"],
-                                    asset_type="StationaryEmplacementSpawner",
-                                    transform=transform,
-                                    team=team,
-                                    properties=properties,
-                                )
-                            )
-                        continue
-
-                    # Decorative static props (AA guns → sandbags, Artillery → wrecks)
-                    if obj_type in decorative_spawners:
-                        transform = self.con_parser.parse_transform(obj)
-                        if transform:
-                            team = self.con_parser.parse_team(obj)
-                            properties = obj.get("properties", {}).copy()
-                            properties["spawner_type"] = "decorative"
-                            properties["original_spawner"] = obj_type
-
-                            game_objects.append(
-                                GameObject(
-                                    name=obj["name"],
-                                    asset_type=obj_type,  # AssetMapper will map to SandBags/WreckTank
-                                    transform=transform,
-                                    team=team,
-                                    properties=properties,
-                                )
-                            )
-                        continue
 
-                    # Regular vehicle spawners (tanks, aircraft, APCs, etc.)
+        for obj in con_files.index().objects:
+            obj_name = obj.get("name", "").lower()
+            obj_type = obj.get("type", "").lower()
+
+            # Handle ObjectSpawners (vehicles and weapon emplacements) specially
+            # obj_type will be the spawner template name (e.g., "lighttankspawner")
+            # Check if this spawner template is known
+            spawner_template = self.spawner_parser.get_template(obj_type)
+            if spawner_template:
+                # Categorize spawner types:
+                # 1. Functional weapon emplacements (MG, TOW)
+                # 2. Decorative static props (AA guns, artillery wrecks)
+                # 3. Vehicle spawners (tanks, aircraft, APCs)
+
+                functional_emplacements = {"machinegunspawner", "antitankgunspawner"}
+                decorative_spawners = {"aagunspawner", "artilleryspawner"}
+
+                # Functional weapon emplacements (will generate StationaryEmplacementSpawner nodes)
+                if obj_type in functional_emplacements:
                     transform = self.con_parser.parse_transform(obj)
                     if transform:
                         team = self.con_parser.parse_team(obj)
-
-                        # Get team-specific vehicle type from template
-                        vehicle_type = spawner_template.get_vehicle_for_team(team)
-
-                        # If no vehicle type found, use spawner name as fallback
-                        if not vehicle_type:
-                            vehicle_type = obj_type
-
-                        # Store vehicle type in properties for VehicleSpawnerGenerator
                         properties = obj.get("properties", {}).copy()
-                        properties["vehicle_type"] = vehicle_type
-                        properties["spawner_template"] = obj_type
+                        properties["spawner_type"] = "weapon_emplacement"
+                        properties["original_spawner"] = obj_type
+
+                        # Map weapon type for StationaryEmplacementGenerator
+                        if obj_type == "machinegunspawner":
+                            properties["weapon_type"] = "machinegun"
+                        elif obj_type == "antitankgunspawner":
+                            properties["weapon_type"] = "tow_launcher"
 
                         game_objects.append(
                             GameObject(
                                 name=obj["name"],
-                                asset_type=vehicle_type,  # Use vehicle type, not spawner template
+                                asset_type="StationaryEmplacementSpawner",
                                 transform=transform,
                                 team=team,
                                 properties=properties,
@@ -665,32 +681,80 @@ class RefractorEngine(IGameEngine):
                         )
                     continue
 
-                # Skip control points and spawn points (already handled)
-                if obj_type in ["controlpoint", "spawnpoint"]:
-                    continue
+                # Decorative static props (AA guns → sandbags, Artillery → wrecks)
+                if obj_type in decorative_spawners:
+                    transform = self.con_parser.parse_transform(obj)
+                    if transform:
+                        team = self.con_parser.parse_team(obj)
+                        properties = obj.get("properties", {}).copy()
+                        properties["spawner_type"] = "decorative"
+                        properties["original_spawner"] = obj_type
 
-                # Skip single-player bot spawns (al_5, ax_6, etc.)
-                # These are SpawnPoint instances used only in SP campaign
-                if self._is_spawn_point(obj_name, obj_type):
+                        game_objects.append(
+                            GameObject(
+                                name=obj["name"],
+                                asset_type=obj_type,  # AssetMapper will map to SandBags/WreckTank
+                                transform=transform,
+                                team=team,
+                                properties=properties,
+                            )
+                        )
                     continue
 
+                # Regular vehicle spawners (tanks, aircraft, APCs, etc.)
                 transform = self.con_parser.parse_transform(obj)
                 if transform:
                     team = self.con_parser.parse_team(obj)
 
+                    # Get team-specific vehicle type from template
+                    vehicle_type = spawner_template.get_vehicle_for_team(team)
+
+                    # If no vehicle type found, use spawner name as fallback
+                    if not vehicle_type:
+                        vehicle_type = obj_type
+
+                    # Store vehicle type in properties for VehicleSpawnerGenerator
+                    properties = obj.get("properties", {}).copy()
+                    properties["vehicle_type"] = vehicle_type
+                    properties["spawner_template"] = obj_type
+
                     game_objects.append(
                         GameObject(
                             name=obj["name"],
-                            asset_type=obj["type"],
+                            asset_type=vehicle_type,  # Use vehicle type, not spawner template
                             transform=transform,
                             team=team,
-                            properties=obj["properties"],
+                            properties=properties,
                         )
                     )
+                continue
+
+            # Skip control points and spawn points (already handled)
+            if obj_type in ["controlpoint", "spawnpoint"]:
+                continue
+
+            # Skip single-player bot spawns (al_5, ax_6, etc.)
+            # These are SpawnPoint instances used only in SP campaign
+            if self._is_spawn_point(obj_name, obj_type):
+                continue
+
+            transform = self.con_parser.parse_transform(obj)
+            if transform:
+                team = self.con_parser.parse_team(obj)
+
+                game_objects.append(
+                    GameObject(
+                        name=obj["name"],
+                        asset_type=obj["type"],
+                        transform=transform,
+                        team=team,
+                        properties=obj["properties"],
+                    )
+                )
 
         return game_objects
 
-    def _parse_water_bodies(self, map_path: Path, con_files: ConFileSet) -> list[GameObject]:
+    def _parse_water_bodies(self, map_path: Path, con_files: ConFileSet | None) -> list[GameObject]:
         """Extract water bodies from heightmap and terrain config.
 
         Analyzes heightmap to find terrain below waterLevel, clusters into
@@ -698,20 +762,20 @@ class RefractorEngine(IGameEngine):
 
         Args:
             map_path: Path to map directory
-            con_files: ConFileSet with terrain config
+            con_files: ConFileSet with terrain config (the map directory is
+                listed again if not given)
 
         Returns:
             List of GameObject representing water surfaces as scaled puddle decals
         """
-        import struct
-
         # Step 1: Parse waterLevel from terrain config
         # waterLevel is defined as: GeometryTemplate.waterLevel 72
-        terrain_con = map_path / "Init" / "Terrain.con"
+        files = con_files.files if con_files is not None else MapFiles(map_path)
+        terrain_con = files.find("Init/Terrain.con")
         water_level = None
 
-        if terrain_con.exists():
-            content = terrain_con.read_text()
+        if terrain_con is not None:
+            content = terrain_con.path.read_text()
             for line in content.split("\n"):
                 if "waterLevel" in line:
                     parts = line.strip().split()
@@ -727,55 +791,39 @@ class RefractorEngine(IGameEngine):
             return []
 
         # Step 2: Read heightmap
-        heightmap_path = map_path / "Heightmap.raw"
-        if not heightmap_path.exists():
+        heightmap = files.find("Heightmap.raw")
+        if heightmap is None:
             return []
+        heightmap_path = heightmap.path
 
         try:
             # Import BF1942 terrain constants
             from ...generators.constants.terrain import BF1942_DEFAULT_HEIGHT_SCALE
+            from ...terrain.heightmap import find_water_bodies, read_heightmap_raw, water_mask
 
-            data = heightmap_path.read_bytes()
-            size = int((len(data) / 2) ** 0.5)
-
-            # Parse heights and find water pixels
-            height_scale = BF1942_DEFAULT_HEIGHT_SCALE
-            water_pixels = []
-
-            for y in range(size):
-                for x in range(size):
-                    idx = y * size + x
-                    h = struct.unpack("<H", data[idx * 2 : (idx + 1) * 2])[0]
-                    h_scaled = (h / 65535.0) * height_scale
-                    if h_scaled < water_level:
-                        water_pixels.append((x, y))
+            heights = read_heightmap_raw(heightmap_path)
+            size = heights.shape[0]
 
-            if not water_pixels:
+            # Step 3: Find water pixels and cluster them into separate lakes
+            mask = water_mask(heights, water_level, BF1942_DEFAULT_HEIGHT_SCALE)
+            lakes = find_water_bodies(mask)
+            if not lakes:
                 return []
 
-            # Step 3: Cluster water pixels into separate lakes
-            clusters = self._cluster_water_pixels(water_pixels)
-
             # Step 4: Create puddle decals for each lake
             water_objects = []
             terrain_size = 1024.0  # Typical BF1942 map size
             scale_factor = terrain_size / size
 
-            for i, cluster in enumerate(clusters, 1):
-                if len(cluster) < 10:  # Skip tiny puddles (< 10 pixels)
+            for i, lake in enumerate(lakes, 1):
+                if lake.pixel_count < 10:  # Skip tiny puddles (< 10 pixels)
                     continue
 
-                # Calculate bounding box
-                min_x = min(p[0] for p in cluster)
-                max_x = max(p[0] for p in cluster)
-                min_y = min(p[1] for p in cluster)
-                max_y = max(p[1] for p in cluster)
-
-                # Convert to world coordinates (centered at origin)
-                world_min_x = (min_x * scale_factor) - (terrain_size / 2)
-                world_max_x = (max_x * scale_factor) - (terrain_size / 2)
-                world_min_z = (min_y * scale_factor) - (terrain_size / 2)
-                world_max_z = (max_y * scale_factor) - (terrain_size / 2)
+                # Convert bounding box to world coordinates (centered at origin)
+                world_min_x = (lake.min_x * scale_factor) - (terrain_size / 2)
+                world_max_x = (lake.max_x * scale_factor) - (terrain_size / 2)
+                world_min_z = (lake.min_y * scale_factor) - (terrain_size / 2)
+                world_max_z = (lake.max_y * scale_factor) - (terrain_size / 2)
 
                 # Lake center and dimensions
                 center_x = (world_min_x + world_max_x) / 2
@@ -815,44 +863,6 @@ class RefractorEngine(IGameEngine):
             print(f"  ⚠️  Failed to extract water bodies: {e}")
             return []
 
-    def _cluster_water_pixels(self, pixels: list[tuple[int, int]]) -> list[list[tuple[int, int]]]:
-        """Group water pixels into separate clusters (lakes).
-
-        Args:
-            pixels: List of (x, y) heightmap coordinates below waterLevel
-
-        Returns:
-            List of clusters, each cluster is a list of pixels
-        """
-        clusters = []
-        used = set()
-
-        for px, py in pixels:
-            if (px, py) in used:
-                continue
-
-            # Start new cluster (BFS)
-            cluster = [(px, py)]
-            used.add((px, py))
-            queue = [(px, py)]
-
-            while queue:
-                cx, cy = queue.pop(0)
-                # Check 8-connected neighbors
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        if dx == 0 and dy == 0:
-                            continue
-                        nx, ny = cx + dx, cy + dy
-                        if (nx, ny) in pixels and (nx, ny) not in used:
-                            cluster.append((nx, ny))
-                            used.add((nx, ny))
-                            queue.append((nx, ny))
-
-            clusters.append(cluster)
-
-        return clusters
-
     def _calculate_bounds(
         self,
         spawns: list[SpawnPoint],
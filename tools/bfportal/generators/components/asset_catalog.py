@@ -4,10 +4,12 @@
 Single Responsibility: Load and query Portal asset information.
 """
 
-import json
 from pathlib import Path
 
+from ...indexers.asset_types_snapshot import load_asset_types
+from ...indexers.keyword_index import AssetKeywordIndex
 from ..constants.paths import get_asset_types_path, get_godot_project_dir
+from .scene_index import SceneIndex, get_scene_index
 
 
 class AssetCatalog:
@@ -17,13 +19,18 @@ class AssetCatalog:
     lookups for asset properties like directory paths and level restrictions.
     """
 
-    def __init__(self, catalog_path: Path | None = None):
+    def __init__(self, catalog_path: Path | None = None, scene_index: SceneIndex | None = None):
         """Initialize catalog.
 
         Args:
             catalog_path: Path to asset_types.json (defaults to SDK location)
+            scene_index: Index of the project's object scenes (defaults to the
+                shared index of the SDK's GodotProject, loaded on first use)
         """
         self.catalog: dict[str, dict] = {}
+        self._keyword_index: AssetKeywordIndex | None = None
+        self._scene_index = scene_index
+        self._scene_paths: dict[tuple[str, str], str | None] = {}
         self._load_catalog(catalog_path)
 
     def _load_catalog(self, catalog_path: Path | None) -> None:
@@ -41,15 +48,13 @@ class AssetCatalog:
             return
 
         try:
-            with open(catalog_path) as f:
-                data = json.load(f)
-                for asset in data.get("AssetTypes", []):
-                    asset_type = asset.get("type")
-                    if asset_type:
-                        self.catalog[asset_type] = {
-                            "directory": asset.get("directory", ""),
-                            "level_restrictions": asset.get("levelRestrictions", []),
-                        }
+            for asset in load_asset_types(catalog_path).asset_types:
+                asset_type = asset.get("type")
+                if asset_type:
+                    self.catalog[asset_type] = {
+                        "directory": asset.get("directory", ""),
+                        "level_restrictions": asset.get("levelRestrictions", []),
+                    }
         except Exception as e:
             print(f"⚠️  Warning: Failed to load asset catalog: {e}")
 
@@ -106,8 +111,17 @@ class AssetCatalog:
 
         Note:
             Portal SDK structure varies by terrain. This method tries
-            multiple path patterns to find the correct location.
+            multiple path patterns to find the correct location, looking
+            them up in the scene index instead of on disk. Results are
+            cached per (asset_type, base_terrain).
         """
+        key = (asset_type, base_terrain)
+        if key not in self._scene_paths:
+            self._scene_paths[key] = self._resolve_scene_path(asset_type, base_terrain)
+        return self._scene_paths[key]
+
+    def _resolve_scene_path(self, asset_type: str, base_terrain: str) -> str | None:
+        """Resolve an asset's scene path (see get_scene_path())."""
         directory = self.get_directory(asset_type)
         if not directory:
             return None
@@ -155,11 +169,12 @@ class AssetCatalog:
             ]
         )
 
-        # Check which path actually exists on disk
-        godot_project = get_godot_project_dir()
+        # Check which path actually exists in the project
+        if self._scene_index is None:
+            self._scene_index = get_scene_index(get_godot_project_dir())
+        existing = self._scene_index.scenes_named(asset_type)
         for res_path in paths_to_try:
-            fs_path = godot_project / res_path.replace("res://", "")
-            if fs_path.exists():
+            if res_path in existing:
                 return res_path
 
         # If none exist, return first option (will error in Godot but structure is correct)
@@ -178,18 +193,12 @@ class AssetCatalog:
         Returns:
             List of matching asset type names
         """
-        keyword_lower = keyword.lower()
-        matches = []
-
-        for asset_type in self.catalog:
-            if keyword_lower in asset_type.lower() and (
-                terrain is None or self.is_available_on_terrain(asset_type, terrain)
-            ):
-                matches.append(asset_type)
-                if len(matches) >= limit:
-                    break
-
-        return matches
+        if self._keyword_index is None:
+            self._keyword_index = AssetKeywordIndex(
+                (asset_type, info["directory"], info["level_restrictions"])
+                for asset_type, info in self.catalog.items()
+            )
+        return self._keyword_index.search([keyword], terrain)[:limit]
 
     def get_stats(self) -> dict:
         """Get catalog statistics.
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Persisted index of the Portal SDK's object scenes (GodotProject/objects).
+
+Resolving an asset's scene used to probe up to seven candidate res:// paths
+with Path.exists() for every asset on every call, against an objects/ tree
+of thousands of .tscn files. SceneIndex lists every .tscn under objects/
+once, groups them by file stem, and persists the listing with the
+modification time of each directory. A later run only stats the few
+hundred directories to confirm the listing is current, since adding or
+removing a file changes its directory's mtime.
+
+Single Responsibility: Only handles listing the .tscn scenes of GodotProject/objects.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Bump when the layout of the index file changes
+INDEX_FORMAT_VERSION = 1
+
+# Environment variable overriding the default index directory
+CACHE_DIR_ENV = "BFPORTAL_SCENE_CACHE"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "bfportal" / "scenes"
+
+OBJECTS_DIR = "objects"
+
+
+class SceneIndex:
+    """res:// paths of the .tscn files under a Godot project's objects/ directory."""
+
+    def __init__(self, godot_project: Path, cache_dir: Path | None = None):
+        """Load the index, rescanning objects/ if it changed since it was saved.
+
+        Args:
+            godot_project: GodotProject directory
+            cache_dir: Directory for index files (default: $BFPORTAL_SCENE_CACHE,
+                then ~/.cache/bfportal/scenes)
+        """
+        self.godot_project = godot_project
+        cache_dir = Path(cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+        resolved = godot_project.resolve()
+        digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()[:12]
+        self.index_path = cache_dir / f"{resolved.name}-{digest}.json"
+        self.rescanned = False
+
+        # Project-relative directory -> mtime_ns, and res:// paths of all scenes
+        self._dirs: dict[str, int] = {}
+        self._scenes: list[str] = []
+
+        loaded = self._load()
+        if loaded is not None:
+            self._dirs, self._scenes = loaded
+        else:
+            self._scan()
+            self.rescanned = True
+            self.save()
+
+        self._by_stem: dict[str, list[str]] = {}
+        for res_path in self._scenes:
+            stem = res_path.rsplit("/", 1)[-1].removesuffix(".tscn")
+            self._by_stem.setdefault(stem, []).append(res_path)
+
+    def _load(self) -> tuple[dict[str, int], list[str]] | None:
+        """Read the saved index, or None if it is missing or any directory changed."""
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            return None
+
+        dirs: dict[str, int] = data.get("dirs", {})
+        if not dirs:
+            return None
+        for relative, mtime_ns in dirs.items():
+            try:
+                if (self.godot_project / relative).stat().st_mtime_ns != mtime_ns:
+                    return None
+            except OSError:
+                return None
+        return dirs, data.get("scenes", [])
+
+    def _scan(self) -> None:
+        """List objects/ with os.scandir, recording each directory's mtime."""
+        pending = [OBJECTS_DIR]
+        while pending:
+            relative = pending.pop()
+            directory = self.godot_project / relative
+            try:
+                self._dirs[relative] = directory.stat().st_mtime_ns
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                child = f"{relative}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(child)
+                elif entry.name.endswith(".tscn"):
+                    self._scenes.append(f"res://{child}")
+        self._scenes.sort()
+
+    def save(self) -> bool:
+        """Write the index atomically.
+
+        Returns:
+            True if the index was written, False if the cache directory is not writable
+        """
+        data = {"version": INDEX_FORMAT_VERSION, "dirs": self._dirs, "scenes": self._scenes}
+        temp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._scenes)
+
+    def scenes_named(self, stem: str) -> list[str]:
+        """Get the res:// paths of every scene with a file stem (e.g. "Birch_01_L")."""
+        return self._by_stem.get(stem, [])
+
+
+# Indexes shared by all catalogs in this process, by resolved GodotProject path
+_shared_indexes: dict[Path, SceneIndex] = {}
+
+
+def get_scene_index(godot_project: Path) -> SceneIndex:
+    """Get the process-wide scene index of a Godot project (loaded once)."""
+    key = godot_project.resolve()
+    index = _shared_indexes.get(key)
+    if index is None:
+        index = SceneIndex(godot_project)
+        _shared_indexes[key] = index
+    return index
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Inverted n-gram index for keyword search over Portal asset types.
+
+The asset fallbacks and catalog search tools look for Portal assets whose
+type name contains any of a few keywords ("tree", "rock", ...), optionally
+limited to assets available on one map. Testing every keyword against all
+of asset_types.json's thousands of entries is repeated for each unmapped
+asset. AssetKeywordIndex maps every character trigram of the lowercase type
+names (and directories) to the assets containing it, so a keyword only has
+to be checked against the assets that contain all of its trigrams.
+
+Single Responsibility: Only handles keyword lookup over asset names and directories.
+"""
+
+from collections.abc import Iterable, Sequence
+
+# Length of the indexed character n-grams
+NGRAM_SIZE = 3
+
+
+def _ngrams(text: str) -> set[str]:
+    """Get the distinct n-grams of a lowercase string."""
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class _NgramPostings:
+    """N-gram → asset ids over one text field, with substring verification."""
+
+    def __init__(self, texts: list[str]):
+        self.texts = texts
+        self.postings: dict[str, list[int]] = {}
+        for asset_id, text in enumerate(texts):
+            for gram in _ngrams(text):
+                self.postings.setdefault(gram, []).append(asset_id)
+
+    def matching(self, keyword: str) -> set[int]:
+        """Get the ids of the texts containing a lowercase keyword."""
+        if len(keyword) < NGRAM_SIZE:
+            # Too short to be indexed; such keywords are rare
+            return {i for i, text in enumerate(self.texts) if keyword in text}
+
+        lists = sorted(
+            (self.postings.get(gram, []) for gram in _ngrams(keyword)),
+            key=len,
+        )
+        candidates = set(lists[0])
+        for posting in lists[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return {i for i in candidates if keyword in self.texts[i]}
+
+
+class AssetKeywordIndex:
+    """Substring keyword search over asset types, filtered by level restrictions.
+
+    Matching is case-insensitive and keeps the semantics of
+    `any(kw in asset_type.lower() for kw in keywords)`; results come back in
+    the order the assets were given. Query results are cached, since the
+    same keyword sets are asked for again and again during a conversion.
+    """
+
+    def __init__(self, assets: Iterable[tuple[str, str, Sequence[str]]]):
+        """Build the index.
+
+        Args:
+            assets: (asset type, directory, level restrictions) per asset,
+                in catalog order
+        """
+        self.asset_types: list[str] = []
+        directories: list[str] = []
+        self._unrestricted: set[int] = set()
+        self._by_level: dict[str, set[int]] = {}
+
+        for asset_id, (asset_type, directory, level_restrictions) in enumerate(assets):
+            self.asset_types.append(asset_type)
+            directories.append(directory.lower())
+            if not level_restrictions:
+                self._unrestricted.add(asset_id)
+            for level in level_restrictions:
+                self._by_level.setdefault(level, set()).add(asset_id)
+
+        self._types = _NgramPostings([asset_type.lower() for asset_type in self.asset_types])
+        self._directories = _NgramPostings(directories)
+        self._queries: dict[tuple, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.asset_types)
+
+    def search(
+        self,
+        keywords: Iterable[str],
+        level: str | None = None,
+        include_directories: bool = False,
+    ) -> list[str]:
+        """Find the assets whose type name contains any of the keywords.
+
+        Args:
+            keywords: Keywords to look for (case-insensitive)
+            level: Only return assets available on this map (unrestricted or
+                restricted to it); None returns assets of every map
+            include_directories: Also match keywords against asset directories
+
+        Returns:
+            Matching asset types in catalog order (shared between calls; do
+            not modify)
+        """
+        keys = tuple(sorted({kw.lower() for kw in keywords}))
+        query = (keys, level, include_directories)
+        cached = self._queries.get(query)
+        if cached is not None:
+            return cached
+
+        ids: set[int] = set()
+        for keyword in keys:
+            ids |= self._types.matching(keyword)
+            if include_directories:
+                ids |= self._directories.matching(keyword)
+
+        if level is not None:
+            on_level = self._by_level.get(level, set())
+            ids = {i for i in ids if i in self._unrestricted or i in on_level}
+
+        result = [self.asset_types[i] for i in sorted(ids)]
+        self._queries[query] = result
+        return result
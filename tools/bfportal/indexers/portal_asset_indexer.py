@@ -14,6 +14,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Protocol
 
+from .asset_types_snapshot import load_asset_types
+
 # ============================================================================
 # Domain Models (Value Objects)
 # ============================================================================
@@ -111,10 +113,7 @@ class PortalSDKAssetReader:
         if not self.asset_types_path.exists():
             raise FileNotFoundError(f"Portal SDK asset file not found: {self.asset_types_path}")
 
-        with open(self.asset_types_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        asset_list = data.get("AssetTypes", [])
+        asset_list = load_asset_types(self.asset_types_path).asset_types
         return [self._parse_asset(asset_data) for asset_data in asset_list]
 
     def _parse_asset(self, asset_data: dict[str, Any]) -> PortalAsset:
@@ -2,11 +2,14 @@
 """Asset mapper implementation using the BF1942 → Portal lookup table."""
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
 from ..core.exceptions import MappingError
 from ..core.interfaces import IAssetMapper, MapContext, PortalAsset
 from ..generators.constants.paths import get_project_root
+from ..indexers.asset_types_snapshot import load_asset_types
+from ..indexers.keyword_index import AssetKeywordIndex
 
 
 class AssetMapper(IAssetMapper):
@@ -25,11 +28,21 @@ class AssetMapper(IAssetMapper):
         self.portal_assets: dict[str, PortalAsset] = {}
         self.fallback_keywords: list[dict] = []
 
-        # Load Portal asset catalog
-        with open(portal_assets_path) as f:
-            portal_data = json.load(f)
+        # Lookup indexes over self.mappings, rebuilt by load_mappings()
+        self._keys_by_lower: dict[str, str] = {}
+        self._category_candidates: dict[str, list[tuple[str, dict, PortalAsset]]] = {}
+        self._ranked_alternatives: dict[tuple, list[tuple[str, dict, PortalAsset]]] = {}
 
-        for asset in portal_data.get("AssetTypes", []):
+        # map_asset() results (or MappingErrors) by (source asset, context fields),
+        # and diagnostics already printed (since the last load or map_assets() call)
+        self._results: dict[tuple, PortalAsset | MappingError | None] = {}
+        self._reported: set[str] = set()
+
+        # Keyword search over self.portal_assets, built on first catalog search
+        self._keyword_index: AssetKeywordIndex | None = None
+
+        # Load Portal asset catalog (shared with the other catalog users in this process)
+        for asset in load_asset_types(portal_assets_path).asset_types:
             self.portal_assets[asset["type"]] = PortalAsset(
                 type=asset["type"],
                 directory=asset.get("directory", ""),
@@ -112,11 +125,94 @@ class AssetMapper(IAssetMapper):
                             "fallbacks": fallbacks,
                         }
 
+        self._build_indexes()
         print(f"✅ Loaded {len(self.mappings)} asset mappings from {mappings_file.name}")
 
+    def _build_indexes(self) -> None:
+        """Build the lookup indexes over the loaded mappings.
+
+        - Lowercase asset name → mapping key (first key wins, as in the
+          mappings file order)
+        - Category → (asset, mapping, Portal asset) for every mapping whose
+          Portal asset exists in the catalog
+
+        Ranked alternatives per (category, target map) are derived from the
+        category index on first use and kept until the next load.
+        """
+        self._keys_by_lower = {}
+        self._category_candidates = {}
+        self._ranked_alternatives = {}
+        self._results = {}
+        self._reported = set()
+
+        for bf_asset, mapping in self.mappings.items():
+            self._keys_by_lower.setdefault(bf_asset.lower(), bf_asset)
+
+            portal_asset = self.portal_assets.get(mapping["portal_type"])
+            if portal_asset is not None:
+                self._category_candidates.setdefault(mapping["category"], []).append(
+                    (bf_asset, mapping, portal_asset)
+                )
+
     def map_asset(self, source_asset: str, context: MapContext) -> PortalAsset | None:
         """Map BF1942 asset to Portal equivalent using preferred + alternatives cascade.
 
+        Results are memoized per (source_asset, context) until the next
+        load_mappings(), so a map with thousands of objects but a few hundred
+        asset types resolves (and reports) each type once.
+
+        Args:
+            source_asset: BF1942 asset type name
+            context: Context for mapping decisions
+
+        Returns:
+            PortalAsset if mapping found and compatible, None otherwise
+
+        Raises:
+            MappingError: If mapping exists but no compatible asset found
+        """
+        key = (source_asset, context.target_base_map, context.era, context.theme, context.team)
+        if key not in self._results:
+            try:
+                self._results[key] = self._resolve_asset(source_asset, context)
+            except MappingError as e:
+                self._results[key] = e
+
+        result = self._results[key]
+        if isinstance(result, MappingError):
+            raise result
+        return result
+
+    def map_assets(
+        self, source_assets: Iterable[str], context: MapContext
+    ) -> dict[str, PortalAsset | None]:
+        """Map many BF1942 assets, resolving each distinct name once.
+
+        Args:
+            source_assets: BF1942 asset type names (repeats are fine)
+            context: Context for mapping decisions
+
+        Returns:
+            Dictionary mapping each distinct name, in first-seen order, to its
+            PortalAsset, or None if it is unmapped or could not be mapped
+            (reported once per name)
+        """
+        # Diagnostics are deduplicated per call, so each map gets its own
+        self._reported = set()
+        results: dict[str, PortalAsset | None] = {}
+        for source_asset in source_assets:
+            if source_asset in results:
+                continue
+            try:
+                results[source_asset] = self.map_asset(source_asset, context)
+            except Exception as e:
+                self._report(f"  ⚠️  Failed to map {source_asset}: {e}")
+                results[source_asset] = None
+        return results
+
+    def _resolve_asset(self, source_asset: str, context: MapContext) -> PortalAsset | None:
+        """Map BF1942 asset to Portal equivalent, without memoization.
+
         New Logic (preferred + alternatives):
         1. Try preferred asset (portal_equivalent)
         2. If unavailable, try explicit alternatives[] in order
@@ -139,11 +235,7 @@ class AssetMapper(IAssetMapper):
         asset_key = source_asset
         if source_asset not in self.mappings:
             # Try case-insensitive lookup
-            source_lower = source_asset.lower()
-            for key in self.mappings:
-                if key.lower() == source_lower:
-                    asset_key = key
-                    break
+            asset_key = self._keys_by_lower.get(source_asset.lower(), source_asset)
 
         # Check if we have a mapping (do this BEFORE terrain element check)
         # This allows us to map water bodies like lakes to crater decals
@@ -188,7 +280,7 @@ class AssetMapper(IAssetMapper):
             if self._is_asset_available_on_map(portal_asset, target_map):
                 # Found a match!
                 if asset_type_label != "preferred":
-                    print(
+                    self._report(
                         f"  🔄 Using {asset_type_label}: {portal_type} "
                         f"for {source_asset} on {target_map}"
                     )
@@ -207,7 +299,9 @@ class AssetMapper(IAssetMapper):
         # Complete failure - no compatible asset found
         # For vegetation assets, skip silently (some terrains don't have bushes/trees)
         if mapping["category"] in ["vegetation", "foliage", "plant"]:
-            print(f"  ℹ️  Skipping {source_asset}: No compatible vegetation found on {target_map}")
+            self._report(
+                f"  ℹ️  Skipping {source_asset}: No compatible vegetation found on {target_map}"
+            )
             return None
 
         # For critical assets (vehicles, spawns, objectives), raise error
@@ -236,85 +330,91 @@ class AssetMapper(IAssetMapper):
         # Get type keywords from config
         _source_keywords, portal_keywords = self._get_type_keywords(source_asset)
 
-        # Look for other mappings in the same category
-        category_mappings = []
-        for bf_asset, mapping in self.mappings.items():
-            if mapping["category"] != category or bf_asset == source_asset:
-                continue
+        # Best other mapping in the same category: the top-ranked one matching the
+        # type keywords, or the top-ranked one at all when there are no keywords.
+        # If no mapping matches the keywords, don't settle for the wrong type and
+        # fall through to the catalog search instead
+        for bf_asset, _mapping, portal_asset in self._get_ranked_alternatives(
+            category, target_map, tuple(portal_keywords)
+        ):
+            if bf_asset != source_asset:
+                self._print_alternative_message(portal_asset, source_asset, target_map)
+                return portal_asset
 
-            portal_type = mapping["portal_type"]
-            if portal_type not in self.portal_assets:
-                continue
+        # Step 2: If no mapped alternatives found, search entire Portal catalog for type matches
+        if portal_keywords:
+            # All catalog assets available on the map that match type keywords
+            catalog_matches = [
+                self.portal_assets[portal_type]
+                for portal_type in self._get_keyword_index().search(portal_keywords, target_map)
+            ]
+
+            # Prefer map-restricted (more specific) over unrestricted, in catalog order
+            catalog_asset = next(
+                (asset for asset in catalog_matches if asset.level_restrictions),
+                catalog_matches[0] if catalog_matches else None,
+            )
+            if catalog_asset is not None:
+                self._report(
+                    f"  ℹ️  Using catalog alternative: {catalog_asset.type} for {source_asset}"
+                )
+                return catalog_asset
 
-            portal_asset = self.portal_assets[portal_type]
+        return None
 
-            # Check if asset is available (unrestricted or on target map)
-            if self._is_asset_available_on_map(portal_asset, target_map):
-                category_mappings.append((bf_asset, mapping, portal_asset))
+    def _get_ranked_alternatives(
+        self, category: str, target_map: str, portal_keywords: tuple[str, ...]
+    ) -> list[tuple[str, dict, PortalAsset]]:
+        """Get a category's mappings available on a map, best alternative first.
 
-        # Sort by: 1) matching type keywords, 2) map-restricted over unrestricted, 3) confidence
-        def sort_key(item):
-            bf_asset, mapping, portal_asset = item
-            portal_type = mapping["portal_type"].lower()
+        Candidates are ranked by 1) map-restricted over unrestricted (more
+        specific/appropriate), 2) confidence, keeping file order for ties. With
+        type keywords, only candidates whose Portal type matches one are kept.
+        Each list is computed once per load_mappings().
 
-            # Check if portal asset matches any type keywords
-            type_match = (
-                any(kw in portal_type for kw in portal_keywords) if portal_keywords else False
-            )
+        Args:
+            category: Asset category (vehicle, building, prop, etc.)
+            target_map: Target map name (e.g., 'MP_Tungsten')
+            portal_keywords: Portal type keywords, or () for no filtering
 
-            # Prefer map-restricted assets (more specific/appropriate) over unrestricted ones
-            is_restricted = bool(portal_asset.level_restrictions)
-
-            # Return tuple: (type_match, is_restricted, confidence)
-            # Prioritizes: 1) type matches, 2) map-specific assets, 3) confidence
-            return (int(type_match), int(is_restricted), mapping["confidence"])
-
-        category_mappings.sort(key=sort_key, reverse=True)
-
-        # Return first available asset (already filtered for availability)
-        if category_mappings:
-            bf_asset, mapping, portal_asset = category_mappings[0]
-
-            # If we have type keywords, only return if first asset matches them
-            # Otherwise fall through to catalog search
-            if portal_keywords:
-                portal_type_lower = portal_asset.type.lower()
-                if not any(kw in portal_type_lower for kw in portal_keywords):
-                    # First result doesn't match type - don't settle for wrong type
-                    # Fall through to catalog search instead
-                    pass
-                else:
-                    # Matches type keywords!
-                    self._print_alternative_message(portal_asset, source_asset, target_map)
-                    return portal_asset
-            else:
-                # No type keywords - return best match by category
-                self._print_alternative_message(portal_asset, source_asset, target_map)
-                return portal_asset
+        Returns:
+            Ranked (BF1942 asset, mapping, Portal asset) candidates
+        """
+        key = (category, target_map, portal_keywords)
+        ranked = self._ranked_alternatives.get(key)
+        if ranked is not None:
+            return ranked
 
-        # Step 2: If no mapped alternatives found, search entire Portal catalog for type matches
         if portal_keywords:
-            # Collect all matching assets from catalog
-            catalog_matches = []
-            for portal_type, portal_asset in self.portal_assets.items():
-                portal_type_lower = portal_type.lower()
-
-                # Check if this Portal asset matches type keywords
-                if any(
-                    kw in portal_type_lower for kw in portal_keywords
-                ) and self._is_asset_available_on_map(portal_asset, target_map):
-                    catalog_matches.append((portal_type, portal_asset))
-
-            # Sort: prefer map-restricted (more specific) over unrestricted
-            catalog_matches.sort(key=lambda x: bool(x[1].level_restrictions), reverse=True)
-
-            # Return first match (most appropriate)
-            if catalog_matches:
-                portal_type, portal_asset = catalog_matches[0]
-                print(f"  ℹ️  Using catalog alternative: {portal_type} for {source_asset}")
-                return portal_asset
-
-        return None
+            ranked = [
+                candidate
+                for candidate in self._get_ranked_alternatives(category, target_map, ())
+                if any(kw in candidate[2].type.lower() for kw in portal_keywords)
+            ]
+        else:
+            ranked = [
+                candidate
+                for candidate in self._category_candidates.get(category, [])
+                if self._is_asset_available_on_map(candidate[2], target_map)
+            ]
+            ranked.sort(
+                key=lambda candidate: (
+                    bool(candidate[2].level_restrictions),
+                    candidate[1]["confidence"],
+                ),
+                reverse=True,
+            )
+        self._ranked_alternatives[key] = ranked
+        return ranked
+
+    def _get_keyword_index(self) -> AssetKeywordIndex:
+        """Get the keyword index over the Portal catalog, building it on first use."""
+        if self._keyword_index is None:
+            self._keyword_index = AssetKeywordIndex(
+                (asset.type, asset.directory, asset.level_restrictions)
+                for asset in self.portal_assets.values()
+            )
+        return self._keyword_index
 
     def get_mapping_info(self, source_asset: str) -> dict | None:
         """Get detailed mapping information for an asset.
@@ -405,13 +505,26 @@ class AssetMapper(IAssetMapper):
             DRY helper - eliminates repeated print logic.
         """
         if not portal_asset.level_restrictions:
-            print(f"  ℹ️  Using unrestricted alternative: {portal_asset.type} for {source_asset}")
+            self._report(
+                f"  ℹ️  Using unrestricted alternative: {portal_asset.type} for {source_asset}"
+            )
         else:
-            print(
+            self._report(
                 f"  ℹ️  Using map-compatible alternative: {portal_asset.type} "
                 f"for {source_asset} on {target_map}"
             )
 
+    def _report(self, message: str) -> None:
+        """Print a mapping diagnostic, unless it was already printed.
+
+        Note:
+            Objects of the same type produce the same messages; printing each
+            once keeps the conversion log readable.
+        """
+        if message not in self._reported:
+            self._reported.add(message)
+            print(message)
+
     def _is_terrain_element(self, source_asset: str) -> bool:
         """Check if asset is a terrain element that should be skipped.
 
@@ -429,7 +542,7 @@ class AssetMapper(IAssetMapper):
 
         # Water bodies - Portal has limited water support
         if any(kw in source_lower for kw in ["lake", "river", "ocean", "sea", "pond"]):
-            print(
+            self._report(
                 f"  ℹ️  Skipping terrain element: {source_asset} "
                 f"(water bodies not supported in Portal SDK)"
             )
@@ -437,7 +550,7 @@ class AssetMapper(IAssetMapper):
 
         # Terrain objects
         if "terrain" in source_lower and "object" in source_lower:
-            print(
+            self._report(
                 f"  ℹ️  Skipping terrain element: {source_asset} "
                 f"(terrain reference, not a placeable object)"
             )
@@ -463,16 +576,13 @@ class AssetMapper(IAssetMapper):
 
         # If we matched a category, search Portal catalog
         if portal_keywords:
-            for portal_type, portal_asset in self.portal_assets.items():
-                portal_type_lower = portal_type.lower()
-
-                if any(
-                    kw in portal_type_lower for kw in portal_keywords
-                ) and self._is_asset_available_on_map(portal_asset, target_map):
-                    print(
-                        f"  ℹ️  Using best-guess fallback: {portal_type} for unmapped {source_asset}"
-                    )
-                    return portal_asset
+            matches = self._get_keyword_index().search(portal_keywords, target_map)
+            if matches:
+                portal_type = matches[0]
+                self._report(
+                    f"  ℹ️  Using best-guess fallback: {portal_type} for unmapped {source_asset}"
+                )
+                return self.portal_assets[portal_type]
 
         # No reasonable guess found
         return None
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Persistent on-disk cache of parsed .con files.
+
+Re-running a conversion after editing one .con file used to re-parse every
+file of the map. ConParseCache keeps the parse results of a map directory in
+one JSON file, each entry stamped with its source file's size and mtime
+(plus a digest of the statements it was parsed from, for scripts reached
+through run/include), so only files that changed are parsed again.
+
+Single Responsibility: Only handles storing and loading parsed .con results.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+# Bump when the layout or meaning of cached parse results changes
+CACHE_FORMAT_VERSION = 1
+
+# Environment variable overriding the default cache directory
+CACHE_DIR_ENV = "BFPORTAL_CON_CACHE"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "bfportal" / "con"
+
+
+class ConParseCache:
+    """Parse results of one map's .con files, keyed by file path and stamp.
+
+    The cache file is read once, on first use, and written by save() only
+    when entries were added or replaced.
+    """
+
+    def __init__(self, map_dir: Path, cache_dir: Path | None = None):
+        """Initialize cache.
+
+        Args:
+            map_dir: Map directory whose files are cached
+            cache_dir: Directory for cache files (default: $BFPORTAL_CON_CACHE,
+                then ~/.cache/bfportal/con)
+        """
+        self.cache_dir = Path(cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+        resolved = Path(map_dir).resolve()
+        digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()[:12]
+        self.cache_path = self.cache_dir / f"{resolved.name}-{digest}.json"
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+
+    @staticmethod
+    def stamp(con_file: Path, statements: list[str] | None = None) -> list[Any] | None:
+        """Get the stamp a cached parse of a file must match.
+
+        Args:
+            con_file: Path to .con file
+            statements: Active statements the file is parsed from, if it is
+                not parsed whole
+
+        Returns:
+            [size, mtime_ns, statements digest], or None if the file is unreadable
+        """
+        try:
+            stat = con_file.stat()
+        except OSError:
+            return None
+        digest = ""
+        if statements is not None:
+            text = "\n".join(statements).encode("utf-8")
+            digest = hashlib.blake2b(text, digest_size=16).hexdigest()
+        return [stat.st_size, stat.st_mtime_ns, digest]
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Read the cache file on first use (a missing or unreadable file is empty)."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.cache_path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                return self._entries
+            if isinstance(data, dict) and data.get("version") == CACHE_FORMAT_VERSION:
+                self._entries = data.get("files", {})
+        return self._entries
+
+    def get(self, con_file: Path, stamp: list[Any] | None) -> dict[str, Any] | None:
+        """Get a cached parse if the file still matches its stamp.
+
+        Args:
+            con_file: Path to .con file
+            stamp: Current stamp from stamp()
+
+        Returns:
+            Parsed data, or None on a miss (counted in hits/misses)
+        """
+        entry = self._load().get(str(con_file)) if stamp is not None else None
+        if entry is not None and entry.get("stamp") == stamp:
+            parsed = entry.get("parsed")
+            if isinstance(parsed, dict):
+                self.hits += 1
+                return parsed
+        self.misses += 1
+        return None
+
+    def put(self, con_file: Path, stamp: list[Any] | None, parsed: dict[str, Any]) -> None:
+        """Store a parse result under the stamp of the file it was parsed from.
+
+        Args:
+            con_file: Path to .con file
+            stamp: Stamp from stamp(), taken before the file was parsed
+            parsed: Parse result
+        """
+        if stamp is None:
+            return
+        self._load()[str(con_file)] = {"stamp": stamp, "parsed": parsed}
+        self._dirty = True
+
+    def save(self) -> bool:
+        """Write the cache file if entries changed since it was read.
+
+        The file is written to a temporary name and renamed into place, so
+        concurrent readers never see a partial cache.
+
+        Returns:
+            True if the cache is up to date on disk, False if it is not writable
+        """
+        if not self._dirty:
+            return True
+
+        data = {"version": CACHE_FORMAT_VERSION, "files": self._entries}
+        temp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return False
+        self._dirty = False
+        return True
@@ -7,11 +7,123 @@
 
 import contextlib
 import re
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Any
 
 from ..core.exceptions import ParseError
 from ..core.interfaces import IParser, Rotation, Team, Transform, Vector3
+from .con_parse_cache import ConParseCache
+from .con_preprocessor import ConPreprocessor, ConScriptCache
+from .map_files import GAME_MODES, INIT_MODE, MapFiles
+
+# Lines starting with these are comments
+_COMMENT_PREFIXES = ("rem ", "//")
+
+# Arguments of ObjectTemplate.create <type> <name> and Object.create <name>
+_TEMPLATE_CREATE_ARGS = re.compile(r"(\w+)\s+(\w+)")
+_NAME_ARG = re.compile(r"\w+")
+
+# x/y/z arguments (positions, rotations, scales); trailing text is ignored
+_VECTOR_ARGS = re.compile(r"([\d\.\-eE]+)/([\d\.\-eE]+)/([\d\.\-eE]+)")
+_TEAM_ARG = re.compile(r"\d+")
+
+# Generic properties are stored for <receiver>.<name> <value> commands
+_PROPERTY_RECEIVERS = ("ObjectTemplate.", "Object.")
+_PROPERTY_NAME = re.compile(r"\w+")
+
+
+def _tokenize(line: str) -> tuple[str, str]:
+    """Split a stripped line into its command and argument string.
+
+    Args:
+        line: Stripped .con line (e.g. "ObjectTemplate.setPosition 1/2/3")
+
+    Returns:
+        Tuple of (command, args), args being "" for bare commands
+    """
+    parts = line.split(None, 1)
+    return (parts[0], parts[1]) if len(parts) == 2 else (parts[0], "")
+
+
+def _parse_vector(args: str) -> tuple[float, float, float] | None:
+    """Parse x/y/z arguments, or None if they are not a vector."""
+    match = _VECTOR_ARGS.match(args)
+    if not match:
+        return None
+    x, y, z = match.groups()
+    return float(x), float(y), float(z)
+
+
+def _set_position(args: str, obj: dict[str, Any]) -> bool:
+    """Handle setPosition / absolutePosition x/y/z."""
+    vector = _parse_vector(args)
+    if vector is None:
+        return False
+    obj["position"] = {"x": vector[0], "y": vector[1], "z": vector[2]}
+    return True
+
+
+def _set_rotation(args: str, obj: dict[str, Any]) -> bool:
+    """Handle setRotation / rotation pitch/yaw/roll."""
+    vector = _parse_vector(args)
+    if vector is None:
+        return False
+    obj["rotation"] = {"pitch": vector[0], "yaw": vector[1], "roll": vector[2]}
+    return True
+
+
+def _set_scale(args: str, obj: dict[str, Any]) -> bool:
+    """Handle geometry.scale x/y/z."""
+    vector = _parse_vector(args)
+    if vector is None:
+        return False
+    obj["scale"] = {"x": vector[0], "y": vector[1], "z": vector[2]}
+    return True
+
+
+def _set_team(args: str, obj: dict[str, Any]) -> bool:
+    """Handle setTeam <team>."""
+    match = _TEAM_ARG.match(args)
+    if not match:
+        return False
+    obj["team"] = int(match.group())
+    return True
+
+
+# Commands with structured values; others are stored as generic properties
+_PROPERTY_HANDLERS: dict[str, Callable[[str, dict[str, Any]], bool]] = {
+    "ObjectTemplate.setPosition": _set_position,
+    "Object.absolutePosition": _set_position,  # BF1942 instance format
+    "ObjectTemplate.setRotation": _set_rotation,
+    "Object.rotation": _set_rotation,  # BF1942 instance format
+    "Object.geometry.scale": _set_scale,  # BF1942 scale format
+    "ObjectTemplate.setTeam": _set_team,
+    "Object.setTeam": _set_team,  # BF1942 instance format
+}
+
+
+def _apply_property(command: str, args: str, obj: dict[str, Any]) -> None:
+    """Apply one tokenized property line to an object.
+
+    Args:
+        command: Command name (e.g. "ObjectTemplate.setPosition")
+        args: Argument string
+        obj: Object dictionary to update
+    """
+    handler = _PROPERTY_HANDLERS.get(command)
+    if handler and handler(args, obj):
+        return
+
+    # Generic property: ObjectTemplate.<property> <value> / Object.<property> <value>
+    if not args:
+        return
+    for receiver in _PROPERTY_RECEIVERS:
+        if command.startswith(receiver):
+            prop_name = command[len(receiver) :]
+            if _PROPERTY_NAME.fullmatch(prop_name):
+                obj["properties"][prop_name] = args
+            return
 
 
 class ConParser(IParser):
@@ -35,11 +147,13 @@ class ConParser(IParser):
         """
         return file_path.suffix.lower() == ".con"
 
-    def parse(self, file_path: Path) -> dict[str, Any]:
+    def parse(self, file_path: Path, keep_raw_content: bool = False) -> dict[str, Any]:
         """Parse .con file and return structured data.
 
         Args:
             file_path: Path to .con file
+            keep_raw_content: Also return the file text as "raw_content"
+                (the file is then read whole instead of streamed)
 
         Returns:
             Dictionary with parsed objects and properties
@@ -47,6 +161,9 @@ class ConParser(IParser):
         Raises:
             ParseError: If file cannot be parsed
         """
+        if not keep_raw_content:
+            return {"file": str(file_path), "objects": list(self.iter_objects(file_path))}
+
         if not file_path.exists():
             raise ParseError(f"File not found: {file_path}")
 
@@ -61,6 +178,48 @@ class ConParser(IParser):
 
         return {"file": str(file_path), "objects": objects, "raw_content": content}
 
+    def iter_objects(self, file_path: Path) -> Iterator[dict[str, Any]]:
+        """Stream object definitions from a .con file.
+
+        The file is read line by line and each object is yielded as soon as
+        the next create line (or the end of the file) closes it, so the file
+        text is never held in memory.
+
+        Args:
+            file_path: Path to .con file
+
+        Yields:
+            Object dictionaries in file order
+
+        Raises:
+            ParseError: If file cannot be read (raised on first iteration)
+        """
+        if not file_path.exists():
+            raise ParseError(f"File not found: {file_path}")
+
+        try:
+            f = open(file_path, encoding="utf-8", errors="ignore")  # noqa: SIM115
+        except Exception as e:
+            raise ParseError(f"Failed to read {file_path}: {e}") from e
+
+        with f:
+            try:
+                yield from self._iter_objects(f)
+            except OSError as e:
+                raise ParseError(f"Failed to read {file_path}: {e}") from e
+
+    def parse_lines(self, lines: Iterable[str], file_path: Path) -> dict[str, Any]:
+        """Parse already-read .con lines (e.g. the active statements of a script).
+
+        Args:
+            lines: Script lines
+            file_path: Path the lines were read from
+
+        Returns:
+            Dictionary with parsed objects, shaped like parse()
+        """
+        return {"file": str(file_path), "objects": list(self._iter_objects(lines))}
+
     def _parse_objects(self, content: str) -> list[dict[str, Any]]:
         """Parse object definitions from .con file content.
 
@@ -70,126 +229,64 @@ class ConParser(IParser):
         Returns:
             List of object dictionaries
         """
-        objects: list[dict[str, Any]] = []
+        return list(self._iter_objects(content.split("\n")))
+
+    def _iter_objects(self, lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+        """Parse object definitions from .con lines, yielding each as it closes.
+
+        Each line is split once into a command and its arguments and
+        dispatched by command name.
+
+        Args:
+            lines: File lines (with or without line endings)
+
+        Yields:
+            Object dictionaries in file order
+        """
         current_object: dict[str, Any] | None = None
 
-        for line in content.split("\n"):
+        for line in lines:
             line = line.strip()
 
             # Skip empty lines and comments
-            if not line or line.startswith(("rem ", "//")):
+            if not line or line.startswith(_COMMENT_PREFIXES):
                 continue
 
-            # ObjectTemplate.create <type> <name> (template definition)
-            create_match = re.match(r"ObjectTemplate\.create\s+(\w+)\s+(\w+)", line)
-            if create_match:
-                if current_object:
-                    objects.append(current_object)
+            command, args = _tokenize(line)
 
-                object_type, object_name = create_match.groups()
-                current_object = {"name": object_name, "type": object_type, "properties": {}}
-                continue
+            # ObjectTemplate.create <type> <name> (template definition)
+            if command == "ObjectTemplate.create":
+                create_match = _TEMPLATE_CREATE_ARGS.match(args)
+                if create_match:
+                    if current_object:
+                        yield current_object
+
+                    object_type, object_name = create_match.groups()
+                    current_object = {"name": object_name, "type": object_type, "properties": {}}
+                    continue
 
             # Object.create <name> (instance definition - use name as type)
-            instance_match = re.match(r"Object\.create\s+(\w+)", line)
-            if instance_match:
-                if current_object:
-                    objects.append(current_object)
-
-                object_name = instance_match.group(1)
-                current_object = {
-                    "name": object_name,
-                    "type": object_name,  # Use instance name as type
-                    "properties": {},
-                }
-                continue
+            elif command == "Object.create":
+                instance_match = _NAME_ARG.match(args)
+                if instance_match:
+                    if current_object:
+                        yield current_object
+
+                    object_name = instance_match.group()
+                    current_object = {
+                        "name": object_name,
+                        "type": object_name,  # Use instance name as type
+                        "properties": {},
+                    }
+                    continue
 
             # If we're inside an object definition, parse properties
             if current_object:
-                self._parse_property(line, current_object)
+                _apply_property(command, args, current_object)
 
-        # Add the last object
+        # Yield the last object
         if current_object:
-            objects.append(current_object)
-
-        return objects
-
-    def _parse_property(self, line: str, obj: dict[str, Any]) -> None:
-        """Parse a property line and add to object.
-
-        Args:
-            line: Property line from .con file
-            obj: Object dictionary to update
-        """
-        # ObjectTemplate.setPosition x/y/z
-        pos_match = re.match(
-            r"ObjectTemplate\.setPosition\s+([\d\.\-eE]+)/([\d\.\-eE]+)/([\d\.\-eE]+)", line
-        )
-        if pos_match:
-            x, y, z = map(float, pos_match.groups())
-            obj["position"] = {"x": x, "y": y, "z": z}
-            return
-
-        # Object.absolutePosition x/y/z (BF1942 instance format)
-        abs_pos_match = re.match(
-            r"Object\.absolutePosition\s+([\d\.\-eE]+)/([\d\.\-eE]+)/([\d\.\-eE]+)", line
-        )
-        if abs_pos_match:
-            x, y, z = map(float, abs_pos_match.groups())
-            obj["position"] = {"x": x, "y": y, "z": z}
-            return
-
-        # ObjectTemplate.setRotation pitch/yaw/roll
-        rot_match = re.match(
-            r"ObjectTemplate\.setRotation\s+([\d\.\-eE]+)/([\d\.\-eE]+)/([\d\.\-eE]+)", line
-        )
-        if rot_match:
-            pitch, yaw, roll = map(float, rot_match.groups())
-            obj["rotation"] = {"pitch": pitch, "yaw": yaw, "roll": roll}
-            return
-
-        # Object.rotation pitch/yaw/roll (BF1942 instance format)
-        inst_rot_match = re.match(
-            r"Object\.rotation\s+([\d\.\-eE]+)/([\d\.\-eE]+)/([\d\.\-eE]+)", line
-        )
-        if inst_rot_match:
-            pitch, yaw, roll = map(float, inst_rot_match.groups())
-            obj["rotation"] = {"pitch": pitch, "yaw": yaw, "roll": roll}
-            return
-
-        # Object.geometry.scale x/y/z (BF1942 scale format)
-        scale_match = re.match(
-            r"Object\.geometry\.scale\s+([\d\.\-eE]+)/([\d\.\-eE]+)/([\d\.\-eE]+)", line
-        )
-        if scale_match:
-            x, y, z = map(float, scale_match.groups())
-            obj["scale"] = {"x": x, "y": y, "z": z}
-            return
-
-        # ObjectTemplate.setTeam <team>
-        team_match = re.match(r"ObjectTemplate\.setTeam\s+(\d+)", line)
-        if team_match:
-            obj["team"] = int(team_match.group(1))
-            return
-
-        # Object.setTeam <team> (BF1942 instance format)
-        inst_team_match = re.match(r"Object\.setTeam\s+(\d+)", line)
-        if inst_team_match:
-            obj["team"] = int(inst_team_match.group(1))
-            return
-
-        # Generic property: ObjectTemplate.<property> <value>
-        prop_match = re.match(r"ObjectTemplate\.(\w+)\s+(.+)", line)
-        if prop_match:
-            prop_name, prop_value = prop_match.groups()
-            obj["properties"][prop_name] = prop_value.strip()
-            return
-
-        # Generic property: Object.<property> <value> (BF1942 instance format)
-        inst_prop_match = re.match(r"Object\.(\w+)\s+(.+)", line)
-        if inst_prop_match:
-            prop_name, prop_value = inst_prop_match.groups()
-            obj["properties"][prop_name] = prop_value.strip()
+            yield current_object
 
     def parse_transform(self, obj_dict: dict[str, Any]) -> Transform | None:
         """Extract Transform from parsed object dictionary.
@@ -253,6 +350,47 @@ class ConParser(IParser):
             return Team.NEUTRAL
 
 
+class ConObjectIndex:
+    """Objects parsed from a set of .con files, with lookup views.
+
+    Views share the parsed object dictionaries and keep file order; keys
+    are lowercased because Refractor names are case-insensitive.
+    """
+
+    def __init__(self, parsed_files: Mapping[str, dict[str, Any]] | Mapping[Path, dict[str, Any]]):
+        """Build the views.
+
+        Args:
+            parsed_files: Dictionary mapping file paths (or filenames) to
+                parsed data; files sharing a name (e.g. Init.con and
+                Conquest/Init.con) are all kept
+        """
+        self.objects: list[dict[str, Any]] = []
+        self.by_file: dict[str, list[dict[str, Any]]] = {}
+        self.by_type: dict[str, list[dict[str, Any]]] = {}
+        self.by_name: dict[str, list[dict[str, Any]]] = {}
+
+        for filename, parsed_data in parsed_files.items():
+            file_objects = self.by_file.setdefault(Path(filename).name.lower(), [])
+            for obj in parsed_data["objects"]:
+                self.objects.append(obj)
+                file_objects.append(obj)
+                self.by_type.setdefault(obj.get("type", "").lower(), []).append(obj)
+                self.by_name.setdefault(obj.get("name", "").lower(), []).append(obj)
+
+    def of_type(self, object_type: str) -> list[dict[str, Any]]:
+        """Get objects of a type (e.g. "SpawnPoint", or a template name for instances)."""
+        return self.by_type.get(object_type.lower(), [])
+
+    def named(self, name: str) -> list[dict[str, Any]]:
+        """Get objects (templates and instances) with a name."""
+        return self.by_name.get(name.lower(), [])
+
+    def in_file(self, filename: str) -> list[dict[str, Any]]:
+        """Get the objects parsed from every file with a name (e.g. "ControlPoints.con")."""
+        return self.by_file.get(filename.lower(), [])
+
+
 class ConFileSet:
     """Manages a set of related .con files for a map.
 
@@ -261,44 +399,104 @@ class ConFileSet:
     - Spawns.con: Spawn points
     - ControlPoints.con: Capture points
     - etc.
+
+    Files are selected for the game mode by path convention, plus every
+    script reached from Init.con through run/include directives. Reached
+    scripts contribute only the statements active for the game mode.
+
+    Each file is parsed once and reused until its modification time changes,
+    so the conversion steps can all read from the same parse. Parse results
+    are also persisted, so a later run only re-parses the files that changed.
     """
 
-    def __init__(self, map_dir: Path):
+    def __init__(
+        self,
+        map_dir: Path,
+        game_mode: str = "Conquest",
+        script_cache: ConScriptCache | None = None,
+        parse_cache: ConParseCache | None = None,
+        files: MapFiles | None = None,
+    ):
         """Initialize with map directory.
 
         Args:
             map_dir: Path to map directory (extracted RFA)
+            game_mode: Game mode whose files are loaded (e.g., "Conquest")
+            script_cache: Parsed script cache for the run/include preprocessor
+                (defaults to the process-wide cache shared by all maps)
+            parse_cache: Persistent parse cache (defaults to the map's cache
+                file in the default cache directory)
+            files: Files of the map directory (scanned if not given); shared
+                with the preprocessor and available to other consumers as
+                self.files
         """
         self.map_dir = map_dir
+        self.game_mode = game_mode
         self.parser = ConParser()
+        self.parse_cache = parse_cache if parse_cache is not None else ConParseCache(map_dir)
+        self.files = files if files is not None else MapFiles(map_dir)
         self.con_files: list[Path] = []
+        self._parsed: dict[Path, tuple[int, dict[str, Any]]] = {}
+        self._index: tuple[tuple[int | None, ...], ConObjectIndex] | None = None
+        self._preprocessor = ConPreprocessor(map_dir, script_cache, self.files)
+        self._statements: dict[Path, list[str]] = {}
+        self._statement_mtimes: tuple[int | None, ...] = ()
+
+        # Filter to ONLY the selected game mode's files (avoid conflicts from TDM, CTF,
+        # SinglePlayer). This ensures we get consistent vehicle assignments and gameplay
+        # objects. ALSO include shared map assets (StaticObjects.con) for trees, rocks,
+        # buildings
+        for con_file in self.files.with_suffix(".con"):
+            # Skip other game modes
+            if con_file.mode in GAME_MODES and not con_file.in_mode(game_mode):
+                continue
 
-        # Find all .con files recursively
+            # Include:
+            # 1. Game mode files (gameplay objects: spawners, control points)
+            # 2. Init files (terrain, sky, shared config)
+            # 3. StaticObjects.con (map assets: trees, rocks, buildings, crates)
+            if (
+                con_file.in_mode(game_mode)
+                or con_file.mode == INIT_MODE
+                or con_file.name == "StaticObjects.con"
+            ):
+                self.con_files.append(con_file.path)
+
+        # Scripts pulled in by run/include from Init.con are loaded too, even
+        # when their path does not match the conventions above
         if map_dir.exists():
-            all_con_files = list(map_dir.rglob("*.con"))
-
-            # Filter to ONLY Conquest mode files (avoid conflicts from TDM, CTF, SinglePlayer)
-            # This ensures we get consistent vehicle assignments and gameplay objects
-            # ALSO include shared map assets (StaticObjects.con) for trees, rocks, buildings
-            for con_file in all_con_files:
-                con_path_str = str(con_file)
-
-                # Skip non-Conquest game modes
-                if any(
-                    mode in con_path_str for mode in ["SinglePlayer", "Coop", "TDM", "Ctf", "CTF"]
-                ):
-                    continue
+            self._expand_scripts()
 
-                # Include:
-                # 1. Conquest mode files (gameplay objects: spawners, control points)
-                # 2. Init files (terrain, sky, shared config)
-                # 3. StaticObjects.con (map assets: trees, rocks, buildings, crates)
-                if (
-                    "Conquest" in con_path_str
-                    or "Init" in con_path_str
-                    or con_file.name == "StaticObjects.con"
-                ):
-                    self.con_files.append(con_file)
+    def _expand_scripts(self) -> None:
+        """Follow the run/include graph from Init.con and the game mode's Init.con.
+
+        Reached scripts are later parsed from their active statements only, so
+        objects inside if/else branches not taken for this game mode are
+        skipped. Scripts that are not reached keep being parsed whole. Reached
+        scripts in another game mode's directory are skipped too, as in
+        __init__.
+        """
+        entries = [
+            script
+            for script in (
+                self._preprocessor.find_script("Init"),
+                self._preprocessor.find_script(f"{self.game_mode}/Init"),
+            )
+            if script is not None
+        ]
+        self._statements = self._preprocessor.expand(entries, ("host", self.game_mode))
+        self._statement_mtimes = tuple(self._mtime(script) for script in self._statements)
+
+        for script in self._statements:
+            map_file = self.files.find(script.relative_to(self.map_dir).as_posix())
+            if (
+                map_file is not None
+                and map_file.mode in GAME_MODES
+                and not map_file.in_mode(self.game_mode)
+            ):
+                continue
+            if script not in self.con_files:
+                self.con_files.append(script)
 
     def find_file(self, pattern: str) -> Path | None:
         """Find a .con file matching a pattern.
@@ -315,23 +513,96 @@ class ConFileSet:
                 return con_file
         return None
 
-    def parse_all(self) -> dict[str, dict[str, Any]]:
-        """Parse all .con files in the map directory.
+    @staticmethod
+    def _mtime(con_file: Path) -> int | None:
+        """Get a file's modification time in nanoseconds, or None if unreadable."""
+        try:
+            return con_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def parse_file(self, con_file: Path) -> dict[str, Any]:
+        """Parse one .con file, reusing the previous result while it is unmodified.
+
+        Args:
+            con_file: Path to .con file
 
         Returns:
-            Dictionary mapping filename to parsed data
+            Parsed data (shared between calls; do not modify)
+
+        Raises:
+            ParseError: If file cannot be parsed
         """
+        # Any edited script may change which branches are taken in the others
+        if self._statements and self._statement_mtimes != tuple(
+            self._mtime(script) for script in self._statements
+        ):
+            self._parsed.clear()
+            self._expand_scripts()
+
+        mtime = self._mtime(con_file)
+        cached = self._parsed.get(con_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        statements = self._statements.get(con_file)
+        stamp = self.parse_cache.stamp(con_file, statements)
+        parsed = self.parse_cache.get(con_file, stamp)
+        if parsed is None:
+            if statements is not None:
+                parsed = self.parser.parse_lines(statements, con_file)
+            else:
+                parsed = self.parser.parse(con_file)
+            self.parse_cache.put(con_file, stamp, parsed)
+        if mtime is not None:
+            self._parsed[con_file] = (mtime, parsed)
+        return parsed
+
+    def _parse_paths(self) -> dict[Path, dict[str, Any]]:
+        """Parse all .con files, keyed by path so same-named files are all kept."""
         results = {}
 
         for con_file in self.con_files:
             try:
-                parsed = self.parser.parse(con_file)
-                results[con_file.name] = parsed
+                results[con_file] = self.parse_file(con_file)
             except ParseError as e:
                 print(f"⚠️  Failed to parse {con_file.name}: {e}")
 
+        self.parse_cache.save()
         return results
 
+    def parse_all(self) -> dict[str, dict[str, Any]]:
+        """Parse all .con files in the map directory.
+
+        Returns:
+            Dictionary mapping filename to parsed data (of files sharing a
+            name, the last one wins; use index() to see every file)
+        """
+        return {con_file.name: parsed for con_file, parsed in self._parse_paths().items()}
+
+    def cache_stats(self) -> dict[str, int]:
+        """Get persistent parse cache hits and misses so far.
+
+        Returns:
+            Dictionary with "hits" (files loaded from the cache) and "misses"
+            (files parsed)
+        """
+        return {"hits": self.parse_cache.hits, "misses": self.parse_cache.misses}
+
+    def index(self) -> ConObjectIndex:
+        """Get lookup views over all parsed objects.
+
+        The index is rebuilt only when a .con file has changed since the
+        last call.
+
+        Returns:
+            ConObjectIndex over every parsed .con file
+        """
+        fingerprint = tuple(self._mtime(con_file) for con_file in self.con_files)
+        if self._index is None or self._index[0] != fingerprint:
+            self._index = (fingerprint, ConObjectIndex(self._parse_paths()))
+        return self._index[1]
+
     def get_objects_by_type(self, object_type: str) -> list[dict[str, Any]]:
         """Get all objects of a specific type from all .con files.
 
@@ -341,15 +612,4 @@ class ConFileSet:
         Returns:
             List of matching objects
         """
-        results = []
-
-        for con_file in self.con_files:
-            try:
-                parsed = self.parser.parse(con_file)
-                for obj in parsed["objects"]:
-                    if obj["type"] == object_type:
-                        results.append(obj)
-            except ParseError:
-                continue
-
-        return results
+        return [obj for obj in self.index().of_type(object_type) if obj["type"] == object_type]
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""Preprocessor for Refractor .con scripts.
+
+Refractor maps are loaded by running Init.con, which pulls in the rest of
+the map with `run` / `include` directives, optionally guarded by
+`if` / `elseIf` / `else` / `endIf` blocks over `v_arg<N>` arguments and
+script variables. This module parses each script into a small AST (cached
+by content hash, so scripts shared between maps are parsed once per
+process), then walks the run graph from an entry script and returns the
+statements that are active in every file it reaches.
+
+Single Responsibility: Only handles .con directive resolution and conditional evaluation.
+"""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .map_files import MapFiles
+
+# Arguments Init.con is run with when a server hosts the map
+DEFAULT_ENTRY_ARGUMENTS = ("host",)
+
+# Parsed scripts kept by the default cache
+DEFAULT_CACHE_ENTRIES = 256
+
+_COMMENT_PREFIXES = ("rem ", "//")
+
+
+@dataclass(slots=True)
+class RunDirective:
+    """`run <script> [args...]` or `include <script> [args...]`.
+
+    Attributes:
+        script: Script reference as written (relative path, extension optional)
+        args: Arguments, visible to the script as v_arg1, v_arg2, ...
+        include: True for include (runs in the caller's variable scope)
+    """
+
+    script: str
+    args: tuple[str, ...]
+    include: bool
+
+
+@dataclass(slots=True)
+class Conditional:
+    """`if` block with optional `elseIf` / `else` branches.
+
+    Attributes:
+        branches: (condition, body) pairs in order; a condition is a
+            (left, operator, right) tuple
+        otherwise: Body of the `else` branch
+    """
+
+    branches: list[tuple[tuple[str, str, str], list["ScriptNode"]]]
+    otherwise: list["ScriptNode"]
+
+
+ScriptNode = str | RunDirective | Conditional
+
+
+def _parse_condition(args: str) -> tuple[str, str, str]:
+    """Split `<left> <op> <right>` (== or !=), treating a bare operand as `!= 0`."""
+    parts = args.split(None, 2)
+    if len(parts) == 3 and parts[1] in ("==", "!="):
+        return parts[0], parts[1], parts[2]
+    return args.strip(), "!=", "0"
+
+
+def parse_script(text: str) -> list[ScriptNode]:
+    """Parse a .con script into statements, directives and conditionals.
+
+    Comments (`rem`, `//` and `beginRem` ... `endRem` blocks) and blank
+    lines are dropped; every other line is kept stripped. Unterminated
+    `if` blocks are closed at the end of the script.
+
+    Args:
+        text: Script contents
+
+    Returns:
+        Top-level script nodes in order
+    """
+    root: list[ScriptNode] = []
+    body = root
+    # Open conditionals with the body that encloses each of them
+    open_blocks: list[tuple[Conditional, list[ScriptNode]]] = []
+    in_comment_block = False
+
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        parts = line.split(None, 1)
+        keyword = parts[0].lower()
+        args = parts[1] if len(parts) == 2 else ""
+
+        if in_comment_block:
+            in_comment_block = keyword != "endrem"
+            continue
+        if keyword == "beginrem":
+            in_comment_block = True
+            continue
+        if line.startswith(_COMMENT_PREFIXES) or keyword == "rem":
+            continue
+
+        if keyword in ("run", "include"):
+            tokens = args.split()
+            if tokens:
+                body.append(RunDirective(tokens[0], tuple(tokens[1:]), keyword == "include"))
+        elif keyword == "if":
+            block = Conditional(branches=[(_parse_condition(args), [])], otherwise=[])
+            body.append(block)
+            open_blocks.append((block, body))
+            body = block.branches[0][1]
+        elif keyword == "elseif" and open_blocks:
+            block = open_blocks[-1][0]
+            block.branches.append((_parse_condition(args), []))
+            body = block.branches[-1][1]
+        elif keyword == "else" and open_blocks:
+            body = open_blocks[-1][0].otherwise
+        elif keyword == "endif" and open_blocks:
+            body = open_blocks.pop()[1]
+        else:
+            body.append(line)
+
+    return root
+
+
+class ConScriptCache:
+    """LRU cache of parsed scripts keyed by content hash.
+
+    Identical scripts (e.g. templates shared by several maps in a batch) are
+    parsed once however many paths they are read from.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Parsed scripts kept before the least recently used
+                one is dropped
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._scripts: OrderedDict[bytes, list[ScriptNode]] = OrderedDict()
+
+    def load(self, path: Path) -> list[ScriptNode]:
+        """Read and parse a script, reusing the parse of identical content.
+
+        Args:
+            path: Path to .con script
+
+        Returns:
+            Parsed script nodes (shared between callers; do not modify)
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        data = path.read_bytes()
+        key = hashlib.blake2b(data, digest_size=16).digest()
+
+        nodes = self._scripts.get(key)
+        if nodes is not None:
+            self.hits += 1
+            self._scripts.move_to_end(key)
+            return nodes
+
+        self.misses += 1
+        nodes = parse_script(data.decode("utf-8", errors="ignore"))
+        self._scripts[key] = nodes
+        if len(self._scripts) > self.max_entries:
+            self._scripts.popitem(last=False)
+        return nodes
+
+
+# Process-wide cache shared by all preprocessors unless one is passed in
+SHARED_SCRIPT_CACHE = ConScriptCache()
+
+
+class ConPreprocessor:
+    """Expands the run/include graph of a map's .con scripts.
+
+    Script references are resolved case-insensitively, first relative to
+    the running script's directory and then to the map root, with the .con
+    extension optional. Each script is expanded once, on its first run.
+    """
+
+    def __init__(
+        self,
+        map_dir: Path,
+        cache: ConScriptCache | None = None,
+        files: MapFiles | None = None,
+    ):
+        """Index the map's scripts.
+
+        Args:
+            map_dir: Path to map directory (extracted RFA)
+            cache: Parsed script cache (defaults to SHARED_SCRIPT_CACHE)
+            files: Files of the map directory (scanned if not given)
+        """
+        self.map_dir = map_dir
+        self.cache = cache if cache is not None else SHARED_SCRIPT_CACHE
+        self._scripts: dict[str, Path] = {}
+        if files is None:
+            files = MapFiles(map_dir)
+        for con_file in files.with_suffix(".con"):
+            key = con_file.relative.casefold().removesuffix(".con")
+            self._scripts.setdefault(key, con_file.path)
+
+    def find_script(self, relative_path: str) -> Path | None:
+        """Find a script by map-relative path, ignoring case and extension."""
+        key = relative_path.replace("\\", "/").strip("/").casefold().removesuffix(".con")
+        return self._scripts.get(key)
+
+    def resolve(self, script: str, current_dir: Path) -> Path | None:
+        """Resolve a run/include reference.
+
+        Args:
+            script: Reference as written in the directive
+            current_dir: Directory of the running script
+
+        Returns:
+            Path of the script, or None if it is not part of the map
+        """
+        relative_dir = current_dir.relative_to(self.map_dir).as_posix()
+        candidates = [f"{relative_dir}/{script}", script] if relative_dir != "." else [script]
+        for candidate in candidates:
+            # Normalise ../ segments within the map
+            parts: list[str] = []
+            for part in candidate.replace("\\", "/").split("/"):
+                if part == "..":
+                    if parts:
+                        parts.pop()
+                elif part not in ("", "."):
+                    parts.append(part)
+            found = self.find_script("/".join(parts))
+            if found:
+                return found
+        return None
+
+    def expand(
+        self, entries: Iterable[Path], args: Iterable[str] = DEFAULT_ENTRY_ARGUMENTS
+    ) -> dict[Path, list[str]]:
+        """Run entry scripts and collect the active statements of every script reached.
+
+        Args:
+            entries: Scripts to run in turn (e.g. the map's Init.con); a
+                script already reached from an earlier entry is not run again
+            args: Arguments each entry script is run with
+
+        Returns:
+            Ordered dict of script path -> active statement lines, in the
+            order scripts are first run (scripts that fail to read are skipped)
+        """
+        args = tuple(args)
+        statements: dict[Path, list[str]] = {}
+        for entry in entries:
+            self._run(entry, self._arguments(args), statements)
+        return statements
+
+    @staticmethod
+    def _arguments(args: Iterable[str]) -> dict[str, str]:
+        """Build a new variable scope holding v_arg1..v_argN."""
+        return {f"v_arg{i}": value for i, value in enumerate(args, start=1)}
+
+    def _run(self, script: Path, variables: dict[str, str], statements: dict[Path, list[str]]):
+        """Expand one script into statements, following its directives."""
+        if script in statements:
+            return
+        try:
+            nodes = self.cache.load(script)
+        except OSError:
+            return
+        lines = statements[script] = []
+        self._execute(nodes, script.parent, variables, lines, statements)
+
+    def _execute(
+        self,
+        nodes: list[ScriptNode],
+        current_dir: Path,
+        variables: dict[str, str],
+        lines: list[str],
+        statements: dict[Path, list[str]],
+    ) -> None:
+        """Execute script nodes, appending active statements to lines."""
+        for node in nodes:
+            if isinstance(node, str):
+                self._assign(node, variables)
+                lines.append(node)
+            elif isinstance(node, RunDirective):
+                target = self.resolve(node.script, current_dir)
+                if target is not None:
+                    args = tuple(self._value(arg, variables) for arg in node.args)
+                    if node.include:
+                        scope = variables
+                        scope.update(self._arguments(args))
+                    else:
+                        scope = self._arguments(args)
+                    self._run(target, scope, statements)
+            else:
+                body = node.otherwise
+                for condition, branch in node.branches:
+                    if self._holds(condition, variables):
+                        body = branch
+                        break
+                self._execute(body, current_dir, variables, lines, statements)
+
+    @staticmethod
+    def _value(token: str, variables: dict[str, str]) -> str:
+        """Substitute a variable reference; other tokens are literals."""
+        if token[:2].lower() in ("v_", "c_"):
+            return variables.get(token.lower(), "")
+        return token
+
+    def _holds(self, condition: tuple[str, str, str], variables: dict[str, str]) -> bool:
+        """Evaluate an if/elseIf condition (string comparison, ignoring case)."""
+        left, operator, right = condition
+        equal = self._value(left, variables).casefold() == self._value(right, variables).casefold()
+        return equal if operator == "==" else not equal
+
+    def _assign(self, line: str, variables: dict[str, str]) -> None:
+        """Track `var` / `const` declarations and `v_name = value` assignments."""
+        parts = line.split()
+        if parts[0].lower() in ("var", "const"):
+            parts = parts[1:]
+        if len(parts) >= 3 and parts[1] == "=" and parts[0][:2].lower() in ("v_", "c_"):
+            variables[parts[0].lower()] = self._value(parts[2], variables)
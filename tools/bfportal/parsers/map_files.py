@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Single-pass file discovery for an extracted map directory.
+
+ConFileSet, the run/include preprocessor, the spawner template lookup and
+the water body extraction each used to walk or probe the map directory on
+their own. MapFiles walks it once with os.scandir, recording every file's
+size and mtime (scandir returns them without an extra stat on most
+platforms) and the game mode it belongs to, and answers their lookups from
+that listing. On extracted archives kept on network storage this replaces
+several directory walks and per-file existence checks with one pass.
+
+Single Responsibility: Only handles listing and classifying a map's files.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+# Game mode directories of a map; files below one belong to that mode
+GAME_MODES = ("Conquest", "TDM", "CTF", "SinglePlayer", "Coop")
+
+# Mode of map-wide Init files (Init.con and everything in Init/)
+INIT_MODE = "Init"
+
+_GAME_MODES_BY_KEY = {mode.casefold(): mode for mode in GAME_MODES}
+
+
+def _classify(parts: tuple[str, ...]) -> str | None:
+    """Get the mode of a file from its map-relative path components.
+
+    The first game mode directory on the path wins, so Conquest/Init.con
+    belongs to Conquest; files outside any game mode directory that are
+    named Init or live below an Init directory are INIT_MODE.
+    """
+    for part in parts[:-1]:
+        mode = _GAME_MODES_BY_KEY.get(part.casefold())
+        if mode is not None:
+            return mode
+    if any(part.casefold() == "init" for part in parts[:-1]):
+        return INIT_MODE
+    if Path(parts[-1]).stem.casefold() == "init":
+        return INIT_MODE
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class MapFile:
+    """A file found in a map directory, with its stat at discovery time."""
+
+    path: Path
+    relative: str  # Map-relative POSIX path, original case
+    size: int
+    mtime_ns: int
+    mode: str | None  # One of GAME_MODES, INIT_MODE, or None for shared files
+
+    @property
+    def name(self) -> str:
+        """File name."""
+        return self.path.name
+
+    def in_mode(self, mode: str) -> bool:
+        """Check whether the file belongs to a game mode (case-insensitive)."""
+        return self.mode is not None and self.mode.casefold() == mode.casefold()
+
+
+class MapFiles:
+    """Every file of a map directory, listed in one os.scandir walk.
+
+    Files are kept in the order sorted(map_dir.rglob("*")) would give them.
+    Lookups by relative path are case-insensitive, like the game's own file
+    system, and never touch the disk.
+    """
+
+    def __init__(self, map_dir: Path):
+        """Walk the map directory.
+
+        Args:
+            map_dir: Path to map directory (extracted RFA); a missing
+                directory has no files
+        """
+        self.map_dir = map_dir
+        self.files: list[MapFile] = []
+        self._by_key: dict[str, MapFile] = {}
+
+        found: list[tuple[tuple[str, ...], MapFile]] = []
+        self._walk(map_dir, (), found)
+        found.sort(key=lambda item: item[0])
+        for _, map_file in found:
+            self.files.append(map_file)
+            self._by_key.setdefault(map_file.relative.casefold(), map_file)
+
+    @classmethod
+    def _walk(
+        cls,
+        directory: Path,
+        prefix: tuple[str, ...],
+        found: list[tuple[tuple[str, ...], "MapFile"]],
+    ) -> None:
+        """Recursively add the files below a directory to found."""
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        for entry in entries:
+            parts = (*prefix, entry.name)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    cls._walk(Path(entry.path), parts, found)
+                    continue
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            map_file = MapFile(
+                path=Path(entry.path),
+                relative="/".join(parts),
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                mode=_classify(parts),
+            )
+            found.append((parts, map_file))
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def find(self, relative_path: str) -> MapFile | None:
+        """Find a file by map-relative path, ignoring case.
+
+        Args:
+            relative_path: Path relative to the map directory; backslashes
+                and leading/trailing slashes are accepted
+
+        Returns:
+            The file, or None if the map has no such file
+        """
+        key = relative_path.replace("\\", "/").strip("/").casefold()
+        return self._by_key.get(key)
+
+    def with_suffix(self, suffix: str) -> list[MapFile]:
+        """Get the files with an extension (e.g. ".con"), ignoring case."""
+        suffix = suffix.casefold()
+        return [f for f in self.files if f.relative.casefold().endswith(suffix)]
+
+    def named(self, name: str) -> list[MapFile]:
+        """Get the files with a file name, in any directory, ignoring case."""
+        name = name.casefold()
+        return [f for f in self.files if f.name.casefold() == name]
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Persistent index of parsed BF1942 spawner templates shared across maps.
+
+Every map conversion used to glob its level directory for
+ObjectSpawnTemplates.con and re-parse each file. SpawnerTemplateIndex keeps
+the parsed templates of every file it has seen in one JSON file, keyed by
+the file's content hash, so identical template files (common across the
+base game, XPack1 and XPack2) are parsed once. It also remembers which
+template files each level has and their size/mtime, so a known level is
+resolved with a few stat calls instead of a directory walk and re-read.
+
+Single Responsibility: Only handles storing and layering parsed spawner templates.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from .map_files import MapFiles
+from .spawner_template_parser import (
+    TEMPLATE_FILENAME,
+    SpawnerTemplate,
+    find_template_files,
+    parse_spawner_templates,
+)
+
+# Bump when the layout or meaning of the index changes
+INDEX_FORMAT_VERSION = 1
+
+# Environment variable overriding the default index path
+INDEX_PATH_ENV = "BFPORTAL_SPAWNER_INDEX"
+
+DEFAULT_INDEX_PATH = Path.home() / ".cache" / "bfportal" / "spawner_templates.json"
+
+
+class SpawnerTemplateIndex:
+    """Parsed spawner templates keyed by template file hash, with per-level file lists.
+
+    The whole index is read from disk in one go when it is created; call
+    save() to persist entries added since.
+    """
+
+    def __init__(self, index_path: Path | None = None):
+        """Load the index.
+
+        Args:
+            index_path: JSON index file (default: $BFPORTAL_SPAWNER_INDEX, then
+                ~/.cache/bfportal/spawner_templates.json)
+        """
+        self.index_path = Path(index_path or os.environ.get(INDEX_PATH_ENV) or DEFAULT_INDEX_PATH)
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        # Content hash -> {spawner name: template fields}
+        self._files: dict[str, dict[str, dict]] = {}
+        # Resolved level dir -> [[template path, size, mtime_ns, content hash], ...]
+        self._levels: dict[str, list[list]] = {}
+
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == INDEX_FORMAT_VERSION:
+            self._files = data.get("files", {})
+            self._levels = data.get("levels", {})
+
+    def _file_templates(self, template_file: Path) -> tuple[str, dict[str, dict]]:
+        """Get (content hash, templates) of a file, parsing it only if its content is new."""
+        data = template_file.read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        templates = self._files.get(digest)
+        if templates is None:
+            self.misses += 1
+            parsed = parse_spawner_templates(data.decode("utf-8", errors="ignore").splitlines())
+            templates = {name: dataclasses.asdict(t) for name, t in parsed.items()}
+            self._files[digest] = templates
+            self._dirty = True
+        else:
+            self.hits += 1
+        return digest, templates
+
+    def _is_fresh(self, entries: list[list], files: MapFiles | None) -> bool:
+        """Check that a level's template files are unchanged and still parsed.
+
+        With the level's file listing at hand, the recorded sizes/mtimes are
+        compared against it (also catching added or removed template files)
+        instead of stat'ing each file.
+        """
+        listed: dict[str, tuple[int, int]] | None = None
+        if files is not None:
+            current = {str(path) for path in find_template_files(files)}
+            if current != {entry[0] for entry in entries}:
+                return False
+            listed = {str(f.path): (f.size, f.mtime_ns) for f in files.named(TEMPLATE_FILENAME)}
+        for path, size, mtime_ns, digest in entries:
+            if digest not in self._files:
+                return False
+            if listed is not None:
+                stamp = listed[path]
+            else:
+                try:
+                    stat = Path(path).stat()
+                except OSError:
+                    return False
+                stamp = (stat.st_size, stat.st_mtime_ns)
+            if stamp != (size, mtime_ns):
+                return False
+        return True
+
+    def _level_entries(self, level_dir: Path, files: MapFiles | None = None) -> list[list]:
+        """Get a level's [path, size, mtime_ns, hash] entries, rescanning stale levels."""
+        key = str(level_dir.resolve())
+        entries = self._levels.get(key)
+        if entries is not None and self._is_fresh(entries, files):
+            return entries
+
+        if files is None:
+            files = MapFiles(level_dir)
+        entries = []
+        for template_file in find_template_files(files):
+            stat = template_file.stat()
+            digest, _ = self._file_templates(template_file)
+            entries.append([str(template_file), stat.st_size, stat.st_mtime_ns, digest])
+        self._levels[key] = entries
+        self._dirty = True
+        return entries
+
+    def level_templates(
+        self, level_dir: Path, files: MapFiles | None = None
+    ) -> dict[str, SpawnerTemplate]:
+        """Get the spawner templates of a level.
+
+        The level's template files are layered in sorted order, so a spawner
+        defined in several game modes takes its last definition.
+
+        Args:
+            level_dir: Path to BF1942 level directory
+            files: Files of the level directory, if already listed; known
+                levels are then checked against it without touching the disk
+
+        Returns:
+            Dictionary mapping lowercase spawner names to new SpawnerTemplate objects
+        """
+        if not level_dir.exists():
+            return {}
+
+        templates: dict[str, SpawnerTemplate] = {}
+        for _, _, _, digest in self._level_entries(level_dir, files):
+            for name, fields in self._files[digest].items():
+                templates[name] = SpawnerTemplate(**fields)
+        return templates
+
+    def build(self, levels_roots: Iterable[Path]) -> int:
+        """Index every level under the given roots (e.g. base game, XPack1, XPack2).
+
+        Args:
+            levels_roots: Directories whose subdirectories are levels
+
+        Returns:
+            Number of levels indexed
+        """
+        count = 0
+        for root in levels_roots:
+            if not root.exists():
+                continue
+            for level_dir in sorted(p for p in root.iterdir() if p.is_dir()):
+                self._level_entries(level_dir)
+                count += 1
+        return count
+
+    def save(self) -> bool:
+        """Write the index if entries were added since it was loaded.
+
+        The file is written to a temporary name and renamed into place, so
+        concurrent readers never see a partial index.
+
+        Returns:
+            True if the index is up to date on disk, False if it is not writable
+        """
+        if not self._dirty:
+            return True
+
+        data = {"version": INDEX_FORMAT_VERSION, "files": self._files, "levels": self._levels}
+        temp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return False
+        self._dirty = False
+        return True
+
+
+# Index shared by all engines in this process, created on first use
+_shared_index: SpawnerTemplateIndex | None = None
+
+
+def get_shared_index() -> SpawnerTemplateIndex:
+    """Get the process-wide spawner template index (loaded from disk once)."""
+    global _shared_index
+    if _shared_index is None:
+        _shared_index = SpawnerTemplateIndex()
+    return _shared_index
@@ -9,10 +9,16 @@ by centralizing spawner template parsing in one place.
 """
 
 import contextlib
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..core.interfaces import Team
+from .map_files import MapFiles
+
+if TYPE_CHECKING:
+    from .spawner_template_index import SpawnerTemplateIndex
 
 
 @dataclass
@@ -51,6 +57,110 @@ class SpawnerTemplate:
         return None
 
 
+def _set_spawn_delay_min(template: SpawnerTemplate, args: list[str]) -> None:
+    """Handle ObjectTemplate.MinSpawnDelay <seconds>."""
+    with contextlib.suppress(ValueError):
+        template.spawn_delay_min = int(args[0])
+
+
+def _set_spawn_delay_max(template: SpawnerTemplate, args: list[str]) -> None:
+    """Handle ObjectTemplate.MaxSpawnDelay <seconds>."""
+    with contextlib.suppress(ValueError):
+        template.spawn_delay_max = int(args[0])
+
+
+def _set_time_to_live(template: SpawnerTemplate, args: list[str]) -> None:
+    """Handle ObjectTemplate.TimeToLive <seconds>."""
+    with contextlib.suppress(ValueError):
+        template.time_to_live = int(args[0])
+
+
+def _set_object_template(template: SpawnerTemplate, args: list[str]) -> None:
+    """Handle ObjectTemplate.setObjectTemplate <team> <vehicle>."""
+    if len(args) < 2:
+        return
+    team_id, vehicle_type = args[0], args[1]
+    if team_id == "1":
+        template.team1_vehicle = vehicle_type
+    elif team_id == "2":
+        template.team2_vehicle = vehicle_type
+
+
+# Spawner properties by lowercased command
+_SPAWNER_PROPERTY_HANDLERS: dict[str, Callable[[SpawnerTemplate, list[str]], None]] = {
+    "objecttemplate.setobjecttemplate": _set_object_template,
+    "objecttemplate.minspawndelay": _set_spawn_delay_min,
+    "objecttemplate.maxspawndelay": _set_spawn_delay_max,
+    "objecttemplate.timetolive": _set_time_to_live,
+}
+
+TEMPLATE_FILENAME = "ObjectSpawnTemplates.con"
+
+# Game mode directories whose vehicle assignments differ from multiplayer
+_EXCLUDED_MODES = ("SinglePlayer", "Coop")
+
+
+def find_template_files(files: MapFiles) -> list[Path]:
+    """Find a level's multiplayer ObjectSpawnTemplates.con files.
+
+    SinglePlayer and Coop files are skipped; they have campaign-specific
+    vehicle assignments (e.g., yak9 instead of Ilyushin).
+
+    Args:
+        files: Files of the level directory
+
+    Returns:
+        Template files in sorted order (later files override earlier ones)
+    """
+    return [
+        template_file.path
+        for template_file in files.named(TEMPLATE_FILENAME)
+        if template_file.mode not in _EXCLUDED_MODES
+    ]
+
+
+def parse_spawner_templates(lines: Iterable[str]) -> dict[str, SpawnerTemplate]:
+    """Parse spawner templates from the lines of an ObjectSpawnTemplates.con.
+
+    Each line is split once and dispatched on its command. Properties
+    apply to the most recently created spawner.
+
+    Args:
+        lines: File lines
+
+    Returns:
+        Dictionary mapping lowercase spawner names to templates, in file order
+    """
+    templates: dict[str, SpawnerTemplate] = {}
+    current_template: SpawnerTemplate | None = None
+
+    for line in lines:
+        parts = line.split()
+
+        # Skip empty lines and comments
+        if not parts or parts[0] == "rem" or parts[0].startswith("//"):
+            continue
+
+        command = parts[0].lower()
+
+        # New spawner template
+        # Format: ObjectTemplate.create ObjectSpawner lighttankspawner
+        if command == "objecttemplate.create":
+            if len(parts) >= 3 and parts[1] == "ObjectSpawner":
+                spawner_name = parts[2].lower()
+                current_template = SpawnerTemplate(name=spawner_name)
+                templates[spawner_name] = current_template
+            continue
+
+        # Vehicle types per team and spawn timing parameters
+        # Format: ObjectTemplate.setObjectTemplate 2 T34-85
+        handler = _SPAWNER_PROPERTY_HANDLERS.get(command)
+        if current_template and handler and len(parts) >= 2:
+            handler(current_template, parts[1:])
+
+    return templates
+
+
 class SpawnerTemplateParser:
     """Parses ObjectSpawnTemplates.con files to extract vehicle spawner info.
 
@@ -88,85 +198,39 @@ class SpawnerTemplateParser:
             return
 
         with open(template_file, encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
-
-        current_template: SpawnerTemplate | None = None
-
-        for line in lines:
-            line = line.strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith(("rem ", "//")):
-                continue
-
-            # New spawner template
-            # Format: ObjectTemplate.create ObjectSpawner lighttankspawner
-            # Parts after split(): ["ObjectTemplate.create", "ObjectSpawner", "lighttankspawner"]
-            if "ObjectTemplate.create ObjectSpawner" in line:
-                parts = line.split()
-                if len(parts) >= 3:  # Fixed: 3 parts, not 4
-                    spawner_name = parts[2].lower()  # Fixed: index 2, not 3
-                    current_template = SpawnerTemplate(name=spawner_name)
-                    self.templates[spawner_name] = current_template
-
-            # Vehicle type for specific team
-            # Format: ObjectTemplate.setObjectTemplate 2 T34-85
-            # Parts after split(): ["ObjectTemplate.setObjectTemplate", "2", "T34-85"]
-            elif current_template and "setObjectTemplate" in line:
-                parts = line.split()
-                if len(parts) >= 3:  # Fixed: 3 parts, not 4
-                    team_id = parts[1]  # Fixed: index 1 (team number)
-                    vehicle_type = parts[2]  # Fixed: index 2 (vehicle name)
-
-                    if team_id == "1":
-                        current_template.team1_vehicle = vehicle_type
-                    elif team_id == "2":
-                        current_template.team2_vehicle = vehicle_type
-
-            # Spawn timing parameters
-            elif current_template and "MinSpawnDelay" in line:
-                parts = line.split()
-                if len(parts) >= 3:
-                    with contextlib.suppress(ValueError):
-                        current_template.spawn_delay_min = int(parts[2])
-
-            elif current_template and "MaxSpawnDelay" in line:
-                parts = line.split()
-                if len(parts) >= 3:
-                    with contextlib.suppress(ValueError):
-                        current_template.spawn_delay_max = int(parts[2])
-
-            elif current_template and "TimeToLive" in line:
-                parts = line.split()
-                if len(parts) >= 3:
-                    with contextlib.suppress(ValueError):
-                        current_template.time_to_live = int(parts[2])
-
-    def parse_directory(self, level_dir: Path) -> None:
+            self.templates.update(parse_spawner_templates(f))
+
+    def parse_directory(
+        self,
+        level_dir: Path,
+        index: "SpawnerTemplateIndex | None" = None,
+        files: MapFiles | None = None,
+    ) -> None:
         """Parse all ObjectSpawnTemplates.con files in a level directory.
 
         Searches recursively for ObjectSpawnTemplates.con files (usually in
-        Conquest/, TDM/, CTF/ subdirectories) and parses all of them.
+        Conquest/, TDM/, CTF/ subdirectories) and parses all of them in
+        sorted order.
 
         IMPORTANT: Skips SinglePlayer directories as they have different
         vehicle assignments for the campaign (e.g., yak9 instead of Ilyushin).
 
         Args:
             level_dir: Path to BF1942 level directory
+            index: Spawner template index to take already parsed files from
+                (files are parsed directly if not given)
+            files: Files of the level directory (scanned if not given)
 
         Updates:
             self.templates with all parsed spawner definitions
         """
-        if not level_dir.exists():
+        if index is not None:
+            self.templates.update(index.level_templates(level_dir, files))
             return
 
-        # Find all ObjectSpawnTemplates.con files
-        template_files = list(level_dir.glob("**/ObjectSpawnTemplates.con"))
-
-        for template_file in template_files:
-            # Skip SinglePlayer directories - they have campaign-specific vehicle assignments
-            if "SinglePlayer" in str(template_file) or "Coop" in str(template_file):
-                continue
+        if files is None:
+            files = MapFiles(level_dir)
+        for template_file in find_template_files(files):
             self.parse_template_file(template_file)
 
     def get_template(self, spawner_name: str) -> SpawnerTemplate | None:
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Binary glTF (.glb) reader for Portal terrain meshes.
+
+Decodes accessor data straight out of the GLB binary chunk as NumPy views
+(honouring byteOffset, byteStride, componentType and normalized flags)
+instead of unpacking elements one at a time with struct.
+
+Single Responsibility: Only handles GLB container parsing and accessor decoding.
+"""
+
+import json
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..core.exceptions import TerrainError
+
+GLB_MAGIC = b"glTF"
+CHUNK_JSON = b"JSON"
+CHUNK_BIN = b"BIN\x00"
+
+# glTF primitive.mode for indexed/unindexed triangle lists (the default)
+PRIMITIVE_MODE_TRIANGLES = 4
+
+# glTF componentType -> little-endian NumPy dtype
+COMPONENT_DTYPES: dict[int, np.dtype] = {
+    5120: np.dtype("<i1"),  # BYTE
+    5121: np.dtype("<u1"),  # UNSIGNED_BYTE
+    5122: np.dtype("<i2"),  # SHORT
+    5123: np.dtype("<u2"),  # UNSIGNED_SHORT
+    5125: np.dtype("<u4"),  # UNSIGNED_INT
+    5126: np.dtype("<f4"),  # FLOAT
+}
+
+# glTF accessor type -> number of components per element
+TYPE_COMPONENTS: dict[str, int] = {
+    "SCALAR": 1,
+    "VEC2": 2,
+    "VEC3": 3,
+    "VEC4": 4,
+    "MAT2": 4,
+    "MAT3": 9,
+    "MAT4": 16,
+}
+
+
+@dataclass
+class GlbDocument:
+    """Parsed GLB container.
+
+    Attributes:
+        gltf: Decoded JSON chunk
+        binary: Raw BIN chunk (empty if the file has no binary chunk)
+    """
+
+    gltf: dict[str, Any]
+    binary: bytes
+
+
+def read_glb(path: Path) -> GlbDocument:
+    """Read a GLB file into its JSON document and binary chunk.
+
+    Args:
+        path: Path to .glb file
+
+    Returns:
+        GlbDocument with decoded JSON and raw binary data
+
+    Raises:
+        TerrainError: If the file is not a valid GLB container
+    """
+    data = Path(path).read_bytes()
+
+    if data[:4] != GLB_MAGIC:
+        raise TerrainError(f"Invalid GLB file: {path}")
+
+    # Header: magic, version, total length (12 bytes), then JSON chunk header
+    if len(data) < 20:
+        raise TerrainError(f"Truncated GLB file: {path}")
+    json_length, json_type = struct.unpack_from("<I4s", data, 12)
+    if json_type != CHUNK_JSON:
+        raise TerrainError("Expected JSON chunk in GLB")
+
+    json_start = 20
+    json_end = json_start + json_length
+    gltf = json.loads(data[json_start:json_end].decode("utf-8"))
+
+    if len(data) < json_end + 8:
+        raise TerrainError("Expected BIN chunk in GLB")
+    bin_length, bin_type = struct.unpack_from("<I4s", data, json_end)
+    if bin_type != CHUNK_BIN:
+        raise TerrainError("Expected BIN chunk in GLB")
+
+    bin_start = json_end + 8
+    return GlbDocument(gltf=gltf, binary=data[bin_start : bin_start + bin_length])
+
+
+def read_accessor(document: GlbDocument, accessor_index: int) -> np.ndarray:
+    """Decode an accessor into a NumPy array without per-element unpacking.
+
+    Tightly packed and interleaved (byteStride) buffer views are both returned
+    as strided views over the binary chunk. Normalized integer accessors are
+    converted to float32 in [0, 1] / [-1, 1] as defined by the glTF spec.
+
+    Args:
+        document: Parsed GLB document
+        accessor_index: Index into gltf["accessors"]
+
+    Returns:
+        Array of shape (count, components), or (count,) for SCALAR accessors
+
+    Raises:
+        TerrainError: If the accessor uses an unsupported layout
+    """
+    gltf = document.gltf
+    accessor = gltf["accessors"][accessor_index]
+
+    component_type = accessor.get("componentType")
+    if component_type not in COMPONENT_DTYPES:
+        raise TerrainError(f"Unsupported accessor componentType: {component_type}")
+    accessor_type = accessor.get("type", "SCALAR")
+    if accessor_type not in TYPE_COMPONENTS:
+        raise TerrainError(f"Unsupported accessor type: {accessor_type}")
+
+    dtype = COMPONENT_DTYPES[component_type]
+    components = TYPE_COMPONENTS[accessor_type]
+    count = accessor["count"]
+
+    if "bufferView" not in accessor:
+        # Spec: accessor without bufferView is all zeros
+        values = np.zeros((count, components), dtype=dtype)
+    else:
+        buffer_view = gltf["bufferViews"][accessor["bufferView"]]
+        start = buffer_view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+        element_size = dtype.itemsize * components
+        stride = buffer_view.get("byteStride") or element_size
+
+        if count and start + stride * (count - 1) + element_size > len(document.binary):
+            raise TerrainError(
+                f"Accessor {accessor_index} exceeds binary chunk "
+                f"({count} elements at offset {start}, stride {stride})"
+            )
+
+        values = np.ndarray(
+            shape=(count, components),
+            dtype=dtype,
+            buffer=document.binary,
+            offset=start,
+            strides=(stride, dtype.itemsize),
+        )
+
+    if accessor.get("normalized", False) and dtype.kind in "iu":
+        max_value = float(np.iinfo(dtype).max)
+        values = values.astype(np.float32) / max_value
+        if dtype.kind == "i":
+            np.maximum(values, -1.0, out=values)
+
+    if accessor_type == "SCALAR":
+        return values[:, 0]
+    return values
+
+
+def find_position_accessors(gltf: dict[str, Any]) -> list[int]:
+    """Locate POSITION accessors through meshes[].primitives[].attributes.
+
+    Args:
+        gltf: Decoded glTF JSON document
+
+    Returns:
+        Unique POSITION accessor indices in mesh/primitive order
+        (empty if the document declares no meshes)
+    """
+    indices: list[int] = []
+    for mesh in gltf.get("meshes", []):
+        for primitive in mesh.get("primitives", []):
+            position = primitive.get("attributes", {}).get("POSITION")
+            if position is not None and position not in indices:
+                indices.append(position)
+    return indices
+
+
+def read_triangles(document: GlbDocument, position_accessors: list[int]) -> np.ndarray:
+    """Read triangle vertex indices for every TRIANGLES primitive.
+
+    Indices are rebased onto the concatenation of ``position_accessors``
+    (in the given order), matching vertices decoded accessor-by-accessor.
+    Primitives without an index buffer use their vertices in order.
+
+    Args:
+        document: Parsed GLB document
+        position_accessors: POSITION accessor indices in concatenation order
+
+    Returns:
+        Integer array of shape (T, 3)
+
+    Raises:
+        TerrainError: If a primitive uses a non-triangle-list mode
+    """
+    gltf = document.gltf
+    accessors = gltf["accessors"]
+
+    vertex_offsets: dict[int, int] = {}
+    offset = 0
+    for index in position_accessors:
+        vertex_offsets[index] = offset
+        offset += accessors[index]["count"]
+
+    triangles = []
+    for mesh in gltf.get("meshes", []):
+        for primitive in mesh.get("primitives", []):
+            position = primitive.get("attributes", {}).get("POSITION")
+            if position not in vertex_offsets:
+                continue
+            mode = primitive.get("mode", PRIMITIVE_MODE_TRIANGLES)
+            if mode != PRIMITIVE_MODE_TRIANGLES:
+                raise TerrainError(f"Unsupported primitive mode {mode} (expected TRIANGLES)")
+
+            if "indices" in primitive:
+                indices = read_accessor(document, primitive["indices"]).astype(np.int64)
+            else:
+                indices = np.arange(accessors[position]["count"], dtype=np.int64)
+
+            usable = len(indices) - len(indices) % 3
+            triangles.append(indices[:usable].reshape(-1, 3) + vertex_offsets[position])
+
+    if not triangles:
+        return np.empty((0, 3), dtype=np.int64)
+    return np.concatenate(triangles)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Height data extraction from Portal terrain scenes (MP_*_Terrain.tscn).
+
+A terrain scene either embeds its collision heightfield as a
+HeightMapShape3D sub-resource, or instances the terrain mesh from a GLB
+ext_resource. This module reads the former into a float32 height array
+(with the world placement of the CollisionShape3D node that uses it) and
+resolves the latter to a mesh path for MeshTerrainProvider.
+
+Single Responsibility: Only handles locating terrain height data inside Godot scenes.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from ..core.exceptions import TerrainError
+from ..utils.tscn_utils import TscnTransformParser
+
+_HEIGHTMAP_RESOURCE = re.compile(
+    r'\[sub_resource type="HeightMapShape3D" id="?([^"\s\]]+)"?\]\s*\n(.*?)(?=^\[|\Z)',
+    re.MULTILINE | re.DOTALL,
+)
+_MAP_WIDTH = re.compile(r"^map_width\s*=\s*(\d+)", re.MULTILINE)
+_MAP_DEPTH = re.compile(r"^map_depth\s*=\s*(\d+)", re.MULTILINE)
+_MAP_DATA = re.compile(r"^map_data\s*=\s*PackedFloat32Array\(([^)]*)\)", re.MULTILINE)
+_NODE_SECTION = re.compile(r"^\[node [^\]]*\]\s*\n(.*?)(?=^\[|\Z)", re.MULTILINE | re.DOTALL)
+_TRANSFORM = re.compile(r"^transform\s*=\s*(Transform3D\([^)]*\))", re.MULTILINE)
+_MESH_RESOURCE = re.compile(r'\[ext_resource [^\]]*path="(res://[^"]+\.glb)"')
+
+
+@dataclass
+class HeightMapShape:
+    """HeightMapShape3D data placed in world space.
+
+    Godot centres the heightfield on its node, with one unit between samples
+    before the node's scale is applied.
+
+    Attributes:
+        heights: (map_depth, map_width) float32 heights indexed [row(Z), column(X)]
+        origin: World position (x, y, z) of the heightfield centre
+        scale: Node scale (x, y, z) applied to sample spacing and heights
+    """
+
+    heights: np.ndarray
+    origin: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    scale: tuple[float, float, float] = (1.0, 1.0, 1.0)
+
+    @property
+    def world_heights(self) -> np.ndarray:
+        """Heights with the node's Y scale and offset applied."""
+        return (self.heights * np.float32(self.scale[1]) + np.float32(self.origin[1])).astype(
+            np.float32, copy=False
+        )
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """World (min_x, max_x, min_z, max_z) covered by the heightfield."""
+        depth, width = self.heights.shape
+        half_x = (width - 1) / 2 * self.scale[0]
+        half_z = (depth - 1) / 2 * self.scale[2]
+        return (
+            self.origin[0] - half_x,
+            self.origin[0] + half_x,
+            self.origin[2] - half_z,
+            self.origin[2] + half_z,
+        )
+
+
+def parse_heightmap_shape(scene_text: str) -> HeightMapShape | None:
+    """Read the first HeightMapShape3D sub-resource of a .tscn scene.
+
+    Args:
+        scene_text: Contents of a .tscn file
+
+    Returns:
+        HeightMapShape, or None if the scene has no HeightMapShape3D
+
+    Raises:
+        TerrainError: If the sub-resource is malformed
+    """
+    resource = _HEIGHTMAP_RESOURCE.search(scene_text)
+    if not resource:
+        return None
+
+    resource_id, body = resource.groups()
+    width_match = _MAP_WIDTH.search(body)
+    depth_match = _MAP_DEPTH.search(body)
+    data_match = _MAP_DATA.search(body)
+    if not (width_match and depth_match and data_match):
+        raise TerrainError(
+            f"HeightMapShape3D '{resource_id}' is missing map_width, map_depth or map_data"
+        )
+
+    width, depth = int(width_match.group(1)), int(depth_match.group(1))
+    heights = np.fromstring(data_match.group(1), dtype=np.float32, sep=",")
+    if width < 2 or depth < 2 or heights.size != width * depth:
+        raise TerrainError(
+            f"HeightMapShape3D '{resource_id}' has {heights.size} samples for a {width}x{depth} map"
+        )
+
+    origin, scale = _shape_placement(scene_text, resource_id)
+    return HeightMapShape(heights=heights.reshape(depth, width), origin=origin, scale=scale)
+
+
+def _shape_placement(
+    scene_text: str, resource_id: str
+) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
+    """Get (origin, scale) of the node whose shape is the given sub-resource."""
+    reference = re.compile(
+        rf'^shape\s*=\s*SubResource\(\s*"?{re.escape(resource_id)}"?\s*\)', re.MULTILINE
+    )
+    for node in _NODE_SECTION.finditer(scene_text):
+        body = node.group(1)
+        if not reference.search(body):
+            continue
+        transform = _TRANSFORM.search(body)
+        if not transform:
+            break
+        basis, position = TscnTransformParser.parse(transform.group(1))
+        # Basis is written row-major; each axis scale is a column length
+        scale = tuple(math.hypot(basis[i], basis[i + 3], basis[i + 6]) for i in range(3))
+        return (position[0], position[1], position[2]), (scale[0], scale[1], scale[2])
+
+    return (0.0, 0.0, 0.0), (1.0, 1.0, 1.0)
+
+
+def find_terrain_mesh(scene_text: str, godot_root: Path) -> Path | None:
+    """Resolve the terrain GLB instanced by a .tscn scene.
+
+    Args:
+        scene_text: Contents of a .tscn file
+        godot_root: GodotProject directory that res:// paths are relative to
+
+    Returns:
+        Path of the referenced .glb (which may not exist), or None if the
+        scene references no GLB
+    """
+    match = _MESH_RESOURCE.search(scene_text)
+    if not match:
+        return None
+    return godot_root / match.group(1).removeprefix("res://")
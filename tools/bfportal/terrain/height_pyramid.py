@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Min/max/sum mipmap pyramid over a terrain height grid.
+
+Each level halves the previous one, keeping the minimum, maximum and sum of
+every 2x2 block. A rectangular query is answered exactly by peeling
+one-sample border strips off the rectangle at each level until the
+remaining interior is aligned with the next coarser level, so it touches
+O(log n) slices instead of every sample in the rectangle.
+
+Single Responsibility: Only handles region min/max/mean queries over a 2D grid.
+"""
+
+import numpy as np
+
+# Rectangles with at most this many samples are reduced directly
+DIRECT_REDUCE_SAMPLES = 256
+
+
+def _downsample(level: np.ndarray, fill: float, reduce: np.ufunc) -> np.ndarray:
+    """Combine 2x2 blocks, padding odd edges with a neutral fill value."""
+    rows, cols = level.shape
+    if rows % 2 or cols % 2:
+        padded = np.full((rows + rows % 2, cols + cols % 2), fill, dtype=level.dtype)
+        padded[:rows, :cols] = level
+        level = padded
+    combined: np.ndarray = reduce(
+        reduce(level[0::2, 0::2], level[1::2, 0::2]),
+        reduce(level[0::2, 1::2], level[1::2, 1::2]),
+    )
+    return combined
+
+
+class HeightPyramid:
+    """Mipmap pyramid answering exact min/max/mean over sample rectangles.
+
+    Levels are indexed [row, column] like the source grid; level 0 is the
+    grid itself.
+    """
+
+    def __init__(self, grid: np.ndarray):
+        """Build the pyramid.
+
+        Args:
+            grid: 2D height grid indexed [row(Z), column(X)] without NaN values
+        """
+        grid = np.asarray(grid)
+        self.rows, self.cols = grid.shape
+        self.mins = [grid]
+        self.maxs = [grid]
+        self.sums = [grid.astype(np.float64)]
+
+        while self.mins[-1].shape != (1, 1):
+            self.mins.append(_downsample(self.mins[-1], np.inf, np.minimum))
+            self.maxs.append(_downsample(self.maxs[-1], -np.inf, np.maximum))
+            self.sums.append(_downsample(self.sums[-1], 0.0, np.add))
+
+    def query(self, row0: int, row1: int, col0: int, col1: int) -> tuple[float, float, float]:
+        """Get (min, max, mean) of the samples in rows [row0, row1) x columns [col0, col1).
+
+        Args:
+            row0: First row
+            row1: One past the last row
+            col0: First column
+            col1: One past the last column
+
+        Returns:
+            Tuple of (min, max, mean)
+
+        Raises:
+            ValueError: If the rectangle is empty or outside the grid
+        """
+        if not (0 <= row0 < row1 <= self.rows and 0 <= col0 < col1 <= self.cols):
+            raise ValueError(
+                f"Empty or out-of-range rectangle rows [{row0}, {row1}) x "
+                f"columns [{col0}, {col1}) for a {self.rows}x{self.cols} grid"
+            )
+
+        count = (row1 - row0) * (col1 - col0)
+        low, high, total = np.inf, -np.inf, 0.0
+
+        for level in range(len(self.mins)):
+            # Interior aligned to the next level's 2x2 blocks
+            inner_r0, inner_r1 = (row0 + 1) // 2, row1 // 2
+            inner_c0, inner_c1 = (col0 + 1) // 2, col1 // 2
+            if (
+                (row1 - row0) * (col1 - col0) <= DIRECT_REDUCE_SAMPLES
+                or inner_r0 >= inner_r1
+                or inner_c0 >= inner_c1
+            ):
+                strips = [(row0, row1, col0, col1)]
+            else:
+                strips = [
+                    (row0, 2 * inner_r0, col0, col1),  # top row (odd start)
+                    (2 * inner_r1, row1, col0, col1),  # bottom row (odd end)
+                    (2 * inner_r0, 2 * inner_r1, col0, 2 * inner_c0),  # left column
+                    (2 * inner_r0, 2 * inner_r1, 2 * inner_c1, col1),  # right column
+                ]
+
+            for r0, r1, c0, c1 in strips:
+                if r0 < r1 and c0 < c1:
+                    low = min(low, float(self.mins[level][r0:r1, c0:c1].min()))
+                    high = max(high, float(self.maxs[level][r0:r1, c0:c1].max()))
+                    total += float(self.sums[level][r0:r1, c0:c1].sum())
+
+            if len(strips) == 1:
+                break
+            row0, row1, col0, col1 = inner_r0, inner_r1, inner_c0, inner_c1
+
+        return low, high, total / count
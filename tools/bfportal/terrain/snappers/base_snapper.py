@@ -8,9 +8,17 @@ Interface Segregation: Simple, focused interface.
 Dependency Inversion: Depends on abstractions (ITerrainProvider).
 """
 
+import math
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+from ...core.exceptions import OutOfBoundsError, TerrainError
+from ...core.interfaces import ITerrainProvider as CoreTerrainProvider
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass
@@ -22,19 +30,22 @@ class SnapResult:
         snapped_y: New Y coordinate after snapping
         was_adjusted: True if Y was changed
         reason: Human-readable reason for adjustment (or why not)
+        normal: Terrain normal to tilt the object onto (None keeps its rotation)
     """
 
     original_y: float
     snapped_y: float
     was_adjusted: bool
     reason: str
+    normal: tuple[float, float, float] | None = None
 
 
 class ITerrainProvider(Protocol):
     """Protocol for terrain height queries.
 
-    Note: This duplicates the interface in core/interfaces.py but avoids
-    circular imports. Both should stay in sync.
+    Note: Snappers accept any object answering these height queries.
+    Providers implementing the full core interface (CoreTerrainProvider)
+    are also asked for region and normal queries.
     """
 
     def get_height_at(self, x: float, z: float) -> float:
@@ -52,6 +63,77 @@ class ITerrainProvider(Protocol):
         """
         ...
 
+    def get_heights_at(self, xs: list[float], zs: list[float]) -> "np.ndarray":
+        """Get terrain heights for many (x, z) positions in one call.
+
+        Args:
+            xs: X coordinates
+            zs: Z coordinates
+
+        Returns:
+            Heights at each position (NaN where out of bounds)
+        """
+        ...
+
+
+class HeightPrefetchCache:
+    """Terrain heights fetched ahead of time with a single batched query.
+
+    Lookups that were not prefetched fall through to get_height_at, so
+    callers get the same answers with or without a prefetch.
+    """
+
+    def __init__(self, terrain: ITerrainProvider):
+        """Initialize cache.
+
+        Args:
+            terrain: Terrain provider for height queries
+        """
+        self.terrain = terrain
+        self._heights: dict[tuple[float, float], float] = {}
+
+    def prefetch(self, points: Iterable[tuple[float, float]]) -> None:
+        """Replace cached heights with a batched query for the given points.
+
+        Args:
+            points: (x, z) positions that will be queried next
+        """
+        self._heights = {}
+        unique_points = list(dict.fromkeys(points))
+        if not unique_points:
+            return
+
+        try:
+            heights = self.terrain.get_heights_at(
+                [x for x, _ in unique_points], [z for _, z in unique_points]
+            )
+        except (OutOfBoundsError, TerrainError) as e:
+            # Lookups fall back to per-point queries
+            print(f"  ⚠️  Batched height query failed, querying points one by one: {e}")
+            return
+        self._heights = dict(zip(unique_points, heights.tolist(), strict=True))
+
+    def get_height_at(self, x: float, z: float) -> float:
+        """Get terrain height, using the prefetched value when available.
+
+        Args:
+            x: X coordinate
+            z: Z coordinate
+
+        Returns:
+            Height at position
+
+        Raises:
+            OutOfBoundsError: If a prefetched position was out of bounds
+            Exception: Anything raised by the provider for non-prefetched positions
+        """
+        height = self._heights.get((x, z))
+        if height is None:
+            return self.terrain.get_height_at(x, z)
+        if math.isnan(height):  # NaN marks an out-of-bounds position
+            raise OutOfBoundsError(f"Position ({x}, {z}) is outside terrain bounds")
+        return height
+
 
 class IObjectSnapper(ABC):
     """Abstract base class for object snapping strategies.
@@ -70,6 +152,111 @@ class IObjectSnapper(ABC):
             terrain: Terrain provider for height queries
         """
         self.terrain = terrain
+        self._height_cache = HeightPrefetchCache(terrain)
+        self._normals: dict[tuple[float, float], tuple[float, float, float]] = {}
+
+    def get_sample_points(self, x: float, z: float, node_name: str) -> list[tuple[float, float]]:
+        """Get the terrain positions calculate_snapped_height will query.
+
+        Used to prefetch heights for a whole file in one batch. Subclasses that
+        sample more than the object position override this.
+
+        Args:
+            x: Object X position
+            z: Object Z position
+            node_name: Node name for context
+
+        Returns:
+            List of (x, z) positions
+        """
+        return [(x, z)]
+
+    def prefetch_heights(self, points: Iterable[tuple[float, float]]) -> None:
+        """Fetch terrain heights for upcoming snaps in a single batched query.
+
+        Args:
+            points: (x, z) positions from get_sample_points
+        """
+        self._height_cache.prefetch(points)
+
+    def _query_height(self, x: float, z: float) -> float:
+        """Get terrain height, served from the prefetch cache when possible.
+
+        Args:
+            x: X coordinate
+            z: Z coordinate
+
+        Returns:
+            Terrain height at position
+        """
+        return self._height_cache.get_height_at(x, z)
+
+    def _uses_terrain_queries(self) -> bool:
+        """Check if the terrain answers region and normal queries natively.
+
+        Providers implementing the core terrain interface do; other
+        (duck-typed) terrains only answer height queries.
+        """
+        return isinstance(self.terrain, CoreTerrainProvider)
+
+    def uses_terrain_normals(self, node_name: str) -> bool:
+        """Check if calculate_snapped_height queries the terrain normal for an object.
+
+        Used to prefetch normals for a whole file in one batch. Snappers that
+        use the terrain slope override this.
+
+        Args:
+            node_name: Node name from .tscn
+
+        Returns:
+            True if the object's terrain normal will be queried
+        """
+        return False
+
+    def prefetch_normals(self, points: Iterable[tuple[float, float]]) -> None:
+        """Fetch terrain normals for upcoming snaps in a single batched query.
+
+        Args:
+            points: (x, z) object positions that will be queried next
+        """
+        self._normals = {}
+        terrain = self.terrain
+        unique_points = list(dict.fromkeys(points))
+        if not unique_points or not isinstance(terrain, CoreTerrainProvider):
+            return
+
+        normals = terrain.get_normals_at(
+            [x for x, _ in unique_points], [z for _, z in unique_points]
+        )
+        self._normals = {
+            point: (nx, ny, nz)
+            for point, (nx, ny, nz) in zip(unique_points, normals.tolist(), strict=True)
+        }
+
+    def _query_normal(self, x: float, z: float) -> tuple[float, float, float] | None:
+        """Get the terrain normal, served from the prefetch cache when possible.
+
+        Args:
+            x: X coordinate
+            z: Z coordinate
+
+        Returns:
+            Unit (x, y, z) normal, or None if the terrain has no normal data
+            or the position is out of bounds
+        """
+        normal = self._normals.get((x, z))
+        if normal is None:
+            terrain = self.terrain
+            if not isinstance(terrain, CoreTerrainProvider):
+                return None
+            try:
+                vector = terrain.get_normal_at(x, z)
+            except OutOfBoundsError:
+                return None
+            return (vector.x, vector.y, vector.z)
+        if math.isnan(normal[0]):  # NaN marks an out-of-bounds position
+            return None
+        return normal
 
     @abstractmethod
     def can_snap(self, node_name: str, asset_type: str | None = None) -> bool:
@@ -63,7 +63,7 @@ class GameplaySnapper(IObjectSnapper):
             SnapResult with snapped height
         """
         try:
-            terrain_height = self.terrain.get_height_at(x, z)
+            terrain_height = self._query_height(x, z)
 
             # Determine offset based on object type
             if "SpawnPoint" in node_name or "Spawn_" in node_name:
@@ -4,7 +4,7 @@
 Handles all non-gameplay, non-vegetation objects.
 """
 
-from .base_snapper import IObjectSnapper, ITerrainProvider, SnapResult
+from .base_snapper import CoreTerrainProvider, IObjectSnapper, ITerrainProvider, SnapResult
 
 
 class PropSnapper(IObjectSnapper):
@@ -12,6 +12,7 @@ class PropSnapper(IObjectSnapper):
 
     Height Rules:
     - Most props sit directly on terrain (offset: 0m)
+    - Vehicles, wrecks and rocks are tilted to follow the terrain slope
     - Some props (like water bodies, decals) may need custom handling
 
     Single Responsibility: Only handles prop/decoration snapping.
@@ -79,21 +80,32 @@ class PropSnapper(IObjectSnapper):
         name_lower = node_name.lower()
         return any(pattern in name_lower for pattern in self.LARGE_OBJECT_PATTERNS)
 
-    def _sample_terrain_multipoint(self, x: float, z: float, sample_radius: float = 10.0) -> float:
-        """Sample terrain at multiple points and return minimum height.
+    def _sample_radius(self, node_name: str) -> float:
+        """Get the multi-point sampling radius for an object.
 
-        This prevents large buildings from sinking into terrain on slopes.
+        Args:
+            node_name: Node name
+
+        Returns:
+            10m for large buildings/structures, 2m for everything else
+        """
+        return 10.0 if self._is_large_object(node_name) else 2.0
+
+    @staticmethod
+    def _square_sample_points(
+        x: float, z: float, sample_radius: float
+    ) -> list[tuple[float, float]]:
+        """Get 5 sample points: center + 4 corners of a square.
 
         Args:
             x: Center X position
             z: Center Z position
-            sample_radius: Radius to sample around center (default: 10m)
+            sample_radius: Half the square's side length
 
         Returns:
-            Minimum terrain height from all sample points
+            List of (x, z) positions
         """
-        # Sample 5 points: center + 4 corners of a square
-        sample_points = [
+        return [
             (x, z),  # Center
             (x - sample_radius, z - sample_radius),  # SW corner
             (x + sample_radius, z - sample_radius),  # SE corner
@@ -101,10 +113,90 @@ class PropSnapper(IObjectSnapper):
             (x - sample_radius, z + sample_radius),  # NW corner
         ]
 
+    # Patterns for small objects tilted to sit flush on sloped terrain
+    TERRAIN_ALIGNED_PATTERNS = [
+        "vehicle",
+        "tank",
+        "truck",
+        "jeep",
+        "wreck",
+        "rock",
+        "boulder",
+    ]
+
+    def uses_terrain_normals(self, node_name: str) -> bool:
+        """Check if an object is tilted to the terrain slope.
+
+        Buildings keep their rotation and rest on their footprint minimum.
+
+        Args:
+            node_name: Node name
+
+        Returns:
+            True for vehicles, wrecks and rocks
+        """
+        name_lower = node_name.lower()
+        if self._is_large_object(node_name) or any(
+            pattern in name_lower for pattern in self.SKIP_PATTERNS
+        ):
+            return False
+        return any(pattern in name_lower for pattern in self.TERRAIN_ALIGNED_PATTERNS)
+
+    def _uses_region_query(self) -> bool:
+        """Check if footprints are resolved with one region query.
+
+        Returns:
+            True if the terrain answers region queries exactly from a height grid
+        """
+        terrain = self.terrain
+        return isinstance(terrain, CoreTerrainProvider) and terrain.has_region_grid()
+
+    def get_sample_points(self, x: float, z: float, node_name: str) -> list[tuple[float, float]]:
+        """Get the terrain positions sampled for this prop.
+
+        Args:
+            x: Object X position
+            z: Object Z position
+            node_name: Node name
+
+        Returns:
+            List of (x, z) positions (empty for skipped objects, and when the
+            footprint is resolved with a region query instead; only the
+            centre for slope-aligned objects)
+        """
+        name_lower = node_name.lower()
+        if any(pattern in name_lower for pattern in self.SKIP_PATTERNS):
+            return []
+        if self._uses_terrain_queries() and self.uses_terrain_normals(node_name):
+            return [(x, z)]
+        if self._uses_region_query():
+            return []
+        return self._square_sample_points(x, z, self._sample_radius(node_name))
+
+    def _sample_terrain_multipoint(self, x: float, z: float, sample_radius: float = 10.0) -> float:
+        """Find the minimum terrain height under an object's footprint.
+
+        This prevents large buildings from sinking into terrain on slopes.
+        On grid-backed terrain the footprint is resolved with one exact
+        region query. Otherwise the centre and four corners are sampled
+        (from the prefetched batch when available).
+
+        Args:
+            x: Center X position
+            z: Center Z position
+            sample_radius: Radius to sample around center (default: 10m)
+
+        Returns:
+            Minimum terrain height over the footprint
+        """
+        terrain = self.terrain
+        if isinstance(terrain, CoreTerrainProvider) and self._uses_region_query():
+            return terrain.get_min_height_in_radius(x, z, sample_radius)
+
         heights = []
-        for sx, sz in sample_points:
+        for sx, sz in self._square_sample_points(x, z, sample_radius):
             try:
-                h = self.terrain.get_height_at(sx, sz)
+                h = self._query_height(sx, sz)
                 heights.append(h)
             except Exception:
                 # Skip points that fail (out of bounds)
@@ -112,7 +204,7 @@ class PropSnapper(IObjectSnapper):
 
         if not heights:
             # All samples failed - fall back to center point
-            return self.terrain.get_height_at(x, z)
+            return self._query_height(x, z)
 
         # Return minimum height (prevents sinking)
         return min(heights)
@@ -124,6 +216,8 @@ class PropSnapper(IObjectSnapper):
 
         For large objects (buildings), samples multiple terrain points
         to find the lowest ground height, preventing sinking on slopes.
+        Slope-aligned objects sit on the terrain at their centre and carry
+        the terrain normal so their rotation can be tilted to match.
 
         Args:
             x: Object X position
@@ -146,17 +240,30 @@ class PropSnapper(IObjectSnapper):
                 )
 
         try:
+            normal = self._query_normal(x, z) if self.uses_terrain_normals(node_name) else None
+            if normal is not None:
+                # Tilted flush with the slope, so the centre touches the ground
+                snapped_y = self._query_height(x, z)
+                return SnapResult(
+                    original_y=current_y,
+                    snapped_y=snapped_y,
+                    was_adjusted=abs(snapped_y - current_y) > 0.1,
+                    reason="Prop (aligned to terrain slope)",
+                    normal=normal,
+                )
+
             # ALL objects benefit from multi-point sampling on uneven terrain
             # Adjust sample radius based on object size
+            sample_radius = self._sample_radius(node_name)
             if self._is_large_object(node_name):
                 # Large buildings: sample 10m radius
-                terrain_height = self._sample_terrain_multipoint(x, z, sample_radius=10.0)
+                terrain_height = self._sample_terrain_multipoint(x, z, sample_radius=sample_radius)
                 # Add small upward offset for large buildings to prevent edge clipping
                 terrain_height += 0.2
                 reason = "Large object (10m radius sampled)"
             else:
                 # Small props/crates: sample 2m radius (prevents sinking on slopes)
-                terrain_height = self._sample_terrain_multipoint(x, z, sample_radius=2.0)
+                terrain_height = self._sample_terrain_multipoint(x, z, sample_radius=sample_radius)
                 reason = "Prop (2m radius sampled)"
 
             snapped_y = terrain_height
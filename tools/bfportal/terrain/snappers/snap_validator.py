@@ -4,7 +4,9 @@
 Single Responsibility: Validate and fix objects that ended up underground after snapping.
 """
 
-from .base_snapper import ITerrainProvider, SnapResult
+from collections.abc import Iterable
+
+from .base_snapper import HeightPrefetchCache, ITerrainProvider, SnapResult
 
 
 class SnapValidator:
@@ -25,6 +27,15 @@ class SnapValidator:
             terrain: Terrain provider for height queries
         """
         self.terrain = terrain
+        self._height_cache = HeightPrefetchCache(terrain)
+
+    def prefetch_heights(self, points: Iterable[tuple[float, float]]) -> None:
+        """Fetch terrain heights for upcoming validations in a single batched query.
+
+        Args:
+            points: (x, z) object positions
+        """
+        self._height_cache.prefetch(points)
 
     def validate_and_correct(
         self,
@@ -54,7 +65,7 @@ class SnapValidator:
         """
         try:
             # Get terrain height at this exact position
-            terrain_height = self.terrain.get_height_at(x, z)
+            terrain_height = self._height_cache.get_height_at(x, z)
 
             # Define acceptable range
             min_acceptable_y = terrain_height + min_clearance
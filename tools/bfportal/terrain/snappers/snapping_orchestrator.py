@@ -10,9 +10,12 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from .base_snapper import IObjectSnapper, ITerrainProvider
+from .base_snapper import IObjectSnapper, ITerrainProvider, SnapResult
 from .snap_validator import SnapValidator
 
+# Tilts below this are reported as unchanged rotations
+ALIGNMENT_TOLERANCE_DEGREES = 1.0
+
 
 @dataclass
 class SnappingStats:
@@ -31,6 +34,25 @@ class SnappingStats:
     errors: int = 0
 
 
+@dataclass
+class _PendingSnap:
+    """Object routed to a snapper, awaiting height calculation.
+
+    Attributes:
+        line_index: Index of the transform line in the output lines
+        values: Parsed 12-component transform
+        indent: Leading whitespace of the transform line
+        node_name: Node name from .tscn
+        snapper: Snapper that handles this object
+    """
+
+    line_index: int
+    values: list[float]
+    indent: str
+    node_name: str
+    snapper: IObjectSnapper
+
+
 class SnappingOrchestrator:
     """Coordinates terrain snapping across multiple object categories.
 
@@ -108,6 +130,10 @@ class SnappingOrchestrator:
 
         SOLID: Single Responsibility - handles the core snapping logic.
 
+        Objects are collected first so terrain heights and normals can be
+        fetched in one batched query, then snapped in file order. Objects
+        snapped onto a terrain normal are tilted in a single vectorized pass.
+
         Args:
             lines: Input .tscn file lines
 
@@ -122,6 +148,7 @@ class SnappingOrchestrator:
         skip_terrain_node = False
         adjustments_shown = 0
         max_adjustments_to_show = 10
+        pending: list[_PendingSnap] = []
 
         for line in lines:
             # Track current node and its parent
@@ -160,55 +187,16 @@ class SnappingOrchestrator:
                 transform_result = self._parse_transform_line(line)
                 if transform_result:
                     values, indent = transform_result
-                    x, current_y, z = values[9], values[10], values[11]
 
                     # Find appropriate snapper
                     snapper = self._find_snapper(current_node_name, current_asset_type)
 
                     if snapper:
-                        # Snap the object
-                        result = snapper.calculate_snapped_height(
-                            x, z, current_y, current_node_name
+                        # Defer snapping until terrain heights are prefetched
+                        pending.append(
+                            _PendingSnap(len(new_lines), values, indent, current_node_name, snapper)
                         )
-
-                        stats.total_objects += 1
-
-                        # PASS 2: Validate the snapped height (safety check for underground objects)
-                        validation_result = self.validator.validate_and_correct(
-                            x, z, result.snapped_y, current_node_name, min_clearance=0.3
-                        )
-
-                        # Use validated height (might be lifted if object was underground)
-                        final_y = validation_result.snapped_y
-                        was_lifted = validation_result.was_adjusted
-
-                        if result.was_adjusted or was_lifted:
-                            # Update transform line with validated height
-                            values[10] = final_y
-                            new_line = self._format_transform_line(values, indent)
-                            new_lines.append(new_line)
-
-                            # Track by category
-                            category = snapper.get_category_name()
-                            stats.snapped_by_category[category] = (
-                                stats.snapped_by_category.get(category, 0) + 1
-                            )
-
-                            # Log adjustment
-                            if adjustments_shown < max_adjustments_to_show:
-                                delta = final_y - result.original_y
-                                reason = result.reason
-                                if was_lifted:
-                                    reason += f" + {validation_result.reason}"
-                                print(
-                                    f"   [{category}] {current_node_name}: "
-                                    f"Y {result.original_y:.1f}m → {final_y:.1f}m "
-                                    f"(Δ {delta:+.1f}m) - {reason}"
-                                )
-                                adjustments_shown += 1
-                        else:
-                            # No adjustment needed
-                            new_lines.append(line)
+                        new_lines.append(line)
                     else:
                         # No snapper found
                         stats.skipped += 1
@@ -221,8 +209,124 @@ class SnappingOrchestrator:
                 # Not a transform line
                 new_lines.append(line)
 
+        # Query terrain for every object in one batch per snapper
+        self._prefetch_terrain(pending)
+
+        results = [
+            snap.snapper.calculate_snapped_height(
+                snap.values[9], snap.values[11], snap.values[10], snap.node_name
+            )
+            for snap in pending
+        ]
+        tilts = self._align_to_terrain(pending, results)
+
+        for snap, result in zip(pending, results, strict=True):
+            values = snap.values
+            x, z = values[9], values[11]
+
+            stats.total_objects += 1
+
+            # PASS 2: Validate the snapped height (safety check for underground objects)
+            validation_result = self.validator.validate_and_correct(
+                x, z, result.snapped_y, snap.node_name, min_clearance=0.3
+            )
+
+            # Use validated height (might be lifted if object was underground)
+            final_y = validation_result.snapped_y
+            was_lifted = validation_result.was_adjusted
+            tilt = tilts.get(snap.line_index, 0.0)
+
+            if result.was_adjusted or was_lifted or tilt > ALIGNMENT_TOLERANCE_DEGREES:
+                # Update transform line with validated height (and aligned basis)
+                values[10] = final_y
+                new_lines[snap.line_index] = self._format_transform_line(values, snap.indent)
+
+                # Track by category
+                category = snap.snapper.get_category_name()
+                stats.snapped_by_category[category] = stats.snapped_by_category.get(category, 0) + 1
+
+                # Log adjustment
+                if adjustments_shown < max_adjustments_to_show:
+                    delta = final_y - result.original_y
+                    reason = result.reason
+                    if tilt > ALIGNMENT_TOLERANCE_DEGREES:
+                        reason += f" + tilted {tilt:.1f}°"
+                    if was_lifted:
+                        reason += f" + {validation_result.reason}"
+                    print(
+                        f"   [{category}] {snap.node_name}: "
+                        f"Y {result.original_y:.1f}m → {final_y:.1f}m "
+                        f"(Δ {delta:+.1f}m) - {reason}"
+                    )
+                    adjustments_shown += 1
+
         return new_lines, stats, adjustments_shown
 
+    def _prefetch_terrain(self, pending: list[_PendingSnap]) -> None:
+        """Batch terrain queries for all pending snaps.
+
+        Each snapper receives one height prefetch covering the sample points of
+        every object routed to it, plus one normal prefetch for the objects it
+        places from the terrain slope; the validator receives one height
+        prefetch for all object positions.
+
+        Args:
+            pending: Objects awaiting snapping, in file order
+        """
+        points_by_snapper: dict[int, list[tuple[float, float]]] = {}
+        normal_points_by_snapper: dict[int, list[tuple[float, float]]] = {}
+        for snap in pending:
+            x, z = snap.values[9], snap.values[11]
+            points_by_snapper.setdefault(id(snap.snapper), []).extend(
+                snap.snapper.get_sample_points(x, z, snap.node_name)
+            )
+            if snap.snapper.uses_terrain_normals(snap.node_name):
+                normal_points_by_snapper.setdefault(id(snap.snapper), []).append((x, z))
+
+        for snapper in self.snappers:
+            if id(snapper) in points_by_snapper:
+                snapper.prefetch_heights(points_by_snapper[id(snapper)])
+            if id(snapper) in normal_points_by_snapper:
+                snapper.prefetch_normals(normal_points_by_snapper[id(snapper)])
+
+        self.validator.prefetch_heights((snap.values[9], snap.values[11]) for snap in pending)
+
+    def _align_to_terrain(
+        self, pending: list[_PendingSnap], results: list[SnapResult]
+    ) -> dict[int, float]:
+        """Tilt every object whose snap result carries a terrain normal.
+
+        All bases are rotated in one vectorized pass; the aligned basis is
+        written back into each pending snap's transform values.
+
+        Args:
+            pending: Objects awaiting snapping, in file order
+            results: Snap result for each pending object
+
+        Returns:
+            Dict of line index -> tilt applied in degrees, for aligned objects
+        """
+        aligned = [
+            (snap, result.normal)
+            for snap, result in zip(pending, results, strict=True)
+            if result.normal is not None
+        ]
+        if not aligned:
+            return {}
+
+        import numpy as np
+
+        from ..surface_alignment import align_up_axes
+
+        bases = np.array([snap.values[:9] for snap, _ in aligned]).reshape(-1, 3, 3)
+        bases, tilts = align_up_axes(bases, np.array([normal for _, normal in aligned]))
+
+        for (snap, _), basis in zip(aligned, bases.reshape(-1, 9).tolist(), strict=True):
+            snap.values[:9] = basis
+        return {
+            snap.line_index: tilt for (snap, _), tilt in zip(aligned, tilts.tolist(), strict=True)
+        }
+
     def _write_snapped_file(self, tscn_path: Path, output_path: Path, new_lines: list[str]) -> None:
         """Write snapped .tscn file with backup.
 
@@ -4,6 +4,8 @@
 Handles all vegetation types with appropriate ground contact.
 """
 
+import math
+
 from .base_snapper import IObjectSnapper, ITerrainProvider, SnapResult
 
 
@@ -13,6 +15,7 @@ class VegetationSnapper(IObjectSnapper):
     Height Rules:
     - All vegetation sits directly on terrain (offset: 0m)
     - Roots/base should touch ground naturally
+    - Trunks stay upright; on slopes the base drops to the downhill edge
 
     Single Responsibility: Only handles vegetation snapping.
     """
@@ -63,19 +66,22 @@ class VegetationSnapper(IObjectSnapper):
 
         return False
 
-    def _sample_terrain_multipoint(self, x: float, z: float, sample_radius: float = 1.5) -> float:
-        """Sample terrain at tree base to prevent sinking on slopes.
+    # Radius around the trunk sampled for ground contact
+    SAMPLE_RADIUS = 1.5
+
+    @staticmethod
+    def _trunk_sample_points(x: float, z: float, sample_radius: float) -> list[tuple[float, float]]:
+        """Get 5 sample points: center + 4 cardinal directions around trunk.
 
         Args:
             x: Center X position
             z: Center Z position
-            sample_radius: Radius around tree trunk (default: 1.5m)
+            sample_radius: Distance from the trunk
 
         Returns:
-            Minimum terrain height from sample points
+            List of (x, z) positions
         """
-        # Sample 5 points: center + 4 cardinal directions around trunk
-        sample_points = [
+        return [
             (x, z),  # Center (trunk)
             (x - sample_radius, z),  # West
             (x + sample_radius, z),  # East
@@ -83,16 +89,75 @@ class VegetationSnapper(IObjectSnapper):
             (x, z + sample_radius),  # North
         ]
 
+    def uses_terrain_normals(self, node_name: str) -> bool:
+        """Check if the trunk base is placed from the terrain slope.
+
+        Args:
+            node_name: Node name (unused)
+
+        Returns:
+            True when the terrain provides normals
+        """
+        return self._uses_terrain_queries()
+
+    def get_sample_points(self, x: float, z: float, node_name: str) -> list[tuple[float, float]]:
+        """Get the terrain positions sampled around the trunk.
+
+        Args:
+            x: Object X position
+            z: Object Z position
+            node_name: Node name (unused)
+
+        Returns:
+            List of (x, z) positions (only the trunk when the terrain
+            provides normals)
+        """
+        if self.uses_terrain_normals(node_name):
+            return [(x, z)]
+        return self._trunk_sample_points(x, z, self.SAMPLE_RADIUS)
+
+    def _sample_terrain_slope(self, x: float, z: float, sample_radius: float) -> float | None:
+        """Estimate the lowest ground around the trunk from the terrain slope.
+
+        The terrain is treated as the tangent plane at the trunk, whose
+        lowest point within the radius lies downhill by radius * slope.
+
+        Args:
+            x: Center X position
+            z: Center Z position
+            sample_radius: Radius around tree trunk
+
+        Returns:
+            Lowest plane height within the radius, or None without normal data
+        """
+        normal = self._query_normal(x, z)
+        if normal is None:
+            return None
+        nx, ny, nz = normal
+        slope = math.hypot(nx, nz) / ny if ny > 0 else 0.0
+        return self._query_height(x, z) - sample_radius * slope
+
+    def _sample_terrain_multipoint(self, x: float, z: float, sample_radius: float = 1.5) -> float:
+        """Sample terrain at tree base to prevent sinking on slopes.
+
+        Args:
+            x: Center X position
+            z: Center Z position
+            sample_radius: Radius around tree trunk (default: 1.5m)
+
+        Returns:
+            Minimum terrain height from sample points
+        """
         heights = []
-        for sx, sz in sample_points:
+        for sx, sz in self._trunk_sample_points(x, z, sample_radius):
             try:
-                h = self.terrain.get_height_at(sx, sz)
+                h = self._query_height(sx, sz)
                 heights.append(h)
             except Exception:
                 continue
 
         if not heights:
-            return self.terrain.get_height_at(x, z)
+            return self._query_height(x, z)
 
         # Return minimum height (prevents sinking)
         return min(heights)
@@ -102,8 +167,8 @@ class VegetationSnapper(IObjectSnapper):
     ) -> SnapResult:
         """Calculate appropriate height for vegetation.
 
-        Uses multi-point sampling around the tree trunk to prevent
-        sinking into slopes.
+        Uses the terrain slope (or multi-point sampling around the tree
+        trunk when no normals are available) to prevent sinking into slopes.
 
         Args:
             x: Object X position
@@ -115,8 +180,12 @@ class VegetationSnapper(IObjectSnapper):
             SnapResult with snapped height
         """
         try:
-            # Multi-point sample around tree base (prevents sinking on slopes)
-            terrain_height = self._sample_terrain_multipoint(x, z, sample_radius=1.5)
+            # Lowest ground around tree base (prevents sinking on slopes)
+            terrain_height = self._sample_terrain_slope(x, z, self.SAMPLE_RADIUS)
+            if terrain_height is None:
+                terrain_height = self._sample_terrain_multipoint(
+                    x, z, sample_radius=self.SAMPLE_RADIUS
+                )
 
             # Vegetation sits directly on terrain
             snapped_y = terrain_height
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Tilting object transforms to sit flush on the terrain surface.
+
+Transform3D bases are handled as (N, 3, 3) matrices in .tscn order, whose
+columns are the object's local X, Y (up) and Z axes. Each basis is rotated
+by the smallest rotation taking its current up axis onto the terrain
+normal, which keeps the object's heading and scale and makes re-aligning
+an already aligned object a no-op.
+
+Single Responsibility: Only handles rotating transform bases onto surface normals.
+"""
+
+import numpy as np
+
+# Bases whose up axis points this close to straight down are left unrotated
+ANTIPARALLEL_EPSILON = 1e-6
+
+
+def align_up_axes(bases: np.ndarray, normals: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Rotate each basis so its local up axis points along a surface normal.
+
+    Args:
+        bases: (N, 3, 3) rotation-scale matrices (columns are local axes)
+        normals: (N, 3) unit surface normals
+
+    Returns:
+        Tuple of (aligned (N, 3, 3) bases, (N,) tilt applied in degrees);
+        bases with a degenerate or upside-down up axis, or a NaN normal, are
+        returned unchanged with a tilt of 0
+    """
+    bases = np.asarray(bases, dtype=np.float64)
+    normals = np.asarray(normals, dtype=np.float64)
+
+    up = bases[:, :, 1]
+    up_length = np.linalg.norm(up, axis=1)
+    valid = up_length > 0
+    up = up / np.where(valid, up_length, 1.0)[:, None]
+
+    # Rodrigues' formula for the rotation taking `up` onto `normal`:
+    # R = I + K + K^2 / (1 + cos), with K the cross-product matrix of up x normal
+    axis = np.cross(up, normals)
+    cos = np.einsum("ij,ij->i", up, normals)
+    valid &= cos > -1.0 + ANTIPARALLEL_EPSILON  # also False for NaN normals
+    axis[~valid] = 0.0
+    cos = np.where(valid, cos, 1.0)
+
+    skew = np.zeros((len(bases), 3, 3))
+    skew[:, 0, 1], skew[:, 0, 2] = -axis[:, 2], axis[:, 1]
+    skew[:, 1, 0], skew[:, 1, 2] = axis[:, 2], -axis[:, 0]
+    skew[:, 2, 0], skew[:, 2, 1] = -axis[:, 1], axis[:, 0]
+
+    rotations = np.eye(3) + skew + (skew @ skew) / (1.0 + cos)[:, None, None]
+
+    tilt = np.degrees(np.arccos(np.clip(cos, -1.0, 1.0)))
+    return rotations @ bases, tilt
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Persistent on-disk cache of preprocessed terrain meshes.
+
+Every tool run used to re-parse the same Portal terrain GLB and rebuild its
+height grid (and, in triangle query mode, its triangle index). TerrainCache
+stores those arrays in one uncompressed .npz file per mesh and grid
+resolution, and discards it automatically when the GLB's size or
+modification time changes.
+
+Single Responsibility: Only handles storing and loading preprocessed terrain arrays.
+"""
+
+import hashlib
+import os
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .triangle_index import TriangleSpatialIndex
+
+# Bump when the layout or meaning of cached arrays changes
+CACHE_FORMAT_VERSION = 1
+
+# Environment variable overriding the default cache directory
+CACHE_DIR_ENV = "BFPORTAL_TERRAIN_CACHE"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "bfportal" / "terrain"
+
+# Key prefix for triangle index arrays inside the .npz
+TRIANGLE_PREFIX = "tri_"
+
+
+@dataclass
+class CachedTerrain:
+    """Preprocessed terrain arrays loaded from the cache.
+
+    Attributes:
+        vertices: (N, 3) float32 vertex positions
+        height_grid: Gap-filled height grid
+        triangle_index: Restored triangle index, or None if not requested
+    """
+
+    vertices: np.ndarray
+    height_grid: np.ndarray
+    triangle_index: TriangleSpatialIndex | None = None
+
+
+class TerrainCache:
+    """Stores preprocessed terrain arrays keyed by mesh file and grid resolution.
+
+    Cache files are named after the mesh path and grid resolution; the mesh's
+    size and mtime are stored inside, so a changed GLB invalidates its entry
+    and the next store overwrites it in place.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for cache files (default: $BFPORTAL_TERRAIN_CACHE,
+                then ~/.cache/bfportal/terrain)
+        """
+        self.cache_dir = Path(cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+    def cache_path(self, mesh_path: Path, grid_resolution: int) -> Path:
+        """Get the cache file path for a mesh and grid resolution.
+
+        Args:
+            mesh_path: Path to .glb terrain mesh
+            grid_resolution: Height grid resolution
+
+        Returns:
+            Path of the .npz cache file
+        """
+        resolved = Path(mesh_path).resolve()
+        digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()[:12]
+        return self.cache_dir / f"{resolved.stem}-{digest}-r{grid_resolution}.npz"
+
+    @staticmethod
+    def _source_stamp(mesh_path: Path) -> np.ndarray:
+        """Get the (format version, size, mtime_ns) stamp of a mesh file."""
+        stat = Path(mesh_path).stat()
+        return np.array([CACHE_FORMAT_VERSION, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    def load(
+        self, mesh_path: Path, grid_resolution: int, with_triangles: bool = False
+    ) -> CachedTerrain | None:
+        """Load cached terrain arrays if they are still valid.
+
+        Args:
+            mesh_path: Path to .glb terrain mesh
+            grid_resolution: Height grid resolution
+            with_triangles: Also require and restore the triangle index
+
+        Returns:
+            CachedTerrain, or None on a miss (no entry, stale entry, missing
+            triangle index or unreadable file)
+        """
+        path = self.cache_path(mesh_path, grid_resolution)
+        if not path.exists():
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if not np.array_equal(data["source_stamp"], self._source_stamp(mesh_path)):
+                    return None
+
+                triangle_index = None
+                if with_triangles:
+                    triangle_keys = [k for k in data.files if k.startswith(TRIANGLE_PREFIX)]
+                    if not triangle_keys:
+                        return None
+                    triangle_index = TriangleSpatialIndex.from_arrays(
+                        {k[len(TRIANGLE_PREFIX) :]: data[k] for k in triangle_keys}
+                    )
+
+                return CachedTerrain(
+                    vertices=data["vertices"],
+                    height_grid=data["height_grid"],
+                    triangle_index=triangle_index,
+                )
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            # Corrupt or incompatible entry - treat as a miss and rebuild
+            return None
+
+    def store(
+        self,
+        mesh_path: Path,
+        grid_resolution: int,
+        vertices: np.ndarray,
+        height_grid: np.ndarray,
+        triangle_index: TriangleSpatialIndex | None = None,
+    ) -> bool:
+        """Write terrain arrays to the cache.
+
+        The file is written to a temporary name and renamed into place, so
+        concurrent readers never see a partial entry.
+
+        Args:
+            mesh_path: Path to .glb terrain mesh the arrays were built from
+            grid_resolution: Height grid resolution
+            vertices: (N, 3) vertex positions
+            height_grid: Gap-filled height grid
+            triangle_index: Optional triangle index to store alongside
+
+        Returns:
+            True if the entry was written, False if the cache is not writable
+        """
+        path = self.cache_path(mesh_path, grid_resolution)
+        # Any, because np.savez's keyword arguments include allow_pickle: bool
+        arrays: dict[str, Any] = {
+            "source_stamp": self._source_stamp(mesh_path),
+            "vertices": vertices,
+            "height_grid": height_grid,
+        }
+        if triangle_index is not None:
+            for name, array in triangle_index.to_arrays().items():
+                arrays[TRIANGLE_PREFIX + name] = array
+
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return False
+        return True
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Terrain providers for height queries."""
 
-import struct
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -9,8 +8,94 @@ from ..core.exceptions import OutOfBoundsError, TerrainError
 from ..core.interfaces import ITerrainProvider, Vector3
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import numpy as np
 
+    from .terrain_cache import TerrainCache
+    from .triangle_index import TriangleSpatialIndex
+
+# MeshTerrainProvider query modes
+QUERY_MODE_GRID = "grid"  # Bilinear interpolation over the resampled height grid
+QUERY_MODE_TRIANGLE = "triangle"  # Exact ray-down intersection with mesh triangles
+QUERY_MODES = (QUERY_MODE_GRID, QUERY_MODE_TRIANGLE)
+
+# PIL image modes holding 16-bit samples (16-bit grayscale PNGs)
+SIXTEEN_BIT_IMAGE_MODES = ("I;16", "I;16L", "I;16B", "I")
+
+# Portal base terrains shipped as GodotProject/static/<map>_Terrain.tscn
+PORTAL_BASE_TERRAINS = (
+    "MP_Abbasid",
+    "MP_Aftermath",
+    "MP_Battery",
+    "MP_Capstone",
+    "MP_Dumbo",
+    "MP_FireStorm",
+    "MP_Limestone",
+    "MP_Outskirts",
+    "MP_Tungsten",
+)
+
+# Default Portal SDK root (this repository: tools/bfportal/terrain -> root)
+PORTAL_SDK_ROOT = Path(__file__).resolve().parents[3]
+
+# Nominal terrain_size passed to MeshTerrainProvider for base terrains
+# (PortalTerrainProvider replaces it with the measured mesh extent)
+PORTAL_TERRAIN_SIZE = (2048.0, 2048.0)
+
+
+def _bilinear_sample_point(grid: "np.ndarray", grid_x: float, grid_z: float) -> float:
+    """Bilinearly interpolate a 2D grid at fractional (column, row) coordinates.
+
+    Args:
+        grid: 2D array indexed [row, column]
+        grid_x: Column coordinate in [0, columns - 1]
+        grid_z: Row coordinate in [0, rows - 1]
+
+    Returns:
+        Interpolated value
+    """
+    rows, cols = grid.shape
+    x0 = int(grid_x)
+    z0 = int(grid_z)
+    x1 = min(x0 + 1, cols - 1)
+    z1 = min(z0 + 1, rows - 1)
+    wx = grid_x - x0
+    wz = grid_z - z0
+
+    h0 = float(grid[z0, x0]) * (1 - wx) + float(grid[z0, x1]) * wx
+    h1 = float(grid[z1, x0]) * (1 - wx) + float(grid[z1, x1]) * wx
+    return h0 * (1 - wz) + h1 * wz
+
+
+def _bilinear_sample(
+    grid: "np.ndarray", grid_x: "np.ndarray", grid_z: "np.ndarray"
+) -> "np.ndarray":
+    """Vectorized _bilinear_sample_point for arrays of coordinates.
+
+    Args:
+        grid: 2D array indexed [row, column]
+        grid_x: Column coordinates in [0, columns - 1]
+        grid_z: Row coordinates in [0, rows - 1]
+
+    Returns:
+        Float64 array of interpolated values
+    """
+    import numpy as np
+
+    rows, cols = grid.shape
+    x0 = np.floor(grid_x).astype(np.intp)
+    z0 = np.floor(grid_z).astype(np.intp)
+    x1 = np.minimum(x0 + 1, cols - 1)
+    z1 = np.minimum(z0 + 1, rows - 1)
+    wx = grid_x - x0
+    wz = grid_z - z0
+
+    h0 = grid[z0, x0] * (1 - wx) + grid[z0, x1] * wx
+    h1 = grid[z1, x0] * (1 - wx) + grid[z1, x1] * wx
+    heights: np.ndarray = h0 * (1 - wz) + h1 * wz
+    return heights
+
 
 class CenteredTerrainBoundsMixin:
     """Mixin for terrain providers with centered, rectangular bounds.
@@ -46,11 +131,212 @@ class CenteredTerrainBoundsMixin:
         )
 
 
-class CustomHeightmapProvider(CenteredTerrainBoundsMixin, ITerrainProvider):
+class HeightPyramidMixin:
+    """Mixin answering region height queries from a min/max/mean pyramid.
+
+    The pyramid is built on the first region query and kept for the
+    provider's lifetime, so get_height_range touches O(log n) grid slices
+    plus the samples along the region's edges instead of every sample in
+    the region.
+
+    Requires the following method in the implementing class:
+    - _height_grid() -> (grid, (min_x, max_x, min_z, max_z)): the height
+      grid indexed [row(Z), column(X)] and the world bounds of its first and
+      last samples
+    """
+
+    def get_height_range(
+        self, rect: tuple[float, float, float, float]
+    ) -> tuple[float, float, float]:
+        """Get exact minimum, maximum and mean height over a region.
+
+        The rectangle is clipped to the grid. Inside each cell the bilinear
+        surface only reaches its extremes at the corners of the part of the
+        cell the rectangle covers, so the minimum and maximum are taken over
+        the grid samples inside the rectangle and the surface interpolated
+        where its edges cross grid lines. The mean averages those samples.
+
+        Args:
+            rect: World-space rectangle (min_x, max_x, min_z, max_z)
+
+        Returns:
+            Tuple of (min_height, max_height, mean_height)
+
+        Raises:
+            OutOfBoundsError: If the region does not overlap the terrain
+        """
+        import math
+
+        import numpy as np
+
+        from .height_pyramid import HeightPyramid
+
+        # Type hint for mixin contract
+        grid, grid_bounds = self._height_grid()  # type: ignore
+        grid_min_x, grid_max_x, grid_min_z, grid_max_z = grid_bounds
+        min_x, max_x, min_z, max_z = rect
+        if max_x < grid_min_x or min_x > grid_max_x or max_z < grid_min_z or min_z > grid_max_z:
+            raise OutOfBoundsError(
+                f"Region [{min_x:.1f}, {max_x:.1f}] x [{min_z:.1f}, {max_z:.1f}] "
+                "is outside terrain bounds"
+            )
+
+        rows, cols = grid.shape
+
+        def to_grid(value: float, low: float, high: float, samples: int) -> float:
+            # Fractional sample coordinate, snapped onto grid lines it lies within rounding of
+            coord = (min(max(value, low), high) - low) / (high - low) * (samples - 1)
+            return float(round(coord)) if abs(coord - round(coord)) < 1e-9 else coord
+
+        col_lo = to_grid(min_x, grid_min_x, grid_max_x, cols)
+        col_hi = to_grid(max_x, grid_min_x, grid_max_x, cols)
+        row_lo = to_grid(min_z, grid_min_z, grid_max_z, rows)
+        row_hi = to_grid(max_z, grid_min_z, grid_max_z, rows)
+        col0, col1 = math.ceil(col_lo), math.floor(col_hi) + 1
+        row0, row1 = math.ceil(row_lo), math.floor(row_hi) + 1
+
+        low, high, total, count = math.inf, -math.inf, 0.0, 0
+        if row0 < row1 and col0 < col1:
+            pyramid = getattr(self, "_height_pyramid", None)
+            if pyramid is None:
+                pyramid = self._height_pyramid = HeightPyramid(grid)
+            low, high, mean = pyramid.query(row0, row1, col0, col1)
+            count = (row1 - row0) * (col1 - col0)
+            total = mean * count
+
+        # Edge crossings with grid lines and the corners; points on grid
+        # samples were already covered by the pyramid query
+        edge_cols = np.concatenate([[col_lo], np.arange(col0, col1), [col_hi]])
+        edge_rows = np.concatenate([[row_lo], np.arange(row0, row1), [row_hi]])
+        across = np.stack(
+            [np.tile(edge_cols, 2), np.repeat([row_lo, row_hi], edge_cols.size)], axis=1
+        )
+        down = np.stack(
+            [np.repeat([col_lo, col_hi], edge_rows.size), np.tile(edge_rows, 2)], axis=1
+        )
+        edges = np.unique(np.concatenate([across, down]), axis=0)
+        edges = edges[(edges != np.floor(edges)).any(axis=1)]
+        if edges.size:
+            heights = _bilinear_sample(grid, edges[:, 0], edges[:, 1])
+            low = min(low, float(heights.min()))
+            high = max(high, float(heights.max()))
+            total += float(heights.sum())
+            count += heights.size
+
+        return low, high, total / count
+
+    def has_region_grid(self) -> bool:
+        """Check if region queries are answered exactly from a height grid.
+
+        Returns:
+            True
+        """
+        return True
+
+
+class TerrainNormalMixin:
+    """Mixin answering surface normal queries from precomputed grid gradients.
+
+    Height gradients along X and Z are computed once over the whole grid
+    (central differences, one-sided at the edges) and bilinearly
+    interpolated per query, so normals cost the same as height lookups.
+
+    Requires the same _height_grid() method as HeightPyramidMixin.
+    """
+
+    def _grid_gradients(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """Get (dh/dx, dh/dz) arrays over the height grid, computing them once."""
+        gradients = getattr(self, "_gradients", None)
+        if gradients is None:
+            import numpy as np
+
+            # Type hint for mixin contract
+            grid, (min_x, max_x, min_z, max_z) = self._height_grid()  # type: ignore
+            rows, cols = grid.shape
+            grad_z, grad_x = np.gradient(
+                np.asarray(grid, dtype=np.float64),
+                (max_z - min_z) / (rows - 1),
+                (max_x - min_x) / (cols - 1),
+            )
+            gradients = self._gradients = (
+                np.asarray(grad_x, dtype=np.float32),
+                np.asarray(grad_z, dtype=np.float32),
+            )
+        return gradients
+
+    def get_normal_at(self, x: float, z: float) -> Vector3:
+        """Get the unit terrain surface normal at world coordinates.
+
+        Args:
+            x: World X coordinate
+            z: World Z coordinate
+
+        Returns:
+            Surface normal pointing up (positive Y)
+
+        Raises:
+            OutOfBoundsError: If position is outside the height grid
+        """
+        grid, (min_x, max_x, min_z, max_z) = self._height_grid()  # type: ignore
+        if x < min_x or x > max_x or z < min_z or z > max_z:
+            raise OutOfBoundsError(f"Position ({x:.1f}, {z:.1f}) is outside terrain bounds")
+
+        rows, cols = grid.shape
+        grid_x = (x - min_x) / (max_x - min_x) * (cols - 1)
+        grid_z = (z - min_z) / (max_z - min_z) * (rows - 1)
+        grad_x, grad_z = self._grid_gradients()
+        nx = -_bilinear_sample_point(grad_x, grid_x, grid_z)
+        nz = -_bilinear_sample_point(grad_z, grid_x, grid_z)
+        length = (nx * nx + 1.0 + nz * nz) ** 0.5
+        return Vector3(nx / length, 1.0 / length, nz / length)
+
+    def get_normals_at(
+        self, xs: "Sequence[float] | np.ndarray", zs: "Sequence[float] | np.ndarray"
+    ) -> "np.ndarray":
+        """Get unit terrain surface normals for many world positions in one call.
+
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates
+
+        Returns:
+            Float64 (N, 3) array of normals, NaN rows outside the height grid
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        zs = np.asarray(zs, dtype=np.float64).ravel()
+        normals = np.full((xs.size, 3), np.nan)
+
+        grid, (min_x, max_x, min_z, max_z) = self._height_grid()  # type: ignore
+        inside = (xs >= min_x) & (xs <= max_x) & (zs >= min_z) & (zs <= max_z)
+        if not inside.any():
+            return normals
+
+        rows, cols = grid.shape
+        grid_x = (xs[inside] - min_x) / (max_x - min_x) * (cols - 1)
+        grid_z = (zs[inside] - min_z) / (max_z - min_z) * (rows - 1)
+        grad_x, grad_z = self._grid_gradients()
+        inside_normals = np.stack(
+            [
+                -_bilinear_sample(grad_x, grid_x, grid_z),
+                np.ones(grid_x.shape),
+                -_bilinear_sample(grad_z, grid_x, grid_z),
+            ],
+            axis=1,
+        )
+        normals[inside] = inside_normals / np.linalg.norm(inside_normals, axis=1, keepdims=True)
+        return normals
+
+
+class CustomHeightmapProvider(
+    CenteredTerrainBoundsMixin, HeightPyramidMixin, TerrainNormalMixin, ITerrainProvider
+):
     """Terrain provider using custom heightmap data.
 
-    Reads heightmap from PNG or raw file and provides height queries.
-    Used for BF1942 heightmaps converted to image format.
+    Loads the heightmap once into a float32 array of world heights and
+    answers queries by bilinear interpolation. Supports 8-bit and 16-bit
+    grayscale images (PNG) and BF1942 Heightmap.raw files (uint16).
     """
 
     def __init__(
@@ -62,7 +348,7 @@ class CustomHeightmapProvider(CenteredTerrainBoundsMixin, ITerrainProvider):
         """Initialize heightmap provider.
 
         Args:
-            heightmap_path: Path to heightmap image (PNG)
+            heightmap_path: Path to heightmap image (PNG, 8 or 16-bit) or .raw file
             terrain_size: (width, depth) in world units
             height_range: (min_height, max_height) in world units
 
@@ -74,13 +360,51 @@ class CustomHeightmapProvider(CenteredTerrainBoundsMixin, ITerrainProvider):
         self.terrain_width, self.terrain_depth = terrain_size
         self.min_height, self.max_height = height_range
 
-        # Load heightmap
+        normalized = self._load_normalized(heightmap_path)
+
+        # World heights, indexed [row (Z), column (X)]
+        self.heightmap = (
+            self.min_height + normalized * (self.max_height - self.min_height)
+        ).astype("float32")
+        self.height, self.width = self.heightmap.shape
+
+    @staticmethod
+    def _load_normalized(heightmap_path: Path) -> "np.ndarray":
+        """Load heightmap samples scaled to [0, 1].
+
+        Args:
+            heightmap_path: Path to heightmap image or .raw file
+
+        Returns:
+            Float32 array indexed [row, column]
+
+        Raises:
+            TerrainError: If heightmap cannot be loaded
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise TerrainError("NumPy not installed. Run: pip3 install numpy") from e
+
+        if Path(heightmap_path).suffix.lower() == ".raw":
+            from .heightmap import HEIGHTMAP_MAX_VALUE, read_heightmap_raw
+
+            try:
+                samples = read_heightmap_raw(heightmap_path)
+            except OSError as e:
+                raise TerrainError(f"Failed to load heightmap {heightmap_path}: {e}") from e
+            return samples.astype(np.float32) / np.float32(HEIGHTMAP_MAX_VALUE)
+
         try:
             from PIL import Image
 
-            img = Image.open(heightmap_path).convert("L")  # Grayscale
-            self.heightmap = img
-            self.width, self.height = img.size
+            img: Image.Image = Image.open(heightmap_path)
+            if img.mode in SIXTEEN_BIT_IMAGE_MODES:
+                max_value = 65535.0
+            else:
+                img = img.convert("L")  # Grayscale
+                max_value = 255.0
+            return np.asarray(img, dtype=np.float32) / np.float32(max_value)
         except ImportError as e:
             raise TerrainError("PIL/Pillow not installed. Run: pip3 install Pillow") from e
         except Exception as e:
@@ -94,7 +418,7 @@ class CustomHeightmapProvider(CenteredTerrainBoundsMixin, ITerrainProvider):
             z: World Z coordinate
 
         Returns:
-            Terrain height (Y coordinate)
+            Terrain height (Y coordinate), bilinearly interpolated
 
         Raises:
             OutOfBoundsError: If position is outside terrain bounds
@@ -115,69 +439,217 @@ class CustomHeightmapProvider(CenteredTerrainBoundsMixin, ITerrainProvider):
                 f"[{-half_width}, {half_width}] x [{-half_depth}, {half_depth}]"
             )
 
-        # Convert to pixel coordinates
-        px = int(norm_x * (self.width - 1))
-        py = int(norm_z * (self.height - 1))
-
-        # Get pixel value (0-255)
-        # getpixel returns int for mode 'L', tuple for RGB, or None
-        pixel_value = self.heightmap.getpixel((px, py))
-
-        # Handle different return types
-        if isinstance(pixel_value, tuple):
-            # RGB/RGBA - use first channel
-            grayscale_value = pixel_value[0]
-        elif isinstance(pixel_value, int):
-            # Grayscale - use directly
-            grayscale_value = pixel_value
-        else:
-            # None or other - default to 0
-            grayscale_value = 0
+        # Convert to (fractional) pixel coordinates
+        return _bilinear_sample_point(
+            self.heightmap, norm_x * (self.width - 1), norm_z * (self.height - 1)
+        )
 
-        # Normalize to 0-1 and scale to height range
-        normalized = grayscale_value / 255.0
-        height = self.min_height + (normalized * (self.max_height - self.min_height))
+    def get_heights_at(
+        self, xs: "Sequence[float] | np.ndarray", zs: "Sequence[float] | np.ndarray"
+    ) -> "np.ndarray":
+        """Query terrain heights for many world positions in one call.
+
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates
 
-        return height
+        Returns:
+            Float64 array of heights, NaN for positions outside terrain bounds
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        zs = np.asarray(zs, dtype=np.float64).ravel()
+
+        norm_x = (xs + self.terrain_width / 2) / self.terrain_width
+        norm_z = (zs + self.terrain_depth / 2) / self.terrain_depth
+        inside = (norm_x >= 0) & (norm_x <= 1) & (norm_z >= 0) & (norm_z <= 1)
+
+        heights = np.full(xs.shape, np.nan)
+        heights[inside] = _bilinear_sample(
+            self.heightmap,
+            norm_x[inside] * (self.width - 1),
+            norm_z[inside] * (self.height - 1),
+        )
+        return heights
+
+    def _height_grid(self) -> tuple["np.ndarray", tuple[float, float, float, float]]:
+        """Get the heightmap and the world bounds of its corner samples."""
+        half_width = self.terrain_width / 2
+        half_depth = self.terrain_depth / 2
+        return self.heightmap, (-half_width, half_width, -half_depth, half_depth)
 
 
-class TungstenTerrainProvider(CenteredTerrainBoundsMixin, ITerrainProvider):
-    """Terrain provider for Portal's MP_Tungsten base map.
+class HeightGridProvider(HeightPyramidMixin, TerrainNormalMixin, ITerrainProvider):
+    """Terrain provider over a regular grid of world heights.
 
-    Queries the Tungsten heightmap from Portal SDK static files.
+    Samples are evenly spaced across explicit world bounds, with the first
+    row/column on the min edge and the last on the max edge. Queries use
+    bilinear interpolation.
+
+    Single Responsibility: Only handles height queries on an in-memory grid.
     """
 
-    def __init__(self, portal_sdk_root: Path):
-        """Initialize Tungsten terrain provider.
+    def __init__(
+        self,
+        heights: "np.ndarray",
+        bounds: tuple[float, float, float, float],
+    ):
+        """Initialize grid terrain provider.
+
+        Args:
+            heights: 2D array of world heights indexed [row(Z), column(X)]
+            bounds: World (min_x, max_x, min_z, max_z) covered by the grid
+        """
+        import numpy as np
+
+        self.heights = np.asarray(heights, dtype=np.float32)
+        self.depth_samples, self.width_samples = self.heights.shape
+        self.min_x, self.max_x, self.min_z, self.max_z = (float(b) for b in bounds)
+
+        self.terrain_width = self.max_x - self.min_x
+        self.terrain_depth = self.max_z - self.min_z
+        self.min_height = float(self.heights.min())
+        self.max_height = float(self.heights.max())
+
+    def get_height_at(self, x: float, z: float) -> float:
+        """Query terrain height at world coordinates.
 
         Args:
-            portal_sdk_root: Root directory of Portal SDK
+            x: World X coordinate
+            z: World Z coordinate
+
+        Returns:
+            Interpolated terrain height
 
         Raises:
-            TerrainError: If Tungsten terrain files not found
+            OutOfBoundsError: If position is outside the grid bounds
         """
-        self.portal_root = portal_sdk_root
+        if x < self.min_x or x > self.max_x or z < self.min_z or z > self.max_z:
+            raise OutOfBoundsError(
+                f"Position ({x:.1f}, {z:.1f}) is outside terrain bounds "
+                f"[{self.min_x:.1f}, {self.max_x:.1f}] x [{self.min_z:.1f}, {self.max_z:.1f}]"
+            )
+
+        grid_x = (x - self.min_x) / self.terrain_width * (self.width_samples - 1)
+        grid_z = (z - self.min_z) / self.terrain_depth * (self.depth_samples - 1)
+        return _bilinear_sample_point(self.heights, grid_x, grid_z)
 
-        # Try to find Tungsten terrain heightmap
-        # Portal SDK structure: GodotProject/static/MP_Tungsten_Terrain.tscn
-        terrain_path = portal_sdk_root / "GodotProject" / "static" / "MP_Tungsten_Terrain.tscn"
+    def get_heights_at(
+        self, xs: "Sequence[float] | np.ndarray", zs: "Sequence[float] | np.ndarray"
+    ) -> "np.ndarray":
+        """Query terrain heights for many world positions in one call.
 
-        if not terrain_path.exists():
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates
+
+        Returns:
+            Float64 array of heights, NaN for positions outside the grid bounds
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        zs = np.asarray(zs, dtype=np.float64).ravel()
+        heights = np.full(xs.shape, np.nan)
+
+        inside = (xs >= self.min_x) & (xs <= self.max_x) & (zs >= self.min_z) & (zs <= self.max_z)
+        if inside.any():
+            heights[inside] = _bilinear_sample(
+                self.heights,
+                (xs[inside] - self.min_x) / self.terrain_width * (self.width_samples - 1),
+                (zs[inside] - self.min_z) / self.terrain_depth * (self.depth_samples - 1),
+            )
+        return heights
+
+    def _height_grid(self) -> tuple["np.ndarray", tuple[float, float, float, float]]:
+        """Get the height grid and its world bounds."""
+        return self.heights, (self.min_x, self.max_x, self.min_z, self.max_z)
+
+    def get_bounds(self) -> tuple[Vector3, Vector3]:
+        """Get terrain bounds.
+
+        Returns:
+            Tuple of (min_point, max_point)
+        """
+        return (
+            Vector3(self.min_x, self.min_height, self.min_z),
+            Vector3(self.max_x, self.max_height, self.max_z),
+        )
+
+
+class PortalTerrainProvider(ITerrainProvider):
+    """Terrain provider for a Portal base map, backed by its real height data.
+
+    Reads GodotProject/static/<map>_Terrain.tscn and uses, in order:
+    1. An embedded HeightMapShape3D (collision heightfield), loaded into a
+       float32 grid
+    2. The terrain GLB the scene instances, loaded through MeshTerrainProvider
+       (and its TerrainCache, so the mesh is only preprocessed once)
+
+    Single Responsibility: Only handles locating and loading Portal base terrain data.
+    """
+
+    def __init__(
+        self,
+        map_name: str,
+        portal_sdk_root: Path | None = None,
+        cache: "TerrainCache | None" = None,
+        query_mode: str = QUERY_MODE_GRID,
+    ):
+        """Initialize Portal base terrain provider.
+
+        Args:
+            map_name: Portal base map name (e.g., 'MP_Tungsten')
+            portal_sdk_root: Root directory of Portal SDK (default: this repository)
+            cache: Optional TerrainCache for GLB-backed terrains
+            query_mode: MeshTerrainProvider query mode for GLB-backed terrains
+
+        Raises:
+            TerrainError: If the terrain scene or its height data is missing
+        """
+        from .godot_terrain import find_terrain_mesh, parse_heightmap_shape
+
+        self.map_name = map_name
+        self.portal_root = portal_sdk_root or PORTAL_SDK_ROOT
+        godot_root = self.portal_root / "GodotProject"
+        self.scene_path = godot_root / "static" / f"{map_name}_Terrain.tscn"
+
+        if not self.scene_path.exists():
             raise TerrainError(
-                f"Tungsten terrain not found at {terrain_path}. "
+                f"{map_name.removeprefix('MP_')} terrain not found at {self.scene_path}. "
                 "Ensure Portal SDK is properly set up."
             )
 
-        # TODO: Parse .tscn to extract HeightMapShape3D data
-        # For now, use estimated values based on Tungsten terrain
-        self.terrain_width = 2048.0  # Estimated
-        self.terrain_depth = 2048.0  # Estimated
-        self.min_height = 50.0  # Estimated
-        self.max_height = 250.0  # Estimated
+        scene_text = self.scene_path.read_text(encoding="utf-8")
+        shape = parse_heightmap_shape(scene_text)
+
+        self.source: ITerrainProvider
+        if shape is not None:
+            self.source = HeightGridProvider(shape.world_heights, shape.bounds)
+            self.source_path = self.scene_path
+        else:
+            mesh_path = find_terrain_mesh(scene_text, godot_root) or (
+                godot_root / "raw" / "models" / f"{map_name}_Terrain.glb"
+            )
+            if not mesh_path.exists():
+                raise TerrainError(
+                    f"No height data for {map_name}: {self.scene_path.name} has no "
+                    f"HeightMapShape3D and terrain mesh {mesh_path} is missing"
+                )
+            mesh = MeshTerrainProvider(
+                mesh_path, PORTAL_TERRAIN_SIZE, query_mode=query_mode, cache=cache
+            )
+            mesh.terrain_width = mesh.mesh_max_x - mesh.mesh_min_x
+            mesh.terrain_depth = mesh.mesh_max_z - mesh.mesh_min_z
+            self.source = mesh
+            self.source_path = mesh_path
 
-        print("⚠️  Using estimated Tungsten terrain dimensions:")
-        print(f"   Width: {self.terrain_width}m, Depth: {self.terrain_depth}m")
-        print(f"   Height range: {self.min_height}m - {self.max_height}m")
+        min_point, max_point = self.source.get_bounds()
+        self.terrain_width = max_point.x - min_point.x
+        self.terrain_depth = max_point.z - min_point.z
+        self.min_height = min_point.y
+        self.max_height = max_point.y
 
     def get_height_at(self, x: float, z: float) -> float:
         """Query terrain height at world coordinates.
@@ -189,71 +661,120 @@ class TungstenTerrainProvider(CenteredTerrainBoundsMixin, ITerrainProvider):
         Returns:
             Terrain height (Y coordinate)
 
-        Note:
-            Currently returns estimated average height.
-            TODO: Parse actual Tungsten heightmap data.
+        Raises:
+            OutOfBoundsError: If position is outside the terrain
         """
-        # TODO: Query actual Tungsten heightmap
-        # For now, return average height
-        avg_height = (self.min_height + self.max_height) / 2
+        return self.source.get_height_at(x, z)
 
-        # Add some variation based on position (temporary)
-        import math
+    def get_heights_at(
+        self, xs: "Sequence[float] | np.ndarray", zs: "Sequence[float] | np.ndarray"
+    ) -> "np.ndarray":
+        """Query terrain heights for many world positions in one call.
 
-        variation = math.sin(x * 0.01) * math.cos(z * 0.01) * 20.0
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates
 
-        return avg_height + variation
+        Returns:
+            Float64 array of heights, NaN for positions outside the terrain
+        """
+        return self.source.get_heights_at(xs, zs)
 
+    def get_height_range(
+        self, rect: tuple[float, float, float, float]
+    ) -> tuple[float, float, float]:
+        """Get minimum, maximum and mean height over a region.
 
-class OutskirtsTerrainProvider(CenteredTerrainBoundsMixin, ITerrainProvider):
-    """Terrain provider for Portal's MP_Outskirts base map.
+        Args:
+            rect: World-space rectangle (min_x, max_x, min_z, max_z)
 
-    Queries the Outskirts heightmap from Portal SDK static files.
-    """
+        Returns:
+            Tuple of (min_height, max_height, mean_height)
 
-    def __init__(self, portal_sdk_root: Path | None = None):
-        """Initialize Outskirts terrain provider.
+        Raises:
+            OutOfBoundsError: If the region does not overlap the terrain
+        """
+        return self.source.get_height_range(rect)
 
-        Args:
-            portal_sdk_root: Root directory of Portal SDK (optional)
+    def has_region_grid(self) -> bool:
+        """Check if region queries are answered exactly from a height grid.
 
-        Note:
-            Currently uses estimated values. TODO: Parse actual terrain data.
+        Returns:
+            Whether the underlying terrain has a region grid
         """
-        self.portal_root = portal_sdk_root
-
-        # TODO: Parse .tscn to extract HeightMapShape3D data
-        # For now, use estimated values based on Outskirts terrain (urban)
-        self.terrain_width = 1536.0  # Smaller urban map
-        self.terrain_depth = 1536.0
-        self.min_height = 0.0  # Flat urban terrain
-        self.max_height = 50.0  # Low buildings/elevation
+        return self.source.has_region_grid()
 
-    def get_height_at(self, x: float, z: float) -> float:
-        """Query terrain height at world coordinates.
+    def get_normal_at(self, x: float, z: float) -> Vector3:
+        """Get the unit terrain surface normal at world coordinates.
 
         Args:
             x: World X coordinate
             z: World Z coordinate
 
         Returns:
-            Terrain height (Y coordinate)
+            Surface normal pointing up (positive Y)
 
-        Note:
-            Currently returns estimated height for urban terrain.
-            TODO: Parse actual Outskirts heightmap data.
+        Raises:
+            OutOfBoundsError: If position is outside the terrain
         """
-        # TODO: Query actual Outskirts heightmap
-        # Urban terrain is mostly flat with slight variations
-        import math
+        return self.source.get_normal_at(x, z)
+
+    def get_normals_at(
+        self, xs: "Sequence[float] | np.ndarray", zs: "Sequence[float] | np.ndarray"
+    ) -> "np.ndarray":
+        """Get unit terrain surface normals for many world positions in one call.
+
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates
+
+        Returns:
+            Float64 (N, 3) array of normals, NaN rows outside the terrain
+        """
+        return self.source.get_normals_at(xs, zs)
+
+    def get_bounds(self) -> tuple[Vector3, Vector3]:
+        """Get terrain bounds.
+
+        Returns:
+            Tuple of (min_point, max_point)
+        """
+        return self.source.get_bounds()
+
+
+class TungstenTerrainProvider(PortalTerrainProvider):
+    """Terrain provider for Portal's MP_Tungsten base map."""
+
+    def __init__(self, portal_sdk_root: Path | None = None, cache: "TerrainCache | None" = None):
+        """Initialize Tungsten terrain provider.
+
+        Args:
+            portal_sdk_root: Root directory of Portal SDK (default: this repository)
+            cache: Optional TerrainCache for the terrain mesh
 
-        base_height = 5.0  # Slight elevation
-        variation = math.sin(x * 0.02) * math.cos(z * 0.02) * 3.0
+        Raises:
+            TerrainError: If Tungsten terrain files not found
+        """
+        super().__init__("MP_Tungsten", portal_sdk_root, cache=cache)
 
-        return base_height + variation
+
+class OutskirtsTerrainProvider(PortalTerrainProvider):
+    """Terrain provider for Portal's MP_Outskirts base map."""
+
+    def __init__(self, portal_sdk_root: Path | None = None, cache: "TerrainCache | None" = None):
+        """Initialize Outskirts terrain provider.
+
+        Args:
+            portal_sdk_root: Root directory of Portal SDK (default: this repository)
+            cache: Optional TerrainCache for the terrain mesh
+
+        Raises:
+            TerrainError: If Outskirts terrain files not found
+        """
+        super().__init__("MP_Outskirts", portal_sdk_root, cache=cache)
 
 
-class MeshTerrainProvider(ITerrainProvider):
+class MeshTerrainProvider(HeightPyramidMixin, TerrainNormalMixin, ITerrainProvider):
     """Terrain provider that queries heights from a 3D mesh (.glb file).
 
     This provider extracts vertex data from Portal terrain meshes and builds
@@ -265,42 +786,83 @@ class MeshTerrainProvider(ITerrainProvider):
     Open/Closed: Can be extended with different interpolation strategies.
     """
 
-    def __init__(self, mesh_path: Path, terrain_size: tuple[float, float]):
+    def __init__(
+        self,
+        mesh_path: Path,
+        terrain_size: tuple[float, float],
+        query_mode: str = QUERY_MODE_GRID,
+        cache: "TerrainCache | None" = None,
+    ):
         """Initialize mesh terrain provider.
 
         Args:
             mesh_path: Path to .glb terrain mesh file
             terrain_size: (width, depth) in world units
+            query_mode: QUERY_MODE_GRID (bilinear over the height grid) or
+                QUERY_MODE_TRIANGLE (exact ray-down hit on the mesh triangles)
+            cache: Optional TerrainCache; preprocessed vertices, height grid and
+                triangle index are loaded from it when valid and stored on a miss
 
         Raises:
             FileNotFoundError: If mesh file not found
             TerrainError: If mesh cannot be loaded or parsed
         """
+        if query_mode not in QUERY_MODES:
+            raise TerrainError(
+                f"Unknown terrain query mode '{query_mode}' (expected one of {QUERY_MODES})"
+            )
+
         self.mesh_path = mesh_path
         self.terrain_width, self.terrain_depth = terrain_size
+        self.query_mode = query_mode
+
+        self.grid_resolution = 256
+        with_triangles = query_mode == QUERY_MODE_TRIANGLE
+
+        cached = None
+        if cache is not None:
+            cached = cache.load(mesh_path, self.grid_resolution, with_triangles=with_triangles)
+        self.loaded_from_cache = cached is not None
 
         # Extract vertices from GLB
-        self.vertices = self._extract_vertices()
+        self.vertices = cached.vertices if cached else self._extract_vertices()
 
         # Calculate terrain mesh center and bounds from actual vertex positions
-        self.mesh_center_x = self.vertices[:, 0].mean()
-        self.mesh_center_z = self.vertices[:, 2].mean()
-        self.mesh_min_x = self.vertices[:, 0].min()
-        self.mesh_max_x = self.vertices[:, 0].max()
-        self.mesh_min_z = self.vertices[:, 2].min()
-        self.mesh_max_z = self.vertices[:, 2].max()
+        self.mesh_center_x = float(self.vertices[:, 0].mean(dtype="float64"))
+        self.mesh_center_z = float(self.vertices[:, 2].mean(dtype="float64"))
+        self.mesh_min_x = float(self.vertices[:, 0].min())
+        self.mesh_max_x = float(self.vertices[:, 0].max())
+        self.mesh_min_z = float(self.vertices[:, 2].min())
+        self.mesh_max_z = float(self.vertices[:, 2].max())
 
         # Calculate mesh height bounds (raw mesh coordinates)
-        self.mesh_min_height = self.vertices[:, 1].min()
-        self.mesh_max_height = self.vertices[:, 1].max()
+        self.mesh_min_height = float(self.vertices[:, 1].min())
+        self.mesh_max_height = float(self.vertices[:, 1].max())
 
         # For Portal compatibility: terrain Y baseline (used for scene transform offset)
         # This is the amount we subtract from mesh heights to normalize to Y=0 baseline
         self.terrain_y_baseline = self.mesh_min_height
 
         # Build spatial grid for fast lookups
-        self.grid_resolution = 256
-        self.height_grid = self._build_height_grid()
+        self.height_grid = cached.height_grid if cached else self._build_height_grid()
+
+        # Triangle mode: index the mesh triangles for exact queries
+        # (the height grid is kept as a fallback for holes in the mesh)
+        self.triangle_index = None
+        if with_triangles:
+            self.triangle_index = cached.triangle_index if cached else self._build_triangle_index()
+
+        if cache is not None and cached is None:
+            cache.store(
+                mesh_path,
+                self.grid_resolution,
+                self.vertices,
+                self.height_grid,
+                self.triangle_index,
+            )
+
+        # Precompute slope gradients alongside the height grid (for normal queries)
+        self._grid_gradients()
 
         # Portal-compatible height range (mesh heights as-is for now)
         self.min_height = self.mesh_min_height
@@ -309,63 +871,44 @@ class MeshTerrainProvider(ITerrainProvider):
     def _extract_vertices(self) -> "np.ndarray":
         """Extract vertex positions from GLB mesh.
 
+        POSITION accessors are located through meshes[].primitives[].attributes
+        and decoded directly from the binary chunk (see glb_reader). Files that
+        declare no meshes fall back to the first accessor.
+
         Returns:
-            Numpy array of shape (N, 3) containing vertex positions
+            Numpy float32 array of shape (N, 3) containing vertex positions
 
         Raises:
             TerrainError: If GLB parsing fails
         """
-        import json
-
         try:
             import numpy as np
         except ImportError as e:
             raise TerrainError("NumPy required for mesh terrain. Run: pip3 install numpy") from e
 
+        from .glb_reader import find_position_accessors, read_accessor, read_glb
+
         try:
-            with open(self.mesh_path, "rb") as f:
-                # Read GLB header
-                magic = f.read(4)
-                if magic != b"glTF":
-                    raise TerrainError(f"Invalid GLB file: {self.mesh_path}")
-
-                struct.unpack("<I", f.read(4))[0]
-                struct.unpack("<I", f.read(4))[0]
-
-                # Read JSON chunk
-                json_length = struct.unpack("<I", f.read(4))[0]
-                json_type = f.read(4)
-                if json_type != b"JSON":
-                    raise TerrainError("Expected JSON chunk in GLB")
-
-                json_data = f.read(json_length).decode("utf-8")
-                gltf = json.loads(json_data)
-
-                # Read binary chunk
-                bin_length = struct.unpack("<I", f.read(4))[0]
-                bin_type = f.read(4)
-                if bin_type != b"BIN\x00":
-                    raise TerrainError("Expected BIN chunk in GLB")
-
-                binary_data = f.read(bin_length)
-
-            # Extract position accessor (first VEC3 accessor)
-            accessor = gltf["accessors"][0]
-            if accessor["type"] != "VEC3":
-                raise TerrainError("First accessor is not VEC3 (positions)")
-
-            buffer_view = gltf["bufferViews"][accessor["bufferView"]]
-            offset = buffer_view.get("byteOffset", 0)
-            count = accessor["count"]
-
-            # Parse vertices (3 floats per vertex)
-            vertices = []
-            for i in range(count):
-                pos = offset + (i * 12)  # 3 floats * 4 bytes each
-                x, y, z = struct.unpack("<fff", binary_data[pos : pos + 12])
-                vertices.append([x, y, z])
-
-            return np.array(vertices)
+            document = self._glb_document = read_glb(self.mesh_path)
+            gltf = document.gltf
+
+            position_accessors = find_position_accessors(gltf)
+            if not position_accessors:
+                # No mesh declarations - assume first accessor holds positions
+                if gltf["accessors"][0].get("type") != "VEC3":
+                    raise TerrainError("First accessor is not VEC3 (positions)")
+                position_accessors = [0]
+            self._position_accessors = position_accessors
+
+            arrays = []
+            for index in position_accessors:
+                if gltf["accessors"][index].get("type") != "VEC3":
+                    raise TerrainError(f"POSITION accessor {index} is not VEC3")
+                arrays.append(read_accessor(document, index))
+
+            if len(arrays) == 1:
+                return np.asarray(arrays[0], dtype=np.float32)
+            return np.concatenate(arrays).astype(np.float32, copy=False)
 
         except Exception as e:
             raise TerrainError(f"Failed to extract vertices from {self.mesh_path}: {e}") from e
@@ -374,36 +917,35 @@ class MeshTerrainProvider(ITerrainProvider):
         """Build 2D grid of heights for fast lookups.
 
         Projects 3D vertices onto 2D grid and stores maximum height at each cell.
-        Uses actual mesh bounds, not assumed centered terrain.
+        Uses actual mesh bounds, not assumed centered terrain. The per-cell
+        maximum is a single scatter-max over all vertices.
 
         Returns:
             2D numpy array of heights
         """
         import numpy as np
 
-        grid = np.full((self.grid_resolution, self.grid_resolution), np.nan)
+        resolution = self.grid_resolution
 
         # Calculate mesh dimensions
         mesh_width = self.mesh_max_x - self.mesh_min_x
         mesh_depth = self.mesh_max_z - self.mesh_min_z
 
-        # Project vertices onto grid using actual mesh bounds
-        for x, y, z in self.vertices:
-            # Normalize to 0-1 range using actual mesh bounds
-            norm_x = (x - self.mesh_min_x) / mesh_width
-            norm_z = (z - self.mesh_min_z) / mesh_depth
-
-            # Convert to grid indices
-            grid_x = int(norm_x * (self.grid_resolution - 1))
-            grid_z = int(norm_z * (self.grid_resolution - 1))
+        # Normalize to 0-1 range using actual mesh bounds, then to grid indices
+        grid_x = ((self.vertices[:, 0] - self.mesh_min_x) / mesh_width * (resolution - 1)).astype(
+            np.intp
+        )
+        grid_z = ((self.vertices[:, 2] - self.mesh_min_z) / mesh_depth * (resolution - 1)).astype(
+            np.intp
+        )
+        np.clip(grid_x, 0, resolution - 1, out=grid_x)
+        np.clip(grid_z, 0, resolution - 1, out=grid_z)
 
-            # Keep maximum height at each grid cell
-            if (
-                0 <= grid_x < self.grid_resolution
-                and 0 <= grid_z < self.grid_resolution
-                and (np.isnan(grid[grid_z, grid_x]) or y > grid[grid_z, grid_x])
-            ):
-                grid[grid_z, grid_x] = y
+        # Keep maximum height at each grid cell
+        cells = np.full(resolution * resolution, -np.inf)
+        np.maximum.at(cells, grid_z * resolution + grid_x, self.vertices[:, 1])
+        cells[np.isneginf(cells)] = np.nan
+        grid = cells.reshape(resolution, resolution)
 
         # Fill gaps using nearest neighbor interpolation
         self._fill_grid_gaps(grid)
@@ -413,6 +955,11 @@ class MeshTerrainProvider(ITerrainProvider):
     def _fill_grid_gaps(self, grid: "np.ndarray") -> None:
         """Fill NaN values in grid using nearest neighbor propagation.
 
+        Each pass assigns every empty cell that touches a filled cell the mean
+        of its filled 4-neighbours, growing the filled region by one cell per
+        pass. Passes are whole-array operations, so the cost is
+        O(cells x gap width) in NumPy rather than Python loops per cell.
+
         Modifies grid in-place.
 
         Args:
@@ -420,38 +967,63 @@ class MeshTerrainProvider(ITerrainProvider):
         """
         import numpy as np
 
-        max_iterations = 100
-        iteration = 0
-
-        while np.isnan(grid).any() and iteration < max_iterations:
-            for i in range(self.grid_resolution):
-                for j in range(self.grid_resolution):
-                    if np.isnan(grid[i, j]):
-                        # Get valid neighbors
-                        neighbors = []
-                        if i > 0 and not np.isnan(grid[i - 1, j]):
-                            neighbors.append(grid[i - 1, j])
-                        if i < self.grid_resolution - 1 and not np.isnan(grid[i + 1, j]):
-                            neighbors.append(grid[i + 1, j])
-                        if j > 0 and not np.isnan(grid[i, j - 1]):
-                            neighbors.append(grid[i, j - 1])
-                        if j < self.grid_resolution - 1 and not np.isnan(grid[i, j + 1]):
-                            neighbors.append(grid[i, j + 1])
-
-                        if neighbors:
-                            grid[i, j] = np.mean(neighbors)
-
-            iteration += 1
-
-        # Fill any remaining NaN with mean height
-        if np.isnan(grid).any():
-            mean_height = np.nanmean(grid)
-            grid[np.isnan(grid)] = mean_height
+        missing = np.isnan(grid)
+        neighbour_sum = np.empty_like(grid)
+        neighbour_count = np.empty_like(grid)
+
+        while missing.any():
+            values = np.where(missing, 0.0, grid)
+            filled = (~missing).astype(grid.dtype)
+
+            neighbour_sum.fill(0.0)
+            neighbour_count.fill(0.0)
+            neighbour_sum[1:, :] += values[:-1, :]
+            neighbour_sum[:-1, :] += values[1:, :]
+            neighbour_sum[:, 1:] += values[:, :-1]
+            neighbour_sum[:, :-1] += values[:, 1:]
+            neighbour_count[1:, :] += filled[:-1, :]
+            neighbour_count[:-1, :] += filled[1:, :]
+            neighbour_count[:, 1:] += filled[:, :-1]
+            neighbour_count[:, :-1] += filled[:, 1:]
+
+            frontier = missing & (neighbour_count > 0)
+            if not frontier.any():
+                # Grid without any vertices - nothing to propagate from
+                break
+
+            grid[frontier] = neighbour_sum[frontier] / neighbour_count[frontier]
+            missing &= ~frontier
+
+    def _build_triangle_index(self) -> "TriangleSpatialIndex":
+        """Build the triangle spatial index from the GLB index buffers.
+
+        Returns:
+            TriangleSpatialIndex over all TRIANGLES primitives
+
+        Raises:
+            TerrainError: If the mesh has no triangle primitives
+        """
+        from .glb_reader import read_triangles
+        from .triangle_index import TriangleSpatialIndex
+
+        try:
+            triangles = read_triangles(self._glb_document, self._position_accessors)
+        except Exception as e:
+            raise TerrainError(f"Failed to read triangles from {self.mesh_path}: {e}") from e
+
+        if len(triangles) == 0:
+            raise TerrainError(
+                f"Triangle query mode requires mesh primitives with triangles: {self.mesh_path}"
+            )
+
+        return TriangleSpatialIndex(self.vertices, triangles)
 
     def get_height_at(self, x: float, z: float) -> float:
         """Query terrain height at world coordinates.
 
-        Uses bilinear interpolation for smooth height transitions.
+        In grid mode, uses bilinear interpolation for smooth height transitions.
+        In triangle mode, returns the exact mesh surface height below the point
+        (falling back to the grid where the mesh has a hole).
         Coordinates are in world space, aligned with mesh position.
 
         Args:
@@ -464,8 +1036,6 @@ class MeshTerrainProvider(ITerrainProvider):
         Raises:
             OutOfBoundsError: If position is outside terrain mesh bounds
         """
-        import numpy as np
-
         # Check bounds using actual mesh bounds
         if x < self.mesh_min_x or x > self.mesh_max_x or z < self.mesh_min_z or z > self.mesh_max_z:
             raise OutOfBoundsError(
@@ -474,6 +1044,23 @@ class MeshTerrainProvider(ITerrainProvider):
                 f"[{self.mesh_min_z:.1f}, {self.mesh_max_z:.1f}]"
             )
 
+        if self.triangle_index is not None:
+            height = self.triangle_index.query_point(x, z)
+            if height is not None:
+                return height
+
+        return self._interpolate_grid(x, z)
+
+    def _interpolate_grid(self, x: float, z: float) -> float:
+        """Bilinearly interpolate the height grid at an in-bounds position.
+
+        Args:
+            x: World X coordinate
+            z: World Z coordinate
+
+        Returns:
+            Interpolated terrain height
+        """
         # Calculate mesh dimensions
         mesh_width = self.mesh_max_x - self.mesh_min_x
         mesh_depth = self.mesh_max_z - self.mesh_min_z
@@ -484,28 +1071,78 @@ class MeshTerrainProvider(ITerrainProvider):
         grid_x = norm_x * (self.grid_resolution - 1)
         grid_z = norm_z * (self.grid_resolution - 1)
 
-        # Bilinear interpolation
-        x0 = int(np.floor(grid_x))
-        x1 = min(x0 + 1, self.grid_resolution - 1)
-        z0 = int(np.floor(grid_z))
-        z1 = min(z0 + 1, self.grid_resolution - 1)
+        return _bilinear_sample_point(self.height_grid, grid_x, grid_z)
 
-        # Interpolation weights
-        wx = grid_x - x0
-        wz = grid_z - z0
+    def get_heights_at(
+        self, xs: "Sequence[float] | np.ndarray", zs: "Sequence[float] | np.ndarray"
+    ) -> "np.ndarray":
+        """Query terrain heights for many world positions in one call.
 
-        # Get corner heights
-        h00 = self.height_grid[z0, x0]
-        h10 = self.height_grid[z0, x1]
-        h01 = self.height_grid[z1, x0]
-        h11 = self.height_grid[z1, x1]
+        Vectorized equivalent of get_height_at for the active query mode.
 
-        # Bilinear interpolation
-        h0 = h00 * (1 - wx) + h10 * wx
-        h1 = h01 * (1 - wx) + h11 * wx
-        height = h0 * (1 - wz) + h1 * wz
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates
 
-        return float(height)
+        Returns:
+            Float64 array of heights, NaN for positions outside the mesh bounds
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        zs = np.asarray(zs, dtype=np.float64).ravel()
+        heights = np.full(xs.shape, np.nan)
+
+        inside = (
+            (xs >= self.mesh_min_x)
+            & (xs <= self.mesh_max_x)
+            & (zs >= self.mesh_min_z)
+            & (zs <= self.mesh_max_z)
+        )
+
+        if self.triangle_index is not None:
+            heights[inside] = self.triangle_index.query(xs[inside], zs[inside])
+            use_grid = inside & np.isnan(heights)
+        else:
+            use_grid = inside
+
+        if use_grid.any():
+            heights[use_grid] = self._interpolate_grid_batch(xs[use_grid], zs[use_grid])
+
+        return heights
+
+    def _interpolate_grid_batch(self, xs: "np.ndarray", zs: "np.ndarray") -> "np.ndarray":
+        """Vectorized bilinear interpolation of the height grid at in-bounds positions.
+
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates
+
+        Returns:
+            Interpolated terrain heights
+        """
+        last = self.grid_resolution - 1
+        grid_x = (xs - self.mesh_min_x) / (self.mesh_max_x - self.mesh_min_x) * last
+        grid_z = (zs - self.mesh_min_z) / (self.mesh_max_z - self.mesh_min_z) * last
+        return _bilinear_sample(self.height_grid, grid_x, grid_z)
+
+    def has_region_grid(self) -> bool:
+        """Check if region queries are answered exactly from a height grid.
+
+        Returns:
+            False in triangle mode, where height queries are exact against
+            the mesh and grid region queries would bypass it
+        """
+        return self.query_mode != QUERY_MODE_TRIANGLE
+
+    def _height_grid(self) -> tuple["np.ndarray", tuple[float, float, float, float]]:
+        """Get the height grid and the mesh bounds it spans."""
+        return self.height_grid, (
+            self.mesh_min_x,
+            self.mesh_max_x,
+            self.mesh_min_z,
+            self.mesh_max_z,
+        )
 
     def get_bounds(self) -> tuple[Vector3, Vector3]:
         """Get terrain bounds.
@@ -524,7 +1161,11 @@ class MeshTerrainProvider(ITerrainProvider):
 class TerrainEstimator:
     """Estimates terrain characteristics for Portal base maps.
 
-    Single Responsibility: Provides estimated height ranges for Portal terrains.
+    When given a Portal SDK root, height ranges are measured from the map's
+    real terrain data (see PortalTerrainProvider) and memoized per map; the
+    hard-coded estimates remain the fallback when that data is unavailable.
+
+    Single Responsibility: Provides height ranges for Portal terrains.
     Open/Closed: Easy to extend with new map estimates without modification.
     """
 
@@ -542,12 +1183,48 @@ class TerrainEstimator:
         "MP_Abbasid": (0.0, 80.0, 40.0),  # Urban terrain
     }
 
+    # Measured (min_height, max_height) per (map_name, portal_sdk_root); None if unavailable
+    _measured_ranges: dict[tuple[str, Path], tuple[float, float] | None] = {}
+
     @classmethod
-    def get_fixed_height(cls, map_name: str) -> float:
+    def _measured_range(
+        cls, map_name: str, portal_sdk_root: Path | None, cache: "TerrainCache | None" = None
+    ) -> tuple[float, float] | None:
+        """Measure a map's height range from its terrain data, memoized per map.
+
+        Args:
+            map_name: Portal base map name
+            portal_sdk_root: Root directory of Portal SDK, or None to skip measuring
+            cache: Optional TerrainCache for the terrain mesh
+
+        Returns:
+            (min_height, max_height), or None if the terrain data is unavailable
+        """
+        if portal_sdk_root is None:
+            return None
+
+        key = (map_name, Path(portal_sdk_root))
+        if key not in cls._measured_ranges:
+            try:
+                terrain = PortalTerrainProvider(map_name, key[1], cache=cache)
+                cls._measured_ranges[key] = (terrain.min_height, terrain.max_height)
+            except TerrainError:
+                cls._measured_ranges[key] = None
+        return cls._measured_ranges[key]
+
+    @classmethod
+    def get_fixed_height(
+        cls,
+        map_name: str,
+        portal_sdk_root: Path | None = None,
+        cache: "TerrainCache | None" = None,
+    ) -> float:
         """Get recommended fixed height for a Portal map.
 
         Args:
             map_name: Portal base map name (e.g., 'MP_Battery')
+            portal_sdk_root: Optional Portal SDK root to measure the real terrain
+            cache: Optional TerrainCache for the measured terrain mesh
 
         Returns:
             Recommended fixed height in meters
@@ -555,6 +1232,10 @@ class TerrainEstimator:
         Note:
             Returns middle of terrain range, suitable for manual snapping in Godot.
         """
+        measured = cls._measured_range(map_name, portal_sdk_root, cache)
+        if measured is not None:
+            return (measured[0] + measured[1]) / 2
+
         if map_name in cls.TERRAIN_ESTIMATES:
             min_h, max_h, fixed_h = cls.TERRAIN_ESTIMATES[map_name]
             return fixed_h
@@ -563,15 +1244,26 @@ class TerrainEstimator:
             return 100.0
 
     @classmethod
-    def get_height_range(cls, map_name: str) -> tuple[float, float]:
-        """Get estimated height range for a Portal map.
+    def get_height_range(
+        cls,
+        map_name: str,
+        portal_sdk_root: Path | None = None,
+        cache: "TerrainCache | None" = None,
+    ) -> tuple[float, float]:
+        """Get height range for a Portal map.
 
         Args:
             map_name: Portal base map name
+            portal_sdk_root: Optional Portal SDK root to measure the real terrain
+            cache: Optional TerrainCache for the measured terrain mesh
 
         Returns:
             Tuple of (min_height, max_height) in meters
         """
+        measured = cls._measured_range(map_name, portal_sdk_root, cache)
+        if measured is not None:
+            return measured
+
         if map_name in cls.TERRAIN_ESTIMATES:
             min_h, max_h, _ = cls.TERRAIN_ESTIMATES[map_name]
             return (min_h, max_h)
@@ -627,6 +1319,68 @@ class FixedHeightProvider(ITerrainProvider):
 
         return self.fixed_height
 
+    def get_heights_at(
+        self, xs: "Sequence[float] | np.ndarray", zs: "Sequence[float] | np.ndarray"
+    ) -> "np.ndarray":
+        """Query terrain heights for many world positions in one call.
+
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates
+
+        Returns:
+            Array of the fixed height, NaN for positions outside terrain bounds
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        zs = np.asarray(zs, dtype=np.float64).ravel()
+        inside = (np.abs(xs) <= self.terrain_width / 2) & (np.abs(zs) <= self.terrain_depth / 2)
+        return np.where(inside, float(self.fixed_height), np.nan)
+
+    def get_height_range(
+        self, rect: tuple[float, float, float, float]
+    ) -> tuple[float, float, float]:
+        """Get minimum, maximum and mean height over a region.
+
+        Args:
+            rect: World-space rectangle (min_x, max_x, min_z, max_z)
+
+        Returns:
+            The fixed height as (min, max, mean)
+
+        Raises:
+            OutOfBoundsError: If the region does not overlap the terrain
+        """
+        min_x, max_x, min_z, max_z = rect
+        half_width = self.terrain_width / 2
+        half_depth = self.terrain_depth / 2
+        if max_x < -half_width or min_x > half_width or max_z < -half_depth or min_z > half_depth:
+            raise OutOfBoundsError(
+                f"Region [{min_x}, {max_x}] x [{min_z}, {max_z}] is outside terrain bounds "
+                f"[{-half_width}, {half_width}] x [{-half_depth}, {half_depth}]"
+            )
+        return (self.fixed_height, self.fixed_height, self.fixed_height)
+
+    def get_normals_at(
+        self, xs: "Sequence[float] | np.ndarray", zs: "Sequence[float] | np.ndarray"
+    ) -> "np.ndarray":
+        """Get terrain surface normals for many world positions in one call.
+
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates
+
+        Returns:
+            (N, 3) array of straight-up normals, NaN rows outside terrain bounds
+        """
+        import numpy as np
+
+        inside = ~np.isnan(self.get_heights_at(xs, zs))
+        normals = np.full((inside.size, 3), np.nan)
+        normals[inside] = (0.0, 1.0, 0.0)
+        return normals
+
     def get_bounds(self) -> tuple[Vector3, Vector3]:
         """Get terrain bounds.
 
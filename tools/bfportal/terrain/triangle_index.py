@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Uniform-grid spatial index over terrain mesh triangles.
+
+Answers "what is the terrain height straight below (x, z)?" exactly, by
+casting a vertical ray against the mesh triangles instead of interpolating
+a resampled height grid.
+
+Single Responsibility: Only handles triangle lookup and barycentric height queries.
+"""
+
+import numpy as np
+
+# Barycentric tolerance so points on shared edges/vertices always hit a triangle
+BARYCENTRIC_EPSILON = 1e-7
+
+# Target average number of triangles referenced by each index cell
+TRIANGLES_PER_CELL = 2.0
+
+# Instance attributes that fully describe a built index (see to_arrays/from_arrays)
+INDEX_ARRAYS = (
+    "_x0",
+    "_z0",
+    "_e1x",
+    "_e1z",
+    "_e2x",
+    "_e2z",
+    "_inv_det",
+    "_y0",
+    "_dy1",
+    "_dy2",
+    "_cell_triangles",
+    "_cell_start",
+)
+INDEX_SCALARS = (
+    "triangle_count",
+    "min_x",
+    "min_z",
+    "cells_x",
+    "cells_z",
+    "cell_size_x",
+    "cell_size_z",
+)
+
+
+class TriangleSpatialIndex:
+    """2D uniform grid (XZ plane) of triangle references with batched ray-down queries.
+
+    Each cell stores the triangles whose XZ bounding box overlaps it, in a
+    CSR layout (cell_start offsets into cell_triangles). A query looks up
+    the candidates for each point's cell and evaluates all
+    point/triangle pairs in one vectorized barycentric test.
+    """
+
+    def __init__(self, vertices: np.ndarray, triangles: np.ndarray):
+        """Build the index.
+
+        Args:
+            vertices: (N, 3) vertex positions (X, Y, Z)
+            triangles: (T, 3) vertex indices per triangle
+        """
+        vertices = np.asarray(vertices, dtype=np.float64)
+        triangles = np.asarray(triangles, dtype=np.int64)
+
+        v0 = vertices[triangles[:, 0]]
+        v1 = vertices[triangles[:, 1]]
+        v2 = vertices[triangles[:, 2]]
+
+        # Edge vectors projected on the XZ plane
+        e1x, e1z = v1[:, 0] - v0[:, 0], v1[:, 2] - v0[:, 2]
+        e2x, e2z = v2[:, 0] - v0[:, 0], v2[:, 2] - v0[:, 2]
+        det = e1x * e2z - e2x * e1z
+
+        # Vertical (zero-area in XZ) triangles can never be hit by a vertical ray
+        keep = np.abs(det) > 1e-12
+        self.triangle_count = int(keep.sum())
+
+        self._x0 = v0[keep, 0]
+        self._z0 = v0[keep, 2]
+        self._e1x = e1x[keep]
+        self._e1z = e1z[keep]
+        self._e2x = e2x[keep]
+        self._e2z = e2z[keep]
+        self._inv_det = 1.0 / det[keep]
+        self._y0 = v0[keep, 1]
+        self._dy1 = v1[keep, 1] - v0[keep, 1]
+        self._dy2 = v2[keep, 1] - v0[keep, 1]
+
+        xs = np.stack([v0[keep, 0], v1[keep, 0], v2[keep, 0]], axis=1)
+        zs = np.stack([v0[keep, 2], v1[keep, 2], v2[keep, 2]], axis=1)
+        tri_min_x, tri_max_x = xs.min(axis=1), xs.max(axis=1)
+        tri_min_z, tri_max_z = zs.min(axis=1), zs.max(axis=1)
+
+        self.min_x = float(vertices[:, 0].min())
+        self.min_z = float(vertices[:, 2].min())
+        width = max(float(vertices[:, 0].max()) - self.min_x, 1e-9)
+        depth = max(float(vertices[:, 2].max()) - self.min_z, 1e-9)
+
+        cells_per_side = max(1, int(np.ceil(np.sqrt(self.triangle_count / TRIANGLES_PER_CELL))))
+        self.cells_x = self.cells_z = cells_per_side
+        self.cell_size_x = width / cells_per_side
+        self.cell_size_z = depth / cells_per_side
+
+        self._build_cells(tri_min_x, tri_max_x, tri_min_z, tri_max_z)
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Export the built index as named arrays (e.g. for np.savez).
+
+        Returns:
+            Dict of array name -> array, restorable with from_arrays
+        """
+        arrays = {name.lstrip("_"): getattr(self, name) for name in INDEX_ARRAYS}
+        arrays.update({name: np.asarray(getattr(self, name)) for name in INDEX_SCALARS})
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray]) -> "TriangleSpatialIndex":
+        """Restore an index exported with to_arrays without rebuilding it.
+
+        Args:
+            arrays: Mapping containing every key produced by to_arrays
+
+        Returns:
+            TriangleSpatialIndex equivalent to the exported one
+        """
+        index = cls.__new__(cls)
+        for name in INDEX_ARRAYS:
+            setattr(index, name, np.asarray(arrays[name.lstrip("_")]))
+        for name in INDEX_SCALARS:
+            setattr(index, name, np.asarray(arrays[name]).item())
+        return index
+
+    def _cell_coords(self, xs: np.ndarray, zs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Convert world XZ to clamped cell coordinates."""
+        cx = np.floor((xs - self.min_x) / self.cell_size_x).astype(np.int64)
+        cz = np.floor((zs - self.min_z) / self.cell_size_z).astype(np.int64)
+        np.clip(cx, 0, self.cells_x - 1, out=cx)
+        np.clip(cz, 0, self.cells_z - 1, out=cz)
+        return cx, cz
+
+    def _build_cells(
+        self,
+        tri_min_x: np.ndarray,
+        tri_max_x: np.ndarray,
+        tri_min_z: np.ndarray,
+        tri_max_z: np.ndarray,
+    ) -> None:
+        """Register every triangle in each cell its XZ bounding box overlaps."""
+        cx0, cz0 = self._cell_coords(tri_min_x, tri_min_z)
+        cx1, cz1 = self._cell_coords(tri_max_x, tri_max_z)
+        span_x = cx1 - cx0 + 1
+        span_z = cz1 - cz0 + 1
+        counts = span_x * span_z
+
+        # Expand (triangle, covered cell) pairs without a Python loop
+        triangle_ids = np.repeat(np.arange(self.triangle_count, dtype=np.int64), counts)
+        entry_starts = np.cumsum(counts) - counts
+        local = np.arange(int(counts.sum()), dtype=np.int64) - np.repeat(entry_starts, counts)
+        local_x = local % np.repeat(span_x, counts)
+        local_z = local // np.repeat(span_x, counts)
+        cell_ids = (np.repeat(cz0, counts) + local_z) * self.cells_x + (
+            np.repeat(cx0, counts) + local_x
+        )
+
+        order = np.argsort(cell_ids, kind="stable")
+        self._cell_triangles = triangle_ids[order]
+        cell_counts = np.bincount(cell_ids, minlength=self.cells_x * self.cells_z)
+        self._cell_start = np.concatenate([[0], np.cumsum(cell_counts)])
+
+    def query(self, xs: np.ndarray, zs: np.ndarray) -> np.ndarray:
+        """Intersect vertical rays at (xs, zs) with the mesh.
+
+        Where several triangles overlap a point (overhangs, duplicate
+        surfaces), the highest hit is returned, as seen by a ray cast down
+        from above.
+
+        Args:
+            xs: World X coordinates
+            zs: World Z coordinates
+
+        Returns:
+            Heights (float64), NaN where no triangle lies below the point
+        """
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        zs = np.asarray(zs, dtype=np.float64).ravel()
+        heights = np.full(xs.shape, np.nan)
+        if xs.size == 0 or self.triangle_count == 0:
+            return heights
+
+        cx, cz = self._cell_coords(xs, zs)
+        cells = cz * self.cells_x + cx
+        starts = self._cell_start[cells]
+        counts = self._cell_start[cells + 1] - starts
+
+        # Expand (point, candidate triangle) pairs
+        point_ids = np.repeat(np.arange(xs.size, dtype=np.int64), counts)
+        pair_starts = np.cumsum(counts) - counts
+        local = np.arange(int(counts.sum()), dtype=np.int64) - np.repeat(pair_starts, counts)
+        tri = self._cell_triangles[np.repeat(starts, counts) + local]
+
+        dx = xs[point_ids] - self._x0[tri]
+        dz = zs[point_ids] - self._z0[tri]
+        inv_det = self._inv_det[tri]
+        u = (dx * self._e2z[tri] - dz * self._e2x[tri]) * inv_det
+        v = (dz * self._e1x[tri] - dx * self._e1z[tri]) * inv_det
+
+        hit = (
+            (u >= -BARYCENTRIC_EPSILON)
+            & (v >= -BARYCENTRIC_EPSILON)
+            & (u + v <= 1.0 + BARYCENTRIC_EPSILON)
+        )
+        if not hit.any():
+            return heights
+
+        tri = tri[hit]
+        hit_heights = self._y0[tri] + u[hit] * self._dy1[tri] + v[hit] * self._dy2[tri]
+
+        best = np.full(xs.shape, -np.inf)
+        np.maximum.at(best, point_ids[hit], hit_heights)
+        found = np.isfinite(best)
+        heights[found] = best[found]
+        return heights
+
+    def query_point(self, x: float, z: float) -> float | None:
+        """Intersect a single vertical ray with the mesh.
+
+        Scalar fast path for one-off queries, avoiding array setup overhead.
+
+        Args:
+            x: World X coordinate
+            z: World Z coordinate
+
+        Returns:
+            Highest hit height, or None where no triangle lies below the point
+        """
+        if self.triangle_count == 0:
+            return None
+
+        cx = min(max(int((x - self.min_x) // self.cell_size_x), 0), self.cells_x - 1)
+        cz = min(max(int((z - self.min_z) // self.cell_size_z), 0), self.cells_z - 1)
+        cell = cz * self.cells_x + cx
+
+        best: float | None = None
+        for tri in self._cell_triangles[self._cell_start[cell] : self._cell_start[cell + 1]]:
+            dx = x - self._x0[tri]
+            dz = z - self._z0[tri]
+            inv_det = self._inv_det[tri]
+            u = (dx * self._e2z[tri] - dz * self._e2x[tri]) * inv_det
+            v = (dz * self._e1x[tri] - dx * self._e1z[tri]) * inv_det
+            if (
+                u >= -BARYCENTRIC_EPSILON
+                and v >= -BARYCENTRIC_EPSILON
+                and u + v <= 1.0 + BARYCENTRIC_EPSILON
+            ):
+                height = float(self._y0[tri] + u * self._dy1[tri] + v * self._dy2[tri])
+                if best is None or height > best:
+                    best = height
+        return best
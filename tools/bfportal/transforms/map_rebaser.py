@@ -13,6 +13,7 @@ When you want to move a converted map from one Portal base to another
 This is DIFFERENT from the initial BF1942 → Portal conversion.
 """
 
+import math
 import re
 from pathlib import Path
 
@@ -96,15 +97,22 @@ class MapRebaser:
         out_of_bounds = 0
         height_adjusted = 0
 
-        for obj in objects:
-            # Apply offset to re-center
-            new_transform = self.offset_calc.apply_offset(obj.transform, offset)
+        # Apply offset to re-center
+        new_transforms = [self.offset_calc.apply_offset(obj.transform, offset) for obj in objects]
 
+        # Query the new terrain for all objects in one batch
+        terrain_heights = self.terrain.get_heights_at(
+            [t.position.x for t in new_transforms], [t.position.z for t in new_transforms]
+        ).tolist()
+
+        for obj, new_transform, terrain_height in zip(
+            objects, new_transforms, terrain_heights, strict=True
+        ):
             # Adjust height for new terrain
-            try:
-                terrain_height = self.terrain.get_height_at(
-                    new_transform.position.x, new_transform.position.z
-                )
+            if math.isnan(terrain_height):  # NaN: outside the new terrain
+                print(f"  ⚠️  Cannot query height for {obj.name}: outside terrain bounds")
+                out_of_bounds += 1
+            else:
                 height_diff = abs(new_transform.position.y - terrain_height)
 
                 # If object is significantly above/below terrain, adjust
@@ -112,10 +120,6 @@ class MapRebaser:
                     new_transform.position.y = terrain_height
                     height_adjusted += 1
 
-            except Exception as e:
-                print(f"  ⚠️  Cannot query height for {obj.name}: {e}")
-                out_of_bounds += 1
-
             rebased_objects.append(
                 GameObject(
                     name=obj.name,
@@ -9,11 +9,11 @@ AI Assistant: Claude (Anthropic)
 Date: 2025-10-17
 """
 
-import json
 from pathlib import Path
 from typing import Any, cast
 
 from ..generators.constants.paths import get_asset_types_path
+from ..indexers.asset_types_snapshot import load_asset_types
 
 
 class AssetCatalog:
@@ -49,11 +49,8 @@ class AssetCatalog:
         if not self.catalog_path.exists():
             raise FileNotFoundError(f"Asset catalog not found: {self.catalog_path}")
 
-        with open(self.catalog_path, encoding="utf-8") as f:
-            data = json.load(f)
-
         # Build indexed catalog for fast lookup
-        for asset in data.get("AssetTypes", []):
+        for asset in load_asset_types(self.catalog_path).asset_types:
             asset_type = asset.get("type")
             if asset_type:
                 self._catalog[asset_type] = {
@@ -17,6 +17,7 @@ Date: 2025-10-11
 """
 
 import argparse
+import math
 import re
 import sys
 from pathlib import Path
@@ -26,11 +27,12 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from bfportal.core.exceptions import BFPortalError, TerrainError
 from bfportal.core.interfaces import Rotation, Transform, Vector3
+from bfportal.terrain.terrain_cache import TerrainCache
 from bfportal.terrain.terrain_provider import (
+    PORTAL_BASE_TERRAINS,
     CustomHeightmapProvider,
     HeightAdjuster,
-    OutskirtsTerrainProvider,
-    TungstenTerrainProvider,
+    PortalTerrainProvider,
 )
 from bfportal.utils.tscn_utils import TscnTransformParser
 
@@ -101,12 +103,14 @@ Use Cases:
             "--in-place", action="store_true", help="Modify input file directly (overwrites input)"
         )
 
-        parser.add_argument("--heightmap", type=Path, help="Custom heightmap PNG file")
+        parser.add_argument(
+            "--heightmap", type=Path, help="Custom heightmap (8/16-bit PNG or BF1942 .raw)"
+        )
 
         parser.add_argument(
             "--base-terrain",
             type=str,
-            choices=["MP_Tungsten", "MP_Outskirts"],
+            choices=list(PORTAL_BASE_TERRAINS),
             help="Use Portal base terrain provider",
         )
 
@@ -170,10 +174,9 @@ Use Cases:
             # Get portal SDK root (two dirs up from tools/)
             portal_sdk_root = Path(__file__).parent.parent
 
-            if self.args.base_terrain == "MP_Tungsten":
-                return TungstenTerrainProvider(portal_sdk_root)
-            elif self.args.base_terrain == "MP_Outskirts":
-                return OutskirtsTerrainProvider(portal_sdk_root)
+            return PortalTerrainProvider(
+                self.args.base_terrain, portal_sdk_root, cache=TerrainCache()
+            )
 
         else:
             raise ValueError("Must specify either --heightmap or --base-terrain")
@@ -239,6 +242,23 @@ Use Cases:
         adjusted_count = 0
         skip_nodes = ["HQ", "Spawn", "Combat", "Static", "Terrain", "Area", "Volume", "Trigger"]
 
+        # First pass: collect every adjustable object, keyed by match offset
+        candidates: dict[int, Transform] = {}
+        for match in re.finditer(pattern, content):
+            # Skip system nodes
+            if any(skip in match.group(2) for skip in skip_nodes):
+                continue
+            transform = self.parse_transform(match.group(3))
+            if transform:
+                candidates[match.start()] = transform
+
+        # Query terrain heights for all objects in one batch
+        heights = terrain.get_heights_at(
+            [t.position.x for t in candidates.values()],
+            [t.position.z for t in candidates.values()],
+        )
+        terrain_heights = dict(zip(candidates, heights.tolist(), strict=True))
+
         def replace_transform(match):
             nonlocal adjusted_count
 
@@ -246,49 +266,42 @@ Use Cases:
             node_name = match.group(2)
             transform_values = match.group(3)
 
-            # Skip system nodes
-            if any(skip in node_name for skip in skip_nodes):
+            transform = candidates.get(match.start())
+            if transform is None:
                 return full_match
 
-            # Parse transform
-            transform = self.parse_transform(transform_values)
-            if not transform:
+            terrain_height = terrain_heights[match.start()]
+            if math.isnan(terrain_height):
+                if self.args.dry_run:
+                    print(f"   ⚠️  Cannot adjust {node_name}: outside terrain bounds")
                 return full_match
 
-            # Query terrain height
-            try:
-                terrain_height = terrain.get_height_at(transform.position.x, transform.position.z)
-
-                height_diff = abs(transform.position.y - terrain_height)
-
-                # Only adjust if difference exceeds tolerance
-                if height_diff > self.args.tolerance:
-                    if self.args.dry_run:
-                        print(
-                            f"   Would adjust {node_name}: "
-                            f"Y={transform.position.y:.1f} → {terrain_height + self.args.ground_offset:.1f} "
-                            f"(diff: {height_diff:.1f}m)"
-                        )
-
-                    # Update position
-                    new_transform = Transform(
-                        position=Vector3(
-                            transform.position.x,
-                            terrain_height + self.args.ground_offset,
-                            transform.position.z,
-                        ),
-                        rotation=transform.rotation,
-                    )
-
-                    adjusted_count += 1
+            height_diff = abs(transform.position.y - terrain_height)
 
-                    # Format back to string
-                    new_values = self.format_transform(new_transform, transform_values)
-                    return f"{match.group(1)}{new_values}{match.group(4)}"
-
-            except Exception as e:
+            # Only adjust if difference exceeds tolerance
+            if height_diff > self.args.tolerance:
                 if self.args.dry_run:
-                    print(f"   ⚠️  Cannot adjust {node_name}: {e}")
+                    print(
+                        f"   Would adjust {node_name}: "
+                        f"Y={transform.position.y:.1f} → {terrain_height + self.args.ground_offset:.1f} "
+                        f"(diff: {height_diff:.1f}m)"
+                    )
+
+                # Update position
+                new_transform = Transform(
+                    position=Vector3(
+                        transform.position.x,
+                        terrain_height + self.args.ground_offset,
+                        transform.position.z,
+                    ),
+                    rotation=transform.rotation,
+                )
+
+                adjusted_count += 1
+
+                # Format back to string
+                new_values = self.format_transform(new_transform, transform_values)
+                return f"{match.group(1)}{new_values}{match.group(4)}"
 
             return full_match
 
@@ -58,7 +58,13 @@ from bfportal.orientation import (
     OrientationMatcher,
     TerrainOrientationDetector,
 )
-from bfportal.terrain.terrain_provider import HeightAdjuster, MeshTerrainProvider
+from bfportal.terrain.terrain_cache import TerrainCache
+from bfportal.terrain.terrain_provider import (
+    QUERY_MODE_GRID,
+    QUERY_MODES,
+    HeightAdjuster,
+    MeshTerrainProvider,
+)
 from bfportal.transforms.centering_service import CenteringService
 from bfportal.transforms.coordinate_offset import CoordinateOffset
 
@@ -113,9 +119,13 @@ class PortalConverter:
 
         print_info(f"Loading Portal terrain mesh: {terrain_mesh_path.name}")
         self.terrain = MeshTerrainProvider(
-            mesh_path=terrain_mesh_path, terrain_size=(args.terrain_size, args.terrain_size)
+            mesh_path=terrain_mesh_path,
+            terrain_size=(args.terrain_size, args.terrain_size),
+            query_mode=args.terrain_query,
+            cache=None if args.no_terrain_cache else TerrainCache(),
         )
-        print_success(f"Terrain loaded: {len(self.terrain.vertices):,} vertices")
+        cache_note = " (from cache)" if self.terrain.loaded_from_cache else ""
+        print_success(f"Terrain loaded: {len(self.terrain.vertices):,} vertices{cache_note}")
         print(
             f"   Mesh internal Y: {self.terrain.mesh_min_height:.1f}m - {self.terrain.mesh_max_height:.1f}m"
         )
@@ -133,6 +143,8 @@ class PortalConverter:
             f"   Mesh center: ({self.terrain.mesh_center_x:.1f}, {self.terrain.mesh_center_z:.1f})"
         )
         print(f"   Grid resolution: {self.terrain.grid_resolution}x{self.terrain.grid_resolution}")
+        if self.terrain.triangle_index is not None:
+            print(f"   Triangle index: {self.terrain.triangle_index.triangle_count:,} triangles")
 
         self.height_adjuster = HeightAdjuster()
 
@@ -435,19 +447,24 @@ class PortalConverter:
             team=Team.NEUTRAL,
         )
 
+        # Each distinct asset type is resolved (and reported) once
+        portal_assets = self.asset_mapper.map_assets(
+            (obj.asset_type for obj in map_data.game_objects), context
+        )
+        terrain_types = {
+            asset_type
+            for asset_type, portal_asset in portal_assets.items()
+            if portal_asset is None and self.asset_mapper._is_terrain_element(asset_type)
+        }
+
         for obj in map_data.game_objects:
-            try:
-                portal_asset = self.asset_mapper.map_asset(obj.asset_type, context)
-                if portal_asset:
-                    obj.asset_type = portal_asset.type
-                    mapped_count += 1
-                else:
-                    if self.asset_mapper._is_terrain_element(obj.asset_type):
-                        skipped_terrain.append(obj.asset_type)
-                    else:
-                        unmapped.append(obj.asset_type)
-            except Exception as e:
-                print(f"   ⚠️  Failed to map {obj.asset_type}: {e}")
+            portal_asset = portal_assets[obj.asset_type]
+            if portal_asset:
+                obj.asset_type = portal_asset.type
+                mapped_count += 1
+            elif obj.asset_type in terrain_types:
+                skipped_terrain.append(obj.asset_type)
+            else:
                 unmapped.append(obj.asset_type)
 
         print_success(f"Mapped: {mapped_count}/{len(map_data.game_objects)}")
@@ -678,6 +695,18 @@ Note:
     parser.add_argument(
         "--terrain-size", type=float, default=2048.0, help="Terrain size in meters (default: 2048)"
     )
+    parser.add_argument(
+        "--terrain-query",
+        choices=QUERY_MODES,
+        default=QUERY_MODE_GRID,
+        help="Terrain height query mode: 'grid' (bilinear height grid) or "
+        "'triangle' (exact mesh triangle intersection) (default: grid)",
+    )
+    parser.add_argument(
+        "--no-terrain-cache",
+        action="store_true",
+        help="Rebuild the terrain height grid from the GLB instead of using the on-disk cache",
+    )
     parser.add_argument(
         "--rotate-terrain",
         action="store_true",
@@ -26,11 +26,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from bfportal.core.exceptions import BFPortalError
 from bfportal.core.interfaces import Vector3
-from bfportal.terrain.terrain_provider import (
-    CustomHeightmapProvider,
-    OutskirtsTerrainProvider,
-    TungstenTerrainProvider,
-)
+from bfportal.terrain.terrain_cache import TerrainCache
+from bfportal.terrain.terrain_provider import CustomHeightmapProvider, PortalTerrainProvider
 from bfportal.transforms.coordinate_offset import CoordinateOffset
 from bfportal.transforms.map_rebaser import MapRebaser
 
@@ -108,7 +105,9 @@ Available Base Terrains:
         )
 
         parser.add_argument(
-            "--heightmap", type=Path, help="Custom heightmap for new base terrain (PNG)"
+            "--heightmap",
+            type=Path,
+            help="Custom heightmap for new base terrain (8/16-bit PNG or BF1942 .raw)",
         )
 
         parser.add_argument(
@@ -163,14 +162,7 @@ Available Base Terrains:
         # Get portal SDK root (two dirs up from tools/)
         portal_sdk_root = Path(__file__).parent.parent
 
-        if base_terrain == "MP_Tungsten":
-            return TungstenTerrainProvider(portal_sdk_root)
-        elif base_terrain == "MP_Outskirts":
-            return OutskirtsTerrainProvider(portal_sdk_root)
-        else:
-            # Fallback to generic provider (flat terrain estimation)
-            print(f"  ⚠️  No specific terrain provider for {base_terrain}, using flat estimation")
-            return TungstenTerrainProvider(portal_sdk_root)  # Generic flat provider
+        return PortalTerrainProvider(base_terrain, portal_sdk_root, cache=TerrainCache())
 
     def run(self) -> int:
         """Execute the rebasing process.
@@ -28,7 +28,6 @@ Date: 2025-10-11
 """
 
 import argparse
-import json
 import re
 import sys
 from dataclasses import dataclass
@@ -55,6 +54,7 @@ from bfportal.cli import (
 
 # Import constants (DRY principle - no magic numbers)
 from bfportal.generators.constants import MIN_SPAWNS_PER_TEAM
+from bfportal.indexers.asset_types_snapshot import load_asset_types
 
 
 @dataclass
@@ -92,9 +92,7 @@ class PortalMapValidator:
             print(f"⚠️  Warning: Asset catalog not found at {catalog_path}")
             return {"AssetTypes": []}
 
-        with open(catalog_path) as f:
-            catalog: dict[str, Any] = json.load(f)
-            return catalog
+        return load_asset_types(catalog_path).data
 
     def validate_map(self, tscn_path: Path) -> bool:
         """Validate a Portal map.
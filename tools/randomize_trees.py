@@ -8,7 +8,6 @@ randomized tree types appropriate for the terrain, while:
 - Using only assets available on the target terrain
 """
 
-import json
 import random
 import re
 import sys
@@ -18,6 +17,7 @@ from bfportal.generators.constants.paths import (
     get_asset_types_path,
     get_level_tscn_path,
 )
+from bfportal.indexers.asset_types_snapshot import load_asset_types
 
 
 def load_tree_catalog(terrain: str = "MP_Tungsten") -> dict[str, list[str]]:
@@ -29,13 +29,9 @@ def load_tree_catalog(terrain: str = "MP_Tungsten") -> dict[str, list[str]]:
     Returns:
         Dict with categories: large, medium, small, dead, burnt
     """
-    catalog_path = get_asset_types_path()
-    with open(catalog_path) as f:
-        data = json.load(f)
-
     trees: dict[str, list[str]] = {"large": [], "medium": [], "small": [], "dead": [], "burnt": []}
 
-    for asset in data.get("AssetTypes", []):
+    for asset in load_asset_types(get_asset_types_path()).asset_types:
         asset_type = asset.get("type", "")
         directory = asset.get("directory", "")
         restrictions = asset.get("levelRestrictions", [])
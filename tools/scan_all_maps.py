@@ -10,6 +10,7 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
+from bfportal.engines.batch import map_in_parallel
 from bfportal.generators.constants.paths import (
     DIR_BF1942_EXTRACTED_BASE,
     DIR_BF1942_EXTRACTED_XPACK1,
@@ -91,9 +92,9 @@ def main() -> None:
     all_discovered_assets: set[str] = set()
     asset_usage: dict[str, list[str]] = defaultdict(list)
 
-    for map_dir in all_maps:
-        print(f"  📖 Scanning: {map_dir.name}...")
-        data = scan_map_directory(map_dir)
+    # Maps are scanned in worker processes; results come back in map order
+    for map_dir, data in zip(all_maps, map_in_parallel(scan_map_directory, all_maps), strict=True):
+        print(f"  📖 Scanned: {map_dir.name}")
         map_data.append(data)
 
         # Track global asset usage
@@ -10,6 +10,8 @@ import json
 import re
 from pathlib import Path
 
+from bfportal.engines.batch import map_in_parallel
+
 # Base game maps to scan (Battle_of_Britain through Gazala alphabetically)
 BASE_GAME_MAPS = [
     "Battle_of_Britain",
@@ -67,9 +69,26 @@ def extract_vehicles_from_file(file_path: Path) -> set[str]:
     return vehicles
 
 
+def scan_map_vehicles(map_dir: Path) -> list[str] | None:
+    """
+    Extract the vehicles of one map's Conquest ObjectSpawnTemplates.con.
+
+    Args:
+        map_dir: Map directory
+
+    Returns:
+        Sorted vehicle template names, or None if the map has no
+        ObjectSpawnTemplates.con
+    """
+    conquest_file = map_dir / "Conquest" / "ObjectSpawnTemplates.con"
+    if not conquest_file.exists():
+        return None
+    return sorted(extract_vehicles_from_file(conquest_file))
+
+
 def scan_all_maps(base_path: Path) -> dict[str, list[str]]:
     """
-    Scan all base game maps and extract vehicles.
+    Scan all base game maps and extract vehicles (maps are scanned in parallel).
 
     Args:
         base_path: Base directory containing BF1942 extracted levels
@@ -79,17 +98,16 @@ def scan_all_maps(base_path: Path) -> dict[str, list[str]]:
     """
     results: dict[str, list[str]] = {}
 
-    for map_name in BASE_GAME_MAPS:
-        map_dir = base_path / map_name
-        conquest_file = map_dir / "Conquest" / "ObjectSpawnTemplates.con"
-
-        if not conquest_file.exists():
+    map_dirs = [base_path / map_name for map_name in BASE_GAME_MAPS]
+    for map_name, vehicles in zip(
+        BASE_GAME_MAPS, map_in_parallel(scan_map_vehicles, map_dirs), strict=True
+    ):
+        if vehicles is None:
             print(f"⚠️  {map_name}: No ObjectSpawnTemplates.con found")
             results[map_name] = []
             continue
 
-        vehicles = extract_vehicles_from_file(conquest_file)
-        results[map_name] = sorted(vehicles)
+        results[map_name] = vehicles
 
         print(f"✓ {map_name}: Found {len(vehicles)} vehicles")
 
@@ -31,7 +31,8 @@ from bfportal.terrain.snappers import (
     VegetationSnapper,
 )
 from bfportal.terrain.snappers.snapping_orchestrator import SnappingOrchestrator
-from bfportal.terrain.terrain_provider import MeshTerrainProvider
+from bfportal.terrain.terrain_cache import TerrainCache
+from bfportal.terrain.terrain_provider import QUERY_MODE_TRIANGLE, QUERY_MODES, MeshTerrainProvider
 
 
 def main() -> int:
@@ -82,6 +83,18 @@ ensuring objects are positioned precisely on the terrain surface.
         default=2048.0,
         help="Terrain size in meters (default: 2048)",
     )
+    parser.add_argument(
+        "--terrain-query",
+        choices=QUERY_MODES,
+        default=QUERY_MODE_TRIANGLE,
+        help="Terrain height query mode: 'triangle' (exact mesh triangle intersection) "
+        "or 'grid' (bilinear height grid) (default: triangle)",
+    )
+    parser.add_argument(
+        "--no-terrain-cache",
+        action="store_true",
+        help="Rebuild the terrain grid and triangle index instead of using the on-disk cache",
+    )
 
     args = parser.parse_args()
 
@@ -112,8 +125,14 @@ ensuring objects are positioned precisely on the terrain surface.
         terrain = MeshTerrainProvider(
             mesh_path=terrain_mesh_path,
             terrain_size=(args.terrain_size, args.terrain_size),
+            query_mode=args.terrain_query,
+            cache=None if args.no_terrain_cache else TerrainCache(),
+        )
+        cache_note = ", from cache" if terrain.loaded_from_cache else ""
+        print(
+            f"   ✅ Loaded {len(terrain.vertices):,} vertices "
+            f"({args.terrain_query} queries{cache_note})"
         )
-        print(f"   ✅ Loaded {len(terrain.vertices):,} vertices")
         print(f"   Height range: {terrain.min_height:.1f}m - {terrain.max_height:.1f}m")
 
         # Create snappers (order matters - first match wins)
@@ -12,7 +12,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from bfportal.core.interfaces import Rotation, Team, Transform, Vector3
 from bfportal.engines.refractor.refractor_base import RefractorEngine
-from bfportal.parsers.con_parser import ConFileSet
+from bfportal.parsers.con_parser import ConFileSet, ConObjectIndex
+from bfportal.parsers.map_files import MapFiles
+
+
+def autospec_con_file_set():
+    """Create a ConFileSet mock whose index() views its parse_all() result."""
+    con_files = create_autospec(ConFileSet, instance=True)
+    con_files.files = MapFiles(Path("missing-map-dir"))  # No templates, terrain or heightmap
+    con_files.index.side_effect = lambda: ConObjectIndex(con_files.parse_all())
+    return con_files
 
 
 class ConcreteRefractorEngine(RefractorEngine):
@@ -52,7 +61,7 @@ class TestRefractorEngineParseMap:
         map_dir.mkdir()
 
         # Create mock ConFileSet that returns parsed data using autospec
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.con_files = ["init.con"]
         mock_con_files.parse_all.return_value = {
             "init.con": {
@@ -72,8 +81,9 @@ class TestRefractorEngineParseMap:
         }
 
         # Mock ConFileSet constructor
-        def mock_con_file_set_constructor(path: Path):
+        def mock_con_file_set_constructor(path: Path, game_mode: str):
             assert path == map_dir
+            assert game_mode == "Conquest"
             return mock_con_files
 
         monkeypatch.setattr(
@@ -106,13 +116,13 @@ class TestRefractorEngineParseMap:
         map_dir = tmp_path / "Kursk"
         map_dir.mkdir()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.con_files = ["init.con", "objects.con"]
         mock_con_files.parse_all.return_value = {"init.con": {"objects": []}}
 
         monkeypatch.setattr(
             "bfportal.engines.refractor.refractor_base.ConFileSet",
-            lambda path: mock_con_files,
+            lambda path, game_mode: mock_con_files,
         )
 
         # Act
@@ -133,7 +143,7 @@ class TestRefractorEngineParseSpawns:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "spawns.con": {
                 "objects": [
@@ -163,7 +173,7 @@ class TestRefractorEngineParseSpawns:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "spawns.con": {
                 "objects": [
@@ -193,7 +203,7 @@ class TestRefractorEngineParseSpawns:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "spawns.con": {
                 "objects": [
@@ -221,7 +231,7 @@ class TestRefractorEngineParseSpawns:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "spawns.con": {
                 "objects": [
@@ -254,7 +264,7 @@ class TestRefractorEngineParseSpawns:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "spawns.con": {
                 "objects": [
@@ -284,7 +294,7 @@ class TestRefractorEngineParseHQ:
         """Test _parse_hq calculates HQ position as spawn centroid."""
         # Arrange
         engine = ConcreteRefractorEngine()
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
 
         from bfportal.core.interfaces import SpawnPoint
 
@@ -332,7 +342,7 @@ class TestRefractorEngineParseHQ:
         """Test _parse_hq returns default position when no spawns."""
         # Arrange
         engine = ConcreteRefractorEngine()
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
 
         # Act
         hq = engine._parse_hq(mock_con_files, Team.TEAM_1, [])
@@ -351,7 +361,7 @@ class TestRefractorEngineParseGameObjects:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "objects.con": {
                 "objects": [
@@ -393,7 +403,7 @@ class TestRefractorEngineParseGameObjects:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "objects.con": {
                 "objects": [
@@ -453,7 +463,7 @@ class TestRefractorEngineParseGameObjects:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "objects.con": {
                 "objects": [
@@ -493,7 +503,7 @@ class TestRefractorEngineParseCapturePoints:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "controlpoints.con": {
                 "objects": [
@@ -531,7 +541,7 @@ class TestRefractorEngineParseCapturePoints:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "controlpoints.con": {
                 "objects": [
@@ -571,7 +581,7 @@ class TestRefractorEngineParseCapturePoints:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "controlpoints.con": {
                 "objects": [
@@ -621,7 +631,7 @@ class TestRefractorEngineParseCapturePoints:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "controlpoints.con": {
                 "objects": [
@@ -686,7 +696,7 @@ class TestRefractorEngineParseCapturePoints:
         # Arrange
         engine = ConcreteRefractorEngine()
 
-        mock_con_files = create_autospec(ConFileSet, instance=True)
+        mock_con_files = autospec_con_file_set()
         mock_con_files.parse_all.return_value = {
             "controlpoints.con": {
                 "objects": [
@@ -709,3 +719,86 @@ class TestRefractorEngineParseCapturePoints:
 
         # Assert - Default radius is 50.0
         assert capture_points[0].radius == 50.0
+
+    def test_parse_capture_points_attaches_ungrouped_spawns_to_nearest_cp(self):
+        """Test neutral spawns without a group number join the nearest CP in range."""
+        # Arrange
+        engine = ConcreteRefractorEngine()
+
+        def obj(name: str, obj_type: str, x: float) -> dict:
+            return {
+                "name": name,
+                "type": obj_type,
+                "properties": {},
+                "position": {"x": x, "y": 0.0, "z": 0.0},
+            }
+
+        mock_con_files = autospec_con_file_set()
+        mock_con_files.parse_all.return_value = {
+            "controlpoints.con": {
+                "objects": [
+                    obj("CP_West", "ControlPoint", 0.0),
+                    obj("CP_East", "ControlPoint", 0.0),
+                ]
+            },
+            "soldierspawns.con": {
+                "objects": [
+                    obj("spawn_3_1", "SpawnPoint", 0.0),
+                    obj("spawn_4_1", "SpawnPoint", 1000.0),
+                    obj("openbase_spawn", "SpawnPoint", 1040.0),
+                    obj("far_spawn", "SpawnPoint", 5000.0),
+                ]
+            },
+        }
+
+        # Act
+        west, east = engine._parse_capture_points(mock_con_files)
+
+        # Assert - East CP stays at its grouped spawn's centroid; far spawn is dropped
+        assert [spawn.name for spawn in west.team1_spawns] == ["spawn_3_1"]
+        assert [spawn.name for spawn in east.team1_spawns] == ["spawn_4_1", "openbase_spawn"]
+        assert [spawn.name for spawn in east.team2_spawns] == ["spawn_4_1", "openbase_spawn"]
+        assert east.transform.position.x == pytest.approx(1000.0)
+
+
+class TestRefractorEngineParseWaterBodies:
+    """Tests for _parse_water_bodies heightmap water extraction."""
+
+    def test_parse_water_bodies_creates_lake_per_region(self, tmp_path: Path):
+        """Test each sufficiently large below-waterLevel region becomes a lake."""
+        # Arrange - 64x64 heightmap at max height with two low basins
+        import numpy as np
+
+        heights = np.full((64, 64), 65535, dtype="<u2")
+        heights[4:10, 4:12] = 0  # 48 pixel lake
+        heights[40:44, 50:52] = 0  # 8 pixel puddle (skipped, < 10 pixels)
+        heights[50:60, 20:30] = 0  # 100 pixel lake
+        map_dir = tmp_path / "TestMap"
+        (map_dir / "Init").mkdir(parents=True)
+        (map_dir / "Init" / "Terrain.con").write_text("GeometryTemplate.waterLevel 72\n")
+        heights.tofile(map_dir / "Heightmap.raw")
+        engine = ConcreteRefractorEngine()
+
+        # Act
+        lakes = engine._parse_water_bodies(map_dir, None)
+
+        # Assert - numbering counts the skipped puddle
+        assert [lake.name for lake in lakes] == ["Lake_1", "Lake_3"]
+        assert [lake.asset_type for lake in lakes] == ["lake", "lake3"]
+        first = lakes[0].transform
+        assert first.position.y == 72.0
+        # Pixel columns 4..11 at 16m/pixel, centered on a 1024m map
+        assert first.position.x == pytest.approx((4 + 11) / 2 * 16.0 - 512.0)
+        assert first.scale.x == pytest.approx((11 - 4) * 16.0 / 10.0)
+        assert lakes[1].properties["dimensions"] == "144x144"
+
+    def test_parse_water_bodies_without_water_level_returns_empty(self, tmp_path: Path):
+        """Test maps without a waterLevel produce no water bodies."""
+        # Arrange
+        map_dir = tmp_path / "TestMap"
+        map_dir.mkdir()
+        (map_dir / "Heightmap.raw").write_bytes(b"\x00\x00" * 16)
+        engine = ConcreteRefractorEngine()
+
+        # Act & Assert
+        assert engine._parse_water_bodies(map_dir, None) == []
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for parallel multi-map parsing."""
+
+import sys
+from pathlib import Path
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from bfportal.engines.batch import map_in_parallel, parse_maps
+from bfportal.engines.refractor.games.bf1942 import BF1942Engine
+
+
+def _write_map(map_dir: Path, x: float) -> None:
+    """Write a minimal Conquest map with one spawn point per team."""
+    conquest = map_dir / "Conquest"
+    conquest.mkdir(parents=True)
+    (conquest / "SoldierSpawns.con").write_text(
+        f"""Object.create SpawnPoint_1_1
+Object.absolutePosition {x}/10/100
+Object.create SpawnPoint_2_1
+Object.absolutePosition {x}/10/-100
+"""
+    )
+
+
+def _count_con_files(map_dir: Path) -> int:
+    """Count a map's .con files (module-level so worker processes can run it)."""
+    return len(list(map_dir.rglob("*.con")))
+
+
+class TestParseMaps:
+    """Tests for parse_maps."""
+
+    def test_parallel_results_match_serial_in_input_order(self, tmp_path: Path):
+        """Test worker processes return the same maps, in order, as an in-process run."""
+        # Arrange
+        map_dirs = [tmp_path / name for name in ("Kursk", "Berlin", "Wake")]
+        for i, map_dir in enumerate(map_dirs):
+            _write_map(map_dir, x=50.0 * i)
+
+        # Act
+        parallel = parse_maps(map_dirs, BF1942Engine, max_workers=2)
+        serial = parse_maps(map_dirs, BF1942Engine, max_workers=1)
+
+        # Assert
+        assert [result.map_path for result in parallel] == map_dirs
+        assert [result.map_data for result in parallel] == [result.map_data for result in serial]
+        assert [result.map_data.map_name for result in parallel] == ["Kursk", "Berlin", "Wake"]
+        assert "Map parsing complete" in parallel[0].log
+
+    def test_failed_map_is_reported_without_aborting_batch(self, tmp_path: Path):
+        """Test a missing map yields an error result while the others parse."""
+        # Arrange
+        _write_map(tmp_path / "Kursk", x=0.0)
+        map_dirs = [tmp_path / "Missing", tmp_path / "Kursk"]
+
+        # Act
+        results = parse_maps(map_dirs, BF1942Engine, max_workers=2)
+
+        # Assert
+        assert results[0].map_data is None
+        assert "Map directory not found" in results[0].error
+        assert results[1].map_data is not None
+        assert results[1].error is None
+
+
+class TestMapInParallel:
+    """Tests for map_in_parallel."""
+
+    def test_returns_results_in_input_order(self, tmp_path: Path):
+        """Test per-map results line up with the input directories."""
+        # Arrange
+        map_dirs = []
+        for count in (3, 1, 2):
+            map_dir = tmp_path / f"map{count}"
+            map_dir.mkdir()
+            for i in range(count):
+                (map_dir / f"{i}.con").write_text("")
+            map_dirs.append(map_dir)
+
+        # Act
+        counts = map_in_parallel(_count_con_files, map_dirs, max_workers=3)
+
+        # Assert
+        assert counts == [3, 1, 2]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Tests for scene_index.py and scene path resolution in AssetCatalog."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from bfportal.generators.components.asset_catalog import AssetCatalog
+from bfportal.generators.components.scene_index import SceneIndex
+
+SCENES = [
+    "objects/Tajikistan/MP_Tungsten/Generic/Nature/Trees/Birch_01_L.tscn",
+    "objects/Shared/Generic/Nature/Trees/Birch_01_L.tscn",
+    "objects/Shared/Props/Barrel_01.tscn",
+]
+
+
+def _make_project(root: Path, scenes: list[str]) -> Path:
+    """Create a GodotProject with empty scene files."""
+    for scene in scenes:
+        path = root / scene
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("[gd_scene]\n")
+    return root
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move a directory's mtime forward so the change is seen on coarse filesystems."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestSceneIndex:
+    """Tests for SceneIndex."""
+
+    def test_index_is_saved_and_reused(self, tmp_path):
+        """Test the first load scans objects/ and later loads read the saved index."""
+        # Arrange
+        project = _make_project(tmp_path / "GodotProject", SCENES)
+        first = SceneIndex(project, tmp_path / "cache")
+
+        # Act
+        second = SceneIndex(project, tmp_path / "cache")
+
+        # Assert
+        assert first.rescanned
+        assert not second.rescanned
+        assert len(second) == 3
+        assert second.scenes_named("Birch_01_L") == [
+            "res://objects/Shared/Generic/Nature/Trees/Birch_01_L.tscn",
+            "res://objects/Tajikistan/MP_Tungsten/Generic/Nature/Trees/Birch_01_L.tscn",
+        ]
+        assert second.scenes_named("Missing") == []
+
+    def test_added_scene_triggers_rescan(self, tmp_path):
+        """Test a file added to an indexed directory is picked up on the next load."""
+        # Arrange
+        project = _make_project(tmp_path / "GodotProject", SCENES)
+        SceneIndex(project, tmp_path / "cache")
+        _make_project(project, ["objects/Shared/Props/Crate_01.tscn"])
+        _bump_mtime(project / "objects/Shared/Props")
+
+        # Act
+        index = SceneIndex(project, tmp_path / "cache")
+
+        # Assert
+        assert index.rescanned
+        assert index.scenes_named("Crate_01") == ["res://objects/Shared/Props/Crate_01.tscn"]
+
+    def test_corrupt_index_is_rebuilt(self, tmp_path):
+        """Test an unreadable index file is ignored and rewritten."""
+        # Arrange
+        project = _make_project(tmp_path / "GodotProject", SCENES)
+        index_path = SceneIndex(project, tmp_path / "cache").index_path
+        index_path.write_text("{not json")
+
+        # Act
+        index = SceneIndex(project, tmp_path / "cache")
+
+        # Assert
+        assert index.rescanned
+        assert len(index) == 3
+
+
+class TestAssetCatalogScenePath:
+    """Tests for AssetCatalog.get_scene_path() over a scene index."""
+
+    def _make_catalog(self, tmp_path: Path) -> AssetCatalog:
+        catalog_path = tmp_path / "asset_types.json"
+        catalog_path.write_text(
+            json.dumps(
+                {
+                    "AssetTypes": [
+                        {"type": "Birch_01_L", "directory": "Nature/Trees"},
+                        {"type": "Barrel_01", "directory": "Props"},
+                        {"type": "Rock_01", "directory": "Nature/Rocks"},
+                    ]
+                }
+            )
+        )
+        project = _make_project(tmp_path / "GodotProject", SCENES)
+        return AssetCatalog(catalog_path, SceneIndex(project, tmp_path / "cache"))
+
+    def test_region_scene_preferred_over_shared(self, tmp_path):
+        """Test a terrain's own scene wins over the shared one."""
+        # Arrange
+        catalog = self._make_catalog(tmp_path)
+
+        # Act & Assert
+        assert (
+            catalog.get_scene_path("Birch_01_L", "MP_Tungsten")
+            == "res://objects/Tajikistan/MP_Tungsten/Generic/Nature/Trees/Birch_01_L.tscn"
+        )
+        assert (
+            catalog.get_scene_path("Birch_01_L", "MP_Battery")
+            == "res://objects/Shared/Generic/Nature/Trees/Birch_01_L.tscn"
+        )
+        assert (
+            catalog.get_scene_path("Barrel_01", "MP_Tungsten")
+            == "res://objects/Shared/Props/Barrel_01.tscn"
+        )
+
+    def test_missing_scene_falls_back_to_first_candidate(self, tmp_path):
+        """Test an asset without a scene gets the first candidate path, and unknown ones None."""
+        # Arrange
+        catalog = self._make_catalog(tmp_path)
+
+        # Act & Assert
+        assert (
+            catalog.get_scene_path("Rock_01", "MP_Tungsten")
+            == "res://objects/Tajikistan/MP_Tungsten/Generic/Nature/Rocks/Rock_01.tscn"
+        )
+        assert catalog.get_scene_path("Unknown_Asset", "MP_Tungsten") is None
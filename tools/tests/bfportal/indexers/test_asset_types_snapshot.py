@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Tests for asset_types_snapshot.py."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from bfportal.indexers.asset_types_snapshot import AssetTypesSnapshot, load_asset_types
+
+CATALOG = {
+    "AssetTypes": [
+        {"type": "Tree_Pine_Large", "directory": "Nature/Trees", "levelRestrictions": []},
+        {"type": "Rock_Boulder_01", "directory": "Nature/Rocks", "levelRestrictions": ["MP_A"]},
+    ]
+}
+
+
+def _write_catalog(path: Path, catalog: dict) -> Path:
+    """Write an asset_types.json."""
+    path.write_text(json.dumps(catalog))
+    return path
+
+
+class TestAssetTypesSnapshot:
+    """Tests for AssetTypesSnapshot."""
+
+    def test_snapshot_is_compiled_and_reused(self, tmp_path):
+        """Test the first load writes a snapshot that later loads read instead of the JSON."""
+        # Arrange
+        catalog_path = _write_catalog(tmp_path / "asset_types.json", CATALOG)
+        first = AssetTypesSnapshot(catalog_path, tmp_path / "cache")
+
+        # Act
+        second = AssetTypesSnapshot(catalog_path, tmp_path / "cache")
+
+        # Assert
+        assert first.snapshot_path.exists()
+        assert second.data == first.data == CATALOG
+        assert second.by_type()["Rock_Boulder_01"]["levelRestrictions"] == ["MP_A"]
+
+    def test_changed_catalog_gets_a_new_snapshot(self, tmp_path):
+        """Test snapshots are keyed by content, so an edited catalog is parsed again."""
+        # Arrange
+        catalog_path = _write_catalog(tmp_path / "asset_types.json", CATALOG)
+        first = AssetTypesSnapshot(catalog_path, tmp_path / "cache")
+        _write_catalog(catalog_path, {"AssetTypes": CATALOG["AssetTypes"][:1]})
+
+        # Act
+        second = AssetTypesSnapshot(catalog_path, tmp_path / "cache")
+
+        # Assert
+        assert second.snapshot_path != first.snapshot_path
+        assert [asset["type"] for asset in second.asset_types] == ["Tree_Pine_Large"]
+
+    def test_corrupt_snapshot_falls_back_to_json(self, tmp_path):
+        """Test an unreadable snapshot is ignored and rewritten."""
+        # Arrange
+        catalog_path = _write_catalog(tmp_path / "asset_types.json", CATALOG)
+        snapshot_path = AssetTypesSnapshot(catalog_path, tmp_path / "cache").snapshot_path
+        snapshot_path.write_bytes(b"not a snapshot")
+
+        # Act
+        snapshot = AssetTypesSnapshot(catalog_path, tmp_path / "cache")
+
+        # Assert
+        assert snapshot.data == CATALOG
+
+
+class TestLoadAssetTypes:
+    """Tests for the process-wide load_asset_types()."""
+
+    def test_shared_until_file_changes(self, tmp_path):
+        """Test one snapshot is shared per file until its size or mtime changes."""
+        # Arrange
+        catalog_path = _write_catalog(tmp_path / "asset_types.json", CATALOG)
+        first = load_asset_types(catalog_path)
+
+        # Act
+        same = load_asset_types(catalog_path)
+        _write_catalog(catalog_path, {"AssetTypes": []})
+        stat = catalog_path.stat()
+        os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        reloaded = load_asset_types(catalog_path)
+
+        # Assert
+        assert same is first
+        assert reloaded is not first
+        assert reloaded.asset_types == []
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Tests for keyword_index.py."""
+
+import random
+import sys
+from pathlib import Path
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from bfportal.indexers.keyword_index import AssetKeywordIndex
+
+ASSETS = [
+    ("Tree_Pine_Large", "Nature/Trees", []),
+    ("Rock_Boulder_01", "Nature/Rocks", ["MP_Tungsten"]),
+    ("PineCone_Pile", "Props", ["MP_Battery"]),
+    ("Building_Barn_01", "Architecture/Rural", []),
+    ("Shrub_AB", "Nature/Plants", []),
+]
+
+
+class TestAssetKeywordIndex:
+    """Tests for AssetKeywordIndex."""
+
+    def test_search_matches_any_keyword_in_catalog_order(self):
+        """Test assets containing any keyword are returned in the order given."""
+        # Arrange
+        index = AssetKeywordIndex(ASSETS)
+
+        # Act
+        result = index.search(["ROCK", "pine"])
+
+        # Assert
+        assert result == ["Tree_Pine_Large", "Rock_Boulder_01", "PineCone_Pile"]
+
+    def test_search_filters_by_level_restrictions(self):
+        """Test a level keeps unrestricted assets and assets restricted to it."""
+        # Arrange
+        index = AssetKeywordIndex(ASSETS)
+
+        # Act
+        result = index.search(["pine", "rock"], level="MP_Battery")
+
+        # Assert
+        assert result == ["Tree_Pine_Large", "PineCone_Pile"]
+
+    def test_search_short_keywords_and_directories(self):
+        """Test keywords shorter than an n-gram and directory matches are found."""
+        # Arrange
+        index = AssetKeywordIndex(ASSETS)
+
+        # Act & Assert
+        assert index.search(["ab"]) == ["Shrub_AB"]
+        assert index.search(["rural"]) == []
+        assert index.search(["rural"], include_directories=True) == ["Building_Barn_01"]
+
+    def test_search_agrees_with_substring_scan(self):
+        """Test indexed results equal a plain any(kw in name) scan on random names."""
+        # Arrange
+        rng = random.Random(7)
+        syllables = ["tree", "pine", "rock", "bar", "rel", "oak", "wall", "_", "01"]
+        assets = [
+            (
+                "".join(rng.choice(syllables) for _ in range(rng.randint(1, 5))) + str(i),
+                "",
+                rng.sample(["MP_A", "MP_B"], rng.randint(0, 1)),
+            )
+            for i in range(300)
+        ]
+        index = AssetKeywordIndex(assets)
+
+        for keywords in (["tree"], ["barrel", "oak"], ["kwa"], ["e_0"], ["nothing"]):
+            # Act
+            result = index.search(keywords, level="MP_A")
+
+            # Assert
+            expected = [
+                asset_type
+                for asset_type, _, levels in assets
+                if any(kw in asset_type.lower() for kw in keywords)
+                and (not levels or "MP_A" in levels)
+            ]
+            assert result == expected
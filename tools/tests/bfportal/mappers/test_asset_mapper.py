@@ -237,6 +237,21 @@ class TestAssetMapperBasicMapping:
         # Assert
         assert result is None
 
+    def test_map_asset_ignores_case_of_source_name(
+        self, sample_portal_assets, sample_bf1942_mappings, sample_map_context
+    ):
+        """Test BF1942 names are matched case-insensitively (ArtillerySpawner vs artilleryspawner)."""
+        # Arrange
+        mapper = AssetMapper(sample_portal_assets)
+        mapper.load_mappings(sample_bf1942_mappings)
+
+        # Act
+        result = mapper.map_asset("TreeLine_Pine_W", sample_map_context)
+
+        # Assert
+        assert result is not None
+        assert result.type == "Tree_Pine_Large"
+
 
 class TestAssetMapperLevelRestrictions:
     """Test cases for level restrictions and fallback handling."""
@@ -383,6 +398,22 @@ class TestAssetMapperAlternatives:
         # Assert
         assert alternative is None
 
+    def test_ranked_alternatives_are_computed_once_per_map(
+        self, sample_portal_assets, sample_bf1942_mappings
+    ):
+        """Test the ranked candidates of a category and map are reused between lookups."""
+        # Arrange
+        mapper = AssetMapper(sample_portal_assets)
+        mapper.load_mappings(sample_bf1942_mappings)
+
+        # Act
+        first = mapper._get_ranked_alternatives("vegetation", "MP_Tungsten", ())
+        second = mapper._get_ranked_alternatives("vegetation", "MP_Tungsten", ())
+
+        # Assert - restricted Oak ranks above unrestricted Pine on its own map
+        assert first is second
+        assert [bf_asset for bf_asset, _, _ in first] == ["treeline_oak_w", "treeline_pine_w"]
+
 
 class TestAssetMapperTerrainElements:
     """Test cases for terrain element detection."""
@@ -750,3 +781,124 @@ class TestAssetMapperBestGuessFallback:
         # Assert
         assert result is not None
         assert "Rock" in result.type or "Boulder" in result.type
+
+
+class TestAssetMapperMemoization:
+    """Test cases for memoized and bulk asset mapping."""
+
+    def test_map_asset_resolves_each_name_once_per_context(
+        self, sample_portal_assets, sample_bf1942_mappings, sample_map_context
+    ):
+        """Test repeated lookups reuse the first result until mappings are reloaded."""
+        # Arrange
+        mapper = AssetMapper(sample_portal_assets)
+        mapper.load_mappings(sample_bf1942_mappings)
+
+        # Act
+        with patch.object(mapper, "_resolve_asset", wraps=mapper._resolve_asset) as resolve:
+            first = mapper.map_asset("treeline_pine_w", sample_map_context)
+            second = mapper.map_asset("treeline_pine_w", sample_map_context)
+            mapper.load_mappings(sample_bf1942_mappings)
+            mapper.map_asset("treeline_pine_w", sample_map_context)
+
+        # Assert
+        assert first is second
+        assert resolve.call_count == 2
+
+    def test_map_assets_dedupes_names_and_diagnostics(
+        self, sample_portal_assets, sample_bf1942_mappings, capsys
+    ):
+        """Test bulk mapping returns one entry per name and prints each message once."""
+        # Arrange
+        mapper = AssetMapper(sample_portal_assets)
+        mapper.load_mappings(sample_bf1942_mappings)
+        context = MapContext(
+            target_base_map="MP_Battery", era="WW2", theme="open_terrain", team=Team.NEUTRAL
+        )
+        capsys.readouterr()
+
+        # Act
+        results = mapper.map_assets(["treeline_oak_w"] * 50 + ["lake_small"] * 3, context)
+
+        # Assert
+        assert list(results) == ["treeline_oak_w", "lake_small"]
+        assert results["treeline_oak_w"].type == "Tree_Pine_Large"
+        assert results["lake_small"] is None
+        output = capsys.readouterr().out
+        assert output.count("Using fallback: Tree_Pine_Large") == 1
+        assert output.count("Skipping terrain element: lake_small") == 1
+
+    def test_map_assets_reports_mapping_errors_as_unmapped(
+        self, sample_portal_assets, sample_map_context, tmp_path, capsys
+    ):
+        """Test a MappingError is cached, re-raised by map_asset and None in bulk results."""
+        # Arrange
+        import json
+
+        from bfportal.core.exceptions import MappingError
+
+        mappings_path = tmp_path / "mappings.json"
+        mappings_path.write_text(
+            json.dumps(
+                {
+                    "isolated_category": {
+                        "unique_asset": {
+                            "portal_equivalent": "CompletelyNonExistent_Asset",
+                            "category": "unique_isolated_type",
+                        }
+                    }
+                }
+            )
+        )
+        mapper = AssetMapper(sample_portal_assets)
+        mapper.load_mappings(mappings_path)
+
+        # Act
+        results = mapper.map_assets(["unique_asset", "unique_asset"], sample_map_context)
+
+        # Assert
+        assert results == {"unique_asset": None}
+        assert capsys.readouterr().out.count("Failed to map unique_asset") == 1
+        with pytest.raises(MappingError):
+            mapper.map_asset("unique_asset", sample_map_context)
+
+    def test_map_assets_reports_unexpected_errors_as_unmapped(
+        self, sample_portal_assets, sample_bf1942_mappings, sample_map_context, capsys
+    ):
+        """Test any error from one asset leaves it unmapped instead of failing the batch."""
+        # Arrange
+        mapper = AssetMapper(sample_portal_assets)
+        mapper.load_mappings(sample_bf1942_mappings)
+
+        def resolve(source_asset, context):
+            if source_asset == "broken_asset":
+                raise KeyError("portal_type")
+            return None
+
+        # Act
+        with patch.object(mapper, "_resolve_asset", side_effect=resolve):
+            results = mapper.map_assets(["broken_asset", "lake_small"], sample_map_context)
+
+        # Assert
+        assert results == {"broken_asset": None, "lake_small": None}
+        assert "Failed to map broken_asset" in capsys.readouterr().out
+
+    def test_map_assets_reports_diagnostics_for_each_call(
+        self, sample_portal_assets, sample_bf1942_mappings, capsys
+    ):
+        """Test a later batch (another map or context) prints its own diagnostics."""
+        # Arrange
+        mapper = AssetMapper(sample_portal_assets)
+        mapper.load_mappings(sample_bf1942_mappings)
+        contexts = [
+            MapContext(target_base_map="MP_Battery", era="WW2", theme=theme, team=Team.NEUTRAL)
+            for theme in ("open_terrain", "urban")
+        ]
+        capsys.readouterr()
+
+        # Act
+        for context in contexts:
+            mapper.map_assets(["treeline_oak_w"], context)
+
+        # Assert
+        assert capsys.readouterr().out.count("Using fallback: Tree_Pine_Large") == 2
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Unit tests for ConParser."""
 
+import os
 import sys
 from pathlib import Path
 from typing import Any
@@ -13,7 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from bfportal.core.exceptions import ParseError
 from bfportal.core.interfaces import Team
-from bfportal.parsers.con_parser import ConFileSet, ConParser
+from bfportal.parsers.con_parser import ConFileSet, ConObjectIndex, ConParser
 
 
 class TestConParserCanParse:
@@ -70,7 +71,41 @@ class TestConParserBasicParsing:
 
         assert result["file"] == str(con_file)
         assert result["objects"] == []
-        assert result["raw_content"] == ""
+        assert "raw_content" not in result
+
+    def test_parse_keeps_raw_content_when_requested(self, tmp_path):
+        """Test the file text is only returned when explicitly requested."""
+        parser = ConParser()
+        con_file = tmp_path / "objects.con"
+        con_file.write_text("Object.create Tree\nObject.absolutePosition 1/2/3\n")
+
+        result = parser.parse(con_file, keep_raw_content=True)
+
+        assert result["raw_content"] == "Object.create Tree\nObject.absolutePosition 1/2/3\n"
+        assert result["objects"] == parser.parse(con_file)["objects"]
+
+    def test_iter_objects_yields_each_object_as_it_closes(self, tmp_path):
+        """Test streaming yields an object once the next create line is read."""
+        parser = ConParser()
+        con_file = tmp_path / "objects.con"
+        con_file.write_text(
+            "Object.create Tree\r\nObject.absolutePosition 1/2/3\r\n"
+            "Object.create Rock\r\nObject.setTeam 2\r\n"
+        )
+
+        objects = parser.iter_objects(con_file)
+        tree = next(objects)
+
+        assert tree["name"] == "Tree"
+        assert tree["position"] == {"x": 1.0, "y": 2.0, "z": 3.0}
+        assert [obj["name"] for obj in objects] == ["Rock"]
+
+    def test_iter_objects_missing_file_raises(self, tmp_path):
+        """Test streaming a missing file raises ParseError on first iteration."""
+        parser = ConParser()
+
+        with pytest.raises(ParseError, match="File not found"):
+            next(parser.iter_objects(tmp_path / "missing.con"))
 
     def test_parse_comments_only(self, tmp_path):
         """Test parsing file with only comments."""
@@ -422,6 +457,28 @@ ObjectTemplate.mapMaterial 0 Concrete 0
         assert props["geometry"] == "Bunker_Mesh"
         assert props["mapMaterial"] == "0 Concrete 0"
 
+    def test_malformed_structured_values_fall_back_to_generic_properties(self, tmp_path):
+        """Test commands whose arguments don't parse are kept as raw properties."""
+        parser = ConParser()
+        con_file = tmp_path / "malformed.con"
+        con_file.write_text(
+            """Object.create TestObject
+\tObject.absolutePosition  10/20/30 // trailing comment
+Object.rotation 0/90
+Object.setTeam -1
+Object.geometry.scale x/y/z
+Object.layer
+Object.set-Flag 1
+"""
+        )
+
+        result = parser.parse(con_file)
+
+        obj = result["objects"][0]
+        assert obj["position"] == {"x": 10.0, "y": 20.0, "z": 30.0}
+        assert "rotation" not in obj and "team" not in obj and "scale" not in obj
+        assert obj["properties"] == {"rotation": "0/90", "setTeam": "-1"}
+
 
 class TestConParserCompleteObjects:
     """Test cases for parsing complete objects with all properties."""
@@ -988,6 +1045,26 @@ ObjectTemplate.create Vehicle Tank1
         assert len(results) == 1
         assert results[0]["name"] == "TestObj"
 
+    def test_get_objects_by_type_keeps_same_named_files(self, tmp_path):
+        """Test files sharing a name (Init.con and Conquest/Init.con) are all searched."""
+        # Arrange
+        conquest_dir = tmp_path / "Conquest"
+        conquest_dir.mkdir()
+        (tmp_path / "Init.con").write_text("ObjectTemplate.create InitThing Shared")
+        (conquest_dir / "Init.con").write_text("ObjectTemplate.create ConqThing Conquest")
+        (conquest_dir / "ControlPoints.con").write_text("ObjectTemplate.create ControlPoint CP1")
+        fileset = ConFileSet(tmp_path)
+
+        # Act
+        conquest_things = fileset.get_objects_by_type("ConqThing")
+        init_things = fileset.get_objects_by_type("InitThing")
+
+        # Assert
+        assert [obj["name"] for obj in conquest_things] == ["Conquest"]
+        assert [obj["name"] for obj in init_things] == ["Shared"]
+        assert len(fileset.index().in_file("Init.con")) == 2
+        assert len(fileset.index().objects) == 3
+
     def test_get_objects_by_type_returns_empty_list_when_no_match(self, tmp_path):
         """Test get_objects_by_type returns empty list when no matches."""
         # Arrange - Create Conquest mode file
@@ -1001,3 +1078,95 @@ ObjectTemplate.create Vehicle Tank1
 
         # Assert
         assert results == []
+
+
+class TestConFileSetParseCache:
+    """Test cases for ConFileSet parse-once memoization and indexed views."""
+
+    def test_repeated_queries_parse_each_file_once(self, tmp_path):
+        """Test parse_all, index and get_objects_by_type share one parse per file."""
+        # Arrange
+        conquest_dir = tmp_path / "Conquest"
+        conquest_dir.mkdir()
+        (conquest_dir / "Objects.con").write_text("ObjectTemplate.create Test TestObj")
+        (conquest_dir / "Spawns.con").write_text("ObjectTemplate.create SpawnPoint Spawn1")
+        fileset = ConFileSet(tmp_path)
+
+        # Act
+        with patch.object(fileset.parser, "parse", wraps=fileset.parser.parse) as parse:
+            first = fileset.parse_all()
+            second = fileset.parse_all()
+            fileset.index()
+            fileset.get_objects_by_type("SpawnPoint")
+
+        # Assert
+        assert parse.call_count == 2
+        assert first["Objects.con"] is second["Objects.con"]
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Test a changed modification time invalidates the cached parse and index."""
+        # Arrange
+        con_file = tmp_path / "Conquest" / "Objects.con"
+        con_file.parent.mkdir()
+        con_file.write_text("ObjectTemplate.create Test TestObj")
+        fileset = ConFileSet(tmp_path)
+        fileset.index()
+
+        con_file.write_text("ObjectTemplate.create Test Renamed")
+        stat = con_file.stat()
+        os.utime(con_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Act
+        objects = fileset.index().objects
+
+        # Assert
+        assert [obj["name"] for obj in objects] == ["Renamed"]
+
+    def test_second_run_reparses_only_changed_files(self, tmp_path):
+        """Test a new ConFileSet loads unchanged files from the persisted cache."""
+        # Arrange
+        conquest_dir = tmp_path / "Conquest"
+        conquest_dir.mkdir()
+        (conquest_dir / "Objects.con").write_text("ObjectTemplate.create Test TestObj")
+        static_objects = tmp_path / "StaticObjects.con"
+        static_objects.write_text("Object.create Tree")
+        first = ConFileSet(tmp_path)
+        expected = first.parse_all()
+
+        static_objects.write_text("Object.create Rock")
+        stat = static_objects.stat()
+        os.utime(static_objects, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Act
+        second = ConFileSet(tmp_path)
+        with patch.object(second.parser, "parse", wraps=second.parser.parse) as parse:
+            results = second.parse_all()
+
+        # Assert
+        parse.assert_called_once_with(static_objects)
+        assert results["Objects.con"] == expected["Objects.con"]
+        assert results["StaticObjects.con"]["objects"][0]["name"] == "Rock"
+        assert first.cache_stats() == {"hits": 0, "misses": 2}
+        assert second.cache_stats() == {"hits": 1, "misses": 1}
+
+    def test_index_views_are_case_insensitive(self):
+        """Test objects are indexed by type, name and file regardless of case."""
+        # Arrange
+        spawn = {"name": "AxisSpawn", "type": "SpawnPoint", "properties": {}}
+        instance = {"name": "AxisSpawn", "type": "AxisSpawn", "properties": {}}
+        cp = {"name": "CP1", "type": "ControlPoint", "properties": {}}
+
+        # Act
+        index = ConObjectIndex(
+            {
+                "SpawnTemplates.con": {"objects": [spawn]},
+                "ControlPoints.con": {"objects": [instance, cp]},
+            }
+        )
+
+        # Assert
+        assert index.objects == [spawn, instance, cp]
+        assert index.of_type("spawnpoint") == [spawn]
+        assert index.named("axisspawn") == [spawn, instance]
+        assert index.in_file("controlpoints.con") == [instance, cp]
+        assert index.of_type("Vehicle") == []
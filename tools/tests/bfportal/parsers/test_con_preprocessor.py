@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Unit tests for the .con run/include preprocessor."""
+
+import sys
+from pathlib import Path
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bfportal.parsers.con_parser import ConFileSet
+from bfportal.parsers.con_preprocessor import (
+    Conditional,
+    ConPreprocessor,
+    ConScriptCache,
+    RunDirective,
+    parse_script,
+)
+
+
+class TestParseScript:
+    """Test cases for parse_script()."""
+
+    def test_parses_directives_conditionals_and_comments(self):
+        """Test run/include, if/elseIf/else blocks and comment removal."""
+        # Arrange
+        text = """rem header
+run Init/Terrain
+beginRem
+run Skipped
+endRem
+IF v_arg1 == host
+  include Conquest/Objects a b
+elseIf v_arg1 == client
+  // client only
+  game.setCustomGameName Client
+else
+  Object.create Tree
+endIf
+"""
+
+        # Act
+        nodes = parse_script(text)
+
+        # Assert
+        assert nodes[0] == RunDirective("Init/Terrain", (), include=False)
+        assert isinstance(nodes[1], Conditional)
+        (host_condition, host_body), (client_condition, client_body) = nodes[1].branches
+        assert host_condition == ("v_arg1", "==", "host")
+        assert host_body == [RunDirective("Conquest/Objects", ("a", "b"), include=True)]
+        assert client_condition == ("v_arg1", "==", "client")
+        assert client_body == ["game.setCustomGameName Client"]
+        assert nodes[1].otherwise == ["Object.create Tree"]
+        assert len(nodes) == 2
+
+
+class TestConScriptCache:
+    """Test cases for ConScriptCache."""
+
+    def test_identical_content_is_parsed_once(self, tmp_path):
+        """Test scripts with the same bytes share one parse across paths."""
+        # Arrange
+        cache = ConScriptCache()
+        first = tmp_path / "MapA.con"
+        second = tmp_path / "MapB.con"
+        first.write_text("Object.create Tree\n")
+        second.write_text("Object.create Tree\n")
+
+        # Act
+        first_nodes = cache.load(first)
+        second_nodes = cache.load(second)
+
+        # Assert
+        assert first_nodes is second_nodes
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+class TestConPreprocessorExpand:
+    """Test cases for ConPreprocessor.expand()."""
+
+    def test_follows_run_graph_and_evaluates_conditionals(self, tmp_path):
+        """Test scripts are resolved case-insensitively and only taken branches run."""
+        # Arrange
+        (tmp_path / "Conquest").mkdir()
+        (tmp_path / "TDM").mkdir()
+        (tmp_path / "Init.con").write_text(
+            """run staticobjects
+if v_arg1 == host
+  run conquest/init.con
+else
+  run TDM/Objects
+endIf
+"""
+        )
+        (tmp_path / "StaticObjects.con").write_text("Object.create Tree\n")
+        (tmp_path / "Conquest" / "Init.con").write_text("run Spawns Axis\n")
+        (tmp_path / "Conquest" / "Spawns.con").write_text(
+            """if v_arg1 == axis
+  Object.create AxisSpawn
+endIf
+Object.create SharedSpawn
+"""
+        )
+        (tmp_path / "TDM" / "Objects.con").write_text("Object.create TdmOnly\n")
+        preprocessor = ConPreprocessor(tmp_path, ConScriptCache())
+
+        # Act
+        statements = preprocessor.expand([tmp_path / "Init.con"], ("host",))
+
+        # Assert
+        assert list(statements) == [
+            tmp_path / "Init.con",
+            tmp_path / "StaticObjects.con",
+            tmp_path / "Conquest" / "Init.con",
+            tmp_path / "Conquest" / "Spawns.con",
+        ]
+        assert statements[tmp_path / "Conquest" / "Spawns.con"] == [
+            "Object.create AxisSpawn",
+            "Object.create SharedSpawn",
+        ]
+
+    def test_include_shares_variables_and_scripts_run_once(self, tmp_path):
+        """Test include sees the caller's variables and repeated runs are skipped."""
+        # Arrange
+        (tmp_path / "Init.con").write_text(
+            """var v_mode = large
+include Objects
+run Objects
+"""
+        )
+        (tmp_path / "Objects.con").write_text(
+            """if v_mode == LARGE
+  Object.create BigBase
+endIf
+"""
+        )
+        preprocessor = ConPreprocessor(tmp_path, ConScriptCache())
+
+        # Act
+        statements = preprocessor.expand([tmp_path / "Init.con"])
+
+        # Assert
+        assert statements[tmp_path / "Objects.con"] == ["Object.create BigBase"]
+        assert len(statements) == 2
+
+
+class TestConFileSetRunGraph:
+    """Test cases for ConFileSet loading scripts through Init.con."""
+
+    def test_reached_scripts_are_loaded_with_active_statements_only(self, tmp_path):
+        """Test scripts outside the path conventions are found and untaken branches dropped."""
+        # Arrange
+        (tmp_path / "Init.con").write_text("run Bf1942/Objects\n")
+        (tmp_path / "Bf1942").mkdir()
+        (tmp_path / "Bf1942" / "Objects.con").write_text(
+            """Object.create Bunker
+if v_arg2 == TDM
+  Object.create TdmCrate
+endIf
+"""
+        )
+
+        # Act
+        fileset = ConFileSet(tmp_path, game_mode="Conquest", script_cache=ConScriptCache())
+        objects = fileset.index().objects
+
+        # Assert
+        assert tmp_path / "Bf1942" / "Objects.con" in fileset.con_files
+        assert [obj["name"] for obj in objects] == ["Bunker"]
+
+    def test_reached_scripts_of_other_game_modes_are_skipped(self, tmp_path):
+        """Test a taken branch running another mode's script does not load its objects."""
+        # Arrange
+        (tmp_path / "Conquest").mkdir()
+        (tmp_path / "TDM").mkdir()
+        (tmp_path / "Init.con").write_text(
+            """if v_arg2 == TDM
+  run Conquest/Objects
+else
+  run TDM/Objects
+endIf
+"""
+        )
+        (tmp_path / "Conquest" / "Objects.con").write_text("Object.create ConquestCrate\n")
+        (tmp_path / "TDM" / "Objects.con").write_text("Object.create TdmOnly\n")
+
+        # Act
+        fileset = ConFileSet(tmp_path, game_mode="Conquest", script_cache=ConScriptCache())
+        objects = fileset.index().objects
+
+        # Assert
+        assert tmp_path / "TDM" / "Objects.con" not in fileset.con_files
+        assert [obj["name"] for obj in objects] == ["ConquestCrate"]
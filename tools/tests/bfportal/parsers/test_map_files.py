@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Unit tests for single-pass map file discovery."""
+
+import sys
+from pathlib import Path
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bfportal.parsers.con_parser import ConFileSet
+from bfportal.parsers.map_files import INIT_MODE, MapFiles
+from bfportal.parsers.spawner_template_index import SpawnerTemplateIndex
+
+TEMPLATES = """ObjectTemplate.create ObjectSpawner lighttankspawner
+ObjectTemplate.setObjectTemplate 1 PanzerIV
+"""
+
+
+def _write(map_dir: Path, relative: str, content: str = "") -> Path:
+    """Write a file below a map directory, creating its parents."""
+    path = map_dir / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+class TestMapFiles:
+    """Test cases for MapFiles."""
+
+    def test_files_are_listed_in_sorted_path_order_with_stats(self, tmp_path):
+        """Test the listing matches sorted(rglob) and records each file's size and mtime."""
+        # Arrange
+        for relative in ("Init.con", "Conquest/Objects.con", "Conquest-Old.con", "Heightmap.raw"):
+            _write(tmp_path, relative, "12345")
+
+        # Act
+        files = MapFiles(tmp_path)
+
+        # Assert
+        assert [f.path for f in files.files] == sorted(
+            p for p in tmp_path.rglob("*") if p.is_file()
+        )
+        heightmap = files.find("Heightmap.raw")
+        assert heightmap is not None
+        assert (heightmap.size, heightmap.mtime_ns) == (5, heightmap.path.stat().st_mtime_ns)
+
+    def test_files_are_classified_by_mode_directory(self, tmp_path):
+        """Test game mode directories win over Init names and shared files have no mode."""
+        # Arrange
+        for relative in (
+            "Init.con",
+            "Init/Terrain.con",
+            "ctf/Objects.con",
+            "Conquest/Init.con",
+            "StaticObjects.con",
+        ):
+            _write(tmp_path, relative)
+
+        # Act
+        modes = {f.relative: f.mode for f in MapFiles(tmp_path).files}
+
+        # Assert
+        assert modes == {
+            "Init.con": INIT_MODE,
+            "Init/Terrain.con": INIT_MODE,
+            "ctf/Objects.con": "CTF",
+            "Conquest/Init.con": "Conquest",
+            "StaticObjects.con": None,
+        }
+
+    def test_find_ignores_case_and_separators(self, tmp_path):
+        """Test lookups by relative path are case-insensitive and accept backslashes."""
+        # Arrange
+        terrain = _write(tmp_path, "Init/Terrain.con")
+        files = MapFiles(tmp_path)
+
+        # Act & Assert
+        assert files.find("init\\TERRAIN.con").path == terrain
+        assert files.find("Init/Sky.con") is None
+
+    def test_missing_directory_has_no_files(self, tmp_path):
+        """Test a missing map directory is an empty listing."""
+        # Act
+        files = MapFiles(tmp_path / "missing")
+
+        # Assert
+        assert len(files) == 0
+
+
+class TestMapFilesConsumers:
+    """Test cases for consumers sharing one MapFiles listing."""
+
+    def test_con_file_set_ignores_mode_names_above_the_map_directory(self, tmp_path):
+        """Test mode filtering looks only at paths inside the map directory."""
+        # Arrange - the map lives below a directory named after another mode
+        map_dir = tmp_path / "TDM" / "Kursk"
+        objects = _write(map_dir, "Conquest/Objects.con")
+        _write(map_dir, "TDM/Objects.con")
+
+        # Act
+        con_files = ConFileSet(map_dir)
+
+        # Assert
+        assert con_files.con_files == [objects]
+
+    def test_spawner_index_detects_added_template_file_from_listing(self, tmp_path):
+        """Test a known level is rescanned when the listing shows a new template file."""
+        # Arrange
+        level_dir = tmp_path / "Kursk"
+        _write(level_dir, "Conquest/ObjectSpawnTemplates.con", TEMPLATES)
+        index = SpawnerTemplateIndex(tmp_path / "index.json")
+        index.level_templates(level_dir, MapFiles(level_dir))
+        _write(level_dir, "TDM/ObjectSpawnTemplates.con", TEMPLATES.replace("PanzerIV", "Tiger"))
+
+        # Act
+        templates = index.level_templates(level_dir, MapFiles(level_dir))
+
+        # Assert
+        assert templates["lighttankspawner"].team1_vehicle == "Tiger"
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Unit tests for the persisted spawner template index."""
+
+import os
+import sys
+from pathlib import Path
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bfportal.core.interfaces import Team
+from bfportal.parsers.spawner_template_index import SpawnerTemplateIndex
+from bfportal.parsers.spawner_template_parser import SpawnerTemplateParser
+
+KURSK_TEMPLATES = """rem Conquest spawners
+ObjectTemplate.create ObjectSpawner lighttankspawner
+ObjectTemplate.setObjectTemplate 2 T34-85
+ObjectTemplate.setObjectTemplate 1 PanzerIV
+ObjectTemplate.MinSpawnDelay 40
+ObjectTemplate.MaxSpawnDelay 80
+"""
+
+
+def _write_level(level_dir: Path, mode: str, content: str) -> Path:
+    """Write an ObjectSpawnTemplates.con for one game mode of a level."""
+    template_file = level_dir / mode / "ObjectSpawnTemplates.con"
+    template_file.parent.mkdir(parents=True)
+    template_file.write_text(content)
+    return template_file
+
+
+class TestSpawnerTemplateParser:
+    """Test cases for SpawnerTemplateParser."""
+
+    def test_parse_template_file_reads_vehicles_and_delays(self, tmp_path):
+        """Test team vehicles and spawn timing are read from a template file."""
+        # Arrange
+        template_file = _write_level(tmp_path / "Kursk", "Conquest", KURSK_TEMPLATES)
+        parser = SpawnerTemplateParser()
+
+        # Act
+        parser.parse_template_file(template_file)
+
+        # Assert
+        template = parser.get_template("LightTankSpawner")
+        assert template is not None
+        assert template.get_vehicle_for_team(Team.TEAM_1) == "PanzerIV"
+        assert template.get_vehicle_for_team(Team.TEAM_2) == "T34-85"
+        assert (template.spawn_delay_min, template.spawn_delay_max) == (40, 80)
+
+
+class TestSpawnerTemplateIndex:
+    """Test cases for SpawnerTemplateIndex."""
+
+    def test_identical_files_across_levels_are_parsed_once(self, tmp_path):
+        """Test levels sharing a template file reuse one parse via its content hash."""
+        # Arrange
+        _write_level(tmp_path / "Kursk", "Conquest", KURSK_TEMPLATES)
+        _write_level(tmp_path / "Kharkov", "Conquest", KURSK_TEMPLATES)
+        index = SpawnerTemplateIndex(tmp_path / "index.json")
+
+        # Act
+        kursk = index.level_templates(tmp_path / "Kursk")
+        kharkov = index.level_templates(tmp_path / "Kharkov")
+
+        # Assert
+        assert (index.misses, index.hits) == (1, 1)
+        assert kursk == kharkov
+        assert kursk["lighttankspawner"] is not kharkov["lighttankspawner"]
+
+    def test_saved_index_is_reused_without_reparsing(self, tmp_path):
+        """Test a reloaded index serves known levels without reading their files."""
+        # Arrange
+        _write_level(tmp_path / "Kursk", "Conquest", KURSK_TEMPLATES)
+        index_path = tmp_path / "index.json"
+        first = SpawnerTemplateIndex(index_path)
+        expected = first.level_templates(tmp_path / "Kursk")
+        first.save()
+
+        # Act
+        second = SpawnerTemplateIndex(index_path)
+        templates = second.level_templates(tmp_path / "Kursk")
+
+        # Assert
+        assert templates == expected
+        assert (second.misses, second.hits) == (0, 0)
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Test a template file whose size or mtime changed is parsed again."""
+        # Arrange
+        template_file = _write_level(tmp_path / "Kursk", "Conquest", KURSK_TEMPLATES)
+        index = SpawnerTemplateIndex(tmp_path / "index.json")
+        index.level_templates(tmp_path / "Kursk")
+
+        template_file.write_text(KURSK_TEMPLATES.replace("PanzerIV", "Tiger"))
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Act
+        templates = index.level_templates(tmp_path / "Kursk")
+
+        # Assert
+        assert templates["lighttankspawner"].team1_vehicle == "Tiger"
+
+    def test_game_mode_files_are_layered_and_singleplayer_skipped(self, tmp_path):
+        """Test later game mode files override earlier ones and SinglePlayer is ignored."""
+        # Arrange
+        level_dir = tmp_path / "Kursk"
+        _write_level(level_dir, "Conquest", KURSK_TEMPLATES)
+        _write_level(level_dir, "TDM", KURSK_TEMPLATES.replace("PanzerIV", "Tiger"))
+        _write_level(level_dir, "SinglePlayer", KURSK_TEMPLATES.replace("PanzerIV", "Yak9"))
+        index = SpawnerTemplateIndex(tmp_path / "index.json")
+        parser = SpawnerTemplateParser()
+
+        # Act
+        parser.parse_directory(level_dir, index)
+
+        # Assert
+        assert parser.get_vehicle_type("lighttankspawner", Team.TEAM_1) == "Tiger"
@@ -4,9 +4,14 @@
 Tests the abstract base classes and data structures used by all terrain snappers.
 """
 
+from unittest.mock import MagicMock
+
+import numpy as np
 import pytest
 
+from tools.bfportal.core.exceptions import OutOfBoundsError, TerrainError
 from tools.bfportal.terrain.snappers.base_snapper import (
+    HeightPrefetchCache,
     IObjectSnapper,
     ITerrainProvider,
     SnapResult,
@@ -98,3 +103,73 @@ class TestITerrainProvider:
         # Act & Assert
         with pytest.raises(TypeError, match="Protocols cannot be instantiated"):
             ITerrainProvider()
+
+
+class TestHeightPrefetchCache:
+    """Tests for HeightPrefetchCache."""
+
+    @pytest.fixture
+    def mock_terrain(self):
+        """Provide terrain whose batch query marks negative X as out of bounds."""
+        terrain = MagicMock()
+        terrain.get_height_at.return_value = 99.0
+        terrain.get_heights_at.side_effect = lambda xs, zs: np.where(
+            np.asarray(xs) < 0, np.nan, np.asarray(zs, dtype=float)
+        )
+        return terrain
+
+    def test_prefetch_deduplicates_points_into_one_query(self, mock_terrain):
+        """Test repeated points are fetched once in a single batch."""
+        # Arrange
+        cache = HeightPrefetchCache(mock_terrain)
+
+        # Act
+        cache.prefetch([(1.0, 5.0), (2.0, 6.0), (1.0, 5.0)])
+
+        # Assert
+        mock_terrain.get_heights_at.assert_called_once_with([1.0, 2.0], [5.0, 6.0])
+        assert cache.get_height_at(2.0, 6.0) == 6.0
+        mock_terrain.get_height_at.assert_not_called()
+
+    def test_prefetched_nan_raises_out_of_bounds(self, mock_terrain):
+        """Test out-of-bounds prefetched points raise like get_height_at."""
+        # Arrange
+        cache = HeightPrefetchCache(mock_terrain)
+        cache.prefetch([(-1.0, 5.0)])
+
+        # Act & Assert
+        with pytest.raises(OutOfBoundsError):
+            cache.get_height_at(-1.0, 5.0)
+
+    def test_miss_falls_back_to_single_query(self, mock_terrain):
+        """Test points that were not prefetched query the provider directly."""
+        # Arrange
+        cache = HeightPrefetchCache(mock_terrain)
+        cache.prefetch([(1.0, 5.0)])
+
+        # Act & Assert
+        assert cache.get_height_at(3.0, 3.0) == 99.0
+        mock_terrain.get_height_at.assert_called_once_with(3.0, 3.0)
+
+    def test_failed_batch_query_falls_back_to_single_queries(self, mock_terrain, capsys):
+        """Test a terrain error during prefetch is reported and leaves the cache empty."""
+        # Arrange
+        mock_terrain.get_heights_at.side_effect = TerrainError("height grid unavailable")
+        cache = HeightPrefetchCache(mock_terrain)
+
+        # Act
+        cache.prefetch([(1.0, 5.0)])
+
+        # Assert
+        assert cache.get_height_at(1.0, 5.0) == 99.0
+        assert "height grid unavailable" in capsys.readouterr().out
+
+    def test_unexpected_batch_query_errors_propagate(self, mock_terrain):
+        """Test errors other than terrain errors are not swallowed by the prefetch."""
+        # Arrange
+        mock_terrain.get_heights_at.side_effect = RuntimeError("bug")
+        cache = HeightPrefetchCache(mock_terrain)
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="bug"):
+            cache.prefetch([(1.0, 5.0)])
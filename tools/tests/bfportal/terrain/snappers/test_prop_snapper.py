@@ -7,9 +7,11 @@ crates, and other environmental props to terrain height.
 
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from tools.bfportal.terrain.snappers.prop_snapper import PropSnapper
+from tools.bfportal.terrain.terrain_provider import FixedHeightProvider, HeightGridProvider
 
 
 class TestPropSnapper:
@@ -92,3 +94,73 @@ class TestPropSnapper:
         assert result.was_adjusted is False
         assert result.snapped_y == 5.0  # Keeps original
         assert "Skipped" in result.reason
+
+    def test_grid_terrain_uses_single_region_query(self):
+        """Test footprints on grid-backed terrain are resolved in one region query."""
+        # Arrange
+        terrain = HeightGridProvider(np.zeros((301, 301)), (0.0, 300.0, 0.0, 300.0))
+        terrain.get_min_height_in_radius = MagicMock(return_value=7.5)
+        snapper = PropSnapper(terrain)
+
+        # Act
+        result = snapper.calculate_snapped_height(
+            x=100.0, z=200.0, current_y=20.0, node_name="Bunker_01"
+        )
+
+        # Assert
+        terrain.get_min_height_in_radius.assert_called_once_with(100.0, 200.0, 10.0)
+        assert result.snapped_y == pytest.approx(7.7)
+        assert snapper.get_sample_points(100.0, 200.0, "Bunker_01") == []
+
+    def test_small_footprint_on_coarse_grid_takes_surface_minimum(self):
+        """Test footprints smaller than a grid cell rest on the surface, not the cell minimum."""
+        # Arrange - plane y = 0.5 * x on 8m cells; a 2m crate must not take the cell minimum
+        terrain = HeightGridProvider(
+            np.tile(np.arange(0.0, 257.0) * 4.0, (257, 1)), (0.0, 2048.0, 0.0, 2048.0)
+        )
+        snapper = PropSnapper(terrain)
+
+        # Act
+        result = snapper.calculate_snapped_height(
+            x=101.0, z=500.0, current_y=0.0, node_name="Crate_01"
+        )
+
+        # Assert
+        assert snapper.get_sample_points(101.0, 500.0, "Crate_01") == []
+        assert result.snapped_y == pytest.approx(49.5)
+
+    def test_terrain_without_region_grid_samples_points(self):
+        """Test terrains without a height grid keep the centre and corner samples."""
+        # Arrange
+        terrain = FixedHeightProvider(fixed_height=12.0)
+        terrain.get_min_height_in_radius = MagicMock(return_value=7.5)
+        snapper = PropSnapper(terrain)
+
+        # Act
+        result = snapper.calculate_snapped_height(
+            x=100.0, z=200.0, current_y=20.0, node_name="Bunker_01"
+        )
+
+        # Assert
+        terrain.get_min_height_in_radius.assert_not_called()
+        assert result.snapped_y == pytest.approx(12.2)
+        assert len(snapper.get_sample_points(100.0, 200.0, "Bunker_01")) == 5
+
+    def test_vehicles_carry_terrain_normal(self):
+        """Test slope-aligned props sit on the centre height and report the normal."""
+        # Arrange - plane y = 0.5 * x
+        terrain = HeightGridProvider([[0.0, 50.0], [0.0, 50.0]], (0.0, 100.0, 0.0, 100.0))
+        snapper = PropSnapper(terrain)
+
+        # Act
+        jeep = snapper.calculate_snapped_height(x=40.0, z=50.0, current_y=0.0, node_name="Jeep_01")
+        bunker = snapper.calculate_snapped_height(
+            x=40.0, z=50.0, current_y=0.0, node_name="Bunker_01"
+        )
+
+        # Assert
+        assert jeep.snapped_y == pytest.approx(20.0)
+        assert jeep.normal == pytest.approx((-0.5 / 1.25**0.5, 1 / 1.25**0.5, 0.0))
+        assert snapper.get_sample_points(40.0, 50.0, "Jeep_01") == [(40.0, 50.0)]
+        assert bunker.normal is None
+        assert not snapper.uses_terrain_normals("Bunker_01")
@@ -7,6 +7,7 @@ snapper implementations to adjust object heights in .tscn files.
 
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from tools.bfportal.terrain.snappers.snapping_orchestrator import (
@@ -54,6 +55,7 @@ class TestSnappingOrchestrator:
         """Provide mocked terrain provider."""
         terrain = MagicMock()
         terrain.get_height_at_position.return_value = 10.0
+        terrain.get_heights_at.side_effect = lambda xs, zs: np.full(len(xs), 10.0)
         return terrain
 
     @pytest.fixture
@@ -69,6 +71,7 @@ class TestSnappingOrchestrator:
         snap_result.original_y = 5.0
         snap_result.was_adjusted = True
         snap_result.reason = "Snapped to terrain"
+        snap_result.normal = None
         snapper.calculate_snapped_height.return_value = snap_result
 
         return snapper
@@ -299,6 +302,62 @@ transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, 100, 5, 200)
         assert stats.skipped == 1
         assert stats.total_objects == 0
 
+    def test_process_all_lines_prefetches_heights_in_one_batch(self, mock_terrain):
+        """Test real snappers are served from a single batched terrain query."""
+        # Arrange
+        import numpy as np
+
+        from tools.bfportal.terrain.snappers.prop_snapper import PropSnapper
+
+        mock_terrain.get_heights_at.side_effect = lambda xs, zs: np.full(len(xs), 12.0)
+        orchestrator = SnappingOrchestrator([PropSnapper(mock_terrain)], mock_terrain)
+        lines = [
+            '[node name="Crate_1" type="Node3D" parent="."]\n',
+            "transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, 100, 5, 200)\n",
+            '[node name="Crate_2" type="Node3D" parent="."]\n',
+            "transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, -50, 5, 25)\n",
+        ]
+
+        # Act
+        new_lines, stats, _ = orchestrator._process_all_lines(lines)
+
+        # Assert - one batch for the snapper, one for the validator, no per-point queries
+        assert mock_terrain.get_heights_at.call_count == 2
+        mock_terrain.get_height_at.assert_not_called()
+        assert stats.snapped_by_category == {"Props": 2}
+        assert new_lines[1].endswith("100, 12.3, 200)\n")
+
+    def test_process_all_lines_tilts_vehicles_onto_slope(self, capsys):
+        """Test slope-aligned props get their up axis rotated onto the terrain normal."""
+        # Arrange
+        import numpy as np
+
+        from tools.bfportal.terrain.snappers.prop_snapper import PropSnapper
+        from tools.bfportal.terrain.terrain_provider import HeightGridProvider
+
+        # Plane y = 0.75 * x: normal (-0.6, 0.8, 0)
+        terrain = HeightGridProvider(
+            np.tile(np.linspace(0.0, 75.0, 11), (11, 1)), (0.0, 100.0, 0.0, 100.0)
+        )
+        orchestrator = SnappingOrchestrator([PropSnapper(terrain)], terrain)
+        lines = [
+            '[node name="Jeep_1" type="Node3D" parent="."]\n',
+            "transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, 40, 30, 50)\n",
+            '[node name="Crate_1" type="Node3D" parent="."]\n',
+            "transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, 40, 30, 50)\n",
+        ]
+
+        # Act
+        new_lines, stats, _ = orchestrator._process_all_lines(lines)
+
+        # Assert - the jeep's up axis (second column) is the normal; the crate stays upright
+        assert new_lines[1] == (
+            "transform = Transform3D(0.8, -0.6, 0, 0.6, 0.8, 0, 0, 0, 1, 40, 30.3, 50)\n"
+        )
+        assert new_lines[3].startswith("transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1,")
+        assert stats.snapped_by_category == {"Props": 2}
+        assert "tilted 36.9°" in capsys.readouterr().out
+
     def test_write_snapped_file_creates_backup_and_writes(self, orchestrator, tmp_path):
         """Test _write_snapped_file creates backup and writes new content."""
         # Arrange
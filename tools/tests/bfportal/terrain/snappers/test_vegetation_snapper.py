@@ -10,6 +10,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from tools.bfportal.terrain.snappers.vegetation_snapper import VegetationSnapper
+from tools.bfportal.terrain.terrain_provider import HeightGridProvider
 
 
 class TestVegetationSnapper:
@@ -99,3 +100,19 @@ class TestVegetationSnapper:
         # Assert - May have small offset but should be close to terrain
         assert abs(result.snapped_y - 10.0) <= 1.0  # Within 1m of terrain
         assert result.was_adjusted is True
+
+    def test_slope_lowers_trunk_base_without_tilting(self):
+        """Test trees on slopes drop to the downhill edge of the trunk radius but stay upright."""
+        # Arrange - plane y = 0.5 * x
+        terrain = HeightGridProvider([[0.0, 50.0], [0.0, 50.0]], (0.0, 100.0, 0.0, 100.0))
+        snapper = VegetationSnapper(terrain)
+
+        # Act
+        result = snapper.calculate_snapped_height(
+            x=40.0, z=50.0, current_y=0.0, node_name="Pine_01"
+        )
+
+        # Assert
+        assert result.snapped_y == pytest.approx(20.0 - 1.5 * 0.5)
+        assert result.normal is None
+        assert snapper.get_sample_points(40.0, 50.0, "Pine_01") == [(40.0, 50.0)]
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""Tests for glb_reader - GLB container parsing and accessor decoding."""
+
+import json
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bfportal.core.exceptions import TerrainError
+from bfportal.terrain.glb_reader import (
+    find_position_accessors,
+    read_accessor,
+    read_glb,
+)
+from bfportal.terrain.terrain_provider import MeshTerrainProvider
+
+
+def write_glb(path: Path, gltf: dict, binary: bytes) -> Path:
+    """Write a GLB container with the given JSON document and BIN chunk."""
+    json_bytes = json.dumps(gltf).encode("utf-8")
+    json_bytes += b" " * ((4 - len(json_bytes) % 4) % 4)
+    binary += b"\x00" * ((4 - len(binary) % 4) % 4)
+    total = 12 + 8 + len(json_bytes) + 8 + len(binary)
+
+    with open(path, "wb") as f:
+        f.write(b"glTF")
+        f.write(struct.pack("<II", 2, total))
+        f.write(struct.pack("<I", len(json_bytes)) + b"JSON" + json_bytes)
+        f.write(struct.pack("<I", len(binary)) + b"BIN\x00" + binary)
+    return path
+
+
+class TestReadGlb:
+    """Tests for read_glb container parsing."""
+
+    def test_reads_json_and_binary_chunks(self, tmp_path: Path):
+        """Test JSON document and BIN chunk are both returned."""
+        # Arrange
+        glb_path = write_glb(tmp_path / "a.glb", {"asset": {"version": "2.0"}}, b"\x01\x02\x03\x04")
+
+        # Act
+        document = read_glb(glb_path)
+
+        # Assert
+        assert document.gltf["asset"]["version"] == "2.0"
+        assert document.binary == b"\x01\x02\x03\x04"
+
+    def test_invalid_magic_raises_terrain_error(self, tmp_path: Path):
+        """Test non-GLB data is rejected."""
+        # Arrange
+        bad = tmp_path / "bad.glb"
+        bad.write_bytes(b"NOTAGLBFILE!")
+
+        # Act & Assert
+        with pytest.raises(TerrainError, match="Invalid GLB file"):
+            read_glb(bad)
+
+
+class TestReadAccessor:
+    """Tests for read_accessor decoding."""
+
+    def test_decodes_interleaved_positions_with_byte_stride(self, tmp_path: Path):
+        """Test VEC3 positions are read from an interleaved (position + normal) buffer."""
+        # Arrange - each vertex: position (12 bytes) + normal (12 bytes)
+        positions = [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0), (7.0, 8.0, 9.0)]
+        binary = b"".join(struct.pack("<6f", *p, 0.0, 1.0, 0.0) for p in positions)
+        gltf = {
+            "accessors": [
+                {"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"},
+                {
+                    "bufferView": 0,
+                    "byteOffset": 12,
+                    "componentType": 5126,
+                    "count": 3,
+                    "type": "VEC3",
+                },
+            ],
+            "bufferViews": [{"buffer": 0, "byteOffset": 0, "byteLength": 72, "byteStride": 24}],
+        }
+        document = read_glb(write_glb(tmp_path / "i.glb", gltf, binary))
+
+        # Act
+        decoded_positions = read_accessor(document, 0)
+        decoded_normals = read_accessor(document, 1)
+
+        # Assert
+        assert decoded_positions.dtype == np.float32
+        np.testing.assert_array_equal(decoded_positions, np.array(positions, dtype=np.float32))
+        np.testing.assert_array_equal(decoded_normals[:, 1], [1.0, 1.0, 1.0])
+
+    def test_decodes_normalized_unsigned_short(self, tmp_path: Path):
+        """Test normalized UNSIGNED_SHORT components map to [0, 1]."""
+        # Arrange
+        binary = struct.pack("<6H", 0, 65535, 32768, 65535, 0, 0)
+        gltf = {
+            "accessors": [
+                {
+                    "bufferView": 0,
+                    "componentType": 5123,
+                    "normalized": True,
+                    "count": 2,
+                    "type": "VEC3",
+                }
+            ],
+            "bufferViews": [{"buffer": 0, "byteLength": 12}],
+        }
+        document = read_glb(write_glb(tmp_path / "n.glb", gltf, binary))
+
+        # Act
+        decoded = read_accessor(document, 0)
+
+        # Assert
+        assert decoded.dtype == np.float32
+        assert decoded[0].tolist() == pytest.approx([0.0, 1.0, 0.5], abs=1e-4)
+        assert decoded[1].tolist() == pytest.approx([1.0, 0.0, 0.0])
+
+    def test_decodes_scalar_indices_as_flat_array(self, tmp_path: Path):
+        """Test SCALAR accessors are returned one-dimensional."""
+        # Arrange
+        binary = struct.pack("<3I", 0, 1, 2)
+        gltf = {
+            "accessors": [{"bufferView": 0, "componentType": 5125, "count": 3, "type": "SCALAR"}],
+            "bufferViews": [{"buffer": 0, "byteLength": 12}],
+        }
+        document = read_glb(write_glb(tmp_path / "s.glb", gltf, binary))
+
+        # Act
+        decoded = read_accessor(document, 0)
+
+        # Assert
+        assert decoded.shape == (3,)
+        assert decoded.tolist() == [0, 1, 2]
+
+    def test_accessor_past_end_of_binary_raises(self, tmp_path: Path):
+        """Test accessors that overrun the BIN chunk are rejected."""
+        # Arrange
+        gltf = {
+            "accessors": [{"bufferView": 0, "componentType": 5126, "count": 10, "type": "VEC3"}],
+            "bufferViews": [{"buffer": 0, "byteLength": 120}],
+        }
+        document = read_glb(write_glb(tmp_path / "short.glb", gltf, b"\x00" * 12))
+
+        # Act & Assert
+        with pytest.raises(TerrainError, match="exceeds binary chunk"):
+            read_accessor(document, 0)
+
+
+class TestFindPositionAccessors:
+    """Tests for find_position_accessors."""
+
+    def test_finds_positions_through_mesh_primitives(self):
+        """Test POSITION attributes are collected from every primitive, deduplicated."""
+        # Arrange
+        gltf = {
+            "meshes": [
+                {"primitives": [{"attributes": {"NORMAL": 0, "POSITION": 1}, "indices": 2}]},
+                {"primitives": [{"attributes": {"POSITION": 3}}, {"attributes": {"POSITION": 1}}]},
+            ]
+        }
+
+        # Act & Assert
+        assert find_position_accessors(gltf) == [1, 3]
+
+    def test_returns_empty_without_meshes(self):
+        """Test documents without meshes yield no accessors."""
+        assert find_position_accessors({"accessors": []}) == []
+
+
+class TestMeshTerrainProviderPositionLookup:
+    """Tests MeshTerrainProvider locates positions via mesh attributes."""
+
+    def test_uses_position_attribute_not_first_accessor(self, tmp_path: Path):
+        """Test provider reads POSITION even when accessor 0 holds normals."""
+        # Arrange - accessor 0: normals, accessor 1: positions
+        normals = struct.pack("<12f", *([0.0, 1.0, 0.0] * 4))
+        positions = struct.pack(
+            "<12f",
+            *[-10.0, 1.0, -10.0, 10.0, 2.0, -10.0, -10.0, 3.0, 10.0, 10.0, 4.0, 10.0],
+        )
+        gltf = {
+            "accessors": [
+                {"bufferView": 0, "componentType": 5126, "count": 4, "type": "VEC3"},
+                {"bufferView": 1, "componentType": 5126, "count": 4, "type": "VEC3"},
+            ],
+            "bufferViews": [
+                {"buffer": 0, "byteOffset": 0, "byteLength": 48},
+                {"buffer": 0, "byteOffset": 48, "byteLength": 48},
+            ],
+            "meshes": [{"primitives": [{"attributes": {"NORMAL": 0, "POSITION": 1}}]}],
+        }
+        glb_path = write_glb(tmp_path / "terrain.glb", gltf, normals + positions)
+
+        # Act
+        provider = MeshTerrainProvider(mesh_path=glb_path, terrain_size=(20.0, 20.0))
+
+        # Assert
+        assert provider.vertices.shape == (4, 3)
+        assert provider.min_height == pytest.approx(1.0)
+        assert provider.max_height == pytest.approx(4.0)
+        assert provider.mesh_min_x == pytest.approx(-10.0)
+
+
+class TestReadTriangles:
+    """Tests for read_triangles and triangle query mode."""
+
+    @pytest.fixture
+    def indexed_quad_glb(self, tmp_path: Path) -> Path:
+        """Two-triangle quad (y = x / 10) with an UNSIGNED_SHORT index buffer."""
+        positions = struct.pack(
+            "<12f",
+            *[0.0, 0.0, 0.0, 10.0, 1.0, 0.0, 0.0, 0.0, 10.0, 10.0, 1.0, 10.0],
+        )
+        indices = struct.pack("<6H", 0, 1, 2, 1, 3, 2)
+        gltf = {
+            "accessors": [
+                {"bufferView": 0, "componentType": 5126, "count": 4, "type": "VEC3"},
+                {"bufferView": 1, "componentType": 5123, "count": 6, "type": "SCALAR"},
+            ],
+            "bufferViews": [
+                {"buffer": 0, "byteOffset": 0, "byteLength": 48},
+                {"buffer": 0, "byteOffset": 48, "byteLength": 12},
+            ],
+            "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}],
+        }
+        return write_glb(tmp_path / "quad.glb", gltf, positions + indices)
+
+    def test_reads_index_buffer_as_triangles(self, indexed_quad_glb: Path):
+        """Test index buffer is reshaped into (T, 3) triangles."""
+        # Arrange
+        from bfportal.terrain.glb_reader import read_triangles
+
+        document = read_glb(indexed_quad_glb)
+
+        # Act
+        triangles = read_triangles(document, find_position_accessors(document.gltf))
+
+        # Assert
+        assert triangles.tolist() == [[0, 1, 2], [1, 3, 2]]
+
+    def test_triangle_mode_provider_returns_exact_heights(self, indexed_quad_glb: Path):
+        """Test triangle query mode intersects the mesh instead of the grid."""
+        # Arrange
+        from bfportal.terrain.terrain_provider import QUERY_MODE_TRIANGLE
+
+        provider = MeshTerrainProvider(
+            mesh_path=indexed_quad_glb,
+            terrain_size=(10.0, 10.0),
+            query_mode=QUERY_MODE_TRIANGLE,
+        )
+
+        # Act & Assert
+        assert provider.triangle_index is not None
+        assert provider.get_height_at(2.5, 7.0) == pytest.approx(0.25)
+        assert provider.get_height_at(7.5, 1.0) == pytest.approx(0.75)
+
+    def test_triangle_mode_has_no_region_grid(self, indexed_quad_glb: Path):
+        """Test triangle mode does not offer grid region queries to snappers."""
+        # Arrange
+        grid = MeshTerrainProvider(mesh_path=indexed_quad_glb, terrain_size=(10.0, 10.0))
+        triangle = MeshTerrainProvider(
+            mesh_path=indexed_quad_glb, terrain_size=(10.0, 10.0), query_mode="triangle"
+        )
+
+        # Act & Assert
+        assert grid.has_region_grid() is True
+        assert triangle.has_region_grid() is False
+
+    def test_triangle_mode_batch_query_returns_exact_heights(self, indexed_quad_glb: Path):
+        """Test batch queries in triangle mode intersect the mesh."""
+        # Arrange
+        provider = MeshTerrainProvider(
+            mesh_path=indexed_quad_glb, terrain_size=(10.0, 10.0), query_mode="triangle"
+        )
+
+        # Act
+        heights = provider.get_heights_at([2.5, 7.5, 11.0], [7.0, 1.0, 5.0])
+
+        # Assert
+        assert heights[:2].tolist() == pytest.approx([0.25, 0.75])
+        assert np.isnan(heights[2])
+
+    def test_unknown_query_mode_raises(self, indexed_quad_glb: Path):
+        """Test invalid query modes are rejected."""
+        with pytest.raises(TerrainError, match="Unknown terrain query mode"):
+            MeshTerrainProvider(
+                mesh_path=indexed_quad_glb, terrain_size=(10.0, 10.0), query_mode="bvh"
+            )
+
+    def test_triangle_mode_requires_mesh_primitives(self, tmp_path: Path):
+        """Test triangle mode fails clearly for position-only files."""
+        # Arrange
+        gltf = {
+            "accessors": [{"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"}],
+            "bufferViews": [{"buffer": 0, "byteLength": 36}],
+        }
+        positions = struct.pack("<9f", 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+        glb_path = write_glb(tmp_path / "points.glb", gltf, positions)
+
+        # Act & Assert
+        with pytest.raises(TerrainError, match="requires mesh primitives"):
+            MeshTerrainProvider(mesh_path=glb_path, terrain_size=(1.0, 1.0), query_mode="triangle")
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Tests for godot_terrain - height data lookup in Portal terrain scenes."""
+
+import json
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bfportal.core.exceptions import TerrainError
+from bfportal.terrain.godot_terrain import find_terrain_mesh, parse_heightmap_shape
+from bfportal.terrain.terrain_cache import TerrainCache
+from bfportal.terrain.terrain_provider import (
+    PORTAL_BASE_TERRAINS,
+    PORTAL_SDK_ROOT,
+    MeshTerrainProvider,
+    PortalTerrainProvider,
+)
+
+
+def write_quad_glb(path: Path) -> Path:
+    """Write an indexed two-triangle quad (X, Z in [0, 10], y = x / 10) as a GLB."""
+    binary = struct.pack(
+        "<12f", *[0.0, 0.0, 0.0, 10.0, 1.0, 0.0, 0.0, 0.0, 10.0, 10.0, 1.0, 10.0]
+    ) + struct.pack("<6H", 0, 1, 2, 1, 3, 2)
+    gltf = {
+        "accessors": [
+            {"bufferView": 0, "componentType": 5126, "count": 4, "type": "VEC3"},
+            {"bufferView": 1, "componentType": 5123, "count": 6, "type": "SCALAR"},
+        ],
+        "bufferViews": [
+            {"buffer": 0, "byteOffset": 0, "byteLength": 48},
+            {"buffer": 0, "byteOffset": 48, "byteLength": 12},
+        ],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}],
+    }
+    json_bytes = json.dumps(gltf).encode("utf-8")
+    json_bytes += b" " * ((4 - len(json_bytes) % 4) % 4)
+    total = 12 + 8 + len(json_bytes) + 8 + len(binary)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"glTF" + struct.pack("<II", 2, total))
+        f.write(struct.pack("<I", len(json_bytes)) + b"JSON" + json_bytes)
+        f.write(struct.pack("<I", len(binary)) + b"BIN\x00" + binary)
+    return path
+
+
+MESH_SCENE = """[gd_scene load_steps=2 format=3]
+
+[ext_resource path="res://raw/models/MP_Dumbo_Terrain.glb" type="PackedScene" id="1"]
+
+[node name="MP_Dumbo_Terrain" type="Node3D"]
+
+[node name="Mesh" parent="." instance=ExtResource("1")]
+"""
+
+
+class TestParseHeightmapShape:
+    """Tests for parse_heightmap_shape."""
+
+    def test_reads_samples_and_node_placement(self):
+        """Test map data is reshaped [row, column] and placed by the shape's node."""
+        # Arrange
+        scene = """[gd_scene format=3]
+
+[sub_resource type="HeightMapShape3D" id="1"]
+map_width = 3
+map_depth = 2
+map_data = PackedFloat32Array(0, 1, 2, 3, 4, 5)
+
+[node name="Body" type="StaticBody3D"]
+
+[node name="Shape" type="CollisionShape3D" parent="."]
+transform = Transform3D(4, 0, 0, 0, 0.5, 0, 0, 0, 2, 10, 1, 20)
+shape = SubResource("1")
+"""
+
+        # Act
+        shape = parse_heightmap_shape(scene)
+
+        # Assert
+        assert shape is not None
+        assert shape.heights.dtype == np.float32
+        assert shape.heights.tolist() == [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+        assert shape.bounds == (6.0, 14.0, 19.0, 21.0)
+        assert shape.world_heights.tolist() == [[1.0, 1.5, 2.0], [2.5, 3.0, 3.5]]
+
+    def test_defaults_to_unscaled_origin_without_node(self):
+        """Test an unreferenced heightfield is centred on the origin at unit spacing."""
+        # Arrange
+        scene = (
+            '[sub_resource type="HeightMapShape3D" id="hm"]\n'
+            "map_width = 2\nmap_depth = 2\nmap_data = PackedFloat32Array(1, 2, 3, 4)\n"
+        )
+
+        # Act
+        shape = parse_heightmap_shape(scene)
+
+        # Assert
+        assert shape is not None
+        assert shape.bounds == (-0.5, 0.5, -0.5, 0.5)
+
+    def test_returns_none_without_heightmap_shape(self):
+        """Test scenes that only instance a mesh have no heightfield."""
+        assert parse_heightmap_shape(MESH_SCENE) is None
+
+    def test_sample_count_mismatch_raises(self):
+        """Test map_data must hold map_width * map_depth samples."""
+        # Arrange
+        scene = (
+            '[sub_resource type="HeightMapShape3D" id="hm"]\n'
+            "map_width = 3\nmap_depth = 3\nmap_data = PackedFloat32Array(1, 2, 3, 4)\n"
+        )
+
+        # Act & Assert
+        with pytest.raises(TerrainError, match="has 4 samples for a 3x3 map"):
+            parse_heightmap_shape(scene)
+
+
+class TestFindTerrainMesh:
+    """Tests for find_terrain_mesh."""
+
+    def test_resolves_res_path_against_godot_root(self, tmp_path: Path):
+        """Test res:// GLB references resolve inside the GodotProject directory."""
+        assert (
+            find_terrain_mesh(MESH_SCENE, tmp_path) == tmp_path / "raw/models/MP_Dumbo_Terrain.glb"
+        )
+
+    @pytest.mark.parametrize("map_name", PORTAL_BASE_TERRAINS)
+    def test_shipped_scenes_reference_their_terrain_mesh(self, map_name: str):
+        """Test every shipped base terrain scene points at its terrain GLB."""
+        # Arrange
+        godot_root = PORTAL_SDK_ROOT / "GodotProject"
+        scene = (godot_root / "static" / f"{map_name}_Terrain.tscn").read_text()
+
+        # Act & Assert
+        assert (
+            find_terrain_mesh(scene, godot_root)
+            == godot_root / "raw" / "models" / f"{map_name}_Terrain.glb"
+        )
+
+
+class TestPortalTerrainProviderMesh:
+    """Tests for PortalTerrainProvider backed by the scene's terrain GLB."""
+
+    @pytest.fixture
+    def sdk_root(self, tmp_path: Path) -> Path:
+        """Fake Portal SDK with an MP_Dumbo scene instancing a quad GLB."""
+        static_dir = tmp_path / "GodotProject" / "static"
+        static_dir.mkdir(parents=True)
+        (static_dir / "MP_Dumbo_Terrain.tscn").write_text(MESH_SCENE)
+        write_quad_glb(tmp_path / "GodotProject" / "raw" / "models" / "MP_Dumbo_Terrain.glb")
+        return tmp_path
+
+    def test_loads_heights_from_terrain_mesh(self, sdk_root: Path):
+        """Test queries are answered by the referenced GLB mesh."""
+        # Act
+        provider = PortalTerrainProvider("MP_Dumbo", sdk_root)
+
+        # Assert
+        assert isinstance(provider.source, MeshTerrainProvider)
+        assert provider.terrain_width == pytest.approx(10.0)
+        assert provider.max_height == pytest.approx(1.0)
+        assert provider.get_height_at(5.0, 5.0) == pytest.approx(0.5, abs=0.05)
+        assert np.isnan(provider.get_heights_at([20.0], [5.0])[0])
+
+    def test_reuses_terrain_cache(self, sdk_root: Path, tmp_path: Path):
+        """Test the preprocessed mesh is loaded from the cache on the second run."""
+        # Arrange
+        cache = TerrainCache(tmp_path / "cache")
+        PortalTerrainProvider("MP_Dumbo", sdk_root, cache=cache)
+
+        # Act
+        provider = PortalTerrainProvider("MP_Dumbo", sdk_root, cache=cache)
+
+        # Assert
+        assert provider.source.loaded_from_cache is True
+
+    def test_missing_mesh_raises(self, sdk_root: Path):
+        """Test a scene whose GLB is absent reports the missing mesh."""
+        # Arrange
+        (sdk_root / "GodotProject" / "raw" / "models" / "MP_Dumbo_Terrain.glb").unlink()
+
+        # Act & Assert
+        with pytest.raises(TerrainError, match="MP_Dumbo_Terrain.glb is missing"):
+            PortalTerrainProvider("MP_Dumbo", sdk_root)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Tests for HeightPyramid - min/max/mean region queries."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bfportal.terrain.height_pyramid import HeightPyramid
+
+
+class TestHeightPyramid:
+    """Tests for HeightPyramid construction and queries."""
+
+    def test_levels_halve_down_to_single_sample(self):
+        """Test odd-sized grids reduce to a 1x1 top level holding the global stats."""
+        # Arrange
+        grid = np.arange(35, dtype=np.float32).reshape(5, 7)
+
+        # Act
+        pyramid = HeightPyramid(grid)
+
+        # Assert
+        assert [level.shape for level in pyramid.mins] == [(5, 7), (3, 4), (2, 2), (1, 1)]
+        assert pyramid.mins[-1][0, 0] == 0.0
+        assert pyramid.maxs[-1][0, 0] == 34.0
+        assert pyramid.sums[-1][0, 0] == grid.sum()
+
+    def test_random_rectangles_match_brute_force(self):
+        """Test queries equal direct reductions over the same samples."""
+        # Arrange
+        rng = np.random.default_rng(7)
+        grid = rng.normal(50.0, 20.0, size=(97, 130)).astype(np.float32)
+        pyramid = HeightPyramid(grid)
+
+        for _ in range(200):
+            row0, row1 = sorted(rng.choice(98, size=2, replace=False))
+            col0, col1 = sorted(rng.choice(131, size=2, replace=False))
+
+            # Act
+            low, high, mean = pyramid.query(row0, row1, col0, col1)
+
+            # Assert
+            block = grid[row0:row1, col0:col1]
+            assert low == block.min()
+            assert high == block.max()
+            assert mean == pytest.approx(block.astype(np.float64).mean())
+
+    def test_single_sample_query(self):
+        """Test a one-sample rectangle returns that sample for all stats."""
+        # Arrange
+        pyramid = HeightPyramid(np.array([[1.0, 2.0], [3.0, 4.0]]))
+
+        # Act & Assert
+        assert pyramid.query(1, 2, 0, 1) == (3.0, 3.0, 3.0)
+
+    def test_empty_or_out_of_range_rectangle_raises(self):
+        """Test invalid rectangles are rejected."""
+        # Arrange
+        pyramid = HeightPyramid(np.zeros((4, 4)))
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="out-of-range rectangle"):
+            pyramid.query(2, 2, 0, 4)
+        with pytest.raises(ValueError, match="out-of-range rectangle"):
+            pyramid.query(0, 5, 0, 4)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Tests for heightmap - Heightmap.raw decoding and water body labelling."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bfportal.core.exceptions import TerrainError
+from bfportal.terrain.heightmap import (
+    WaterBody,
+    find_water_bodies,
+    read_heightmap_raw,
+    water_mask,
+)
+
+
+class TestReadHeightmapRaw:
+    """Tests for read_heightmap_raw."""
+
+    def test_maps_little_endian_square_grid(self, tmp_path: Path):
+        """Test samples are decoded row-major as uint16."""
+        # Arrange
+        raw = tmp_path / "Heightmap.raw"
+        np.arange(16, dtype="<u2").tofile(raw)
+
+        # Act
+        heights = read_heightmap_raw(raw)
+
+        # Assert
+        assert heights.shape == (4, 4)
+        assert heights[1, 2] == 6
+
+    def test_ignores_trailing_partial_row(self, tmp_path: Path):
+        """Test samples beyond the largest square are ignored."""
+        # Arrange
+        raw = tmp_path / "Heightmap.raw"
+        np.arange(20, dtype="<u2").tofile(raw)
+
+        # Act & Assert
+        assert read_heightmap_raw(raw).shape == (4, 4)
+
+    def test_empty_file_raises(self, tmp_path: Path):
+        """Test an empty heightmap is rejected."""
+        # Arrange
+        raw = tmp_path / "Heightmap.raw"
+        raw.write_bytes(b"")
+
+        # Act & Assert
+        with pytest.raises(TerrainError, match="empty"):
+            read_heightmap_raw(raw)
+
+
+class TestWaterMask:
+    """Tests for water_mask."""
+
+    def test_scales_samples_before_comparing(self):
+        """Test samples are scaled to world height before the waterLevel test."""
+        # Arrange - 150m scale: 65535 -> 150m, 26214 -> ~60m, 39321 -> ~90m
+        heights = np.array([[0, 26214], [39321, 65535]], dtype=np.uint16)
+
+        # Act
+        mask = water_mask(heights, water_level=72.0, height_scale=150.0)
+
+        # Assert
+        assert mask.tolist() == [[True, True], [False, False]]
+
+
+class TestFindWaterBodies:
+    """Tests for find_water_bodies connected-component labelling."""
+
+    def test_returns_empty_for_dry_mask(self):
+        """Test masks without water yield no bodies."""
+        assert find_water_bodies(np.zeros((5, 5), dtype=bool)) == []
+
+    def test_diagonal_pixels_are_connected(self):
+        """Test regions use 8-connectivity."""
+        # Arrange
+        mask = np.eye(4, dtype=bool)
+
+        # Act
+        bodies = find_water_bodies(mask)
+
+        # Assert
+        assert bodies == [WaterBody(min_x=0, max_x=3, min_y=0, max_y=3, pixel_count=4)]
+
+    def test_u_shape_merges_into_one_body(self):
+        """Test runs that only join further down are merged."""
+        # Arrange
+        mask = np.array(
+            [
+                [1, 0, 0, 1],
+                [1, 0, 0, 1],
+                [1, 1, 1, 1],
+            ],
+            dtype=bool,
+        )
+
+        # Act
+        bodies = find_water_bodies(mask)
+
+        # Assert
+        assert bodies == [WaterBody(min_x=0, max_x=3, min_y=0, max_y=2, pixel_count=8)]
+
+    def test_separate_bodies_in_row_major_order(self):
+        """Test bodies are ordered by their first pixel."""
+        # Arrange
+        mask = np.zeros((6, 6), dtype=bool)
+        mask[3:5, 0:2] = True
+        mask[0, 4:6] = True
+
+        # Act
+        bodies = find_water_bodies(mask)
+
+        # Assert
+        assert bodies == [
+            WaterBody(min_x=4, max_x=5, min_y=0, max_y=0, pixel_count=2),
+            WaterBody(min_x=0, max_x=1, min_y=3, max_y=4, pixel_count=4),
+        ]
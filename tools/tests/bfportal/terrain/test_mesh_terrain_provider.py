@@ -5,6 +5,7 @@ import struct
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # Add tools directory to Python path
@@ -192,6 +193,21 @@ class TestMeshTerrainProvider:
         with pytest.raises(OutOfBoundsError, match="outside terrain mesh bounds"):
             provider.get_height_at(0.0, -500.0)
 
+    def test_get_heights_at_matches_get_height_at(self, mock_glb_file: Path):
+        """Test batch grid query matches per-point queries and marks misses NaN."""
+        # Arrange
+        provider = MeshTerrainProvider(mesh_path=mock_glb_file, terrain_size=(200.0, 200.0))
+        xs = [0.0, -100.0, -50.0, 37.5, 100.0, 150.0]
+        zs = [0.0, -100.0, -50.0, -12.25, 100.0, 0.0]
+
+        # Act
+        heights = provider.get_heights_at(xs, zs)
+
+        # Assert
+        for height, x, z in zip(heights[:5], xs[:5], zs[:5], strict=True):
+            assert height == pytest.approx(provider.get_height_at(x, z))
+        assert np.isnan(heights[5])
+
     def test_get_bounds_returns_actual_mesh_bounds(self, mock_glb_file: Path):
         """Test get_bounds returns actual mesh bounds from vertices."""
         # Arrange
@@ -230,6 +246,111 @@ class TestMeshTerrainProvider:
         assert provider.height_grid.min() >= provider.min_height
         assert provider.height_grid.max() <= provider.max_height
 
+    def test_get_height_range_covers_grid_samples(self, mock_glb_file: Path):
+        """Test region query on grid lines returns exact min/max/mean of the covered samples."""
+        # Arrange
+        provider = MeshTerrainProvider(mesh_path=mock_glb_file, terrain_size=(200.0, 200.0))
+        step = 200.0 / 255
+
+        # Act - rectangle spanning sample columns 10..40 and rows 100..180
+        min_h, max_h, mean_h = provider.get_height_range(
+            (-100.0 + 10 * step, -100.0 + 40 * step, -100.0 + 100 * step, -100.0 + 180 * step)
+        )
+
+        # Assert
+        expected = provider.height_grid[100:181, 10:41]
+        assert min_h == pytest.approx(expected.min())
+        assert max_h == pytest.approx(expected.max())
+        assert mean_h == pytest.approx(expected.mean())
+
+    def test_get_height_range_interpolates_edges_inside_cells(self, mock_glb_file: Path):
+        """Test regions between grid lines take the surface along their edges, not whole cells."""
+        # Arrange
+        provider = MeshTerrainProvider(mesh_path=mock_glb_file, terrain_size=(200.0, 200.0))
+        step = 200.0 / 255
+        x, z = -100.0 + 10.5 * step, -100.0 + 100.25 * step
+
+        # Act - footprint inside a single grid cell
+        min_h, max_h, _ = provider.get_height_range((x, x + 0.2 * step, z, z + 0.5 * step))
+
+        # Assert - bilinear extremes lie on the footprint corners
+        corners = provider.get_heights_at(
+            [x, x + 0.2 * step, x, x + 0.2 * step], [z, z, z + 0.5 * step, z + 0.5 * step]
+        )
+        assert min_h == pytest.approx(corners.min())
+        assert max_h == pytest.approx(corners.max())
+
+    def test_get_min_height_in_radius_is_never_above_point_samples(self, mock_glb_file: Path):
+        """Test footprint minimum is at most every interpolated height inside it."""
+        # Arrange
+        provider = MeshTerrainProvider(mesh_path=mock_glb_file, terrain_size=(200.0, 200.0))
+        offsets = np.linspace(-10.0, 10.0, 9)
+
+        # Act
+        minimum = provider.get_min_height_in_radius(-40.0, 25.0, 10.0)
+
+        # Assert
+        sampled = provider.get_heights_at(np.repeat(-40.0 + offsets, 9), np.tile(25.0 + offsets, 9))
+        assert minimum <= sampled.min() + 1e-9
+
+    def test_get_height_range_clips_partially_outside_region(self, mock_glb_file: Path):
+        """Test regions overlapping the mesh edge only cover samples inside it."""
+        # Arrange
+        provider = MeshTerrainProvider(mesh_path=mock_glb_file, terrain_size=(200.0, 200.0))
+
+        # Act
+        min_h, max_h, _ = provider.get_height_range((90.0, 500.0, 90.0, 500.0))
+
+        # Assert - samples from column/row 243 plus edges interpolated at 242.25
+        inside = provider.height_grid[243:, 243:]
+        touched = provider.height_grid[242:, 242:]
+        assert touched.min() <= min_h <= inside.min()
+        assert inside.max() <= max_h <= touched.max()
+
+    def test_get_height_range_outside_mesh_raises(self, mock_glb_file: Path):
+        """Test regions entirely outside the mesh raise OutOfBoundsError."""
+        # Arrange
+        provider = MeshTerrainProvider(mesh_path=mock_glb_file, terrain_size=(200.0, 200.0))
+
+        # Act & Assert
+        with pytest.raises(OutOfBoundsError, match="outside terrain bounds"):
+            provider.get_height_range((150.0, 200.0, 0.0, 10.0))
+
+    def test_get_normal_at_matches_grid_gradient(self, mock_glb_file: Path):
+        """Test normals at grid samples follow the height grid's central differences."""
+        # Arrange
+        provider = MeshTerrainProvider(mesh_path=mock_glb_file, terrain_size=(200.0, 200.0))
+        step = 200.0 / 255
+        grid = provider.height_grid.astype(np.float64)
+        dh_dx = (grid[100, 41] - grid[100, 39]) / (2 * step)
+        dh_dz = (grid[101, 40] - grid[99, 40]) / (2 * step)
+        length = np.sqrt(dh_dx**2 + 1.0 + dh_dz**2)
+
+        # Act
+        normal = provider.get_normal_at(-100.0 + 40 * step, -100.0 + 100 * step)
+
+        # Assert
+        expected = [-dh_dx / length, 1.0 / length, -dh_dz / length]
+        assert [normal.x, normal.y, normal.z] == pytest.approx(expected, abs=1e-5)
+
+    def test_get_normals_at_matches_get_normal_at(self, mock_glb_file: Path):
+        """Test batch normals agree with single queries and mark outside points NaN."""
+        # Arrange
+        provider = MeshTerrainProvider(mesh_path=mock_glb_file, terrain_size=(200.0, 200.0))
+        xs = [-73.3, 0.0, 12.5, 500.0]
+        zs = [41.7, 0.0, -88.0, 0.0]
+
+        # Act
+        normals = provider.get_normals_at(xs, zs)
+
+        # Assert
+        for i in range(3):
+            normal = provider.get_normal_at(xs[i], zs[i])
+            assert normals[i].tolist() == pytest.approx([normal.x, normal.y, normal.z])
+        assert np.isnan(normals[3]).all()
+        with pytest.raises(OutOfBoundsError):
+            provider.get_normal_at(500.0, 0.0)
+
 
 class TestMeshTerrainProviderEdgeCases:
     """Tests for MeshTerrainProvider edge cases."""
@@ -321,3 +442,74 @@ class TestMeshTerrainProviderEdgeCases:
         # Act & Assert
         with pytest.raises(TerrainError, match="First accessor is not VEC3"):
             MeshTerrainProvider(mesh_path=glb_path, terrain_size=(200.0, 200.0))
+
+
+class TestMeshTerrainProviderHeightGrid:
+    """Tests for vectorized height grid rasterization and gap filling."""
+
+    @staticmethod
+    def _make_provider(vertices, resolution: int) -> MeshTerrainProvider:
+        """Build a provider around in-memory vertices without reading a GLB."""
+        import numpy as np
+
+        provider = MeshTerrainProvider.__new__(MeshTerrainProvider)
+        provider.vertices = np.asarray(vertices, dtype=np.float32)
+        provider.mesh_min_x = float(provider.vertices[:, 0].min())
+        provider.mesh_max_x = float(provider.vertices[:, 0].max())
+        provider.mesh_min_z = float(provider.vertices[:, 2].min())
+        provider.mesh_max_z = float(provider.vertices[:, 2].max())
+        provider.grid_resolution = resolution
+        return provider
+
+    def test_keeps_maximum_height_per_cell(self):
+        """Test several vertices in one cell keep the highest Y."""
+        # Arrange - three vertices share the (0, 0) cell
+        provider = self._make_provider(
+            [[0.0, 1.0, 0.0], [0.1, 7.0, 0.1], [0.2, 3.0, 0.0], [10.0, 2.0, 10.0]],
+            resolution=4,
+        )
+
+        # Act
+        grid = provider._build_height_grid()
+
+        # Assert
+        assert grid[0, 0] == pytest.approx(7.0)
+        assert grid[3, 3] == pytest.approx(2.0)
+
+    def test_gap_fill_uses_nearest_valid_neighbours(self):
+        """Test empty cells take the mean of their filled 4-neighbours."""
+        import numpy as np
+
+        # Arrange
+        provider = self._make_provider([[0.0, 0.0, 0.0], [1.0, 0.0, 1.0]], resolution=3)
+        grid = np.array(
+            [
+                [1.0, np.nan, 3.0],
+                [np.nan, np.nan, np.nan],
+                [5.0, np.nan, 7.0],
+            ]
+        )
+
+        # Act
+        provider._fill_grid_gaps(grid)
+
+        # Assert - edges average their two filled neighbours, centre averages the edges
+        assert grid[0, 1] == pytest.approx(2.0)
+        assert grid[1, 0] == pytest.approx(3.0)
+        assert grid[1, 2] == pytest.approx(5.0)
+        assert grid[2, 1] == pytest.approx(6.0)
+        assert grid[1, 1] == pytest.approx(4.0)
+
+    def test_gap_fill_reaches_cells_far_from_vertices(self):
+        """Test gaps wider than any fixed sweep count are still filled."""
+        import numpy as np
+
+        # Arrange - only two opposite corners contain vertices
+        provider = self._make_provider([[0.0, 2.0, 0.0], [100.0, 2.0, 100.0]], resolution=512)
+
+        # Act
+        grid = provider._build_height_grid()
+
+        # Assert
+        assert not np.isnan(grid).any()
+        assert np.allclose(grid, 2.0)
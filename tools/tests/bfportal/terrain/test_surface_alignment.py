@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Tests for align_up_axes - tilting transform bases onto surface normals."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bfportal.terrain.surface_alignment import align_up_axes
+
+
+def yaw_basis(degrees: float, scale: float = 1.0) -> np.ndarray:
+    """Basis rotated about Y and uniformly scaled."""
+    c, s = np.cos(np.radians(degrees)), np.sin(np.radians(degrees))
+    return np.array([[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]]) * scale
+
+
+class TestAlignUpAxes:
+    """Tests for align_up_axes."""
+
+    def test_up_axis_follows_normal(self):
+        """Test the aligned basis' up column is the normal, scaled like the original."""
+        # Arrange
+        bases = np.stack([yaw_basis(30.0, scale=2.0)])
+        normals = np.array([[0.6, 0.8, 0.0]])
+
+        # Act
+        aligned, tilt = align_up_axes(bases, normals)
+
+        # Assert
+        np.testing.assert_allclose(aligned[0][:, 1], [1.2, 1.6, 0.0], atol=1e-12)
+        np.testing.assert_allclose(np.linalg.norm(aligned[0], axis=0), [2.0, 2.0, 2.0])
+        assert tilt[0] == pytest.approx(36.8699, abs=1e-4)
+
+    def test_keeps_axes_orthogonal(self):
+        """Test the rotation keeps the basis a rotation (heading preserved, no shear)."""
+        # Arrange
+        bases = np.stack([yaw_basis(-75.0)])
+        normals = np.array([[0.0, 0.8, -0.6]])
+
+        # Act
+        aligned, _ = align_up_axes(bases, normals)
+
+        # Assert
+        np.testing.assert_allclose(aligned[0].T @ aligned[0], np.eye(3), atol=1e-12)
+        assert np.linalg.det(aligned[0]) == pytest.approx(1.0)
+
+    def test_realigning_is_a_no_op(self):
+        """Test aligning an already aligned basis reports zero tilt."""
+        # Arrange
+        normals = np.array([[0.6, 0.8, 0.0], [0.0, 1.0, 0.0]])
+        once, _ = align_up_axes(np.stack([yaw_basis(10.0), yaw_basis(80.0)]), normals)
+
+        # Act
+        twice, tilt = align_up_axes(once, normals)
+
+        # Assert
+        np.testing.assert_allclose(twice, once, atol=1e-12)
+        np.testing.assert_allclose(tilt, [0.0, 0.0], atol=1e-6)
+
+    def test_invalid_inputs_are_left_unchanged(self):
+        """Test NaN normals, zero up axes and upside-down bases are not rotated."""
+        # Arrange
+        upside_down = np.diag([1.0, -1.0, -1.0])
+        degenerate = np.diag([1.0, 0.0, 1.0])
+        bases = np.stack([np.eye(3), degenerate, upside_down])
+        normals = np.array([[np.nan, np.nan, np.nan], [0.6, 0.8, 0.0], [0.0, 1.0, 0.0]])
+
+        # Act
+        aligned, tilt = align_up_axes(bases, normals)
+
+        # Assert
+        np.testing.assert_array_equal(aligned, bases)
+        np.testing.assert_array_equal(tilt, [0.0, 0.0, 0.0])
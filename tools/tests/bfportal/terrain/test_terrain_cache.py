@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Tests for TerrainCache - persistent preprocessed terrain arrays."""
+
+import json
+import os
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bfportal.terrain.terrain_cache import TerrainCache
+from bfportal.terrain.terrain_provider import QUERY_MODE_TRIANGLE, MeshTerrainProvider
+
+
+@pytest.fixture
+def quad_glb(tmp_path: Path) -> Path:
+    """Indexed two-triangle quad (y = x / 10) as a GLB file."""
+    binary = struct.pack(
+        "<12f", *[0.0, 0.0, 0.0, 10.0, 1.0, 0.0, 0.0, 0.0, 10.0, 10.0, 1.0, 10.0]
+    ) + struct.pack("<6H", 0, 1, 2, 1, 3, 2)
+    gltf = {
+        "accessors": [
+            {"bufferView": 0, "componentType": 5126, "count": 4, "type": "VEC3"},
+            {"bufferView": 1, "componentType": 5123, "count": 6, "type": "SCALAR"},
+        ],
+        "bufferViews": [
+            {"buffer": 0, "byteOffset": 0, "byteLength": 48},
+            {"buffer": 0, "byteOffset": 48, "byteLength": 12},
+        ],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}],
+    }
+    json_bytes = json.dumps(gltf).encode("utf-8")
+    json_bytes += b" " * ((4 - len(json_bytes) % 4) % 4)
+    total = 12 + 8 + len(json_bytes) + 8 + len(binary)
+
+    glb_path = tmp_path / "MP_Test_Terrain.glb"
+    with open(glb_path, "wb") as f:
+        f.write(b"glTF" + struct.pack("<II", 2, total))
+        f.write(struct.pack("<I", len(json_bytes)) + b"JSON" + json_bytes)
+        f.write(struct.pack("<I", len(binary)) + b"BIN\x00" + binary)
+    return glb_path
+
+
+class TestTerrainCache:
+    """Tests for TerrainCache load/store and invalidation."""
+
+    def test_first_load_builds_and_stores_entry(self, tmp_path: Path, quad_glb: Path):
+        """Test a cache miss builds from the GLB and writes an entry."""
+        # Arrange
+        cache = TerrainCache(tmp_path / "cache")
+
+        # Act
+        provider = MeshTerrainProvider(quad_glb, (10.0, 10.0), cache=cache)
+
+        # Assert
+        assert provider.loaded_from_cache is False
+        assert cache.cache_path(quad_glb, provider.grid_resolution).exists()
+
+    def test_second_load_uses_cached_arrays(self, tmp_path: Path, quad_glb: Path):
+        """Test a valid entry is loaded instead of parsing the GLB."""
+        # Arrange
+        cache = TerrainCache(tmp_path / "cache")
+        built = MeshTerrainProvider(quad_glb, (10.0, 10.0), cache=cache)
+
+        # Act
+        cached = MeshTerrainProvider(quad_glb, (10.0, 10.0), cache=cache)
+
+        # Assert
+        assert cached.loaded_from_cache is True
+        np.testing.assert_array_equal(cached.vertices, built.vertices)
+        np.testing.assert_array_equal(cached.height_grid, built.height_grid)
+        assert cached.mesh_max_x == built.mesh_max_x
+        assert cached.get_height_at(5.0, 5.0) == pytest.approx(built.get_height_at(5.0, 5.0))
+
+    def test_modified_glb_invalidates_entry(self, tmp_path: Path, quad_glb: Path):
+        """Test changing the GLB's mtime forces a rebuild."""
+        # Arrange
+        cache = TerrainCache(tmp_path / "cache")
+        MeshTerrainProvider(quad_glb, (10.0, 10.0), cache=cache)
+        stat = quad_glb.stat()
+        os.utime(quad_glb, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Act
+        provider = MeshTerrainProvider(quad_glb, (10.0, 10.0), cache=cache)
+
+        # Assert
+        assert provider.loaded_from_cache is False
+        assert cache.load(quad_glb, provider.grid_resolution) is not None
+
+    def test_triangle_mode_restores_triangle_index(self, tmp_path: Path, quad_glb: Path):
+        """Test triangle mode rebuilds once, then restores the index from the cache."""
+        # Arrange
+        cache = TerrainCache(tmp_path / "cache")
+        MeshTerrainProvider(quad_glb, (10.0, 10.0), cache=cache)  # grid-only entry
+
+        # Act
+        first = MeshTerrainProvider(
+            quad_glb, (10.0, 10.0), query_mode=QUERY_MODE_TRIANGLE, cache=cache
+        )
+        second = MeshTerrainProvider(
+            quad_glb, (10.0, 10.0), query_mode=QUERY_MODE_TRIANGLE, cache=cache
+        )
+
+        # Assert
+        assert first.loaded_from_cache is False
+        assert second.loaded_from_cache is True
+        assert second.triangle_index.triangle_count == 2
+        assert second.get_height_at(2.5, 7.0) == pytest.approx(0.25)
+
+    def test_corrupt_entry_is_treated_as_miss(self, tmp_path: Path, quad_glb: Path):
+        """Test unreadable cache files fall back to building from the GLB."""
+        # Arrange
+        cache = TerrainCache(tmp_path / "cache")
+        entry = cache.cache_path(quad_glb, 256)
+        entry.parent.mkdir(parents=True)
+        entry.write_bytes(b"not an npz file")
+
+        # Act
+        provider = MeshTerrainProvider(quad_glb, (10.0, 10.0), cache=cache)
+
+        # Assert
+        assert provider.loaded_from_cache is False
+        assert cache.load(quad_glb, 256) is not None
+
+    def test_cache_dir_defaults_to_environment_variable(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test BFPORTAL_TERRAIN_CACHE overrides the default directory."""
+        # Arrange
+        monkeypatch.setenv("BFPORTAL_TERRAIN_CACHE", str(tmp_path / "env_cache"))
+
+        # Act
+        cache = TerrainCache()
+
+        # Assert
+        assert cache.cache_dir == tmp_path / "env_cache"
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """Tests for terrain provider implementations."""
 
+import math
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -11,7 +12,7 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from bfportal.core.exceptions import OutOfBoundsError, TerrainError
-from bfportal.core.interfaces import Vector3
+from bfportal.core.interfaces import ITerrainProvider, Vector3
 from bfportal.terrain.terrain_provider import (
     CustomHeightmapProvider,
     FixedHeightProvider,
@@ -87,26 +88,135 @@ class TestFixedHeightProvider:
         with pytest.raises(OutOfBoundsError):
             provider.get_height_at(600.0, 0.0)
 
+    def test_get_heights_at_marks_out_of_bounds_as_nan(self):
+        """Test batch query returns fixed height in bounds and NaN outside."""
+        # Arrange
+        provider = FixedHeightProvider(fixed_height=100.0, terrain_size=(2048.0, 2048.0))
+
+        # Act
+        heights = provider.get_heights_at([0.0, 1023.0, 1025.0], [0.0, -1023.0, 0.0])
+
+        # Assert
+        assert heights[:2].tolist() == [100.0, 100.0]
+        assert math.isnan(heights[2])
+
+    def test_get_height_range_returns_fixed_height(self):
+        """Test region queries return the fixed height and reject regions outside."""
+        # Arrange
+        provider = FixedHeightProvider(fixed_height=100.0, terrain_size=(2048.0, 2048.0))
+
+        # Act & Assert
+        assert provider.get_height_range((1000.0, 1100.0, 0.0, 10.0)) == (100.0, 100.0, 100.0)
+        assert provider.get_min_height_in_radius(0.0, 0.0, 10.0) == 100.0
+        with pytest.raises(OutOfBoundsError):
+            provider.get_height_range((1100.0, 1200.0, 0.0, 10.0))
+
+    def test_normals_point_straight_up(self):
+        """Test flat terrain has vertical normals and NaN rows outside."""
+        # Arrange
+        provider = FixedHeightProvider(fixed_height=100.0, terrain_size=(2048.0, 2048.0))
+
+        # Act
+        normals = provider.get_normals_at([0.0, 5000.0], [0.0, 0.0])
+
+        # Assert
+        assert provider.get_normal_at(10.0, 10.0) == Vector3(0.0, 1.0, 0.0)
+        assert normals[0].tolist() == [0.0, 1.0, 0.0]
+        assert math.isnan(normals[1, 0])
+
+
+class TestDefaultRegionQueries:
+    """Tests for ITerrainProvider's default region query implementation."""
+
+    class SlopeProvider(ITerrainProvider):
+        """Terrain with height x + z, out of bounds where x or z exceeds 100."""
+
+        def get_height_at(self, x: float, z: float) -> float:
+            if x > 100.0 or z > 100.0:
+                raise OutOfBoundsError(f"({x}, {z}) outside")
+            return x + z
+
+        def get_bounds(self) -> tuple[Vector3, Vector3]:
+            return Vector3(-100.0, -200.0, -100.0), Vector3(100.0, 200.0, 100.0)
+
+    def test_samples_centre_and_corners(self):
+        """Test the default range uses the centre and four corner heights."""
+        # Act
+        min_h, max_h, mean_h = self.SlopeProvider().get_height_range((0.0, 10.0, 0.0, 20.0))
+
+        # Assert - corners 0, 10, 30, 20 and centre 15
+        assert (min_h, max_h, mean_h) == (0.0, 30.0, 15.0)
+
+    def test_ignores_samples_outside_terrain(self):
+        """Test out-of-bounds samples are skipped, and fully outside regions raise."""
+        # Arrange
+        provider = self.SlopeProvider()
+
+        # Act & Assert
+        assert provider.get_min_height_in_radius(100.0, 100.0, 10.0) == 180.0
+        with pytest.raises(OutOfBoundsError, match="outside terrain bounds"):
+            provider.get_height_range((150.0, 160.0, 150.0, 160.0))
+
+    def test_normals_from_finite_differences(self):
+        """Test the default normal is derived from neighbouring height samples."""
+        # Arrange
+        provider = self.SlopeProvider()
+        expected = [-1 / math.sqrt(3), 1 / math.sqrt(3), -1 / math.sqrt(3)]
+
+        # Act
+        normal = provider.get_normal_at(0.0, 0.0)
+        edge_normals = provider.get_normals_at([100.0, 150.0], [0.0, 0.0])
+
+        # Assert - one-sided differences at the edge, NaN outside
+        assert [normal.x, normal.y, normal.z] == pytest.approx(expected)
+        assert edge_normals[0].tolist() == pytest.approx(expected)
+        assert math.isnan(edge_normals[1, 1])
+        with pytest.raises(OutOfBoundsError):
+            provider.get_normal_at(150.0, 0.0)
+
+
+def write_terrain_scene(root: Path, map_name: str, scene: str) -> Path:
+    """Write GodotProject/static/<map_name>_Terrain.tscn under a fake SDK root."""
+    static_dir = root / "GodotProject" / "static"
+    static_dir.mkdir(parents=True, exist_ok=True)
+    scene_path = static_dir / f"{map_name}_Terrain.tscn"
+    scene_path.write_text(scene)
+    return scene_path
+
+
+# 3x3 heightfield (samples 0..8) scaled 10x horizontally and 2x vertically,
+# centred at (100, 5, -50): covers X [90, 110], Z [-60, -40], heights 5..21
+HEIGHTMAP_SCENE = """[gd_scene load_steps=2 format=3]
+
+[sub_resource type="HeightMapShape3D" id="HeightMapShape3D_1"]
+map_width = 3
+map_depth = 3
+map_data = PackedFloat32Array(0, 1, 2, 3, 4, 5, 6, 7, 8)
+
+[node name="Terrain" type="StaticBody3D"]
+
+[node name="Collision" type="CollisionShape3D" parent="."]
+transform = Transform3D(10, 0, 0, 0, 2, 0, 0, 0, 10, 100, 5, -50)
+shape = SubResource("HeightMapShape3D_1")
+"""
+
 
 class TestTungstenTerrainProvider:
     """Tests for TungstenTerrainProvider."""
 
-    def test_initialization_with_valid_sdk_root(self, tmp_path: Path):
-        """Test provider initialization with valid Portal SDK structure."""
+    def test_initialization_reads_heightmap_shape(self, tmp_path: Path):
+        """Test provider loads dimensions and height range from the scene's heightfield."""
         # Arrange
-        godot_dir = tmp_path / "GodotProject" / "static"
-        godot_dir.mkdir(parents=True)
-        terrain_file = godot_dir / "MP_Tungsten_Terrain.tscn"
-        terrain_file.write_text("[gd_scene]\n")
+        write_terrain_scene(tmp_path, "MP_Tungsten", HEIGHTMAP_SCENE)
 
         # Act
         provider = TungstenTerrainProvider(portal_sdk_root=tmp_path)
 
         # Assert
-        assert provider.terrain_width == 2048.0
-        assert provider.terrain_depth == 2048.0
-        assert provider.min_height == 50.0
-        assert provider.max_height == 250.0
+        assert provider.terrain_width == 20.0
+        assert provider.terrain_depth == 20.0
+        assert provider.min_height == 5.0
+        assert provider.max_height == 21.0
 
     def test_initialization_missing_terrain_file(self, tmp_path: Path):
         """Test that provider raises TerrainError when terrain file is missing."""
@@ -116,136 +226,156 @@ class TestTungstenTerrainProvider:
         with pytest.raises(TerrainError, match="Tungsten terrain not found"):
             TungstenTerrainProvider(portal_sdk_root=tmp_path)
 
-    def test_get_height_returns_value_in_range(self, tmp_path: Path):
-        """Test that get_height_at returns values within min/max height range."""
+    def test_initialization_without_height_data_raises(self, tmp_path: Path):
+        """Test a scene with neither heightfield nor terrain mesh is rejected."""
+        # Arrange
+        write_terrain_scene(tmp_path, "MP_Tungsten", "[gd_scene]\n")
+
+        # Act & Assert
+        with pytest.raises(TerrainError, match="No height data for MP_Tungsten"):
+            TungstenTerrainProvider(portal_sdk_root=tmp_path)
+
+    def test_get_height_interpolates_heightfield(self, tmp_path: Path):
+        """Test heights are bilinearly sampled from the scaled heightfield."""
+        # Arrange
+        write_terrain_scene(tmp_path, "MP_Tungsten", HEIGHTMAP_SCENE)
+        provider = TungstenTerrainProvider(portal_sdk_root=tmp_path)
+
+        # Act & Assert
+        assert provider.get_height_at(100.0, -50.0) == pytest.approx(13.0)  # sample 4
+        assert provider.get_height_at(95.0, -60.0) == pytest.approx(6.0)  # samples 0/1
+        assert provider.get_height_at(110.0, -40.0) == pytest.approx(21.0)  # sample 8
+        with pytest.raises(OutOfBoundsError):
+            provider.get_height_at(0.0, 0.0)
+
+    def test_get_normal_follows_heightfield_slope(self, tmp_path: Path):
+        """Test normals come from the heightfield gradient (0.2 along X, 0.6 along Z)."""
         # Arrange
-        godot_dir = tmp_path / "GodotProject" / "static"
-        godot_dir.mkdir(parents=True)
-        terrain_file = godot_dir / "MP_Tungsten_Terrain.tscn"
-        terrain_file.write_text("[gd_scene]\n")
+        write_terrain_scene(tmp_path, "MP_Tungsten", HEIGHTMAP_SCENE)
         provider = TungstenTerrainProvider(portal_sdk_root=tmp_path)
+        length = math.sqrt(0.2**2 + 1.0 + 0.6**2)
+        expected = [-0.2 / length, 1.0 / length, -0.6 / length]
 
         # Act
-        height1 = provider.get_height_at(0.0, 0.0)
-        height2 = provider.get_height_at(100.0, 100.0)
-        height3 = provider.get_height_at(-100.0, -100.0)
+        normal = provider.get_normal_at(100.0, -50.0)
+        normals = provider.get_normals_at([92.0, 0.0], [-45.0, 0.0])
 
         # Assert
-        assert provider.min_height <= height1 <= provider.max_height
-        assert provider.min_height <= height2 <= provider.max_height
-        assert provider.min_height <= height3 <= provider.max_height
+        assert [normal.x, normal.y, normal.z] == pytest.approx(expected, abs=1e-6)
+        assert normals[0].tolist() == pytest.approx(expected, abs=1e-6)
+        assert math.isnan(normals[1, 0])
+        with pytest.raises(OutOfBoundsError):
+            provider.get_normal_at(0.0, 0.0)
 
-    def test_get_bounds_returns_centered_bounds(self, tmp_path: Path):
-        """Test that get_bounds returns correct centered bounds."""
+    def test_get_heights_at_matches_single_queries(self, tmp_path: Path):
+        """Test batch queries agree with get_height_at and mark outside points NaN."""
         # Arrange
-        godot_dir = tmp_path / "GodotProject" / "static"
-        godot_dir.mkdir(parents=True)
-        terrain_file = godot_dir / "MP_Tungsten_Terrain.tscn"
-        terrain_file.write_text("[gd_scene]\n")
+        write_terrain_scene(tmp_path, "MP_Tungsten", HEIGHTMAP_SCENE)
         provider = TungstenTerrainProvider(portal_sdk_root=tmp_path)
+        xs = [90.0, 97.5, 104.0, 0.0]
+        zs = [-60.0, -43.0, -51.0, 0.0]
 
         # Act
-        min_point, max_point = provider.get_bounds()
+        heights = provider.get_heights_at(xs, zs)
 
         # Assert
-        assert min_point.x == -1024.0
-        assert min_point.y == 50.0
-        assert min_point.z == -1024.0
+        for height, x, z in zip(heights[:3], xs[:3], zs[:3], strict=True):
+            assert height == pytest.approx(provider.get_height_at(x, z))
+        assert math.isnan(heights[3])
 
-        assert max_point.x == 1024.0
-        assert max_point.y == 250.0
-        assert max_point.z == 1024.0
+    def test_get_bounds_returns_heightfield_bounds(self, tmp_path: Path):
+        """Test that get_bounds returns the world-space heightfield bounds."""
+        # Arrange
+        write_terrain_scene(tmp_path, "MP_Tungsten", HEIGHTMAP_SCENE)
+        provider = TungstenTerrainProvider(portal_sdk_root=tmp_path)
+
+        # Act
+        min_point, max_point = provider.get_bounds()
+
+        # Assert
+        assert (min_point.x, min_point.y, min_point.z) == (90.0, 5.0, -60.0)
+        assert (max_point.x, max_point.y, max_point.z) == (110.0, 21.0, -40.0)
 
 
 class TestOutskirtsTerrainProvider:
     """Tests for OutskirtsTerrainProvider."""
 
-    def test_initialization_with_default_values(self):
-        """Test provider initialization with default estimated values."""
-        # Arrange & Act
-        provider = OutskirtsTerrainProvider()
-
-        # Assert
-        assert provider.terrain_width == 1536.0
-        assert provider.terrain_depth == 1536.0
-        assert provider.min_height == 0.0
-        assert provider.max_height == 50.0
-
-    def test_get_height_returns_value_in_range(self):
-        """Test that get_height_at returns values within urban terrain range."""
+    def test_initialization_reads_outskirts_scene(self, tmp_path: Path):
+        """Test provider loads MP_Outskirts_Terrain.tscn from the SDK root."""
         # Arrange
-        provider = OutskirtsTerrainProvider()
+        write_terrain_scene(tmp_path, "MP_Outskirts", HEIGHTMAP_SCENE)
 
         # Act
-        height1 = provider.get_height_at(0.0, 0.0)
-        height2 = provider.get_height_at(100.0, 100.0)
-        height3 = provider.get_height_at(-100.0, -100.0)
+        provider = OutskirtsTerrainProvider(portal_sdk_root=tmp_path)
 
         # Assert
-        assert provider.min_height <= height1 <= provider.max_height
-        assert provider.min_height <= height2 <= provider.max_height
-        assert provider.min_height <= height3 <= provider.max_height
+        assert provider.map_name == "MP_Outskirts"
+        assert provider.min_height == 5.0
+        assert provider.max_height == 21.0
 
-    def test_get_bounds_returns_centered_bounds(self):
-        """Test that get_bounds returns correct centered bounds for urban map."""
-        # Arrange
-        provider = OutskirtsTerrainProvider()
+    def test_initialization_missing_terrain_file(self, tmp_path: Path):
+        """Test that provider raises TerrainError when terrain file is missing."""
+        # Act & Assert
+        with pytest.raises(TerrainError, match="Outskirts terrain not found"):
+            OutskirtsTerrainProvider(portal_sdk_root=tmp_path)
 
-        # Act
-        min_point, max_point = provider.get_bounds()
 
-        # Assert
-        assert min_point.x == -768.0
-        assert min_point.y == 0.0
-        assert min_point.z == -768.0
+def write_heightmap_png(path: Path, pixels, mode: str = "L") -> Path:
+    """Write a heightmap image from a 2D list/array of pixel values."""
+    import numpy as np
+    from PIL import Image
 
-        assert max_point.x == 768.0
-        assert max_point.y == 50.0
-        assert max_point.z == 768.0
+    array = np.asarray(pixels, dtype=np.uint16 if mode == "I;16" else np.uint8)
+    if mode == "RGB":
+        array = np.stack([array] * 3, axis=-1)
+    Image.fromarray(array).save(path)
+    return path
 
 
 class TestCustomHeightmapProvider:
     """Tests for CustomHeightmapProvider."""
 
-    @pytest.fixture
-    def mock_heightmap_image(self):
-        """Create a mock PIL Image for testing."""
-        # Import PIL.Image.Image to use as spec
-        try:
-            from PIL.Image import Image as PILImage
-
-            mock_image = MagicMock(spec=PILImage)
-        except ImportError:
-            # If PIL not available, create mock with explicit spec
-            mock_image = MagicMock(spec=["size", "getpixel", "convert"])
-
-        mock_image.size = (256, 256)
-        mock_image.getpixel = Mock(spec=[], return_value=128)  # Mid-gray (50% height)
-        # Make convert() return the same mock object
-        mock_image.convert = Mock(spec=[], return_value=mock_image)
-        return mock_image
-
-    def test_initialization_with_valid_heightmap(self, tmp_path: Path, mock_heightmap_image):
+    def _uniform_provider(
+        self, tmp_path: Path, value: int, height_range: tuple[float, float] = (0.0, 200.0)
+    ) -> CustomHeightmapProvider:
+        """Create a provider over a uniform 256x256 8-bit heightmap."""
+        heightmap_path = write_heightmap_png(
+            tmp_path / f"uniform_{value}.png", [[value] * 256] * 256
+        )
+        return CustomHeightmapProvider(
+            heightmap_path=heightmap_path,
+            terrain_size=(2048.0, 2048.0),
+            height_range=height_range,
+        )
+
+    def test_initialization_with_valid_heightmap(self, tmp_path: Path):
         """Test provider initialization with valid heightmap file."""
-        # Arrange
-        heightmap_path = tmp_path / "heightmap.png"
-        heightmap_path.write_bytes(b"fake png data")
+        # Act
+        provider = self._uniform_provider(tmp_path, 128)
+
+        # Assert
+        assert provider.terrain_width == 2048.0
+        assert provider.terrain_depth == 2048.0
+        assert provider.min_height == 0.0
+        assert provider.max_height == 200.0
+        assert provider.width == 256
+        assert provider.height == 256
+        assert provider.heightmap.dtype.name == "float32"
+
+    def test_get_height_range_covers_heightmap_samples(self, tmp_path: Path):
+        """Test region queries cover the interpolated heightmap inside the region."""
+        # Arrange - 3x3 heightmap over 200m x 200m (samples every 100m)
+        heightmap_path = write_heightmap_png(
+            tmp_path / "ramp.png", [[0, 51, 102], [51, 102, 153], [102, 153, 255]]
+        )
+        provider = CustomHeightmapProvider(heightmap_path, (200.0, 200.0), (0.0, 100.0))
 
         # Act
-        with patch("PIL.Image.open", autospec=True, return_value=mock_heightmap_image):
-            provider = CustomHeightmapProvider(
-                heightmap_path=heightmap_path,
-                terrain_size=(2048.0, 2048.0),
-                height_range=(0.0, 200.0),
-            )
+        min_h, max_h, mean_h = provider.get_height_range((-100.0, -50.0, -100.0, -100.0))
 
-            # Assert
-            assert provider.terrain_width == 2048.0
-            assert provider.terrain_depth == 2048.0
-            assert provider.min_height == 0.0
-            assert provider.max_height == 200.0
-            assert provider.width == 256
-            assert provider.height == 256
+        # Assert - sample (0, 0) and the surface interpolated halfway to column 1
+        assert (min_h, max_h) == pytest.approx((0.0, 10.0))
+        assert mean_h == pytest.approx(5.0)
 
     def test_initialization_missing_heightmap_file(self, tmp_path: Path):
         """Test that provider raises TerrainError when heightmap file is missing."""
@@ -286,118 +416,143 @@ class TestCustomHeightmapProvider:
                 height_range=(0.0, 200.0),
             )
 
-    def test_get_height_at_center(self, tmp_path: Path, mock_heightmap_image):
+    def test_get_height_at_center(self, tmp_path: Path):
         """Test height query at terrain center."""
         # Arrange
-        heightmap_path = tmp_path / "heightmap.png"
-        heightmap_path.write_bytes(b"fake png data")
-        mock_heightmap_image.getpixel = Mock(spec=[], return_value=128)  # Mid-gray
+        provider = self._uniform_provider(tmp_path, 128)  # Mid-gray
 
-        with patch("PIL.Image.open", autospec=True, return_value=mock_heightmap_image):
-            provider = CustomHeightmapProvider(
-                heightmap_path=heightmap_path,
-                terrain_size=(2048.0, 2048.0),
-                height_range=(0.0, 200.0),
-            )
-
-            # Act
-            height = provider.get_height_at(0.0, 0.0)
+        # Act
+        height = provider.get_height_at(0.0, 0.0)
 
-            # Assert
-            assert 99.0 <= height <= 101.0
+        # Assert
+        assert 99.0 <= height <= 101.0
 
-    def test_get_height_with_grayscale_value(self, tmp_path: Path, mock_heightmap_image):
+    def test_get_height_with_grayscale_value(self, tmp_path: Path):
         """Test height query with different grayscale values."""
-        # Arrange
-        heightmap_path = tmp_path / "heightmap.png"
-        heightmap_path.write_bytes(b"fake png data")
+        # Act & Assert - Test minimum height (black pixel)
+        provider = self._uniform_provider(tmp_path, 0, height_range=(0.0, 100.0))
+        assert provider.get_height_at(0.0, 0.0) == 0.0
 
-        with patch("PIL.Image.open", autospec=True, return_value=mock_heightmap_image):
-            provider = CustomHeightmapProvider(
-                heightmap_path=heightmap_path,
-                terrain_size=(2048.0, 2048.0),
-                height_range=(0.0, 100.0),
-            )
+        # Act & Assert - Test maximum height (white pixel)
+        provider = self._uniform_provider(tmp_path, 255, height_range=(0.0, 100.0))
+        assert provider.get_height_at(0.0, 0.0) == pytest.approx(100.0)
+
+        # Act & Assert - Test mid height (gray pixel)
+        provider = self._uniform_provider(tmp_path, 127, height_range=(0.0, 100.0))
+        assert 49.0 <= provider.get_height_at(0.0, 0.0) <= 51.0
 
-            # Act & Assert - Test minimum height (black pixel)
-            mock_heightmap_image.getpixel = Mock(spec=[], return_value=0)
-            height = provider.get_height_at(0.0, 0.0)
-            assert height == 0.0
+    def test_get_height_with_rgb_image(self, tmp_path: Path):
+        """Test RGB heightmaps are converted to grayscale."""
+        # Arrange
+        heightmap_path = write_heightmap_png(tmp_path / "rgb.png", [[128] * 16] * 16, mode="RGB")
+        provider = CustomHeightmapProvider(
+            heightmap_path=heightmap_path,
+            terrain_size=(2048.0, 2048.0),
+            height_range=(0.0, 200.0),
+        )
 
-            # Act & Assert - Test maximum height (white pixel)
-            mock_heightmap_image.getpixel = Mock(spec=[], return_value=255)
-            height = provider.get_height_at(0.0, 0.0)
-            assert height == 100.0
+        # Act
+        height = provider.get_height_at(0.0, 0.0)
 
-            # Act & Assert - Test mid height (gray pixel)
-            mock_heightmap_image.getpixel = Mock(spec=[], return_value=127)
-            height = provider.get_height_at(0.0, 0.0)
-            assert 49.0 <= height <= 51.0
+        # Assert
+        assert 99.0 <= height <= 101.0
 
-    def test_get_height_with_rgb_tuple(self, tmp_path: Path, mock_heightmap_image):
-        """Test height query when getpixel returns RGB tuple."""
+    def test_get_height_uses_16_bit_precision(self, tmp_path: Path):
+        """Test 16-bit PNG samples are not truncated to 8 bits."""
         # Arrange
-        heightmap_path = tmp_path / "heightmap.png"
-        heightmap_path.write_bytes(b"fake png data")
-        mock_heightmap_image.getpixel = Mock(spec=[], return_value=(128, 128, 128))  # RGB tuple
+        heightmap_path = write_heightmap_png(tmp_path / "16bit.png", [[1000] * 4] * 4, mode="I;16")
+        provider = CustomHeightmapProvider(
+            heightmap_path=heightmap_path,
+            terrain_size=(100.0, 100.0),
+            height_range=(0.0, 65535.0),
+        )
 
-        with patch("PIL.Image.open", autospec=True, return_value=mock_heightmap_image):
-            provider = CustomHeightmapProvider(
-                heightmap_path=heightmap_path,
-                terrain_size=(2048.0, 2048.0),
-                height_range=(0.0, 200.0),
-            )
+        # Act & Assert
+        assert provider.get_height_at(0.0, 0.0) == pytest.approx(1000.0)
 
-            # Act
-            height = provider.get_height_at(0.0, 0.0)
+    def test_loads_bf1942_raw_heightmap(self, tmp_path: Path):
+        """Test .raw files are read as little-endian uint16 squares."""
+        # Arrange
+        import numpy as np
+
+        heightmap_path = tmp_path / "Heightmap.raw"
+        np.array([[0, 65535], [65535, 65535]], dtype="<u2").tofile(heightmap_path)
+        provider = CustomHeightmapProvider(
+            heightmap_path=heightmap_path,
+            terrain_size=(100.0, 100.0),
+            height_range=(0.0, 150.0),
+        )
 
-            # Assert
-            assert 99.0 <= height <= 101.0
+        # Act & Assert
+        assert provider.width == 2
+        assert provider.get_height_at(-50.0, -50.0) == 0.0
+        assert provider.get_height_at(50.0, 50.0) == pytest.approx(150.0)
+
+    def test_get_height_interpolates_between_pixels(self, tmp_path: Path):
+        """Test heights are bilinearly interpolated, not nearest-pixel."""
+        # Arrange - 2x2 heightmap: left column 0, right column 200
+        heightmap_path = write_heightmap_png(tmp_path / "ramp.png", [[0, 255], [0, 255]])
+        provider = CustomHeightmapProvider(
+            heightmap_path=heightmap_path,
+            terrain_size=(100.0, 100.0),
+            height_range=(0.0, 200.0),
+        )
 
-    def test_get_height_out_of_bounds(self, tmp_path: Path, mock_heightmap_image):
+        # Act & Assert - pixel centers map to terrain edges
+        assert provider.get_height_at(-50.0, 0.0) == pytest.approx(0.0)
+        assert provider.get_height_at(-25.0, 0.0) == pytest.approx(50.0)
+        assert provider.get_height_at(0.0, 10.0) == pytest.approx(100.0)
+        assert provider.get_height_at(50.0, 0.0) == pytest.approx(200.0)
+
+    def test_get_height_out_of_bounds(self, tmp_path: Path):
         """Test that provider raises OutOfBoundsError for positions outside terrain."""
         # Arrange
-        heightmap_path = tmp_path / "heightmap.png"
-        heightmap_path.write_bytes(b"fake png data")
+        provider = self._uniform_provider(tmp_path, 128)
 
-        with patch("PIL.Image.open", autospec=True, return_value=mock_heightmap_image):
-            provider = CustomHeightmapProvider(
-                heightmap_path=heightmap_path,
-                terrain_size=(2048.0, 2048.0),
-                height_range=(0.0, 200.0),
-            )
-
-            # Act & Assert
-            with pytest.raises(OutOfBoundsError, match="outside terrain bounds"):
-                provider.get_height_at(2000.0, 0.0)
+        # Act & Assert
+        with pytest.raises(OutOfBoundsError, match="outside terrain bounds"):
+            provider.get_height_at(2000.0, 0.0)
 
-            with pytest.raises(OutOfBoundsError, match="outside terrain bounds"):
-                provider.get_height_at(0.0, -2000.0)
+        with pytest.raises(OutOfBoundsError, match="outside terrain bounds"):
+            provider.get_height_at(0.0, -2000.0)
 
-    def test_get_bounds(self, tmp_path: Path, mock_heightmap_image):
+    def test_get_bounds(self, tmp_path: Path):
         """Test that get_bounds returns correct terrain bounds."""
         # Arrange
-        heightmap_path = tmp_path / "heightmap.png"
-        heightmap_path.write_bytes(b"fake png data")
+        provider = self._uniform_provider(tmp_path, 128, height_range=(50.0, 250.0))
 
-        with patch("PIL.Image.open", autospec=True, return_value=mock_heightmap_image):
-            provider = CustomHeightmapProvider(
-                heightmap_path=heightmap_path,
-                terrain_size=(2048.0, 2048.0),
-                height_range=(50.0, 250.0),
-            )
+        # Act
+        min_point, max_point = provider.get_bounds()
+
+        # Assert
+        assert min_point.x == -1024.0
+        assert min_point.y == 50.0
+        assert min_point.z == -1024.0
+
+        assert max_point.x == 1024.0
+        assert max_point.y == 250.0
+        assert max_point.z == 1024.0
 
-            # Act
-            min_point, max_point = provider.get_bounds()
+    def test_get_heights_at_matches_get_height_at(self, tmp_path: Path):
+        """Test vectorized interpolation matches the per-point path."""
+        # Arrange
+        heightmap_file = write_heightmap_png(
+            tmp_path / "heightmap.png",
+            [list(range(row, row + 64, 16)) for row in range(0, 256, 64)],
+        )
+        provider = CustomHeightmapProvider(
+            heightmap_path=heightmap_file, terrain_size=(100.0, 100.0), height_range=(0.0, 255.0)
+        )
+        xs = [-50.0, -10.0, 0.0, 20.0, 50.0, 60.0]
+        zs = [-50.0, 30.0, 0.0, -40.0, 50.0, 0.0]
 
-            # Assert
-            assert min_point.x == -1024.0
-            assert min_point.y == 50.0
-            assert min_point.z == -1024.0
+        # Act
+        heights = provider.get_heights_at(xs, zs)
 
-            assert max_point.x == 1024.0
-            assert max_point.y == 250.0
-            assert max_point.z == 1024.0
+        # Assert
+        for height, x, z in zip(heights[:5], xs[:5], zs[:5], strict=True):
+            assert height == pytest.approx(provider.get_height_at(x, z))
+        assert math.isnan(heights[5])
 
 
 class TestTerrainEstimator:
@@ -441,6 +596,27 @@ class TestTerrainEstimator:
         assert min_h == 0.0
         assert max_h == 200.0
 
+    def test_get_height_range_measures_real_terrain(self, tmp_path: Path):
+        """Test the range is measured from terrain data when an SDK root is given."""
+        # Arrange
+        write_terrain_scene(tmp_path, "MP_Battery", HEIGHTMAP_SCENE)
+
+        # Act
+        min_h, max_h = TerrainEstimator.get_height_range("MP_Battery", tmp_path)
+        fixed_h = TerrainEstimator.get_fixed_height("MP_Battery", tmp_path)
+
+        # Assert
+        assert (min_h, max_h) == (5.0, 21.0)
+        assert fixed_h == 13.0
+
+    def test_get_height_range_falls_back_without_terrain_data(self, tmp_path: Path):
+        """Test the estimates table is used when the terrain cannot be loaded."""
+        # Arrange - tmp_path has no terrain scenes
+
+        # Act & Assert
+        assert TerrainEstimator.get_height_range("MP_Battery", tmp_path) == (24.0, 255.0)
+        assert TerrainEstimator.get_fixed_height("MP_Battery", tmp_path) == 140.0
+
 
 class TestHeightAdjuster:
     """Tests for HeightAdjuster."""
@@ -522,3 +698,21 @@ class TestHeightAdjuster:
         assert adjusted.position.x == 5000.0
         assert adjusted.position.y == 50.0
         assert adjusted.position.z == 5000.0
+
+
+class TestDefaultBatchHeightQuery:
+    """Tests for the ITerrainProvider.get_heights_at fallback loop."""
+
+    def test_default_get_heights_at_loops_over_get_height_at(self):
+        """Test providers without a vectorized override still answer batch queries."""
+        # Arrange
+        from bfportal.core.interfaces import ITerrainProvider
+
+        provider = FixedHeightProvider(fixed_height=42.0, terrain_size=(100.0, 100.0))
+
+        # Act - call the base implementation rather than the vectorized override
+        heights = ITerrainProvider.get_heights_at(provider, [0.0, 50.0, 51.0], [0.0, -50.0, 0.0])
+
+        # Assert
+        assert heights[:2].tolist() == [42.0, 42.0]
+        assert math.isnan(heights[2])
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for TriangleSpatialIndex - exact ray-down terrain height queries."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add tools directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bfportal.terrain.triangle_index import TriangleSpatialIndex
+
+
+def make_grid_mesh(size: int, extent: float):
+    """Build a regular triangulated height field y = 0.1 * x + 0.2 * z."""
+    coords = np.linspace(-extent, extent, size)
+    xs, zs = np.meshgrid(coords, coords)
+    vertices = np.column_stack([xs.ravel(), (0.1 * xs + 0.2 * zs).ravel(), zs.ravel()])
+
+    cells = np.arange(size - 1)
+    col, row = np.meshgrid(cells, cells)
+    a = (row * size + col).ravel()
+    b, c = a + 1, a + size
+    d = c + 1
+    triangles = np.concatenate([np.column_stack([a, b, c]), np.column_stack([b, d, c])])
+    return vertices, triangles
+
+
+class TestTriangleSpatialIndex:
+    """Tests for TriangleSpatialIndex."""
+
+    def test_query_is_exact_on_planar_mesh(self):
+        """Test batched queries reproduce the plane exactly between vertices."""
+        # Arrange
+        vertices, triangles = make_grid_mesh(size=33, extent=100.0)
+        index = TriangleSpatialIndex(vertices, triangles)
+        rng = np.random.default_rng(42)
+        xs = rng.uniform(-100.0, 100.0, 500)
+        zs = rng.uniform(-100.0, 100.0, 500)
+
+        # Act
+        heights = index.query(xs, zs)
+
+        # Assert
+        np.testing.assert_allclose(heights, 0.1 * xs + 0.2 * zs, atol=1e-9)
+
+    def test_query_point_matches_batch_query(self):
+        """Test scalar fast path agrees with batched query, including on vertices."""
+        # Arrange
+        vertices, triangles = make_grid_mesh(size=9, extent=50.0)
+        index = TriangleSpatialIndex(vertices, triangles)
+
+        # Act & Assert
+        for x, z in [(0.0, 0.0), (-50.0, -50.0), (50.0, 50.0), (12.3, -7.7)]:
+            assert index.query_point(x, z) == pytest.approx(index.query([x], [z])[0])
+            assert index.query_point(x, z) == pytest.approx(0.1 * x + 0.2 * z)
+
+    def test_points_outside_mesh_return_nan(self):
+        """Test points with no triangle below them are reported as misses."""
+        # Arrange - single triangle covering the lower-left half of a square
+        vertices = np.array([[0.0, 1.0, 0.0], [10.0, 1.0, 0.0], [0.0, 1.0, 10.0]])
+        index = TriangleSpatialIndex(vertices, np.array([[0, 1, 2]]))
+
+        # Act
+        heights = index.query([2.0, 9.0], [2.0, 9.0])
+
+        # Assert
+        assert heights[0] == pytest.approx(1.0)
+        assert np.isnan(heights[1])
+        assert index.query_point(9.0, 9.0) is None
+
+    def test_overlapping_triangles_return_highest_surface(self):
+        """Test a downward ray reports the first (highest) surface it hits."""
+        # Arrange - two coincident triangles at different heights
+        vertices = np.array(
+            [
+                [0.0, 0.0, 0.0],
+                [10.0, 0.0, 0.0],
+                [0.0, 0.0, 10.0],
+                [0.0, 5.0, 0.0],
+                [10.0, 5.0, 0.0],
+                [0.0, 5.0, 10.0],
+            ]
+        )
+        index = TriangleSpatialIndex(vertices, np.array([[0, 1, 2], [3, 4, 5]]))
+
+        # Act & Assert
+        assert index.query([1.0], [1.0])[0] == pytest.approx(5.0)
+        assert index.query_point(1.0, 1.0) == pytest.approx(5.0)
+
+    def test_vertical_triangles_are_ignored(self):
+        """Test zero-area (in XZ) triangles are excluded from the index."""
+        # Arrange
+        vertices = np.array([[0.0, 0.0, 0.0], [10.0, 0.0, 0.0], [10.0, 10.0, 0.0]])
+
+        # Act
+        index = TriangleSpatialIndex(vertices, np.array([[0, 1, 2]]))
+
+        # Assert
+        assert index.triangle_count == 0
+        assert np.isnan(index.query([5.0], [0.0])[0])
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Unit tests for MapRebaser."""
 
+import math
 import sys
 from pathlib import Path
 from unittest.mock import create_autospec
 
+import numpy as np
 import pytest
 
 # Add tools directory to Python path
@@ -23,6 +25,11 @@ from bfportal.core.interfaces import (
 from bfportal.transforms.map_rebaser import MapRebaser
 
 
+def _batch_heights(height: float):
+    """Create a get_heights_at side effect returning one height for every position."""
+    return lambda xs, zs: np.full(len(xs), height)
+
+
 class TestMapRebaserInitialization:
     """Test cases for MapRebaser initialization."""
 
@@ -65,7 +72,7 @@ class TestMapRebaserOffsetCalculation:
         offset_calc.calculate_centroid.return_value = Vector3(100.0, 50.0, 200.0)
         offset_calc.calculate_offset.return_value = Vector3(0.0, 0.0, 0.0)
         offset_calc.apply_offset.side_effect = lambda t, o: t
-        terrain.get_height_at.return_value = 50.0
+        terrain.get_heights_at.side_effect = _batch_heights(50.0)
         rebaser = MapRebaser(terrain, offset_calc, None)
         test_tscn = Path(__file__).parent / "test_rebaser_input.tscn"
         test_tscn.write_text(
@@ -101,7 +108,7 @@ class TestMapRebaserOffsetCalculation:
         offset_calc.apply_offset.side_effect = lambda t, o: Transform(
             Vector3(t.position.x + o.x, t.position.y + o.y, t.position.z + o.z), t.rotation
         )
-        terrain.get_height_at.return_value = 25.0
+        terrain.get_heights_at.side_effect = _batch_heights(25.0)
         rebaser = MapRebaser(terrain, offset_calc, None)
         test_tscn = Path(__file__).parent / "test_rebaser_offset.tscn"
         test_tscn.write_text(
@@ -144,7 +151,7 @@ class TestMapRebaserOffsetCalculation:
             )
 
         offset_calc.apply_offset.side_effect = mock_apply_offset
-        terrain.get_height_at.return_value = 0.0
+        terrain.get_heights_at.side_effect = _batch_heights(0.0)
         rebaser = MapRebaser(terrain, offset_calc, None)
         test_tscn = Path(__file__).parent / "test_rebaser_multi.tscn"
         test_tscn.write_text(
@@ -176,7 +183,7 @@ class TestMapRebaserHeightAdjustment:
         terrain = create_autospec(ITerrainProvider, instance=True)
         offset_calc = create_autospec(ICoordinateOffset, instance=True)
 
-        terrain.get_height_at.return_value = 10.0
+        terrain.get_heights_at.side_effect = _batch_heights(10.0)
         offset_calc.calculate_centroid.return_value = Vector3(0.0, 50.0, 0.0)
         offset_calc.calculate_offset.return_value = Vector3(0.0, 0.0, 0.0)
         offset_calc.apply_offset.side_effect = lambda t, o: t
@@ -198,7 +205,7 @@ class TestMapRebaserHeightAdjustment:
 
             # Assert
             assert stats["height_adjusted"] == 1
-            terrain.get_height_at.assert_called()
+            terrain.get_heights_at.assert_called_once()
 
         finally:
             test_tscn.unlink(missing_ok=True)
@@ -210,7 +217,7 @@ class TestMapRebaserHeightAdjustment:
         terrain = create_autospec(ITerrainProvider, instance=True)
         offset_calc = create_autospec(ICoordinateOffset, instance=True)
 
-        terrain.get_height_at.return_value = 10.0
+        terrain.get_heights_at.side_effect = _batch_heights(10.0)
         offset_calc.calculate_centroid.return_value = Vector3(0.0, 11.0, 0.0)
         offset_calc.calculate_offset.return_value = Vector3(0.0, 0.0, 0.0)
         offset_calc.apply_offset.side_effect = lambda t, o: t
@@ -243,7 +250,7 @@ class TestMapRebaserHeightAdjustment:
         terrain = create_autospec(ITerrainProvider, instance=True)
         offset_calc = create_autospec(ICoordinateOffset, instance=True)
 
-        terrain.get_height_at.side_effect = Exception("Out of terrain bounds")
+        terrain.get_heights_at.side_effect = _batch_heights(math.nan)
         offset_calc.calculate_centroid.return_value = Vector3(0.0, 0.0, 0.0)
         offset_calc.calculate_offset.return_value = Vector3(0.0, 0.0, 0.0)
         offset_calc.apply_offset.side_effect = lambda t, o: t
@@ -460,7 +467,7 @@ class TestMapRebaserStatistics:
         offset_calc.calculate_centroid.return_value = Vector3(0.0, 0.0, 0.0)
         offset_calc.calculate_offset.return_value = Vector3(0.0, 0.0, 0.0)
         offset_calc.apply_offset.side_effect = lambda t, o: t
-        terrain.get_height_at.return_value = 0.0
+        terrain.get_heights_at.side_effect = _batch_heights(0.0)
 
         rebaser = MapRebaser(terrain, offset_calc, None)
 
@@ -494,17 +501,7 @@ class TestMapRebaserStatistics:
         terrain = create_autospec(ITerrainProvider, instance=True)
         offset_calc = create_autospec(ICoordinateOffset, instance=True)
 
-        heights = [5.0, 10.0, None]
-        height_calls = [0]
-
-        def get_height_side_effect(x, z):
-            idx = height_calls[0]
-            height_calls[0] += 1
-            if heights[idx] is None:
-                raise Exception("Out of bounds")
-            return heights[idx]
-
-        terrain.get_height_at.side_effect = get_height_side_effect
+        terrain.get_heights_at.side_effect = lambda xs, zs: np.array([5.0, 10.0, math.nan])
         offset_calc.calculate_centroid.return_value = Vector3(0.0, 0.0, 0.0)
         offset_calc.calculate_offset.return_value = Vector3(0.0, 0.0, 0.0)
         offset_calc.apply_offset.side_effect = lambda t, o: t
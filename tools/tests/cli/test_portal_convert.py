@@ -3,6 +3,7 @@
 
 import sys
 from argparse import Namespace
+from functools import partial
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -20,6 +21,7 @@ from bfportal.mappers.asset_mapper import AssetMapper
 from bfportal.orientation.map_orientation_detector import MapOrientationDetector
 from bfportal.orientation.orientation_matcher import OrientationMatcher
 from bfportal.orientation.terrain_orientation_detector import TerrainOrientationDetector
+from bfportal.terrain.terrain_provider import QUERY_MODE_GRID
 from portal_convert import PortalConverter, main
 
 # Test constants for terrain dimensions
@@ -41,6 +43,8 @@ def _create_mock_converter(args: Namespace, sdk_root: Path, mock_terrain_provide
     """
     mock_asset_mapper = MagicMock(spec=AssetMapper)
     mock_asset_mapper.load_mappings = MagicMock()
+    # Bulk mapping goes through map_asset, so tests can mock the single-asset call
+    mock_asset_mapper.map_assets.side_effect = partial(AssetMapper.map_assets, mock_asset_mapper)
 
     with (
         patch("portal_convert.BF1942Engine", autospec=True),
@@ -69,6 +73,8 @@ class TestPortalConverterInit:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -104,6 +110,8 @@ class TestPortalConverterInit:
             map="Kursk",
             base_terrain="MP_NonExistent",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -131,6 +139,8 @@ class TestResolveMapPath:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -165,6 +175,8 @@ class TestResolveMapPath:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=2048.0,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=str(custom_root),
             output=None,
             rotate_terrain=False,
@@ -188,6 +200,8 @@ class TestResolveMapPath:
             map="NonExistentMap",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -211,6 +225,8 @@ class TestResolveOutputPath:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -234,6 +250,8 @@ class TestResolveOutputPath:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=2048.0,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=str(custom_output),
             rotate_terrain=False,
@@ -259,6 +277,8 @@ class TestGuessTheme:
             map="El_Alamein",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -280,6 +300,8 @@ class TestGuessTheme:
             map="Berlin",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -301,6 +323,8 @@ class TestGuessTheme:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -331,6 +355,8 @@ class TestGetTargetCenter:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -360,6 +386,8 @@ class TestGuessThemeTropical:
             map="Wake_Island",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -394,6 +422,8 @@ class TestConvertMethod:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -536,6 +566,8 @@ class TestConvertMethod:
             map="EmptyMap",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -627,6 +659,8 @@ class TestConvertMethod:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -662,6 +696,8 @@ class TestConvertMethod:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -712,6 +748,8 @@ class TestConvertWithCapturePoints:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -846,6 +884,8 @@ class TestConvertWithRotation:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -954,6 +994,8 @@ class TestConvertAssetMapping:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -1084,6 +1126,8 @@ class TestConvertAssetMapping:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -1207,6 +1251,8 @@ class TestConvertAssetMapping:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -1325,6 +1371,8 @@ class TestGenerateTscn:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
@@ -1372,6 +1420,8 @@ class TestGenerateTscn:
             map="Kursk",
             base_terrain="MP_Tungsten",
             terrain_size=TERRAIN_SIZE_STANDARD,
+            terrain_query=QUERY_MODE_GRID,
+            no_terrain_cache=False,
             bf1942_root=None,
             output=None,
             rotate_terrain=False,
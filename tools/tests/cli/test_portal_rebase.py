@@ -6,7 +6,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from bfportal.core.exceptions import BFPortalError
+from bfportal.core.exceptions import BFPortalError, TerrainError
 from bfportal.core.interfaces import ITerrainProvider, Vector3
 from bfportal.transforms.map_rebaser import MapRebaser
 from portal_rebase import PORTAL_BASE_CENTERS, PortalRebaseApp
@@ -207,44 +207,43 @@ class TestCreateTerrainProvider:
             app.create_terrain_provider()
 
     def test_create_terrain_provider_tungsten_builtin(self):
-        """Test create_terrain_provider creates TungstenTerrainProvider."""
+        """Test create_terrain_provider loads the MP_Tungsten base terrain."""
         # Arrange
         app = PortalRebaseApp()
         app.args = Namespace(heightmap=None, new_base="MP_Tungsten")
 
-        with patch("portal_rebase.TungstenTerrainProvider", spec=True) as mock_provider:
+        with patch("portal_rebase.PortalTerrainProvider", spec=True) as mock_provider:
             # Act
             app.create_terrain_provider()
 
         # Assert
         mock_provider.assert_called_once()
+        assert mock_provider.call_args.args[0] == "MP_Tungsten"
 
     def test_create_terrain_provider_outskirts_builtin(self):
-        """Test create_terrain_provider creates OutskirtsTerrainProvider."""
+        """Test create_terrain_provider loads the MP_Outskirts base terrain."""
         # Arrange
         app = PortalRebaseApp()
         app.args = Namespace(heightmap=None, new_base="MP_Outskirts")
 
-        with patch("portal_rebase.OutskirtsTerrainProvider", spec=True) as mock_provider:
+        with patch("portal_rebase.PortalTerrainProvider", spec=True) as mock_provider:
             # Act
             app.create_terrain_provider()
 
         # Assert
         mock_provider.assert_called_once()
+        assert mock_provider.call_args.args[0] == "MP_Outskirts"
 
-    def test_create_terrain_provider_fallback_for_unsupported_terrain(self):
-        """Test create_terrain_provider falls back to TungstenTerrainProvider for unsupported terrains."""
+    def test_create_terrain_provider_raises_for_terrain_without_scene(self):
+        """Test terrains without a terrain scene fail instead of using placeholder heights."""
         # Arrange
         app = PortalRebaseApp()
         app.args = Namespace(heightmap=None, new_base="MP_Nexus")
 
-        with patch("portal_rebase.TungstenTerrainProvider", spec=True) as mock_provider:
-            # Act
+        # Act & Assert
+        with pytest.raises(TerrainError, match="Nexus terrain not found"):
             app.create_terrain_provider()
 
-        # Assert
-        mock_provider.assert_called_once()
-
 
 class TestRun:
     """Tests for PortalRebaseApp.run()."""
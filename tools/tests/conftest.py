@@ -11,6 +11,23 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from bfportal.core.interfaces import MapContext, Team
+from bfportal.generators.components import scene_index
+from bfportal.indexers import asset_types_snapshot
+from bfportal.parsers import con_parse_cache, spawner_template_index
+from bfportal.terrain import terrain_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_persistent_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep persisted parse caches and indexes out of the user's cache directory."""
+    monkeypatch.setenv(con_parse_cache.CACHE_DIR_ENV, str(tmp_path / "con_cache"))
+    monkeypatch.setenv(spawner_template_index.INDEX_PATH_ENV, str(tmp_path / "spawners.json"))
+    monkeypatch.setattr(spawner_template_index, "_shared_index", None)
+    monkeypatch.setenv(asset_types_snapshot.CACHE_DIR_ENV, str(tmp_path / "catalog_cache"))
+    monkeypatch.setattr(asset_types_snapshot, "_shared_snapshots", {})
+    monkeypatch.setenv(scene_index.CACHE_DIR_ENV, str(tmp_path / "scene_cache"))
+    monkeypatch.setattr(scene_index, "_shared_indexes", {})
+    monkeypatch.setenv(terrain_cache.CACHE_DIR_ENV, str(tmp_path / "terrain_cache"))
 
 
 @pytest.fixture(scope="session")
@@ -346,6 +363,7 @@ def mock_terrain_provider():
     mock_terrain.mesh_center_z = 0.0
     mock_terrain.terrain_y_baseline = 0.0
     mock_terrain.grid_resolution = 256
+    mock_terrain.triangle_index = None
 
     return mock_terrain
 
@@ -93,7 +93,7 @@ def main():
 
     parser.add_argument("--source", required=True, help="Path to source BF1942 map directory")
     parser.add_argument("--output", required=True, help="Path to generated .tscn file")
-    parser.add_argument("--heightmap", type=str, help="Path to heightmap PNG (optional)")
+    parser.add_argument("--heightmap", type=str, help="Path to heightmap PNG or .raw (optional)")
     parser.add_argument(
         "--terrain-size", type=float, default=2048.0, help="Terrain size in meters (default: 2048)"
     )
@@ -87,6 +87,7 @@ def get_terrain_bounds(terrain_name: str) -> tuple[float, float, float, float] |
         Tuple of (min_x, max_x, min_z, max_z) or None if mesh not found
     """
     # Import here to avoid loading at module level
+    from bfportal.terrain.terrain_cache import TerrainCache
     from bfportal.terrain.terrain_provider import MeshTerrainProvider
 
     mesh_path = get_terrain_glb_path(terrain_name)
@@ -95,7 +96,7 @@ def get_terrain_bounds(terrain_name: str) -> tuple[float, float, float, float] |
         return None
 
     # Terrain size doesn't matter for bounds checking
-    provider = MeshTerrainProvider(mesh_path, (2048, 2048))
+    provider = MeshTerrainProvider(mesh_path, (2048, 2048), cache=TerrainCache())
 
     min_x = provider.vertices[:, 0].min()
     max_x = provider.vertices[:, 0].max()
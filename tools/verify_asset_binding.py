@@ -12,6 +12,8 @@ import re
 import sys
 from pathlib import Path
 
+from bfportal.indexers.asset_types_snapshot import load_asset_types
+
 
 def extract_tscn_objects(tscn_path: Path) -> list[dict]:
     """Extract objects from .tscn file.
@@ -124,9 +126,7 @@ def verify_asset_binding(map_name: str, check_spatial: bool = True) -> dict:
         return {"error": f".tscn not found: {tscn_path}"}
 
     # Load Portal asset catalog
-    with open(asset_types_path) as f:
-        asset_catalog = json.load(f)
-        valid_asset_types = {asset["type"] for asset in asset_catalog["AssetTypes"]}
+    valid_asset_types = {asset["type"] for asset in load_asset_types(asset_types_path).asset_types}
 
     print(f"\n{'=' * 70}")
     print(f"ASSET BINDING VERIFICATION: {map_name}")